@@ -0,0 +1,98 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for content location and reference wrappers.
+
+Compares reading path_segments and path 10 times from each of 10,000 locations by marshalling
+the .NET values on every access, as the generated getters do, and through the cached wrapper properties.
+Also compares building a set of the locations keyed by path strings and by the locations themselves.
+"""
+
+from uuid import uuid4
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration import PyContentLocation, PyContentReference # noqa: E402
+
+from System import Guid # noqa: E402
+from Tableau.Migration import ContentLocation # noqa: E402
+from Tableau.Migration.Content import ContentReferenceStub # noqa: E402
+
+
+def _run_uncached(locations: list[PyContentLocation], reads: int) -> dict:
+    def _read_all():
+        for location in locations:
+            for _ in range(reads):
+                list(location._dotnet.PathSegments)
+                location._dotnet.Path
+
+    return {"seconds": measure(_read_all)}
+
+
+def _run_cached(locations: list[PyContentLocation], reads: int) -> dict:
+    def _read_all():
+        for location in locations:
+            for _ in range(reads):
+                location.path_segments
+                location.path
+
+    return {"seconds": measure(_read_all)}
+
+
+def _run_sets(locations: list[PyContentLocation]) -> dict:
+    return {
+        "path_set_seconds": measure(lambda: {location._dotnet.Path.casefold() for location in locations}),
+        "location_set_seconds": measure(lambda: set(locations))
+    }
+
+
+def _run_reference_locations(references: list[PyContentReference], reads: int) -> dict:
+    def _read_uncached():
+        for reference in references:
+            for _ in range(reads):
+                PyContentLocation(reference._dotnet.Location)
+
+    def _read_cached():
+        for reference in references:
+            for _ in range(reads):
+                reference.location
+
+    return {"uncached_seconds": measure(_read_uncached), "cached_seconds": measure(_read_cached)}
+
+
+def main(count: int = 10_000, reads: int = 10) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of locations.
+        reads: The number of times each field is read from each location.
+    """
+    dotnet_locations = [ContentLocation.FromPath(f"Root/Department {i % 100}/Project {i}/Workbook {i}", "/") for i in range(count)]
+
+    references = [PyContentReference(ContentReferenceStub(Guid.Parse(str(uuid4())), "", location)) for location in dotnet_locations]
+
+    report("content_location", {
+        "items": count,
+        "reads": reads,
+        "uncached": _run_uncached([PyContentLocation(x) for x in dotnet_locations], reads),
+        "cached": _run_cached([PyContentLocation(x) for x in dotnet_locations], reads),
+        "sets": _run_sets([PyContentLocation(x) for x in dotnet_locations]),
+        "reference_location": _run_reference_locations(references, reads)
+    })
+
+
+if __name__ == "__main__":
+    main()
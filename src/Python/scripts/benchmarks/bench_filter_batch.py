@@ -0,0 +1,109 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for Python filter hooks.
+
+Compares the elapsed time to filter 10,000 content items with a per-item filter callback and a batch filter callback,
+and the number of times .NET calls into Python for each.
+"""
+
+from uuid import uuid4
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration import PyContentReference # noqa: E402
+from tableau_migration.migration_engine_hooks_filters_builder import PyContentFilterBuilder # noqa: E402
+
+from System import Guid # noqa: E402
+from System.Collections.Generic import List as DotnetList # noqa: E402
+from System.Threading import CancellationToken # noqa: E402
+from Tableau.Migration import ContentLocation, IContentReference # noqa: E402
+from Tableau.Migration.Content import ContentReferenceStub # noqa: E402
+from Tableau.Migration.Engine import ContentMigrationItem # noqa: E402
+from Tableau.Migration.Engine.Hooks import IMigrationHook # noqa: E402
+from Tableau.Migration.Engine.Hooks.Filters import ContentFilterBuilder, ContentFilterContext, IContentFilter # noqa: E402
+
+
+def _create_context(count: int) -> ContentFilterContext:
+    items = DotnetList[ContentMigrationItem[IContentReference]]()
+    for i in range(count):
+        stub = ContentReferenceStub(Guid.Parse(str(uuid4())), f"item{i}", ContentLocation.ForUsername("domain", f"item{i}"))
+        items.Add(ContentMigrationItem[IContentReference](stub, None))
+
+    return ContentFilterContext[IContentReference](items)
+
+
+def _create_hook(callback, is_batch: bool):
+    hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+    hook_builder.add(PyContentReference, callback, is_batch=is_batch)
+
+    factory = hook_builder.build().get_hooks(IContentFilter[IContentReference])[0]
+    return factory.Create[IMigrationHook[ContentFilterContext[IContentReference]]](None)
+
+
+def _run(hook, count: int, repeat: int) -> float:
+    # Filtering changes item statuses in the context, so each run filters a new context and the fastest run is reported.
+    seconds = []
+    for _ in range(repeat):
+        ctx = _create_context(count)
+        seconds.append(measure(lambda: hook.ExecuteAsync(ctx, CancellationToken(False)).GetAwaiter().GetResult()))
+
+    return min(seconds)
+
+
+def _count_calls(callback, is_batch: bool, count: int) -> int:
+    # Calls are counted in a separate untimed run so counting does not add to the timings.
+    calls = [0]
+
+    def counted(items):
+        calls[0] += 1
+        return callback(items)
+
+    ctx = _create_context(count)
+    _create_hook(counted, is_batch).ExecuteAsync(ctx, CancellationToken(False)).GetAwaiter().GetResult()
+    return calls[0]
+
+
+def _filter_item(item) -> bool:
+    return not item.source_item.content_url.endswith("0")
+
+
+def _filter_batch(items) -> list[bool]:
+    return [not item.source_item.content_url.endswith("0") for item in items]
+
+
+def main(count: int = 10_000, repeat: int = 5) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of content items to filter.
+        repeat: The number of runs of each filter, the fastest of which is reported.
+    """
+    per_item_seconds = _run(_create_hook(_filter_item, False), count, repeat)
+    batch_seconds = _run(_create_hook(_filter_batch, True), count, repeat)
+
+    report("filter_batch", {
+        "items": count,
+        "per_item_python_calls": _count_calls(_filter_item, False, count),
+        "batch_python_calls": _count_calls(_filter_batch, True, count),
+        "per_item_seconds": per_item_seconds,
+        "batch_seconds": batch_seconds,
+        "speedup": per_item_seconds / batch_seconds
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for finding all content references.
+
+Compares building the .NET result of a Python finder's find_all for 100,000 references
+with repeated ImmutableList.Add calls and with a single ImmutableArray builder.
+Also compares the peak Python memory of reading every reference through find_all and through iter_all pages.
+"""
+
+import tracemalloc
+from types import SimpleNamespace
+from uuid import uuid4
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration import PyContentReference # noqa: E402
+from tableau_migration.migration_content import PyUser # noqa: E402
+from tableau_migration.migration_content_search import PyContentReferenceFinder # noqa: E402
+from tableau_migration.migration_engine_endpoints_search import ( # noqa: E402
+    PySourceContentReferenceFinderBase,
+    _PySourceContentReferenceFinderWrapperBuilder
+)
+
+from System import Array, Guid # noqa: E402
+from System.Collections.Immutable import IImmutableList, ImmutableArray, ImmutableList # noqa: E402
+from System.Threading import CancellationToken # noqa: E402
+from System.Threading.Tasks import Task # noqa: E402
+from Tableau.Migration import ContentLocation, IContentReference # noqa: E402
+from Tableau.Migration.Content import ContentReferenceStub # noqa: E402
+
+
+def _run_build(references: list[PyContentReference]) -> dict:
+    def _repeated_add():
+        dotnet_list = ImmutableList[IContentReference].Empty
+        for item in references:
+            dotnet_list = dotnet_list.Add(item._dotnet)
+
+    class _Finder(PySourceContentReferenceFinderBase[PyUser]):
+        def find_all(self):
+            return references
+
+    find_all_async = _PySourceContentReferenceFinderWrapperBuilder(_Finder)._build_find_all_async()
+    wrapper = SimpleNamespace(_inner=_Finder())
+
+    return {
+        "repeated_add_seconds": measure(_repeated_add),
+        "builder_seconds": measure(lambda: find_all_async(wrapper, CancellationToken(False)).Result)
+    }
+
+
+def _peak_memory(action) -> int:
+    tracemalloc.start()
+    try:
+        action()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _run_read(references: list[PyContentReference], page_size: int) -> dict:
+    result = ImmutableArray.Create[IContentReference](Array[IContentReference]([r._dotnet for r in references]))
+    finder = PyContentReferenceFinder(SimpleNamespace(FindAllAsync=lambda cancel: Task.FromResult[IImmutableList[IContentReference]](result)))
+
+    def _read_list():
+        for reference in finder.find_all():
+            reference.name
+
+    def _read_pages():
+        for page in finder.iter_all(page_size=page_size):
+            for reference in page:
+                reference.name
+
+    return {
+        "find_all": {"seconds": measure(_read_list), "peak_bytes": _peak_memory(_read_list)},
+        "iter_all": {"seconds": measure(_read_pages), "peak_bytes": _peak_memory(_read_pages)}
+    }
+
+
+def main(count: int = 100_000, page_size: int = 1_000) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of content references.
+        page_size: The iter_all page size.
+    """
+    references = [PyContentReference(ContentReferenceStub(Guid.Parse(str(uuid4())), "", ContentLocation.FromPath(f"Domain/user{i}", "/")))
+                  for i in range(count)]
+
+    report("find_all", {
+        "items": count,
+        "page_size": page_size,
+        "build": _run_build(references),
+        "read": _run_read(references, page_size)
+    })
+
+
+if __name__ == "__main__":
+    main()
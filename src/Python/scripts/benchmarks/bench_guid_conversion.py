@@ -0,0 +1,67 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for Guid and UUID conversions.
+
+Compares converting 1,000,000 .NET Guids to Python UUIDs and back through GUID strings,
+as the generated wrappers did, with copying the 16 bytes of each value.
+"""
+
+from uuid import UUID, uuid4
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration_interop import _to_dotnet_guid, _wrap_guid # noqa: E402
+
+from System import Guid # noqa: E402
+from System.Collections.Generic import List as DotnetList # noqa: E402
+
+
+def _run_to_python(guids: DotnetList) -> dict:
+    items = list(guids)
+
+    return {
+        "string_seconds": measure(lambda: [UUID(g.ToString()) for g in items]),
+        "bytes_seconds": measure(lambda: [_wrap_guid(g) for g in items])
+    }
+
+
+def _run_to_dotnet(uuids: list[UUID]) -> dict:
+    return {
+        "string_seconds": measure(lambda: [Guid.Parse(str(u)) for u in uuids]),
+        "bytes_seconds": measure(lambda: [_to_dotnet_guid(u) for u in uuids])
+    }
+
+
+def main(count: int = 1_000_000) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of values to convert in each direction.
+    """
+    guids = DotnetList[Guid](count)
+    for _ in range(count):
+        guids.Add(Guid.NewGuid())
+
+    report("guid_conversion", {
+        "items": count,
+        "to_python": _run_to_python(guids),
+        "to_dotnet": _run_to_dotnet([uuid4() for _ in range(count)])
+    })
+
+
+if __name__ == "__main__":
+    main()
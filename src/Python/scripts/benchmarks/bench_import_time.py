@@ -0,0 +1,80 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for importing the Migration SDK package.
+
+Compares the time for a new Python process to import tableau_migration eagerly and in lazy import mode,
+and in lazy import mode the time for the first use of MigrationPlanBuilder and MigrationManifestSerializer.
+Each process reports its own timings, so interpreter startup is not included.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmark_helpers import report
+
+_SCRIPT = """
+import json
+import time
+
+start = time.perf_counter()
+import tableau_migration
+imported = time.perf_counter()
+
+tableau_migration.MigrationPlanBuilder()
+planned = time.perf_counter()
+
+tableau_migration.MigrationManifestSerializer()
+manifest = time.perf_counter()
+
+print(json.dumps({"import": imported - start, "plan_builder": planned - imported, "manifest_serializer": manifest - planned}))
+"""
+
+
+def _run_process(lazy: bool) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    if lazy:
+        env["TABLEAU_MIGRATION_LAZY_IMPORT"] = "1"
+    else:
+        env.pop("TABLEAU_MIGRATION_LAZY_IMPORT", None)
+
+    result = subprocess.run([sys.executable, "-c", _SCRIPT], env=env, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _run(lazy: bool, repeat: int) -> dict:
+    runs = [_run_process(lazy) for _ in range(repeat)]
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def main(repeat: int = 5) -> None:
+    """Runs the benchmark.
+
+    Args:
+        repeat: The number of processes to start for each mode. Median timings are reported.
+    """
+    report("import_time", {
+        "processes": repeat,
+        "eager_seconds": _run(False, repeat),
+        "lazy_seconds": _run(True, repeat)
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for location prefix lookups.
+
+Compares checking whether 10,000 workbook locations are within any of 100 skipped projects
+by comparing PyContentLocation.path_segments lists against each project, as location-based hooks did,
+and by a LocationIndex built once from the project locations.
+"""
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration import PyContentLocation # noqa: E402
+from tableau_migration.migration_location_index import LocationIndex # noqa: E402
+
+
+def _run_list_compare(locations: list[PyContentLocation], projects: list[PyContentLocation]) -> dict:
+    project_segments = [p.path_segments for p in projects]
+
+    def _check_all():
+        skipped = 0
+        for location in locations:
+            segments = location.path_segments
+            if any(segments[:len(p)] == p for p in project_segments):
+                skipped += 1
+        return skipped
+
+    return {"seconds": measure(_check_all)}
+
+
+def _run_index(locations: list[PyContentLocation], projects: list[PyContentLocation]) -> dict:
+    build_seconds = measure(lambda: LocationIndex(projects))
+    index = LocationIndex(projects)
+
+    def _check_all():
+        return sum(1 for location in locations if index.has_ancestor(location))
+
+    return {"build_seconds": build_seconds, "seconds": measure(_check_all)}
+
+
+def main(count: int = 10_000, project_count: int = 100) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of workbook locations to check.
+        project_count: The number of skipped project locations.
+    """
+    projects = [PyContentLocation.from_path(f"Root/Department {i}/Skipped", "/") for i in range(project_count)]
+    locations = [PyContentLocation.from_path(f"Root/Department {i % (project_count * 2)}/{'Skipped' if i % 3 else 'Kept'}/Workbook {i}", "/") for i in range(count)]
+
+    report("location_index", {
+        "items": count,
+        "projects": project_count,
+        "list_compare": _run_list_compare(locations, projects),
+        "index": _run_index(locations, projects)
+    })
+
+
+if __name__ == "__main__":
+    main()
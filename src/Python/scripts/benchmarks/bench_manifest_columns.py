@@ -0,0 +1,83 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for reading manifest entries into columns for analysis.
+
+Compares building Python column lists from 1,000,000 manifest entries by wrapping each entry,
+with copying the columns through MigrationManifest.to_columns, and converting the columns to Python lists and to an Arrow table.
+"""
+
+import os
+import tempfile
+
+from benchmark_helpers import measure, report, write_manifest
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration_engine_manifest import PyMigrationManifestEntry, PyMigrationManifestSerializer # noqa: E402
+
+
+def _run_wrappers(manifest) -> dict:
+    def _read_all():
+        columns = {"content_type": [], "source_id": [], "source_location": [], "destination_id": [], "status": [], "error_count": [], "skipped_reason": []}
+        for content_type in manifest.entries.GetPartitionTypes():
+            for dotnet_entry in manifest.entries.ForContentType(content_type):
+                entry = PyMigrationManifestEntry(dotnet_entry)
+                columns["content_type"].append(content_type.Name)
+                columns["source_id"].append(entry.source.id)
+                columns["source_location"].append(entry.source.location.path)
+                columns["destination_id"].append(None if entry.destination is None else entry.destination.id)
+                columns["status"].append(entry.status)
+                columns["error_count"].append(len(entry.errors))
+                columns["skipped_reason"].append(entry.skipped_reason or None)
+
+    return {"seconds": measure(_read_all)}
+
+
+def _run_columns(manifest) -> dict:
+    results = {"to_columns_seconds": measure(manifest.to_columns)}
+
+    columns = manifest.to_columns()
+    results["to_dict_seconds"] = measure(columns.to_dict)
+
+    try:
+        results["to_arrow_seconds"] = measure(columns.to_arrow)
+    except ImportError:
+        results["to_arrow_seconds"] = None
+
+    return results
+
+
+def main(count: int = 1_000_000) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of manifest entries.
+    """
+    serializer = PyMigrationManifestSerializer()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "manifest.json")
+        write_manifest(path, serializer.get_supported_manifest_version(), count)
+        manifest = serializer.load(path)
+
+    report("manifest_columns", {
+        "entries": count,
+        "wrappers": _run_wrappers(manifest),
+        "columns": _run_columns(manifest)
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for saving and loading sharded migration manifests.
+
+Compares saving and loading a manifest with 1,000,000 entries as a single JSON file,
+with the sharded format that reads and writes one file per content type partition in parallel,
+and with loading only the workbook partition from the sharded format.
+"""
+
+import os
+import tempfile
+
+from benchmark_helpers import measure, report, write_manifest
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration_content import PyWorkbook # noqa: E402
+from tableau_migration.migration_engine_manifest import PyMigrationManifestSerializer # noqa: E402
+
+
+def _run_single_file(serializer, manifest, temp_dir: str) -> dict:
+    path = os.path.join(temp_dir, "single", "manifest.json")
+    results = {"save_seconds": measure(lambda: serializer.save(manifest, path))}
+    results["load_seconds"] = measure(lambda: serializer.load(path))
+    return results
+
+
+def _run_sharded(serializer, manifest, temp_dir: str) -> dict:
+    directory = os.path.join(temp_dir, "sharded")
+    results = {"save_seconds": measure(lambda: serializer.save_sharded(manifest, directory))}
+    results["load_seconds"] = measure(lambda: serializer.load_sharded(directory))
+    results["load_workbooks_seconds"] = measure(lambda: serializer.load_sharded(directory, [PyWorkbook]))
+    return results
+
+
+def main(count: int = 1_000_000) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of manifest entries.
+    """
+    serializer = PyMigrationManifestSerializer()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "source.json")
+        write_manifest(path, serializer.get_supported_manifest_version(), count)
+        manifest = serializer.load(path)
+
+        report("manifest_sharded", {
+            "entries": count,
+            "single_file": _run_single_file(serializer, manifest, temp_dir),
+            "sharded": _run_sharded(serializer, manifest, temp_dir)
+        })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for Python mapping hooks.
+
+Compares mapping 10,000 usernames with a per-item mapping callback, dispatched once per item like the migration engine did,
+and a batch mapping callback called once for the page, counting the number of times .NET calls into Python for each.
+"""
+
+from uuid import uuid4
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration import PyContentLocation, PyContentReference # noqa: E402
+from tableau_migration.migration_engine_hooks_mappings_builder import PyContentMappingBuilder # noqa: E402
+
+from System import Guid # noqa: E402
+from System.Collections.Generic import List as DotnetList # noqa: E402
+from System.Threading import CancellationToken # noqa: E402
+from Tableau.Migration import ContentLocation, IContentReference # noqa: E402
+from Tableau.Migration.Content import ContentReferenceStub # noqa: E402
+from Tableau.Migration.Engine.Hooks.Mappings import ContentMappingBuilder, ContentMappingContext, IContentBatchMapping, IContentMapping # noqa: E402
+
+
+def _create_contexts(count: int) -> DotnetList:
+    contexts = DotnetList[ContentMappingContext[IContentReference]]()
+    for i in range(count):
+        location = ContentLocation.ForUsername("domain", f"user{i}")
+        stub = ContentReferenceStub(Guid.Parse(str(uuid4())), f"user{i}", location)
+        contexts.Add(ContentMappingContext[IContentReference](stub, location))
+
+    return contexts
+
+
+def _get_factory(callback, is_batch: bool):
+    hook_builder = PyContentMappingBuilder(ContentMappingBuilder())
+    hook_builder.add(PyContentReference, callback, is_batch=is_batch)
+
+    return hook_builder.build().get_hooks(IContentMapping[IContentReference])[0]
+
+
+def _run_per_item(factory, contexts, calls: list[int]) -> dict:
+    def _map_all():
+        for ctx in contexts:
+            hook = factory.Create[IContentMapping[IContentReference]](None)
+            hook.ExecuteAsync(ctx, CancellationToken(False)).GetAwaiter().GetResult()
+
+    calls[0] = 0
+    seconds = measure(_map_all)
+
+    return {"python_calls": calls[0], "seconds": seconds}
+
+
+def _run_batch(factory, contexts, calls: list[int]) -> dict:
+    def _map_batch():
+        hook = factory.Create[IContentBatchMapping[IContentReference]](None)
+        hook.ExecuteBatchAsync(contexts, CancellationToken(False)).GetAwaiter().GetResult()
+
+    calls[0] = 0
+    seconds = measure(_map_batch)
+
+    return {"python_calls": calls[0], "seconds": seconds}
+
+
+def main(count: int = 10_000) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of content items to map.
+    """
+    calls = [0]
+
+    def map_item(ctx):
+        calls[0] += 1
+        return ctx.map_to(PyContentLocation.for_username("newdomain", ctx.content_item.name))
+
+    def map_batch(contexts):
+        calls[0] += 1
+        return [PyContentLocation.for_username("newdomain", ctx.content_item.name) for ctx in contexts]
+
+    contexts = _create_contexts(count)
+    report("mapping_batch", {
+        "items": count,
+        "per_item": _run_per_item(_get_factory(map_item, False), contexts, calls),
+        "batch": _run_batch(_get_factory(map_batch, True), contexts, calls)
+    })
+
+
+if __name__ == "__main__":
+    main()
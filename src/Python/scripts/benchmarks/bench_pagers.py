@@ -0,0 +1,91 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for Python content pagers.
+
+Compares paging through 200,000 content references created by a Python loader with a per-item .NET list,
+memory_pager's single array conversion, and streaming_pager reading pages from a generator,
+measuring time and peak Python memory for each.
+"""
+
+import tracemalloc
+from typing import Iterator
+from uuid import uuid4
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration import PyContentReference # noqa: E402
+from tableau_migration.migration_interop import _unwrap # noqa: E402
+from tableau_migration.migration_paging import memory_pager, streaming_pager # noqa: E402
+
+from System import Guid # noqa: E402
+from System.Collections.Generic import List as DotnetList # noqa: E402
+from System.Threading import CancellationToken # noqa: E402
+from Tableau.Migration import ContentLocation, IContentReference # noqa: E402
+from Tableau.Migration.Content import ContentReferenceStub # noqa: E402
+from Tableau.Migration.Paging import MemoryPager # noqa: E402
+
+
+def _load(count: int) -> Iterator[PyContentReference]:
+    for i in range(count):
+        yield PyContentReference(ContentReferenceStub(Guid.Parse(str(uuid4())), f"item{i}", ContentLocation.ForUsername("domain", f"item{i}")))
+
+
+def _read_all(pager) -> None:
+    cancel = CancellationToken(False)
+    while not pager.NextPageAsync(cancel).GetAwaiter().GetResult().FetchedAllPages:
+        pass
+
+
+def _per_item_pager(count: int, page_size: int):
+    dotnet_list = DotnetList[IContentReference]()
+    for item in list(_load(count)):
+        dotnet_list.Add(_unwrap(item))
+
+    return MemoryPager[IContentReference](dotnet_list, page_size)
+
+
+def _run(create_pager) -> dict:
+    seconds = measure(lambda: _read_all(create_pager()))
+
+    tracemalloc.start()
+    try:
+        _read_all(create_pager())
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": seconds, "peak_bytes": peak_bytes}
+
+
+def main(count: int = 200_000, page_size: int = 1_000) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of content references to page through.
+        page_size: The pager page size.
+    """
+    report("pagers", {
+        "items": count,
+        "page_size": page_size,
+        "per_item_list": _run(lambda: _per_item_pager(count, page_size)),
+        "memory_pager": _run(lambda: memory_pager(PyContentReference, list(_load(count)), page_size)),
+        "streaming_pager": _run(lambda: streaming_pager(PyContentReference, _load(count), page_size))
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for running XML transformers in a process pool.
+
+Runs a CPU-heavy XML transformer over a set of synthetic workbooks from several threads, like parallel migration batch items:
+    - inline: each thread runs the transformer itself, so the threads contend for the GIL.
+    - process_N: each thread submits the transformer to a process pool with N workers, 
+      from 1 worker up to the number of processors.
+
+Throughput is reported in workbooks per second.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+from xml.etree import ElementTree
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_transformers_process import ( # noqa: E402
+    TransformItemInfo,
+    _transform_xml_text,
+    create_transformer_process_pool
+)
+
+_COLUMN = "    <column caption='Column {0}' datatype='string' name='[Column {0}]' role='dimension' type='nominal' />\n"
+
+
+def _create_workbook(columns: int) -> str:
+    content = "".join(_COLUMN.format(i) for i in range(columns))
+    return f"<workbook version='18.1'>\n  <datasource name='ds'>\n{content}  </datasource>\n</workbook>\n"
+
+
+def transform_captions(info: TransformItemInfo, xml: ElementTree.Element) -> None:
+    """Rewrites every column caption several times to simulate a CPU-heavy transformer."""
+    for column in xml.iter("column"):
+        caption = column.get("caption")
+        for _ in range(20):
+            caption = caption.swapcase()
+        column.set("caption", caption.title())
+
+
+def _run(workbooks: list[str], threads: int, submit) -> float:
+    info = TransformItemInfo(uuid4(), "workbook", "workbook", "project/workbook")
+
+    def _transform_all() -> None:
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(lambda text: submit(info, text), workbooks))
+
+    return len(workbooks) / measure(_transform_all)
+
+
+def main(workbook_count: int = 64, columns: int = 2000, threads: int = 8) -> None:
+    """Runs the benchmark.
+
+    Args:
+        workbook_count: The number of workbooks to transform for each mode.
+        columns: The number of columns in each workbook.
+        threads: The number of threads transforming workbooks, like the migration parallelism.
+    """
+    workbooks = [_create_workbook(columns)] * workbook_count
+
+    results = {"inline": _run(workbooks, threads, lambda info, text: _transform_xml_text(transform_captions, False, info, text))}
+
+    cpu_count = os.cpu_count() or 1
+    for workers in sorted({min(2 ** i, cpu_count) for i in range(cpu_count.bit_length() + 1)}):
+        with create_transformer_process_pool(workers) as executor:
+            # Start the workers before measuring.
+            list(executor.map(abs, range(workers)))
+            results[f"process_{workers}"] = _run(workbooks, threads, 
+                lambda info, text: executor.submit(_transform_xml_text, transform_captions, False, info, text).result())
+
+    report("transformer_executor", {"workbooks_per_second": results, "cpu_count": cpu_count})
+
+
+if __name__ == "__main__":
+    main()
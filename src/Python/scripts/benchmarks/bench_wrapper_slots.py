@@ -0,0 +1,87 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for slotted wrapper objects.
+
+Compares the Python memory used by 100,000 content reference wrappers with and without an instance dictionary,
+and reading the id 10 times from each wrapper by converting the .NET Guid on every access, as the generated getters did,
+and through the cached property.
+"""
+
+import tracemalloc
+from uuid import UUID, uuid4
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration import PyContentReference # noqa: E402
+
+from System import Guid # noqa: E402
+from Tableau.Migration import ContentLocation # noqa: E402
+from Tableau.Migration.Content import ContentReferenceStub # noqa: E402
+
+
+class _PyDictContentReference(PyContentReference):
+    """Content reference wrapper without __slots__, so objects have an instance dictionary like unslotted wrappers."""
+
+
+def _memory(wrapper_type: type, dotnet_references: list) -> dict:
+    tracemalloc.start()
+    try:
+        wrappers = [wrapper_type(x) for x in dotnet_references]
+        for wrapper in wrappers:
+            wrapper.id
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return {"bytes": size, "bytes_per_wrapper": size / len(wrappers)}
+
+
+def _run_ids(references: list[PyContentReference], reads: int) -> dict:
+    def _read_uncached():
+        for reference in references:
+            for _ in range(reads):
+                UUID(reference._dotnet.Id.ToString())
+
+    def _read_cached():
+        for reference in references:
+            for _ in range(reads):
+                reference.id
+
+    return {"uncached_seconds": measure(_read_uncached), "cached_seconds": measure(_read_cached)}
+
+
+def main(count: int = 100_000, reads: int = 10) -> None:
+    """Runs the benchmark.
+
+    Args:
+        count: The number of wrappers.
+        reads: The number of times the id is read from each wrapper.
+    """
+    location = ContentLocation.FromPath("Root/Project/Workbook", "/")
+    dotnet_references = [ContentReferenceStub(Guid.Parse(str(uuid4())), "", location) for _ in range(count)]
+
+    report("wrapper_slots", {
+        "items": count,
+        "reads": reads,
+        "dict_memory": _memory(_PyDictContentReference, dotnet_references),
+        "slots_memory": _memory(PyContentReference, dotnet_references),
+        "id": _run_ids([PyContentReference(x) for x in dotnet_references], reads)
+    })
+
+
+if __name__ == "__main__":
+    main()
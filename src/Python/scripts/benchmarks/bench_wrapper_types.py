@@ -0,0 +1,79 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for generic wrapper type resolution.
+
+Compares resolving every registered .NET type to its wrapper type:
+    - legacy: scanning all loaded modules with inspect.getmembers on every new type.
+    - cold: the first resolution after the registry is cleared, including indexing the loaded modules.
+    - warm: resolution once the registry and the resolved type cache are populated.
+"""
+
+import inspect
+import sys
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration import migration # noqa: E402
+
+import System # noqa: E402
+
+
+def _legacy_find_wrapper_type(search_type: type):
+    for module in list(sys.modules.values()):
+        for member in inspect.getmembers(module, inspect.isclass):
+            t = member[1]
+            if hasattr(t, "_dotnet_base"):
+                if issubclass(type(search_type), System.Type) and search_type.Equals(t._dotnet_base):
+                    return t
+                elif t._dotnet_base == search_type:
+                    return t
+
+    return None
+
+
+def _resolve_all(find: callable, dotnet_types: list) -> None:
+    for t in dotnet_types:
+        find(t)
+
+
+def main(repeat: int = 1000) -> None:
+    """Runs the benchmark.
+
+    Args:
+        repeat: The number of warm resolution passes to run.
+    """
+    dotnet_types = [t._dotnet_base for t in set(migration._wrapper_types.values())]
+
+    legacy = measure(lambda: _resolve_all(_legacy_find_wrapper_type, dotnet_types))
+
+    migration._clear_wrapper_types()
+    cold = measure(lambda: _resolve_all(migration._generic_wrapper_type, dotnet_types))
+
+    warm = measure(lambda: _resolve_all(migration._generic_wrapper_type, dotnet_types), repeat) / repeat
+
+    report("wrapper_types", {
+        "loaded_modules": len(sys.modules),
+        "types": len(dotnet_types),
+        "legacy_seconds": legacy,
+        "cold_seconds": cold,
+        "warm_seconds": warm,
+        "warm_per_lookup_microseconds": warm / len(dotnet_types) * 1_000_000
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for XML transformers.
+
+Compares one transformer pass that renames every column caption over synthetic workbooks of 1, 10 and 50 MB:
+    - copy: the default mode, which serializes the XML to an ElementTree copy and parses it back afterwards.
+    - live: the live_xml mode, which edits the XML document in place through PyXmlElement.
+"""
+
+import tracemalloc
+
+from benchmark_helpers import measure, report
+
+import tableau_migration # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_transformers_interop import ( # noqa: E402
+    _PyLiveXmlTransformerWrapperBuilder,
+    _PyXmlTransformerWrapperBuilder
+)
+
+from System.Xml.Linq import LoadOptions, XDocument # noqa: E402
+
+_COLUMN = "    <column caption='Column {0}' datatype='string' name='[Column {0}]' role='dimension' type='nominal' />\n"
+
+
+def _create_workbook(size_mb: int) -> str:
+    count = size_mb * 1024 * 1024 // len(_COLUMN.format(0))
+    columns = "".join(_COLUMN.format(i) for i in range(count))
+    return f"<?xml version='1.0' encoding='utf-8' ?>\n<workbook version='18.1'>\n  <datasource name='ds'>\n{columns}  </datasource>\n</workbook>\n"
+
+
+def _transform(builder: type, text: str) -> None:
+    xml = XDocument.Parse(text, LoadOptions.PreserveWhitespace)
+    py_xml = builder.read_xml(xml)
+    for column in py_xml.iter("column"):
+        column.set("caption", column.get("caption").upper())
+    builder.write_xml(xml, py_xml)
+
+
+def _measure_mode(builder: type, text: str, repeat: int) -> dict:
+    tracemalloc.start()
+    seconds = measure(lambda: _transform(builder, text), repeat) / repeat
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"seconds": seconds, "python_peak_mb": peak / (1024 * 1024)}
+
+
+def main(sizes_mb: tuple[int, ...] = (1, 10, 50), repeat: int = 3) -> None:
+    """Runs the benchmark.
+
+    Args:
+        sizes_mb: The workbook sizes to measure, in megabytes.
+        repeat: The number of transformer passes to average for each size and mode.
+    """
+    results = {}
+    for size_mb in sizes_mb:
+        text = _create_workbook(size_mb)
+        results[f"{size_mb}mb"] = {
+            "copy": _measure_mode(_PyXmlTransformerWrapperBuilder, text, repeat),
+            "live": _measure_mode(_PyLiveXmlTransformerWrapperBuilder, text, repeat)
+        }
+
+    report("xml_transformer", results)
+
+
+if __name__ == "__main__":
+    main()
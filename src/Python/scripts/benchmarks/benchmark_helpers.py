@@ -0,0 +1,108 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helpers for the Migration SDK Python microbenchmarks.
+
+Benchmarks import the package from the local source tree, so the .NET binaries must already be built
+(see scripts/build_binaries.py).
+"""
+
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.append(str(Path(__file__).parent.parent.parent.resolve() / "src"))
+
+
+def measure(action: Callable[[], Any], repeat: int = 1) -> float:
+    """Measures the total time to run an action a number of times.
+
+    Args:
+        action: The action to measure.
+        repeat: The number of times to run the action.
+
+    Returns: The elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return time.perf_counter() - start
+
+
+def report(name: str, results: dict[str, Any]) -> None:
+    """Prints benchmark results as a single JSON document.
+
+    Args:
+        name: The benchmark name.
+        results: The benchmark results.
+    """
+    print(json.dumps({"benchmark": name, "results": results}, indent=2))
+
+
+def write_manifest(path: str, manifest_version: int, count: int,
+                   content_types: tuple[str, ...] = ("IUser", "IGroup", "IProject", "IWorkbook")) -> None:
+    """Writes a synthetic migration manifest in the JSON format of MigrationManifestSerializer.
+
+    Entries are spread evenly over the content types, with a mix of migrated, skipped and error statuses.
+
+    Args:
+        path: The file path to write the manifest to.
+        manifest_version: The manifest version supported by the serializer.
+        count: The total number of entries.
+        content_types: The content type interface names in the Tableau.Migration.Content namespace.
+    """
+    def _reference(name: str, segments: list[str]) -> dict:
+        return {
+            "Id": str(uuid.uuid4()),
+            "ContentUrl": name,
+            "Location": _location(segments),
+            "Name": name
+        }
+
+    def _location(segments: list[str]) -> dict:
+        return {"PathSegments": segments, "PathSeparator": "/", "Path": "/".join(segments), "Name": segments[-1], "IsEmpty": False}
+
+    def _entry(i: int) -> dict:
+        segments = [f"Project {i % 100}", f"Item {i}"]
+        status = ("Migrated", "Skipped", "Error")[i % 3]
+        return {
+            "Source": _reference(f"Item {i}", segments),
+            "MappedLocation": _location(segments),
+            "Destination": _reference(f"Item {i}", segments) if status == "Migrated" else None,
+            "Status": status,
+            "SkippedReason": "Filtered" if status == "Skipped" else None,
+            "HasMigrated": status == "Migrated",
+            "Errors": []
+        }
+
+    entries = {f"Tableau.Migration.Content.{t}": [] for t in content_types}
+    keys = list(entries)
+    for i in range(count):
+        entries[keys[i % len(keys)]].append(_entry(i))
+
+    manifest = {
+        "PlanId": str(uuid.uuid4()),
+        "MigrationId": str(uuid.uuid4()),
+        "PipelineProfile": "ServerToCloud",
+        "Errors": [],
+        "Entries": entries,
+        "ManifestVersion": manifest_version
+    }
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file)
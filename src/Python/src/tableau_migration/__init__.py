@@ -44,151 +44,77 @@ _services = None
 _service_collection = None
 _logger_names = [] # List of logger names
 
-from tableau_migration.migration import (_initialize) # noqa: E402
-_initialize()
+# Lazy import mode defers building the DI container until the first service access,
+# and importing the wrapper modules until their friendly names are first accessed.
+# This reduces startup time for tools that only use part of the SDK.
+_lazy_import = os.environ.get("TABLEAU_MIGRATION_LAZY_IMPORT", "").strip().lower() in ("1", "true", "yes")
+
+if not _lazy_import:
+    from tableau_migration.migration import (_initialize) # noqa: E402
+    _initialize()
 
 # Create out global default cancellation token
 from System.Threading import CancellationTokenSource # noqa: E402 
 cancellation_token_source = CancellationTokenSource()
 cancellation_token = cancellation_token_source.Token
 
-# Friendly renames for common top-level imports
-from tableau_migration.migration import PyMigrationResult as MigrationResult # noqa: E402, F401
-from tableau_migration.migration_engine import PyMigrationPlanBuilder as MigrationPlanBuilder # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_filters_interop import PyContentFilterBase as ContentFilterBase # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_interop import ( # noqa: E402, F401
-    PyContentBatchMigrationCompletedHookBase as ContentBatchMigrationCompletedHookBase,
-    PyInitializeMigrationHookBase as InitializeMigrationHookBase,
-    PyMigrationActionCompletedHookBase as MigrationActionCompletedHookBase
-)
-from tableau_migration.migration_engine_hooks_mappings_interop import ( # noqa: E402, F401
-    PyContentMappingBase as ContentMappingBase,
-    PyTableauCloudUsernameMappingBase as TableauCloudUsernameMappingBase
-)
-from tableau_migration.migration_engine_hooks_postpublish_interop import ( # noqa: E402, F401
-    PyBulkPostPublishHookBase as BulkPostPublishHookBase,
-    PyContentItemPostPublishHookBase as ContentItemPostPublishHookBase
-)
-from tableau_migration.migration_engine_hooks_pulled_interop import ( # noqa: E402, F401
-    PyContentItemPulledHookBase as ContentItemPulledHookBase
-)
-from tableau_migration.migration_engine_hooks_initializemigration import PyInitializeMigrationHookResult as IInitializeMigrationHookResult # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_transformers_interop import ( # noqa: E402, F401
-    PyContentTransformerBase as ContentTransformerBase,
-    PyJsonContentTransformerBase as JsonContentTransformerBase,
-    PyXmlContentTransformerBase as XmlContentTransformerBase
-)
-from tableau_migration.migration_engine_migrators import PyMigrator as Migrator # noqa: E402, F401
-from tableau_migration.migration_engine_endpoints_caching import ( # noqa: E402, F401
-    BulkContentReferenceCacheLoadStrategyProvider,
-    LazyContentReferenceCacheLoadStrategyProvider,
-    ContentReferenceCacheLoadStrategyProviderBase
-)
-from tableau_migration.migration_engine_endpoints_search import PyDestinationContentReferenceFinder as IDestinationContentReferenceFinder # noqa: E402, F401
-from tableau_migration.migration_engine_endpoints_search import PyDestinationContentReferenceFinderFactory as IDestinationContentReferenceFinderFactory # noqa: E402, F401
-from tableau_migration.migration_engine_endpoints_search import PySourceContentReferenceFinder as ISourceContentReferenceFinder # noqa: E402, F401
-from tableau_migration.migration_engine_endpoints_search import PySourceContentReferenceFinderFactory as ISourceContentReferenceFinderFactory # noqa: E402, F401
-from tableau_migration.migration_content_schedules_cloud import PyCloudExtractRefreshTask as ICloudExtractRefreshTask # noqa: E402, F401
-from tableau_migration.migration_content_schedules_server import PyServerExtractRefreshTask as IServerExtractRefreshTask # noqa: E402, F401
-from tableau_migration.migration_engine_manifest import PyMigrationManifest as MigrationManifest # noqa: E402, F401
-from tableau_migration.migration_engine_manifest import PyMigrationManifestSerializer as MigrationManifestSerializer # noqa: E402, F401
-from tableau_migration.migration_engine_endpoints_search import PyDestinationContentReferenceFinderBase as DestinationContentReferenceFinderBase # noqa: E402, F401
-from tableau_migration.migration_engine_endpoints_search import PySourceContentReferenceFinderBase as SourceContentReferenceFinderBase # noqa: E402, F401
-from tableau_migration.migration_engine_services import PyMigrationContentLoaderBase as MigrationContentLoaderBase # noqa: E402, F401
-from tableau_migration.migration_paging import empty_pager, memory_pager # noqa: E402, F401
-
-# region _generated
-
-from tableau_migration.migration import PyContentLocation as ContentLocation # noqa: E402, F401
-from tableau_migration.migration import PyContentReference as IContentReference # noqa: E402, F401
-from tableau_migration.migration import PyEmptyIdContentReference as IEmptyIdContentReference # noqa: E402, F401
-from tableau_migration.migration import PyMigrationCompletionStatus as MigrationCompletionStatus # noqa: E402, F401
-from tableau_migration.migration import PyPipelineProfile as PipelineProfile # noqa: E402, F401
-from tableau_migration.migration import PyResult as IResult # noqa: E402, F401
-from tableau_migration.migration_api_rest import PyRestIdentifiable as IRestIdentifiable # noqa: E402, F401
-from tableau_migration.migration_api_rest_models import PyAdministratorLevels as AdministratorLevels # noqa: E402, F401
-from tableau_migration.migration_api_rest_models import PyContentPermissions as ContentPermissions # noqa: E402, F401
-from tableau_migration.migration_api_rest_models import PyExtractEncryptionModes as ExtractEncryptionModes # noqa: E402, F401
-from tableau_migration.migration_api_rest_models import PyLabelCategories as LabelCategories # noqa: E402, F401
-from tableau_migration.migration_api_rest_models import PyLicenseLevels as LicenseLevels # noqa: E402, F401
-from tableau_migration.migration_api_rest_models import PyPermissionsCapabilityModes as PermissionsCapabilityModes # noqa: E402, F401
-from tableau_migration.migration_api_rest_models import PyPermissionsCapabilityNames as PermissionsCapabilityNames # noqa: E402, F401
-from tableau_migration.migration_api_rest_models import PySiteRoles as SiteRoles # noqa: E402, F401
-from tableau_migration.migration_api_rest_models_types import PyAuthenticationTypes as AuthenticationTypes # noqa: E402, F401
-from tableau_migration.migration_api_rest_models_types import PyDataSourceFileTypes as DataSourceFileTypes # noqa: E402, F401
-from tableau_migration.migration_api_rest_models_types import PyFlowFileTypes as FlowFileTypes # noqa: E402, F401
-from tableau_migration.migration_api_rest_models_types import PyWorkbookFileTypes as WorkbookFileTypes # noqa: E402, F401
-from tableau_migration.migration_content import PyCloudSubscription as ICloudSubscription # noqa: E402, F401
-from tableau_migration.migration_content import PyConnection as IConnection # noqa: E402, F401
-from tableau_migration.migration_content import PyConnectionsContent as IConnectionsContent # noqa: E402, F401
-from tableau_migration.migration_content import PyContainerContent as IContainerContent # noqa: E402, F401
-from tableau_migration.migration_content import PyCustomView as ICustomView # noqa: E402, F401
-from tableau_migration.migration_content import PyDataSource as IDataSource # noqa: E402, F401
-from tableau_migration.migration_content import PyDataSourceDetails as IDataSourceDetails # noqa: E402, F401
-from tableau_migration.migration_content import PyDescriptionContent as IDescriptionContent # noqa: E402, F401
-from tableau_migration.migration_content import PyExtractContent as IExtractContent # noqa: E402, F401
-from tableau_migration.migration_content import PyFavorite as IFavorite # noqa: E402, F401
-from tableau_migration.migration_content import PyFavoriteContentType as FavoriteContentType # noqa: E402, F401
-from tableau_migration.migration_content import PyFlow as IFlow # noqa: E402, F401
-from tableau_migration.migration_content import PyFlowDetails as IFlowDetails # noqa: E402, F401
-from tableau_migration.migration_content import PyFlowOutputStep as IFlowOutputStep # noqa: E402, F401
-from tableau_migration.migration_content import PyGroup as IGroup # noqa: E402, F401
-from tableau_migration.migration_content import PyGroupSet as IGroupSet # noqa: E402, F401
-from tableau_migration.migration_content import PyGroupUser as IGroupUser # noqa: E402, F401
-from tableau_migration.migration_content import PyLabel as ILabel # noqa: E402, F401
-from tableau_migration.migration_content import PyProject as IProject # noqa: E402, F401
-from tableau_migration.migration_content import PyPublishableCustomView as IPublishableCustomView # noqa: E402, F401
-from tableau_migration.migration_content import PyPublishableDataSource as IPublishableDataSource # noqa: E402, F401
-from tableau_migration.migration_content import PyPublishableFlow as IPublishableFlow # noqa: E402, F401
-from tableau_migration.migration_content import PyPublishableGroup as IPublishableGroup # noqa: E402, F401
-from tableau_migration.migration_content import PyPublishableGroupSet as IPublishableGroupSet # noqa: E402, F401
-from tableau_migration.migration_content import PyPublishableWorkbook as IPublishableWorkbook # noqa: E402, F401
-from tableau_migration.migration_content import PyPublishedContent as IPublishedContent # noqa: E402, F401
-from tableau_migration.migration_content import PyServerSubscription as IServerSubscription # noqa: E402, F401
-from tableau_migration.migration_content import PySizeContent as ISizeContent # noqa: E402, F401
-from tableau_migration.migration_content import PySubscription as ISubscription # noqa: E402, F401
-from tableau_migration.migration_content import PySubscriptionContent as ISubscriptionContent # noqa: E402, F401
-from tableau_migration.migration_content import PyTag as ITag # noqa: E402, F401
-from tableau_migration.migration_content import PyUser as IUser # noqa: E402, F401
-from tableau_migration.migration_content import PyUserAuthenticationType as UserAuthenticationType # noqa: E402, F401
-from tableau_migration.migration_content import PyUsernameContent as IUsernameContent # noqa: E402, F401
-from tableau_migration.migration_content import PyView as IView # noqa: E402, F401
-from tableau_migration.migration_content import PyWithDomain as IWithDomain # noqa: E402, F401
-from tableau_migration.migration_content import PyWithOwner as IWithOwner # noqa: E402, F401
-from tableau_migration.migration_content import PyWithTags as IWithTags # noqa: E402, F401
-from tableau_migration.migration_content import PyWithWorkbook as IWithWorkbook # noqa: E402, F401
-from tableau_migration.migration_content import PyWorkbook as IWorkbook # noqa: E402, F401
-from tableau_migration.migration_content import PyWorkbookDetails as IWorkbookDetails # noqa: E402, F401
-from tableau_migration.migration_content_permissions import PyCapability as ICapability # noqa: E402, F401
-from tableau_migration.migration_content_permissions import PyGranteeCapability as IGranteeCapability # noqa: E402, F401
-from tableau_migration.migration_content_permissions import PyGranteeType as GranteeType # noqa: E402, F401
-from tableau_migration.migration_content_permissions import PyPermissions as IPermissions # noqa: E402, F401
-from tableau_migration.migration_content_permissions import PyPermissionSet as IPermissionSet # noqa: E402, F401
-from tableau_migration.migration_content_schedules import PyExtractRefreshContentType as ExtractRefreshContentType # noqa: E402, F401
-from tableau_migration.migration_content_schedules import PyExtractRefreshTask as IExtractRefreshTask # noqa: E402, F401
-from tableau_migration.migration_content_schedules import PyFrequencyDetails as IFrequencyDetails # noqa: E402, F401
-from tableau_migration.migration_content_schedules import PyInterval as IInterval # noqa: E402, F401
-from tableau_migration.migration_content_schedules import PySchedule as ISchedule # noqa: E402, F401
-from tableau_migration.migration_content_schedules import PyWithSchedule as IWithSchedule # noqa: E402, F401
-from tableau_migration.migration_content_schedules_cloud import PyCloudSchedule as ICloudSchedule # noqa: E402, F401
-from tableau_migration.migration_content_schedules_server import PyServerSchedule as IServerSchedule # noqa: E402, F401
-from tableau_migration.migration_content_search import PyContentReferenceFinder as IContentReferenceFinder # noqa: E402, F401
-from tableau_migration.migration_engine import PyContentMigrationItem as ContentMigrationItem # noqa: E402, F401
-from tableau_migration.migration_engine_actions import PyMigrationActionResult as IMigrationActionResult # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_filters import PyContentFilterContext as ContentFilterContext # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_filters import PyContentFilterContextItem as ContentFilterContextItem # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_filters import PyFilterStatus as FilterStatus # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_mappings import PyContentMappingContext as ContentMappingContext # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_postpublish import PyBulkPostPublishContext as BulkPostPublishContext # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_postpublish import PyContentItemPostPublishContext as ContentItemPostPublishContext # noqa: E402, F401
-from tableau_migration.migration_engine_hooks_pulled import PyContentItemPulledContext as ContentItemPulledContext # noqa: E402, F401
-from tableau_migration.migration_engine_manifest import PyMigrationManifestEntry as IMigrationManifestEntry # noqa: E402, F401
-from tableau_migration.migration_engine_manifest import PyMigrationManifestEntryEditor as IMigrationManifestEntryEditor # noqa: E402, F401
-from tableau_migration.migration_engine_manifest import PyMigrationManifestEntryStatus as MigrationManifestEntryStatus # noqa: E402, F401
-from tableau_migration.migration_engine_migrators import PyContentItemMigrationResult as IContentItemMigrationResult # noqa: E402, F401
-from tableau_migration.migration_engine_migrators_batch import PyContentBatchMigrationResult as IContentBatchMigrationResult # noqa: E402, F401
-from tableau_migration.migration_engine_pipelines import PyMigrationPipelineContentType as MigrationPipelineContentType # noqa: E402, F401
-from tableau_migration.migration_engine_pipelines import PyServerToCloudMigrationPipeline as ServerToCloudMigrationPipeline # noqa: E402, F401
-
-# endregion
+# Friendly top-level names are declared in migration_exports.
+# In lazy import mode they are resolved on first access through the module __getattr__ below.
+if not _lazy_import:
+    from tableau_migration.migration_exports import * # noqa: E402, F401, F403
+
+# Register the wrapper types of all imported modules, so generic wrapper lookups resolve without scanning modules.
+from tableau_migration.migration import _index_wrapper_types # noqa: E402
+_index_wrapper_types()
+
+_exports = None # Friendly name to (module name, member name) of migration_exports, read on first lazy access.
+_exports_loaded = not _lazy_import
+
+def _get_exports() -> dict:
+    """Gets the friendly names declared in migration_exports without importing their modules."""
+    global _exports
+
+    if _exports is None:
+        import ast
+
+        tree = ast.parse(Path(__file__).with_name("migration_exports.py").read_text(encoding="utf-8"))
+        _exports = {
+            (alias.asname or alias.name): (node.module, alias.name)
+            for node in tree.body if isinstance(node, ast.ImportFrom) and node.module.startswith("tableau_migration.")
+            for alias in node.names
+        }
+
+    return _exports
+
+def _load_exports() -> bool:
+    """Imports the modules of all friendly names that have not been imported yet in lazy import mode.
+
+    Returns: True if modules were imported, False if all friendly names were already imported.
+    """
+    global _exports_loaded
+
+    if _exports_loaded:
+        return False
+
+    _exports_loaded = True
+
+    from importlib import import_module
+    for module_name in { module for module, _ in _get_exports().values() }:
+        import_module(module_name)
+
+    return True
+
+def __getattr__(name: str):
+    """Resolves friendly names on first access in lazy import mode."""
+    export = _get_exports().get(name) if _lazy_import else None
+    if export is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(export[0]), export[1])
+    globals()[name] = value
+    return value
 
+def __dir__() -> list:
+    """Lists the module attributes, including friendly names not resolved yet in lazy import mode."""
+    return sorted(set(globals()) | (set(_get_exports()) if _lazy_import else set()))
@@ -0,0 +1,30 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""End-to-end migration benchmarks that run against the Tableau API simulator.
+
+The benchmarks seed a simulated Tableau Server site with synthetic content, migrate it
+to a simulated Tableau Cloud site, and report the results as JSON so they can be compared
+between SDK versions.
+
+Example:
+    python -m tableau_migration.benchmarks --users 1000 --workbooks 200 --output results.json
+"""
+
+from tableau_migration.benchmarks.migration_benchmark import ( # noqa: F401
+    SyntheticSite,
+    run_benchmark,
+    write_results
+)
@@ -0,0 +1,47 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Command line entry point for the migration benchmarks."""
+
+import argparse
+
+from tableau_migration.benchmarks import SyntheticSite, run_benchmark, write_results
+
+def main() -> None:
+    """Runs a migration benchmark with the site size given on the command line."""
+    defaults = SyntheticSite()
+
+    parser = argparse.ArgumentParser(prog = "python -m tableau_migration.benchmarks", description = "Benchmarks a migration between simulated sites.")
+    parser.add_argument("--users", type = int, default = defaults.users)
+    parser.add_argument("--groups", type = int, default = defaults.groups)
+    parser.add_argument("--projects", type = int, default = defaults.projects)
+    parser.add_argument("--data-sources", type = int, default = defaults.data_sources)
+    parser.add_argument("--workbooks", type = int, default = defaults.workbooks)
+    parser.add_argument("--extract-refresh-tasks", type = int, default = defaults.extract_refresh_tasks)
+    parser.add_argument("--output", help = "The file to write the JSON results to. Results are written to standard output by default.")
+    args = parser.parse_args()
+
+    site = SyntheticSite(
+        users = args.users,
+        groups = args.groups,
+        projects = args.projects,
+        data_sources = args.data_sources,
+        workbooks = args.workbooks,
+        extract_refresh_tasks = args.extract_refresh_tasks)
+
+    write_results(run_benchmark(site), args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Migration benchmark harness for synthetic simulated sites."""
+
+import json
+import platform
+import sys
+
+from dataclasses import asdict, dataclass
+from importlib import metadata
+from time import perf_counter
+from typing import Callable, Optional, Sequence
+from uuid import uuid4
+
+import clr
+
+from tableau_migration.migration import (
+    PyPipelineProfile,
+    _generic_wrapper_type,
+    get_service,
+    get_service_provider
+)
+from tableau_migration.migration_engine import PyMigrationPlanBuilder
+from tableau_migration.migration_engine_migrators import PyMigrator
+from tableau_migration.migration_engine_migrators_batch import PyContentBatchMigrationResult
+from tableau_migration.migration_engine_pipelines import PyMigrationPipelineContentType
+
+from System import Uri
+from Tableau.Migration import IMigrator
+from Tableau.Migration.Api.Simulation import ITableauApiSimulatorFactory, SyntheticSiteSeeder
+
+@dataclass
+class SyntheticSite:
+    """The amount of synthetic content to seed the simulated source site with."""
+
+    users: int = 100
+    groups: int = 10
+    projects: int = 20
+    data_sources: int = 50
+    workbooks: int = 50
+    extract_refresh_tasks: int = 20
+
+class _BatchRecorder():
+    """Records when each batch of a content type completes and how many items it contained."""
+
+    def __init__(self) -> None:
+        """Creates a new _BatchRecorder object."""
+        self.items = {}
+        self.completed = {}
+
+    def callback(self, content_type_name: str) -> Callable:
+        """Builds a batch completed hook callback for a content type.
+
+        Args:
+            content_type_name: The name of the content type.
+
+        Returns: The hook callback.
+        """
+        def _batch_completed(ctx: PyContentBatchMigrationResult) -> PyContentBatchMigrationResult:
+            self.items[content_type_name] = self.items.get(content_type_name, 0) + len(ctx.item_results)
+            self.completed[content_type_name] = perf_counter()
+            return ctx
+
+        return _batch_completed
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Gets the peak resident set size of the process, or None if the platform does not report it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _package_version() -> Optional[str]:
+    try:
+        return metadata.version("tableau_migration")
+    except metadata.PackageNotFoundError:
+        return None
+
+def _content_type_results(content_type_names: Sequence[str], recorder: _BatchRecorder, stats: dict, start: float) -> dict:
+    """Builds the per content type results.
+
+    Content types are migrated in pipeline order, so the time for a content type is measured from when
+    the last batch of the previous content type completed.
+    """
+    results = {}
+    previous_completed = start
+
+    for name in content_type_names:
+        type_stats = stats.get(name)
+        completed = recorder.completed.get(name)
+
+        elapsed = None if completed is None else completed - previous_completed
+        if completed is not None:
+            previous_completed = completed
+
+        items = recorder.items.get(name, 0)
+        results[name] = {
+            "total": 0 if type_stats is None else type_stats["total"],
+            "batched_items": items,
+            "statuses": {} if type_stats is None else {status.name: count for status, count in type_stats["statuses"].items()},
+            "errors": 0 if type_stats is None else type_stats["errors"],
+            "elapsed_seconds": elapsed,
+            "items_per_second": None if not elapsed else items / elapsed
+        }
+
+    return results
+
+def run_benchmark(site: Optional[SyntheticSite] = None, hooks: Sequence[tuple] = (), mail_domain: str = "example.com") -> dict:
+    """Seeds a simulated Tableau Server site, migrates it to a simulated Tableau Cloud site, and measures the migration.
+
+    Each run uses new simulators, so runs do not share state.
+
+    Args:
+        site: The synthetic content to seed, or None to use the defaults.
+        hooks: Extra hooks to register as (context type, callback) pairs, such as (PyContentBatchMigrationResult[PyUser], callback).
+            These callbacks are included in the Python hook time and the hook profile.
+        mail_domain: The mail domain used to build Tableau Cloud usernames.
+
+    Returns: The benchmark results, which can be serialized to JSON.
+    """
+    site = SyntheticSite() if site is None else site
+
+    run_id = uuid4().hex
+    source_url = f"https://source-{run_id}.simulator"
+    destination_url = f"https://destination-{run_id}.simulator"
+
+    plan_builder = PyMigrationPlanBuilder() \
+        .from_source_tableau_server(source_url, "", "benchmark", "benchmark", create_api_simulator = True) \
+        .to_destination_tableau_cloud(destination_url, "", "benchmark", "benchmark", create_api_simulator = True) \
+        .for_server_to_cloud() \
+        .with_tableau_id_authentication_type() \
+        .with_tableau_cloud_usernames(mail_domain)
+
+    seed_start = perf_counter()
+    simulator = get_service(get_service_provider(), ITableauApiSimulatorFactory).GetOrCreate(Uri(source_url), True)
+    SyntheticSiteSeeder.Seed(simulator, site.users, site.groups, site.projects, site.data_sources, site.workbooks, site.extract_refresh_tasks)
+    seed_seconds = perf_counter() - seed_start
+
+    recorder = _BatchRecorder()
+
+    content_type_names = []
+    for pipeline_content_type in PyMigrationPipelineContentType.get_migration_pipeline_content_types(PyPipelineProfile.SERVER_TO_CLOUD):
+        content_type = pipeline_content_type.content_type
+        wrapper_type = _generic_wrapper_type(content_type)
+        if wrapper_type is None:
+            continue
+
+        content_type_names.append(content_type.Name)
+        plan_builder.hooks.add(PyContentBatchMigrationResult[wrapper_type], recorder.callback(content_type.Name))
+
+    for context_type, callback in hooks:
+        plan_builder.hooks.add(context_type, callback)
+
+    plan = plan_builder.build()
+
+    start = perf_counter()
+    result = PyMigrator().execute(plan, profile_hooks = True)
+    elapsed = perf_counter() - start
+
+    stats = result.manifest.stats_by_content_type()
+    hook_seconds = result.hook_profile.total_seconds
+
+    return {
+        "package_version": _package_version(),
+        "sdk_version": clr.GetClrType(IMigrator).Assembly.GetName().Version.ToString(),
+        "python_version": platform.python_version(),
+        "site": asdict(site),
+        "status": result.status.name,
+        "seed_seconds": seed_seconds,
+        "elapsed_seconds": elapsed,
+        "python_hook_seconds": hook_seconds,
+        "dotnet_seconds": elapsed - hook_seconds,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "content_types": _content_type_results(content_type_names, recorder, stats, start),
+        "hook_profile": result.hook_profile.to_dict()
+    }
+
+def write_results(results: dict, path: Optional[str] = None) -> None:
+    """Writes benchmark results as JSON.
+
+    Args:
+        results: The benchmark results.
+        path: The file path to write to, or None to write to standard output.
+    """
+    if path is None:
+        json.dump(results, sys.stdout, indent = 2)
+        sys.stdout.write("\n")
+        return
+
+    with open(path, "w", encoding = "utf-8") as f:
+        json.dump(results, f, indent = 2)
@@ -17,32 +17,109 @@
 
 Also any method required to start the sdk
 """
-import inspect
 import sys
 
-from typing import Type, TypeVar, List, Union
+from collections import abc
+from threading import Lock
+from typing import Any, Callable, Generic, Iterable, Optional, Type, TypeVar, List, Union
 
 # region Generic Wrapper Helpers
 
+# Wrapper types indexed by the full name of the .NET type they wrap, or the Python object for non-.NET types.
 _wrapper_types = { }
 
+# Wrapper types already resolved for a given lookup type, to avoid calling into .NET on repeated lookups.
+_resolved_wrapper_types = { }
+
+# Negative lookup results, with the number of loaded modules at the time of the lookup.
+_missing_wrapper_types = { }
+
+# Names of the modules that have already been indexed for wrapper types.
+_indexed_modules = set()
+
+def _wrapper_type_keys(t) -> tuple:
+    """Gets the registry keys to try for a type: the .NET type full name, then the generic type definition full name."""
+    dotnet_type = t
+    if not isinstance(t, System.Type):
+        try:
+            dotnet_type = clr.GetClrType(t)
+        except Exception:
+            return (t,)
+
+    if dotnet_type.FullName is None:
+        return (t,)
+
+    if dotnet_type.IsGenericType and not dotnet_type.IsGenericTypeDefinition:
+        return (dotnet_type.FullName, dotnet_type.GetGenericTypeDefinition().FullName)
+
+    return (dotnet_type.FullName,)
+
+def _register_wrapper_type(t: type) -> None:
+    """Registers a wrapper type that declares a _dotnet_base.
+
+    The first type registered for a .NET type is kept, so subclasses of wrapper types do not replace it.
+    """
+    _wrapper_types.setdefault(_wrapper_type_keys(t._dotnet_base)[0], t)
+    _missing_wrapper_types.clear()
+
+def _register_wrapper_types(module) -> None:
+    """Registers all wrapper types declared in a module."""
+    _indexed_modules.add(module.__name__)
+
+    for member in list(vars(module).values()):
+        if isinstance(member, type) and "_dotnet_base" in member.__dict__ and member.__module__ == module.__name__:
+            _register_wrapper_type(member)
+
+def _index_wrapper_types() -> None:
+    """Registers the wrapper types of all loaded modules that have not been indexed yet."""
+    for name in sys.modules.keys() - _indexed_modules:
+        module = sys.modules.get(name)
+        if module is None:
+            _indexed_modules.add(name)
+        else:
+            _register_wrapper_types(module)
+
+def _clear_wrapper_types() -> None:
+    """Clears all registered and resolved wrapper types."""
+    _wrapper_types.clear()
+    _resolved_wrapper_types.clear()
+    _missing_wrapper_types.clear()
+    _indexed_modules.clear()
+
 def _find_wrapper_type(search_type: type) -> Union[type, None]:
-    for module in list(sys.modules.values()):
-        for member in inspect.getmembers(module, inspect.isclass):
-            t = member[1]
-            if hasattr(t, "_dotnet_base"):
-                if issubclass(type(search_type), System.Type) and search_type.Equals(t._dotnet_base):
-                    return t
-                elif t._dotnet_base == search_type:
-                    return t
-    
+    keys = _wrapper_type_keys(search_type)
+
+    for key in keys:
+        if key in _wrapper_types:
+            return _wrapper_types[key]
+
+    # Only index newly imported modules if any were imported since the last miss for this type.
+    module_count = len(sys.modules)
+    if _missing_wrapper_types.get(keys[0]) == module_count:
+        return None
+
+    _index_wrapper_types()
+
+    for key in keys:
+        if key in _wrapper_types:
+            return _wrapper_types[key]
+
+    # In lazy import mode, the wrapper module may not be imported yet.
+    if tableau_migration._load_exports():
+        return _find_wrapper_type(search_type)
+
+    _missing_wrapper_types[keys[0]] = module_count
     return None
 
 def _generic_wrapper_type(t: type) -> Union[type, None]:
-    if t not in _wrapper_types:
-        _wrapper_types[t] = _find_wrapper_type(t)
-        
-    return _wrapper_types[t]
+    if t in _resolved_wrapper_types:
+        return _resolved_wrapper_types[t]
+
+    wrapper_type = _find_wrapper_type(t)
+    if wrapper_type is not None:
+        _resolved_wrapper_types[t] = wrapper_type
+
+    return wrapper_type
 
 def _generic_wrapper(obj, type_override: type = None):
     t = type_override if type_override is not None else type(obj)
@@ -54,6 +131,142 @@ def _generic_wrapper(obj, type_override: type = None):
 
 # endregion
 
+# region Lazy Sequences
+
+TItem = TypeVar("TItem")
+
+# Marks items of a lazy sequence that have not been wrapped yet.
+_NOT_WRAPPED = object()
+
+class PyLazySequence(abc.Sequence, Generic[TItem]):
+    """Read-only sequence view over a .NET collection that only creates Python wrapper objects for the items accessed.
+
+    .NET items are read through the collection indexer when accessed, and each wrapper is created at most once.
+    """
+
+    __slots__ = ("_items", "_indexes", "_wrap", "_wrapped", "_failed", "_succeeded")
+
+    def __init__(self, dotnet_items: Iterable, wrap: Callable[[Any], TItem]) -> None:
+        """Creates a new PyLazySequence object.
+
+        Args:
+            dotnet_items: The .NET items to wrap.
+            wrap: The callback to wrap a single .NET item.
+        """
+        if isinstance(dotnet_items, list):
+            count = len(dotnet_items)
+        elif hasattr(dotnet_items, "Count") and hasattr(type(dotnet_items), "__getitem__"):
+            count = dotnet_items.Count
+        else:
+            # Collections without an indexer are read once.
+            dotnet_items = list(dotnet_items)
+            count = len(dotnet_items)
+
+        self._items = dotnet_items
+        self._indexes = range(count)
+        self._wrap = wrap
+        self._wrapped = [_NOT_WRAPPED] * count
+        self._failed = None
+        self._succeeded = None
+
+    def __len__(self) -> int:
+        """Gets the number of items in the sequence."""
+        return len(self._indexes)
+
+    def __getitem__(self, index):
+        """Gets the wrapped item at an index, or a new view for a slice."""
+        if isinstance(index, slice):
+            return self._subset(self._indexes[index])
+
+        i = self._indexes[index]
+        item = self._wrapped[i]
+        if item is _NOT_WRAPPED:
+            item = self._wrap(self._items[i])
+            self._wrapped[i] = item
+
+        return item
+
+    def __iter__(self):
+        """Iterates the wrapped items."""
+        for i in range(len(self._indexes)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        """Gets a string representation of the sequence."""
+        return f"{type(self).__name__}({len(self._indexes)} items)"
+
+    def failed(self) -> "PyLazySequence[TItem]":
+        """Gets a view of the result items that did not succeed.
+
+        The items must be result objects, and are filtered without creating wrappers.
+
+        Returns: The view of the failed items.
+        """
+        if self._failed is None:
+            self._failed = self._subset(self._indexes_by_success(False))
+
+        return self._failed
+
+    def succeeded(self) -> "PyLazySequence[TItem]":
+        """Gets a view of the result items that succeeded.
+
+        The items must be result objects, and are filtered without creating wrappers.
+
+        Returns: The view of the succeeded items.
+        """
+        if self._succeeded is None:
+            self._succeeded = self._subset(self._indexes_by_success(True))
+
+        return self._succeeded
+
+    def _indexes_by_success(self, success: bool) -> abc.Sequence[int]:
+        if isinstance(self._items, list):
+            indexes = [i for i, x in enumerate(self._items) if x.Success == success]
+        else:
+            # Result statuses are read in one .NET call instead of one call per item.
+            indexes = list(ResultInterop.GetIndexesBySuccess(self._items, success))
+
+        if self._indexes == range(len(self._wrapped)):
+            return indexes
+
+        matches = set(indexes)
+        return [i for i in self._indexes if i in matches]
+
+    def _subset(self, indexes: abc.Sequence[int]) -> "PyLazySequence[TItem]":
+        # Views share the .NET items and created wrappers of the sequence they were created from.
+        result = PyLazySequence.__new__(PyLazySequence)
+        result._items = self._items
+        result._indexes = indexes
+        result._wrap = self._wrap
+        result._wrapped = self._wrapped
+        result._failed = None
+        result._succeeded = None
+        return result
+
+def _lazy_sequence(owner: Any, name: str, dotnet_items: Any, wrap: Callable[[Any], TItem]) -> Optional[PyLazySequence[TItem]]:
+    """Gets a lazy sequence view over a .NET collection property, cached on the owning wrapper object.
+
+    The cached view is reused as long as the property returns the same .NET collection instance.
+    """
+    if dotnet_items is None:
+        return None
+
+    cache = getattr(owner, "_lazy_sequences", None)
+    if cache is None:
+        cache = {}
+        owner._lazy_sequences = cache
+
+    cached = cache.get(name)
+    if cached is not None and System.Object.ReferenceEquals(cached[0], dotnet_items):
+        return cached[1]
+
+    result = PyLazySequence(dotnet_items, wrap)
+    cache[name] = (dotnet_items, result)
+    return result
+
+# endregion
+
+import clr # noqa: E402
 import System # noqa: E402
 from System import ( # noqa: E402
     IServiceProvider,
@@ -72,13 +285,19 @@ from Tableau.Migration.Engine.Manifest import ( # noqa: E402
 )
 
 from Tableau.Migration.Interop import ( # noqa: E402
-    IServiceCollectionExtensions as InteropSCE
+    IServiceCollectionExtensions as InteropSCE,
+    ResultInterop
 )
 
 from Tableau.Migration.Interop.Logging import ( # noqa: E402
     NonGenericLoggerBase
 )
 
+from Tableau.Migration.Interop.Manifest import ( # noqa: E402
+    MigrationManifestColumns,
+    MigrationManifestStatistics
+)
+
 from Microsoft.Extensions.Configuration import ( # noqa: E402
     IConfigurationRoot
 )
@@ -93,11 +312,14 @@ from Microsoft.Extensions.DependencyInjection import ( # noqa: E402
 
 import tableau_migration # noqa: E402
 from tableau_migration.migration_logger import MigrationLogger # noqa: E402
+from tableau_migration.migration_engine_hooks_profiling import HookProfile # noqa: E402
 
 # region init
 
 T = TypeVar("T")
 
+_initialize_lock = Lock()
+
 def get_service(services: IServiceProvider, t: Type[T]) -> T:
     """Gets service of type T.
 
@@ -114,11 +336,15 @@ def get_service_provider() -> ServiceProvider:
     """Gets the Dependency Injection Service Provider.
     
     https://learn.microsoft.com/en-us/dotnet/core/extensions/dependency-injection
+
+    In lazy import mode the service provider is built on first access.
     """
-    if tableau_migration._services is not None:
-        return tableau_migration._services
-    else:
-        raise Exception("Service provider is not initialized.")
+    if tableau_migration._services is None:
+        with _initialize_lock:
+            if tableau_migration._services is None:
+                _initialize()
+
+    return tableau_migration._services
 
 def reload_configuration() -> None:
     """Reloads the configuration providers so that updated Migration SDK configuration options are applied."""
@@ -160,6 +386,11 @@ def _get_new_python_logger_delegate(name: str) -> MigrationLogger:
 
 from enum import IntEnum # noqa: E402, F401
 from tableau_migration.migration_api_rest import PyRestIdentifiable # noqa: E402, F401
+from tableau_migration.migration_interop import (  # noqa: E402, F401
+    _PyWrapperBase,
+    _to_dotnet_guid,
+    _wrap_guid
+)
 from typing import Sequence # noqa: E402, F401
 from typing_extensions import Self # noqa: E402, F401
 from uuid import UUID # noqa: E402, F401
@@ -174,10 +405,11 @@ from Tableau.Migration import (  # noqa: E402, F401
     IResult
 )
 
-class PyContentLocation():
+class PyContentLocation(_PyWrapperBase):
     """Structure representing a logical location of a content item on a Tableau site. For example, for workbooks this represents the project path and the workbook name."""
     
     _dotnet_base = ContentLocation
+    __slots__ = ("_path_segments", "_path", "_hash_key")
     
     def __init__(self, content_location: ContentLocation) -> None:
         """Creates a new PyContentLocation object.
@@ -274,6 +506,7 @@ class PyContentReference(PyRestIdentifiable):
     """Interface for an object that describes information on how to reference an item of content, for example through a Tableau API."""
     
     _dotnet_base = IContentReference
+    __slots__ = ("_location",)
     
     def __init__(self, content_reference: IContentReference) -> None:
         """Creates a new PyContentReference object.
@@ -304,6 +537,7 @@ class PyEmptyIdContentReference(PyContentReference):
     """Interface for an empty ID object that describes information on how to reference an item of content, for example through a Tableau API. This in cases where the content type does not have a LUID on Tableau Server or Cloud."""
     
     _dotnet_base = IEmptyIdContentReference
+    __slots__ = ()
     
     def __init__(self, empty_id_content_reference: IEmptyIdContentReference) -> None:
         """Creates a new PyEmptyIdContentReference object.
@@ -318,7 +552,7 @@ class PyEmptyIdContentReference(PyContentReference):
     @property
     def id(self) -> UUID:
         """Gets the empty unique identifier."""
-        return None if self._dotnet.Id is None else UUID(self._dotnet.Id.ToString())
+        return _wrap_guid(self._dotnet.Id)
     
 class PyMigrationCompletionStatus(IntEnum):
     """Enumeration of the various ways a migration can reach completion."""
@@ -347,10 +581,11 @@ class PyPipelineProfile(IntEnum):
     #: The pipeline to bulk migrate content from a Tableau Cloud site to a Tableau Cloud site.
     CLOUD_TO_CLOUD = 4
     
-class PyResult():
+class PyResult(_PyWrapperBase):
     """Interface representing the result of an operation."""
     
     _dotnet_base = IResult
+    __slots__ = ()
     
     def __init__(self, result: IResult) -> None:
         """Creates a new PyResult object.
@@ -406,6 +641,105 @@ def _create_content_location(cls, path_separator: str, segments: Sequence[str])
 
 setattr(PyContentLocation, "create", classmethod(_create_content_location))
 
+# Content locations are immutable .NET values, so marshalled fields are cached on the wrapper on first access.
+
+def _content_location_path_segments(self) -> Sequence[str]:
+    """Gets the individual segments of the location path."""
+    try:
+        segments = self._path_segments
+    except AttributeError:
+        segments = self._path_segments = tuple(self._dotnet.PathSegments)
+
+    return list(segments)
+
+def _content_location_path(self) -> str:
+    """Gets the full path of the location."""
+    try:
+        return self._path
+    except AttributeError:
+        path = self._path = self._dotnet.Path
+        return path
+
+def _ordinal_ignore_case_key(text: str) -> str:
+    """Gets a key that compares text like .NET StringComparer.OrdinalIgnoreCase."""
+    if text.isascii():
+        return text.upper()
+
+    # OrdinalIgnoreCase upper-cases one character at a time, so characters that upper-case to several characters, like "ß", are kept.
+    return "".join(c if len(u := c.upper()) != 1 else u for c in text)
+
+def _content_location_hash_key(location: PyContentLocation) -> str:
+    try:
+        return location._hash_key
+    except AttributeError:
+        # Locations compare their paths case-insensitively, like ContentLocation.
+        key = location._hash_key = _ordinal_ignore_case_key(location.path)
+        return key
+
+def _content_location_eq(self, other) -> bool:
+    """Gets whether the other object is an equal location."""
+    if not isinstance(other, PyContentLocation):
+        return NotImplemented
+
+    return _content_location_hash_key(self) == _content_location_hash_key(other)
+
+def _content_location_hash(self) -> int:
+    """Gets the hash code of the location path."""
+    return hash(_content_location_hash_key(self))
+
+setattr(PyContentLocation, "path_segments", property(_content_location_path_segments))
+setattr(PyContentLocation, "path", property(_content_location_path))
+setattr(PyContentLocation, "__eq__", _content_location_eq)
+setattr(PyContentLocation, "__hash__", _content_location_hash)
+
+from Tableau.Migration.Content import IMappableContent # noqa: E402
+
+_mappable_content_type = clr.GetClrType(IMappableContent)
+_uncached = object()
+
+def _content_reference_location(self) -> PyContentLocation:
+    """Gets the logical location path of the content item, for project-level content this is the project path and the content item name."""
+    try:
+        location = self._location
+        if location is not _uncached:
+            return location
+
+        cache = False
+    except AttributeError:
+        # Mappable content items are moved during migration, so only other references cache their location.
+        cache = not _mappable_content_type.IsInstanceOfType(self._dotnet)
+
+    dotnet_location = self._dotnet.Location
+    location = None if dotnet_location is None else PyContentLocation(dotnet_location)
+    self._location = location if cache else _uncached
+    return location
+
+def _content_reference_eq(self, other) -> bool:
+    """Gets whether the other object references equal content."""
+    if not isinstance(other, PyContentReference):
+        return NotImplemented
+
+    return self._dotnet.Equals(other._dotnet)
+
+def _content_reference_hash(self) -> int:
+    """Gets the hash code of the content reference."""
+    return self._dotnet.GetHashCode()
+
+setattr(PyContentReference, "location", property(_content_reference_location))
+setattr(PyContentReference, "__eq__", _content_reference_eq)
+setattr(PyContentReference, "__hash__", _content_reference_hash)
+
+def _manifest_stats_to_dict(stats: MigrationManifestStatistics) -> dict:
+    from tableau_migration.migration_engine_manifest import PyMigrationManifestEntryStatus
+
+    return {
+        "total": stats.TotalCount,
+        "statuses": {PyMigrationManifestEntryStatus(i): count for i, count in enumerate(stats.StatusCounts)},
+        "entries_with_errors": stats.EntriesWithErrors,
+        "errors": stats.ErrorCount,
+        "skipped_reasons": dict(zip(stats.SkippedReasons, stats.SkippedReasonCounts))
+    }
+
 class PyMigrationManifest():
     """Interface for an object that describes the various Tableau data items found to migrate and their migration results."""
 
@@ -424,12 +758,12 @@ class PyMigrationManifest():
     @property
     def plan_id(self) -> UUID:
         """Gets the unique identifier of the IMigrationPlan that was executed to produce this manifest."""
-        return UUID(self._migration_manifest.PlanId.ToString())
+        return _wrap_guid(self._migration_manifest.PlanId)
 
     @property
     def migration_id(self) -> UUID:
         """Gets the unique identifier of the migration run that produced this manifest."""
-        return UUID(self._migration_manifest.MigrationId.ToString())
+        return _wrap_guid(self._migration_manifest.MigrationId)
 
     @property
     def manifest_version(self) -> int:
@@ -471,20 +805,57 @@ class PyMigrationManifest():
         # or an exception will be thrown
         self._migration_manifest.AddErrors(errors)
 
+    def stats(self) -> dict:
+        """Gets status statistics for all manifest entries.
+
+        The statistics are aggregated by the migration SDK in a single pass over the entries,
+        which is much faster than wrapping and counting entries in Python.
+
+        Returns: A dictionary with the keys:
+            "total": The number of entries.
+            "statuses": The number of entries for each MigrationManifestEntryStatus.
+            "entries_with_errors": The number of entries that have at least one error.
+            "errors": The total number of entry errors.
+            "skipped_reasons": The number of skipped entries for each skipped reason.
+        """
+        return _manifest_stats_to_dict(MigrationManifestStatistics.ForManifest(self._migration_manifest))
+
+    def stats_by_content_type(self) -> dict[str, dict]:
+        """Gets status statistics for the manifest entries of each content type.
+
+        Returns: The statistics for each content type in the manifest, keyed by the content type name (for example "IUser"). 
+            Each value has the same keys as the stats method result.
+        """
+        return {s.ContentType.Name: _manifest_stats_to_dict(s) for s in MigrationManifestStatistics.ForContentTypes(self._migration_manifest)}
+
+    def to_columns(self):
+        """Gets the values of all manifest entries in column form, for offline analysis.
+
+        The columns are built by the migration SDK in a single pass over the entries,
+        and copied to Python as contiguous buffers without creating wrapper objects for each entry.
+
+        Returns: A PyMigrationManifestColumns object.
+        """
+        from tableau_migration.migration_engine_manifest import PyMigrationManifestColumns
+
+        return PyMigrationManifestColumns(MigrationManifestColumns.ForManifest(self._migration_manifest))
+
 class PyMigrationResult():
     """Interface for a result of a migration."""
 
     _dotnet_base = MigrationResult # MigrationResult is a record struct, not an interface, hence it doesn't start with I
 
-    def __init__(self, migration_result: MigrationResult) -> None:
+    def __init__(self, migration_result: MigrationResult, hook_profile: Optional[HookProfile] = None) -> None:
         """Default init.
 
         Args:
             migration_result: Interface for a result of a migration.
+            hook_profile: The timings of the Python hook calls made during the migration, if hooks were profiled.
         
         Returns: None.
         """
         self._migrationResult = migration_result
+        self._hook_profile = hook_profile
 
     @property
     def status(self) -> PyMigrationCompletionStatus:
@@ -494,4 +865,12 @@ class PyMigrationResult():
     @property 
     def manifest(self) -> PyMigrationManifest:
         """Gets the MigrationManifest the migration produced."""
-        return PyMigrationManifest(self._migrationResult.Manifest)    
+        return PyMigrationManifest(self._migrationResult.Manifest)
+
+    @property
+    def hook_profile(self) -> Optional[HookProfile]:
+        """Gets the timings of the Python hook calls made during the migration, or None if hooks were not profiled.
+        
+        Hooks are profiled by executing the migration with profile_hooks set to True.
+        """
+        return self._hook_profile    
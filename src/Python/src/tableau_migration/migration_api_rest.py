@@ -17,15 +17,21 @@
 
 # region _generated
 
+from tableau_migration.migration_interop import (  # noqa: E402, F401
+    _PyWrapperBase,
+    _to_dotnet_guid,
+    _wrap_guid
+)
 from uuid import UUID # noqa: E402, F401
 
 from System import Guid # noqa: E402, F401
 from Tableau.Migration.Api.Rest import IRestIdentifiable # noqa: E402, F401
 
-class PyRestIdentifiable():
+class PyRestIdentifiable(_PyWrapperBase):
     """Interface for an object that uses a REST API-style LUID identifier."""
     
     _dotnet_base = IRestIdentifiable
+    __slots__ = ("_cached_id",)
     
     def __init__(self, rest_identifiable: IRestIdentifiable) -> None:
         """Creates a new PyRestIdentifiable object.
@@ -40,7 +46,11 @@ class PyRestIdentifiable():
     @property
     def id(self) -> UUID:
         """Gets the unique identifier."""
-        return None if self._dotnet.Id is None else UUID(self._dotnet.Id.ToString())
+        try:
+            return self._cached_id
+        except AttributeError:
+            value = self._cached_id = _wrap_guid(self._dotnet.Id)
+            return value
     
 
 # endregion
@@ -0,0 +1,110 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Event loop that runs asynchronous Python hooks."""
+
+import asyncio
+import atexit
+from concurrent.futures import Future
+from inspect import isawaitable, iscoroutine, iscoroutinefunction
+from threading import Lock, Thread
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
+
+T = TypeVar("T")
+TResult = TypeVar("TResult")
+
+_lock = Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[Thread] = None
+
+def get_hook_event_loop() -> asyncio.AbstractEventLoop:
+    """Gets the event loop that asynchronous hooks run on, starting it if needed.
+
+    Coroutines returned by async hooks are run on a single event loop in a dedicated thread,
+    so that awaiting I/O does not block the .NET thread that called the hook.
+    Objects bound to an event loop, such as HTTP client sessions, should be created on this loop.
+
+    Returns: The event loop.
+    """
+    global _loop, _thread
+
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _thread = Thread(target=_loop.run_forever, name="tableau_migration_hooks", daemon=True)
+            _thread.start()
+
+        return _loop
+
+def stop_hook_event_loop() -> None:
+    """Stops the event loop that asynchronous hooks run on, cancelling any running hooks.
+    
+    The event loop is started again the next time an async hook is called.
+    """
+    global _loop, _thread
+
+    with _lock:
+        loop, thread = _loop, _thread
+        if loop is None:
+            return
+
+        _loop = _thread = None
+
+    async def _cancel_all() -> None:
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(_cancel_all(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+atexit.register(stop_hook_event_loop)
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+def _run_coroutine(awaitable: Awaitable[T]) -> "Future[T]":
+    """Runs an awaitable on the hook event loop.
+
+    Cancelling the returned future cancels the asyncio task running the awaitable.
+    """
+    coro = awaitable if iscoroutine(awaitable) else _await(awaitable)
+    return asyncio.run_coroutine_threadsafe(coro, get_hook_event_loop())
+
+def _is_async_callable(f: Any) -> bool:
+    """Checks if a function, or an object's __call__ method, is a coroutine function."""
+    if f is None:
+        return False
+    return iscoroutinefunction(f) or iscoroutinefunction(getattr(f, "__call__", None))
+
+async def _await_then(awaitable: Awaitable[T], continuation: Callable[[T], TResult]) -> TResult:
+    result = continuation(await awaitable)
+    return (await result) if isawaitable(result) else result
+
+def _then(result: Union[T, Awaitable[T]], continuation: Callable[[T], TResult]) -> Union[TResult, Awaitable[TResult]]:
+    """Calls a continuation with a hook result, after awaiting the result if the hook is async.
+
+    Args:
+        result: The hook result, or an awaitable of the result.
+        continuation: The function to call with the result. The continuation may return an awaitable when the hook result was awaitable.
+
+    Returns: The continuation result, or a coroutine of the continuation result if the hook result was awaitable.
+    """
+    if isawaitable(result):
+        return _await_then(result, continuation)
+    return continuation(result)
@@ -23,12 +23,18 @@ from enum import IntEnum # noqa: E402, F401
 from tableau_migration.migration import (  # noqa: E402, F401
     PyContentReference,
     PyEmptyIdContentReference,
-    _generic_wrapper
+    _generic_wrapper,
+    _lazy_sequence
 )
 from tableau_migration.migration_api_rest import PyRestIdentifiable # noqa: E402, F401
 from tableau_migration.migration_content_schedules import PyWithSchedule # noqa: E402, F401
 from tableau_migration.migration_content_schedules_cloud import PyCloudSchedule # noqa: E402, F401
 from tableau_migration.migration_content_schedules_server import PyServerSchedule # noqa: E402, F401
+from tableau_migration.migration_interop import (  # noqa: E402, F401
+    _PyWrapperBase,
+    _to_dotnet_guid,
+    _wrap_guid
+)
 from typing import (  # noqa: E402, F401
     Optional,
     Sequence,
@@ -95,6 +101,7 @@ class PyWithOwner(PyContentReference):
     """Interface to be inherited by content items with owner."""
     
     _dotnet_base = IWithOwner
+    __slots__ = ()
     
     def __init__(self, with_owner: IWithOwner) -> None:
         """Creates a new PyWithOwner object.
@@ -120,6 +127,7 @@ class PySubscriptionContent(PyContentReference):
     """The content of the subscription."""
     
     _dotnet_base = ISubscriptionContent
+    __slots__ = ()
     
     def __init__(self, subscription_content: ISubscriptionContent) -> None:
         """Creates a new PySubscriptionContent object.
@@ -166,6 +174,7 @@ class PySubscription(Generic[TSchedule], PyWithSchedule[TSchedule], PyWithOwner)
     """Interface for a subscription."""
     
     _dotnet_base = ISubscription
+    __slots__ = ()
     
     def __init__(self, subscription: ISubscription) -> None:
         """Creates a new PySubscription object.
@@ -261,6 +270,7 @@ class PyCloudSubscription(PySubscription[PyCloudSchedule]):
     """The interface for a cloud subscription."""
     
     _dotnet_base = ICloudSubscription
+    __slots__ = ()
     
     def __init__(self, cloud_subscription: ICloudSubscription) -> None:
         """Creates a new PyCloudSubscription object.
@@ -272,10 +282,11 @@ class PyCloudSubscription(PySubscription[PyCloudSchedule]):
         """
         self._dotnet = cloud_subscription
         
-class PyConnection():
+class PyConnection(_PyWrapperBase):
     """Interface for a content item's embedded connection."""
     
     _dotnet_base = IConnection
+    __slots__ = ("_cached_id",)
     
     def __init__(self, connection: IConnection) -> None:
         """Creates a new PyConnection object.
@@ -290,7 +301,11 @@ class PyConnection():
     @property
     def id(self) -> UUID:
         """Gets the unique identifier."""
-        return None if self._dotnet.Id is None else UUID(self._dotnet.Id.ToString())
+        try:
+            return self._cached_id
+        except AttributeError:
+            value = self._cached_id = _wrap_guid(self._dotnet.Id)
+            return value
     
     @property
     def type(self) -> str:
@@ -332,10 +347,11 @@ class PyConnection():
         """Gets whether to embed the password."""
         return self._dotnet.EmbedPassword
     
-class PyConnectionsContent():
+class PyConnectionsContent(_PyWrapperBase):
     """Interface for content that has connection metadata."""
     
     _dotnet_base = IConnectionsContent
+    __slots__ = ()
     
     def __init__(self, connections_content: IConnectionsContent) -> None:
         """Creates a new PyConnectionsContent object.
@@ -350,7 +366,7 @@ class PyConnectionsContent():
     @property
     def connections(self) -> Sequence[PyConnection]:
         """Gets the connection metadata. Connection metadata is read only because connection metadata should not be transformed directly. Instead, connections should be modified by either: 1) manipulating XML before publishing, or 2) updating connection metadata in a post-publish hook."""
-        return None if self._dotnet.Connections is None else list((None if x is None else PyConnection(x)) for x in self._dotnet.Connections)
+        return _lazy_sequence(self, "Connections", self._dotnet.Connections, lambda x: None if x is None else PyConnection(x))
     
     @property
     def has_embedded_password(self) -> bool:
@@ -367,10 +383,11 @@ class PyConnectionsContent():
         """Gets whether any Connections have an embedded password and an OAuth authentication type."""
         return self._dotnet.HasEmbeddedOAuthCredentials
     
-class PyContainerContent():
+class PyContainerContent(_PyWrapperBase):
     """Interface for a content item that belongs to a container (e.g. project or personal space)."""
     
     _dotnet_base = IContainerContent
+    __slots__ = ()
     
     def __init__(self, container_content: IContainerContent) -> None:
         """Creates a new PyContainerContent object.
@@ -391,6 +408,7 @@ class PyWithWorkbook(PyContentReference):
     """Interface to be inherited by content items with workbook."""
     
     _dotnet_base = IWithWorkbook
+    __slots__ = ()
     
     def __init__(self, with_workbook: IWithWorkbook) -> None:
         """Creates a new PyWithWorkbook object.
@@ -416,6 +434,7 @@ class PyCustomView(PyWithOwner, PyWithWorkbook):
     """The interface for a custom view content item."""
     
     _dotnet_base = ICustomView
+    __slots__ = ()
     
     def __init__(self, custom_view: ICustomView) -> None:
         """Creates a new PyCustomView object.
@@ -455,17 +474,18 @@ class PyCustomView(PyWithOwner, PyWithWorkbook):
     @property
     def base_view_id(self) -> UUID:
         """Gets the ID of the view that this custom view is based on."""
-        return None if self._dotnet.BaseViewId is None else UUID(self._dotnet.BaseViewId.ToString())
+        return _wrap_guid(self._dotnet.BaseViewId)
     
     @property
     def base_view_name(self) -> str:
         """Gets the name of the view that this custom view is based on."""
         return self._dotnet.BaseViewName
     
-class PyPublishedContent():
+class PyPublishedContent(_PyWrapperBase):
     """Interface for a content item that has metadata around publishing information."""
     
     _dotnet_base = IPublishedContent
+    __slots__ = ()
     
     def __init__(self, published_content: IPublishedContent) -> None:
         """Creates a new PyPublishedContent object.
@@ -492,10 +512,11 @@ class PyPublishedContent():
         """Gets the webpage URL."""
         return self._dotnet.WebpageUrl
     
-class PyDescriptionContent():
+class PyDescriptionContent(_PyWrapperBase):
     """Interface for a content item that has a description."""
     
     _dotnet_base = IDescriptionContent
+    __slots__ = ()
     
     def __init__(self, description_content: IDescriptionContent) -> None:
         """Creates a new PyDescriptionContent object.
@@ -517,10 +538,11 @@ class PyDescriptionContent():
         """Gets or sets the description."""
         self._dotnet.Description = value
     
-class PySizeContent():
+class PySizeContent(_PyWrapperBase):
     """Interface for a content item that has a file size."""
     
     _dotnet_base = ISizeContent
+    __slots__ = ()
     
     def __init__(self, size_content: ISizeContent) -> None:
         """Creates a new PySizeContent object.
@@ -537,10 +559,11 @@ class PySizeContent():
         """Gets the file size."""
         return self._dotnet.Size
     
-class PyExtractContent():
+class PyExtractContent(_PyWrapperBase):
     """Interface for a content item that has an extract."""
     
     _dotnet_base = IExtractContent
+    __slots__ = ()
     
     def __init__(self, extract_content: IExtractContent) -> None:
         """Creates a new PyExtractContent object.
@@ -562,10 +585,11 @@ class PyExtractContent():
         """Gets or sets whether or not extracts are encrypted."""
         self._dotnet.EncryptExtracts = value
     
-class PyTag():
+class PyTag(_PyWrapperBase):
     """Interface for tags associated with content items."""
     
     _dotnet_base = ITag
+    __slots__ = ()
     
     def __init__(self, tag: ITag) -> None:
         """Creates a new PyTag object.
@@ -587,10 +611,11 @@ class PyTag():
         """Gets or sets label for the tag."""
         self._dotnet.Label = value
     
-class PyWithTags():
+class PyWithTags(_PyWrapperBase):
     """Interface to be inherited by content items with tags."""
     
     _dotnet_base = IWithTags
+    __slots__ = ()
     
     def __init__(self, with_tags: IWithTags) -> None:
         """Creates a new PyWithTags object.
@@ -622,6 +647,7 @@ class PyDataSource(PyPublishedContent, PyDescriptionContent, PySizeContent, PyEx
     """Interface for a data source content item."""
     
     _dotnet_base = IDataSource
+    __slots__ = ()
     
     def __init__(self, data_source: IDataSource) -> None:
         """Creates a new PyDataSource object.
@@ -657,6 +683,7 @@ class PyDataSourceDetails(PyDataSource):
     """Interface for a data source object with extended information, from a GET query for example."""
     
     _dotnet_base = IDataSourceDetails
+    __slots__ = ()
     
     def __init__(self, data_source_details: IDataSourceDetails) -> None:
         """Creates a new PyDataSourceDetails object.
@@ -701,6 +728,7 @@ class PyFavorite(PyEmptyIdContentReference):
     """Interface for a content item named favorite."""
     
     _dotnet_base = IFavorite
+    __slots__ = ()
     
     def __init__(self, favorite: IFavorite) -> None:
         """Creates a new PyFavorite object.
@@ -751,6 +779,7 @@ class PyFlow(PyPublishedContent, PyDescriptionContent, PyWithTags, PyContainerCo
     """Interface for a prep flow content item."""
     
     _dotnet_base = IFlow
+    __slots__ = ()
     
     def __init__(self, flow: IFlow) -> None:
         """Creates a new PyFlow object.
@@ -776,6 +805,7 @@ class PyFlowOutputStep(PyRestIdentifiable):
     """Interface for a flow output step."""
     
     _dotnet_base = IFlowOutputStep
+    __slots__ = ()
     
     def __init__(self, flow_output_step: IFlowOutputStep) -> None:
         """Creates a new PyFlowOutputStep object.
@@ -791,6 +821,7 @@ class PyFlowDetails(PyFlow):
     """Interface for a flow object with extended information, from a GET query for example."""
     
     _dotnet_base = IFlowDetails
+    __slots__ = ()
     
     def __init__(self, flow_details: IFlowDetails) -> None:
         """Creates a new PyFlowDetails object.
@@ -805,12 +836,13 @@ class PyFlowDetails(PyFlow):
     @property
     def flow_output_steps(self) -> Sequence[PyFlowOutputStep]:
         """Gets the flow output step metadata."""
-        return None if self._dotnet.FlowOutputSteps is None else list((None if x is None else PyFlowOutputStep(x)) for x in self._dotnet.FlowOutputSteps)
+        return _lazy_sequence(self, "FlowOutputSteps", self._dotnet.FlowOutputSteps, lambda x: None if x is None else PyFlowOutputStep(x))
     
-class PyWithDomain():
+class PyWithDomain(_PyWrapperBase):
     """Interface for content items with a domain."""
     
     _dotnet_base = IWithDomain
+    __slots__ = ()
     
     def __init__(self, with_domain: IWithDomain) -> None:
         """Creates a new PyWithDomain object.
@@ -831,6 +863,7 @@ class PyUsernameContent(PyContentReference, PyWithDomain):
     """Interface for a content item that uses a domain qualified username."""
     
     _dotnet_base = IUsernameContent
+    __slots__ = ()
     
     def __init__(self, username_content: IUsernameContent) -> None:
         """Creates a new PyUsernameContent object.
@@ -846,6 +879,7 @@ class PyGroup(PyUsernameContent):
     """Interface for a group content item."""
     
     _dotnet_base = IGroup
+    __slots__ = ()
     
     def __init__(self, group: IGroup) -> None:
         """Creates a new PyGroup object.
@@ -881,6 +915,7 @@ class PyGroupSet(PyContentReference):
     """Interface for a group set content item."""
     
     _dotnet_base = IGroupSet
+    __slots__ = ()
     
     def __init__(self, group_set: IGroupSet) -> None:
         """Creates a new PyGroupSet object.
@@ -892,10 +927,11 @@ class PyGroupSet(PyContentReference):
         """
         self._dotnet = group_set
         
-class PyGroupUser():
+class PyGroupUser(_PyWrapperBase):
     """Interface for a user linked to a group content item."""
     
     _dotnet_base = IGroupUser
+    __slots__ = ()
     
     def __init__(self, group_user: IGroupUser) -> None:
         """Creates a new PyGroupUser object.
@@ -921,6 +957,7 @@ class PyLabel(PyRestIdentifiable):
     """Interface for a content item's label."""
     
     _dotnet_base = ILabel
+    __slots__ = ()
     
     def __init__(self, label: ILabel) -> None:
         """Creates a new PyLabel object.
@@ -935,12 +972,12 @@ class PyLabel(PyRestIdentifiable):
     @property
     def site_id(self) -> UUID:
         """Gets the site ID."""
-        return None if self._dotnet.SiteId is None else UUID(self._dotnet.SiteId.ToString())
+        return _wrap_guid(self._dotnet.SiteId)
     
     @property
     def owner_id(self) -> UUID:
         """Gets the owner ID."""
-        return None if self._dotnet.OwnerId is None else UUID(self._dotnet.OwnerId.ToString())
+        return _wrap_guid(self._dotnet.OwnerId)
     
     @property
     def user_display_name(self) -> str:
@@ -950,7 +987,7 @@ class PyLabel(PyRestIdentifiable):
     @property
     def content_id(self) -> UUID:
         """Gets the ID for the label's content item."""
-        return None if self._dotnet.ContentId is None else UUID(self._dotnet.ContentId.ToString())
+        return _wrap_guid(self._dotnet.ContentId)
     
     @property
     def content_type(self) -> str:
@@ -996,6 +1033,7 @@ class PyProject(PyDescriptionContent, PyWithOwner):
     """Interface for a project content item."""
     
     _dotnet_base = IProject
+    __slots__ = ()
     
     def __init__(self, project: IProject) -> None:
         """Creates a new PyProject object.
@@ -1026,6 +1064,7 @@ class PyPublishableCustomView(PyCustomView):
     """Interface for the publishable version of ICustomView."""
     
     _dotnet_base = IPublishableCustomView
+    __slots__ = ()
     
     def __init__(self, publishable_custom_view: IPublishableCustomView) -> None:
         """Creates a new PyPublishableCustomView object.
@@ -1057,6 +1096,7 @@ class PyPublishableDataSource(PyDataSourceDetails, PyConnectionsContent):
     """Interface for a IDataSource that has been downloaded and has full information necessary for re-publishing."""
     
     _dotnet_base = IPublishableDataSource
+    __slots__ = ()
     
     def __init__(self, publishable_data_source: IPublishableDataSource) -> None:
         """Creates a new PyPublishableDataSource object.
@@ -1072,6 +1112,7 @@ class PyPublishableFlow(PyFlow, PyConnectionsContent):
     """Interface for a IFlow that has been downloaded and has full information necessary for re-publishing."""
     
     _dotnet_base = IPublishableFlow
+    __slots__ = ()
     
     def __init__(self, publishable_flow: IPublishableFlow) -> None:
         """Creates a new PyPublishableFlow object.
@@ -1087,6 +1128,7 @@ class PyPublishableGroup(PyGroup):
     """Interface for a group content item with users."""
     
     _dotnet_base = IPublishableGroup
+    __slots__ = ()
     
     def __init__(self, publishable_group: IPublishableGroup) -> None:
         """Creates a new PyPublishableGroup object.
@@ -1118,6 +1160,7 @@ class PyPublishableGroupSet(PyGroupSet):
     """Interface for a group set content item with groups."""
     
     _dotnet_base = IPublishableGroupSet
+    __slots__ = ()
     
     def __init__(self, publishable_group_set: IPublishableGroupSet) -> None:
         """Creates a new PyPublishableGroupSet object.
@@ -1149,6 +1192,7 @@ class PyWorkbook(PyPublishedContent, PyDescriptionContent, PySizeContent, PyExtr
     """Interface for a workbook content item."""
     
     _dotnet_base = IWorkbook
+    __slots__ = ()
     
     def __init__(self, workbook: IWorkbook) -> None:
         """Creates a new PyWorkbook object.
@@ -1174,6 +1218,7 @@ class PyView(PyWithTags, PyContentReference, PyContainerContent):
     """Interface for view associated with the content item."""
     
     _dotnet_base = IView
+    __slots__ = ()
     
     def __init__(self, view: IView) -> None:
         """Creates a new PyView object.
@@ -1194,6 +1239,7 @@ class PyWorkbookDetails(PyWorkbook):
     """Interface for a workbook object with extended information, from a GET query for example."""
     
     _dotnet_base = IWorkbookDetails
+    __slots__ = ()
     
     def __init__(self, workbook_details: IWorkbookDetails) -> None:
         """Creates a new PyWorkbookDetails object.
@@ -1208,12 +1254,13 @@ class PyWorkbookDetails(PyWorkbook):
     @property
     def views(self) -> Sequence[PyView]:
         """Gets the view metadata."""
-        return None if self._dotnet.Views is None else list((None if x is None else PyView(x)) for x in self._dotnet.Views)
+        return _lazy_sequence(self, "Views", self._dotnet.Views, lambda x: None if x is None else PyView(x))
     
 class PyPublishableWorkbook(PyWorkbookDetails, PyConnectionsContent):
     """Interface for an IWorkbook that has been downloaded and has full information necessary for re-publishing."""
     
     _dotnet_base = IPublishableWorkbook
+    __slots__ = ()
     
     def __init__(self, publishable_workbook: IPublishableWorkbook) -> None:
         """Creates a new PyPublishableWorkbook object.
@@ -1228,12 +1275,12 @@ class PyPublishableWorkbook(PyWorkbookDetails, PyConnectionsContent):
     @property
     def thumbnails_user_id(self) -> Optional[UUID]:
         """Gets the ID of the user to generate thumbnails as."""
-        return None if self._dotnet.ThumbnailsUserId is None else UUID(self._dotnet.ThumbnailsUserId.ToString())
+        return _wrap_guid(self._dotnet.ThumbnailsUserId)
     
     @thumbnails_user_id.setter
     def thumbnails_user_id(self, value: Optional[UUID]) -> None:
         """Gets the ID of the user to generate thumbnails as."""
-        self._dotnet.ThumbnailsUserId = None if value is None else Guid.Parse(str(value))
+        self._dotnet.ThumbnailsUserId = _to_dotnet_guid(value)
     
     @property
     def hidden_view_names(self) -> Sequence[str]:
@@ -1255,6 +1302,7 @@ class PyServerSubscription(PySubscription[PyServerSchedule]):
     """The interface for a server subscription."""
     
     _dotnet_base = IServerSubscription
+    __slots__ = ()
     
     def __init__(self, server_subscription: IServerSubscription) -> None:
         """Creates a new PyServerSubscription object.
@@ -1266,10 +1314,11 @@ class PyServerSubscription(PySubscription[PyServerSchedule]):
         """
         self._dotnet = server_subscription
         
-class PyUserAuthenticationType():
+class PyUserAuthenticationType(_PyWrapperBase):
     """Structure representing the authentication type of a user."""
     
     _dotnet_base = UserAuthenticationType
+    __slots__ = ()
     
     def __init__(self, user_authentication_type: UserAuthenticationType) -> None:
         """Creates a new PyUserAuthenticationType object.
@@ -1294,7 +1343,7 @@ class PyUserAuthenticationType():
     @property
     def idp_configuration_id(self) -> Optional[UUID]:
         """Gets the IdP configuration ID, or null if the site uses AuthenticationTypes."""
-        return None if self._dotnet.IdpConfigurationId is None else UUID(self._dotnet.IdpConfigurationId.ToString())
+        return _wrap_guid(self._dotnet.IdpConfigurationId)
     
     @classmethod
     def for_authentication_type(cls, authentication_type: str) -> Self:
@@ -1317,13 +1366,14 @@ class PyUserAuthenticationType():
         
         Returns: The created UserAuthenticationType value.
         """
-        result = UserAuthenticationType.ForConfigurationId(None if idp_configuration_id is None else Guid.Parse(str(idp_configuration_id)))
+        result = UserAuthenticationType.ForConfigurationId(_to_dotnet_guid(idp_configuration_id))
         return None if result is None else PyUserAuthenticationType(result)
     
 class PyUser(PyUsernameContent):
     """Interface for a user content item."""
     
     _dotnet_base = IUser
+    __slots__ = ()
     
     def __init__(self, user: IUser) -> None:
         """Creates a new PyUser object.
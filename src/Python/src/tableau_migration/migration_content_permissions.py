@@ -19,6 +19,11 @@
 
 from enum import IntEnum # noqa: E402, F401
 from tableau_migration.migration import PyContentReference # noqa: E402, F401
+from tableau_migration.migration_interop import (  # noqa: E402, F401
+    _PyWrapperBase,
+    _to_dotnet_guid,
+    _wrap_guid
+)
 from typing import (  # noqa: E402, F401
     Set,
     Optional,
@@ -38,10 +43,11 @@ from Tableau.Migration.Content.Permissions import (  # noqa: E402, F401
     IPermissionSet
 )
 
-class PyCapability():
+class PyCapability(_PyWrapperBase):
     """The interface for a grantee's capability."""
     
     _dotnet_base = ICapability
+    __slots__ = ()
     
     def __init__(self, capability: ICapability) -> None:
         """Creates a new PyCapability object.
@@ -75,10 +81,11 @@ class PyGranteeType(IntEnum):
     #: The group set grantee type.
     GROUP_SET = 2
     
-class PyGranteeCapability():
+class PyGranteeCapability(_PyWrapperBase):
     """Interface for the grantee of permissions."""
     
     _dotnet_base = IGranteeCapability
+    __slots__ = ()
     
     def __init__(self, grantee_capability: IGranteeCapability) -> None:
         """Creates a new PyGranteeCapability object.
@@ -98,7 +105,7 @@ class PyGranteeCapability():
     @property
     def grantee_id(self) -> UUID:
         """Gets the ID for grantee."""
-        return None if self._dotnet.GranteeId is None else UUID(self._dotnet.GranteeId.ToString())
+        return _wrap_guid(self._dotnet.GranteeId)
     
     @property
     def grantee(self) -> PyContentReference:
@@ -119,10 +126,11 @@ class PyGranteeCapability():
         """Resolves Deny in case of conflict."""
         self._dotnet.ResolveCapabilityModeConflicts()
     
-class PyPermissionSet():
+class PyPermissionSet(_PyWrapperBase):
     """Interface for a set of permissions."""
     
     _dotnet_base = IPermissionSet
+    __slots__ = ()
     
     def __init__(self, permission_set: IPermissionSet) -> None:
         """Creates a new PyPermissionSet object.
@@ -154,6 +162,7 @@ class PyPermissions(PyPermissionSet):
     """Interface for the permission information of a content item."""
     
     _dotnet_base = IPermissions
+    __slots__ = ()
     
     def __init__(self, permissions: IPermissions) -> None:
         """Creates a new PyPermissions object.
@@ -168,7 +177,7 @@ class PyPermissions(PyPermissionSet):
     @property
     def parent_id(self) -> Optional[UUID]:
         """The ID of the parent content item that is determining permissions, such as a locked project. The parent content can be one of the types in ParentContentTypeNames, and will be null if the permissions are determined by the content item directly."""
-        return None if self._dotnet.ParentId is None else UUID(self._dotnet.ParentId.ToString())
+        return _wrap_guid(self._dotnet.ParentId)
     
 
 # endregion
@@ -201,7 +210,7 @@ def _create_grantee_capability(grantee_type: PyGranteeType, grantee: Union[PyCon
             dotnet_capabilities.Add(x._dotnet)
 
     if isinstance(grantee, UUID):
-        dotnet_grantee = ContentReferenceStub(Guid.Parse(str(grantee)), "", ContentLocation(DotnetList[str]()))
+        dotnet_grantee = ContentReferenceStub(_to_dotnet_guid(grantee), "", ContentLocation(DotnetList[str]()))
     else:
         dotnet_grantee = grantee._dotnet
 
@@ -23,6 +23,7 @@ from tableau_migration.migration import (  # noqa: E402, F401
     _generic_wrapper,
     PyContentReference
 )
+from tableau_migration.migration_interop import _PyWrapperBase # noqa: E402, F401
 from typing import (  # noqa: E402, F401
     Generic,
     TypeVar,
@@ -59,6 +60,7 @@ class PyWithSchedule(Generic[TSchedule], PyContentReference):
     """Interface to be inherited by content items with a schedule."""
     
     _dotnet_base = IWithSchedule
+    __slots__ = ()
     
     def __init__(self, with_schedule: IWithSchedule) -> None:
         """Creates a new PyWithSchedule object.
@@ -79,6 +81,7 @@ class PyExtractRefreshTask(Generic[TSchedule], PyWithSchedule[TSchedule]):
     """Interface for an extract refresh task content item."""
     
     _dotnet_base = IExtractRefreshTask
+    __slots__ = ()
     
     def __init__(self, extract_refresh_task: IExtractRefreshTask) -> None:
         """Creates a new PyExtractRefreshTask object.
@@ -120,10 +123,11 @@ class PyExtractRefreshTask(Generic[TSchedule], PyWithSchedule[TSchedule]):
         """Gets the extract refresh task's content."""
         self._dotnet.Content = None if value is None else value._dotnet
     
-class PyInterval():
+class PyInterval(_PyWrapperBase):
     """Interface for a schedule interval."""
     
     _dotnet_base = IInterval
+    __slots__ = ()
     
     def __init__(self, interval: IInterval) -> None:
         """Creates a new PyInterval object.
@@ -155,10 +159,11 @@ class PyInterval():
         """Gets the interval day of week value."""
         return self._dotnet.WeekDay
     
-class PyFrequencyDetails():
+class PyFrequencyDetails(_PyWrapperBase):
     """Interface for a schedule's frequency details."""
     
     _dotnet_base = IFrequencyDetails
+    __slots__ = ()
     
     def __init__(self, frequency_details: IFrequencyDetails) -> None:
         """Creates a new PyFrequencyDetails object.
@@ -206,10 +211,11 @@ class PyFrequencyDetails():
                 dotnet_collection.Add(x._dotnet)
             self._dotnet.Intervals = dotnet_collection
     
-class PySchedule():
+class PySchedule(_PyWrapperBase):
     """Interface for an API client schedule model."""
     
     _dotnet_base = ISchedule
+    __slots__ = ()
     
     def __init__(self, schedule: ISchedule) -> None:
         """Creates a new PySchedule object.
@@ -25,6 +25,7 @@ class PyCloudSchedule(PySchedule):
     """Interface for a Tableau Cloud schedule."""
     
     _dotnet_base = ICloudSchedule
+    __slots__ = ()
     
     def __init__(self, cloud_schedule: ICloudSchedule) -> None:
         """Creates a new PyCloudSchedule object.
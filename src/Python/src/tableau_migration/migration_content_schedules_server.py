@@ -26,6 +26,7 @@ class PyServerSchedule(PySchedule, PyContentReference):
     """Interface for server extract refresh schedule."""
     
     _dotnet_base = IServerSchedule
+    __slots__ = ()
     
     def __init__(self, server_schedule: IServerSchedule) -> None:
         """Creates a new PyServerSchedule object.
@@ -19,6 +19,11 @@
 
 from tableau_migration import cancellation_token # noqa: E402, F401
 from tableau_migration.migration import PyContentReference # noqa: E402, F401
+from tableau_migration.migration_interop import (  # noqa: E402, F401
+    _PyWrapperBase,
+    _to_dotnet_guid,
+    _wrap_guid
+)
 from typing import Sequence # noqa: E402, F401
 from uuid import UUID # noqa: E402, F401
 
@@ -30,10 +35,11 @@ from Tableau.Migration import (  # noqa: E402, F401
 )
 from Tableau.Migration.Content.Search import IContentReferenceFinder # noqa: E402, F401
 
-class PyContentReferenceFinder():
+class PyContentReferenceFinder(_PyWrapperBase):
     """Interface for an object that can find IContentReferences for given search criteria."""
     
     _dotnet_base = IContentReferenceFinder
+    __slots__ = ()
     
     def __init__(self, content_reference_finder: IContentReferenceFinder) -> None:
         """Creates a new PyContentReferenceFinder object.
@@ -61,9 +67,49 @@ class PyContentReferenceFinder():
         
         Returns: The found content reference, or null if no content reference was found.
         """
-        result = TaskExtensions.AwaitResult[IContentReference](self._dotnet.FindByIdAsync(None if id is None else Guid.Parse(str(id)), cancellation_token))
+        result = TaskExtensions.AwaitResult[IContentReference](self._dotnet.FindByIdAsync(_to_dotnet_guid(id), cancellation_token))
         return None if result is None else PyContentReference(result)
     
 
 # endregion
 
+from typing import Iterator, List # noqa: E402, F401
+
+from Tableau.Migration.Paging import ( # noqa: E402, F401
+    IPagedResult,
+    MemoryPager
+)
+
+def _content_reference_finder_iter_all(self, page_size: int = 100, cancel = None) -> Iterator[List[PyContentReference]]:
+    """Finds all available content references, one page at a time.
+
+    Only the current page is wrapped as Python objects, so memory use stays flat
+    when enumerating large numbers of content references.
+
+    Args:
+        self: The content reference finder.
+        page_size: The number of content references in each page.
+        cancel: A cancellation token to obey.
+
+    Returns: An iterator of pages of the found content references.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1.")
+
+    if cancel is None:
+        cancel = cancellation_token
+
+    result = TaskExtensions.AwaitResult[IImmutableList[IContentReference]](self._dotnet.FindAllAsync(cancel))
+    if result is None:
+        return
+
+    pager = MemoryPager[IContentReference](result, page_size)
+    while True:
+        page = TaskExtensions.AwaitResult[IPagedResult[IContentReference]](pager.NextPageAsync(cancel))
+        if page.Value is not None and page.Value.Count > 0:
+            yield [PyContentReference(x) for x in page.Value]
+
+        if not page.Success or page.FetchedAllPages:
+            return
+
+setattr(PyContentReferenceFinder, "iter_all", _content_reference_finder_iter_all)
@@ -33,6 +33,7 @@ from tableau_migration.migration_engine_hooks_mappings_builder import PyContentM
 from tableau_migration.migration_engine_hooks_transformers_builder import PyContentTransformerBuilder
 from tableau_migration.migration_engine_options import PyMigrationPlanOptionsBuilder, PyMigrationPlanOptionsCollection
 from tableau_migration.migration_engine_services import PyMigrationServiceBuilder, PyMigrationServiceFactoryCollection
+from tableau_migration.migration_interop import _wrap_guid
 
 from System import Func, IServiceProvider, Uri
 from Tableau.Migration import (
@@ -114,7 +115,7 @@ class PyMigrationPlan():
     @property
     def plan_id(self) -> UUID:
         """Gets the per-plan options to supply."""
-        return UUID(self._migration_plan.PlanId.ToString())
+        return _wrap_guid(self._migration_plan.PlanId)
     
     @property
     def pipeline_profile(self) -> PyPipelineProfile:
@@ -583,6 +584,7 @@ class PyMigrationPlanBuilder():
 
 from tableau_migration.migration import _generic_wrapper # noqa: E402, F401
 from tableau_migration.migration_engine_manifest import PyMigrationManifestEntryEditor # noqa: E402, F401
+from tableau_migration.migration_interop import _PyWrapperBase # noqa: E402, F401
 from typing import (  # noqa: E402, F401
     Generic,
     TypeVar
@@ -592,10 +594,11 @@ from Tableau.Migration.Engine import ContentMigrationItem # noqa: E402, F401
 
 TContent = TypeVar("TContent")
 
-class PyContentMigrationItem(Generic[TContent]):
+class PyContentMigrationItem(Generic[TContent], _PyWrapperBase):
     """Record containing in-progress migration state for a content item."""
     
     _dotnet_base = ContentMigrationItem
+    __slots__ = ()
     
     def __init__(self, content_migration_item: ContentMigrationItem) -> None:
         """Creates a new PyContentMigrationItem object.
@@ -26,6 +26,7 @@ class PyMigrationActionResult(PyResult):
     """IResult object for a migration action."""
     
     _dotnet_base = IMigrationActionResult
+    __slots__ = ()
     
     def __init__(self, migration_action_result: IMigrationActionResult) -> None:
         """Creates a new PyMigrationActionResult object.
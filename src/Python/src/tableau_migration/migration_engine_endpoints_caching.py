@@ -16,18 +16,23 @@
 """Wrapper for classes in Tableau.Migration.Engine.Endpoints.Caching namespace."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from datetime import timedelta
+from typing import Any, Generic, Optional, TypeVar
 
 from tableau_migration.migration_interop import _unwrap
 from tableau_migration.migration_engine_services import _PyServiceWrapperBuilderBase
 
+from System import TimeSpan # noqa: E402
+
 from Tableau.Migration.Content.Search import ( # noqa: E402
     BulkContentReferenceCacheLoadStrategy,
-    LazyContentReferenceCacheLoadStrategy
+    LazyContentReferenceCacheLoadStrategy,
+    PersistentContentReferenceCacheLoadStrategy
 )
 
 from Tableau.Migration.Engine.Endpoints.Caching import ( # noqa: E402
-    IContentReferenceCacheLoadStrategyProvider
+    IContentReferenceCacheLoadStrategyProvider,
+    PersistentContentReferenceCacheSnapshotPaths
 )
 
 TContent = TypeVar("TContent")
@@ -111,4 +116,48 @@ class LazyContentReferenceCacheLoadStrategyProvider(ContentReferenceCacheLoadStr
 
         Returns: The cache load strategy.
         """
-        return LazyContentReferenceCacheLoadStrategy[self._dotnet_content_type]()
\ No newline at end of file
+        return LazyContentReferenceCacheLoadStrategy[self._dotnet_content_type]()
+
+class PersistentContentReferenceCacheLoadStrategyProvider(ContentReferenceCacheLoadStrategyProviderBase[TContent]):
+    """Content reference cache load strategy provider that persists loaded content references to local snapshot files.
+
+    Later runs load the snapshot instead of listing every item again, 
+    and only search for items missing from the snapshot.
+    Snapshots are written to the "source" and "destination" sub-directories of the snapshot directory, 
+    in a sub-directory for each server host and site content URL, with one file per content type.
+    """
+
+    snapshot_directory: Optional[str] = None
+    """The directory to write snapshot files to. Bulk loading is used when no directory is set."""
+
+    max_age: timedelta = timedelta(days=1)
+    """The maximum age of a snapshot before it is ignored and re-written.
+    
+    Items in a snapshot are not searched again, so this limits how long deleted or moved items can still be found.
+    """
+
+    def _get_strategy(self, endpoint: str):
+        if not self.snapshot_directory:
+            return BulkContentReferenceCacheLoadStrategy[self._dotnet_content_type]()
+
+        plan = self.services.get_plan()
+        endpoint_config = plan.source if endpoint == "source" else plan.destination
+
+        path = PersistentContentReferenceCacheSnapshotPaths.GetSnapshotPath[self._dotnet_content_type](
+            self.snapshot_directory, endpoint, _unwrap(endpoint_config))
+
+        return PersistentContentReferenceCacheLoadStrategy[self._dotnet_content_type](path, TimeSpan.FromSeconds(self.max_age.total_seconds()))
+
+    def get_source_cache_load_strategy(self):
+        """Gets the cache load strategy for source endpoints.
+
+        Returns: The cache load strategy.
+        """
+        return self._get_strategy("source")
+
+    def get_destination_cache_load_strategy(self):
+        """Gets the cache load strategy for destination endpoints.
+
+        Returns: The cache load strategy.
+        """
+        return self._get_strategy("destination")
@@ -20,8 +20,11 @@ from typing import (
     TypeVar,
     Type,
     Union,
-    Sequence,
-    Any
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional
 )
 
 from uuid import UUID
@@ -37,6 +40,7 @@ from tableau_migration.migration import ( # noqa: E402, F401
 
 from tableau_migration.migration_content_search import PyContentReferenceFinder # noqa: E402, F401
 from tableau_migration.migration_interop import (
+    _to_dotnet_guid,
     _unwrap_async, 
     _wrap_content_location, 
     _wrap_guid
@@ -45,14 +49,18 @@ from tableau_migration.migration_engine_services import _PyServiceWrapperBuilder
 
 from System import Guid # noqa: E402, F401
 from System.Threading.Tasks import Task # noqa: E402, F401
-from System.Collections.Immutable import ImmutableList # noqa: E402, F401
+from System.Collections.Generic import List as DotnetList # noqa: E402, F401
+from System.Collections.Immutable import ImmutableArray, IImmutableDictionary, IImmutableList # noqa: E402, F401
 
 from Tableau.Migration import ( # noqa: E402, F401
+    ContentLocation,
     IContentReference,
     TaskExtensions
 )
 
 from Tableau.Migration.Engine.Endpoints.Search import ( # noqa: E402, F401
+    IBulkContentReferenceFinder,
+    IBulkMappedContentReferenceFinder,
     IDestinationContentReferenceFinder,
     ISourceContentReferenceFinder,
     ManifestDestinationContentReferenceFinder,
@@ -61,6 +69,55 @@ from Tableau.Migration.Engine.Endpoints.Search import ( # noqa: E402, F401
 )
 
 TContent = TypeVar("TContent")
+TKey = TypeVar("TKey")
+
+def _as_bulk_finder(finder, bulk_type):
+    """Casts a .NET content reference finder to a bulk finder interface, or returns None if it is not implemented."""
+    try:
+        return bulk_type(finder)
+    except TypeError:
+        return None
+
+def _find_many(keys: Iterable[TKey], find_one: Callable, find_many_async: Optional[Callable], dotnet_key_type: type,
+               to_dotnet_key: Callable, cancel) -> Dict[TKey, Optional[PyContentReference]]:
+    """Finds content references for many keys, with a single .NET call when the finder supports bulk lookups.
+
+    Args:
+        keys: The Python keys to find content references for. None keys are skipped.
+        find_one: The Python method to find a single key with when the finder does not support bulk lookups.
+        find_many_async: The bulk .NET finder method, or None if the finder does not support bulk lookups.
+        dotnet_key_type: The .NET key type.
+        to_dotnet_key: A function to convert a Python key to a .NET key.
+        cancel: A cancellation token to obey.
+
+    Returns: The found content references by key, with a None value for each key where no content reference was found.
+    """
+    keys = [k for k in keys if k is not None]
+    if not keys:
+        return {}
+
+    if cancel is None:
+        cancel = cancellation_token
+
+    if find_many_async is None:
+        return {k: find_one(k, cancel) for k in keys}
+
+    dotnet_keys = [to_dotnet_key(k) for k in keys]
+    dotnet_key_list = DotnetList[dotnet_key_type]()
+    for dotnet_key in dotnet_keys:
+        dotnet_key_list.Add(dotnet_key)
+
+    result = TaskExtensions.AwaitResult[IImmutableDictionary[dotnet_key_type, IContentReference]](find_many_async(dotnet_key_list, cancel))
+
+    if result is None:
+        return {k: None for k in keys}
+
+    found = {}
+    for key, dotnet_key in zip(keys, dotnet_keys):
+        has_value, reference = result.TryGetValue(dotnet_key, None)
+        found[key] = PyContentReference(reference) if has_value and reference is not None else None
+
+    return found
 
 class PyDestinationContentReferenceFinder(Generic[TContent], PyContentReferenceFinder):
     """Interface for an object that can find destination content reference for given content information, applying mapping rules."""
@@ -130,7 +187,7 @@ class PyDestinationContentReferenceFinder(Generic[TContent], PyContentReferenceF
         if cancel is None:
             cancel = cancellation_token
 
-        result = TaskExtensions.AwaitResult[IContentReference](self._dotnet.FindBySourceIdAsync(Guid.Parse(str(source_id)), cancel))
+        result = TaskExtensions.AwaitResult[IContentReference](self._dotnet.FindBySourceIdAsync(_to_dotnet_guid(source_id), cancel))
         return None if result is None else PyContentReference(result)
     
     def find_by_id(self, id: UUID, cancel = None) -> Union[PyContentReference, None]:
@@ -148,7 +205,7 @@ class PyDestinationContentReferenceFinder(Generic[TContent], PyContentReferenceF
         if cancel is None:
             cancel = cancellation_token
 
-        result = TaskExtensions.AwaitResult[IContentReference](self._dotnet.FindByIdAsync(Guid.Parse(str(id)), cancel))
+        result = TaskExtensions.AwaitResult[IContentReference](self._dotnet.FindByIdAsync(_to_dotnet_guid(id), cancel))
         return None if result is None else PyContentReference(result)
     
     def find_by_source_content_url(self, source_content_url: str, cancel = None) -> Union[PyContentReference, None]:
@@ -168,6 +225,45 @@ class PyDestinationContentReferenceFinder(Generic[TContent], PyContentReferenceF
 
         result = TaskExtensions.AwaitResult[IContentReference](self._dotnet.FindBySourceContentUrlAsync(source_content_url.strip(), cancel))
         return None if result is None else PyContentReference(result)
+
+    def find_many_by_ids(self, ids: Iterable[UUID], cancel = None) -> Dict[UUID, Optional[PyContentReference]]:
+        """Finds the content references by their unique identifiers.
+        
+        Args:
+            ids: The unique identifiers.
+            cancel: A cancellation token to obey.
+        
+        Returns: The found content references by ID, with a None value for each ID where no content reference was found.
+        """
+        bulk_finder = _as_bulk_finder(self._dotnet, IBulkContentReferenceFinder)
+        return _find_many(ids, self.find_by_id, bulk_finder.FindManyByIdsAsync if bulk_finder else None,
+                          Guid, _to_dotnet_guid, cancel)
+
+    def find_many_by_source_ids(self, source_ids: Iterable[UUID], cancel = None) -> Dict[UUID, Optional[PyContentReference]]:
+        """Finds the destination content references for the source content reference unique identifiers.
+        
+        Args:
+            source_ids: The source content reference unique identifiers.
+            cancel: A cancellation token to obey.
+        
+        Returns: The found destination content references by source ID, with a None value for each ID where no content reference was found.
+        """
+        bulk_finder = _as_bulk_finder(self._dotnet, IBulkMappedContentReferenceFinder)
+        return _find_many(source_ids, self.find_by_source_id, bulk_finder.FindManyBySourceIdsAsync if bulk_finder else None,
+                          Guid, _to_dotnet_guid, cancel)
+
+    def find_many_by_source_locations(self, source_locations: Iterable[PyContentLocation], cancel = None) -> Dict[PyContentLocation, Optional[PyContentReference]]:
+        """Finds the destination content references for the source content reference locations.
+        
+        Args:
+            source_locations: The source content reference locations.
+            cancel: A cancellation token to obey.
+        
+        Returns: The found destination content references by source location, with a None value for each location where no content reference was found.
+        """
+        bulk_finder = _as_bulk_finder(self._dotnet, IBulkContentReferenceFinder)
+        return _find_many(source_locations, self.find_by_source_location, bulk_finder.FindManyBySourceLocationsAsync if bulk_finder else None,
+                          ContentLocation, lambda location: location._dotnet, cancel)
     
 class PySourceContentReferenceFinder(Generic[TContent], PyContentReferenceFinder):
     """Interface for an object that can find source content reference."""
@@ -219,8 +315,34 @@ class PySourceContentReferenceFinder(Generic[TContent], PyContentReferenceFinder
         if cancel is None:
             cancel = cancellation_token
 
-        result = TaskExtensions.AwaitResult[IContentReference](self._dotnet.FindByIdAsync(Guid.Parse(str(id)), cancel))
+        result = TaskExtensions.AwaitResult[IContentReference](self._dotnet.FindByIdAsync(_to_dotnet_guid(id), cancel))
         return None if result is None else PyContentReference(result)
+
+    def find_many_by_ids(self, ids: Iterable[UUID], cancel = None) -> Dict[UUID, Optional[PyContentReference]]:
+        """Finds the content references by their unique identifiers.
+        
+        Args:
+            ids: The unique identifiers.
+            cancel: A cancellation token to obey.
+        
+        Returns: The found content references by ID, with a None value for each ID where no content reference was found.
+        """
+        bulk_finder = _as_bulk_finder(self._dotnet, IBulkContentReferenceFinder)
+        return _find_many(ids, self.find_by_id, bulk_finder.FindManyByIdsAsync if bulk_finder else None,
+                          Guid, _to_dotnet_guid, cancel)
+
+    def find_many_by_source_locations(self, source_locations: Iterable[PyContentLocation], cancel = None) -> Dict[PyContentLocation, Optional[PyContentReference]]:
+        """Finds the source content references for the source content reference locations.
+        
+        Args:
+            source_locations: The source content reference locations.
+            cancel: A cancellation token to obey.
+        
+        Returns: The found source content references by source location, with a None value for each location where no content reference was found.
+        """
+        bulk_finder = _as_bulk_finder(self._dotnet, IBulkContentReferenceFinder)
+        return _find_many(source_locations, self.find_by_source_location, bulk_finder.FindManyBySourceLocationsAsync if bulk_finder else None,
+                          ContentLocation, lambda location: location._dotnet, cancel)
         
 class PyDestinationContentReferenceFinderFactory():
     """Interface for an object that can create destination content reference finders based on content type."""
@@ -308,14 +430,15 @@ class _PyContentReferenceFinderWrapperBuilderBase(_PyServiceWrapperBuilderBase):
             result = python_instance.find_all()
             
             if result is None:
-                return Task.FromResult[ImmutableList[IContentReference]](ImmutableList[IContentReference].Empty)
+                return Task.FromResult[IImmutableList[IContentReference]](ImmutableArray[IContentReference].Empty)
             
-            dotnet_list = ImmutableList[IContentReference].Empty
+            # Build the result in one pass, the result may be a generator that is never fully held in Python.
+            builder = ImmutableArray.CreateBuilder[IContentReference]()
             for item in result:
                 if hasattr(item, "_dotnet"):
-                    dotnet_list = dotnet_list.Add(item._dotnet)
+                    builder.Add(item._dotnet)
             
-            return Task.FromResult[ImmutableList[IContentReference]](dotnet_list)
+            return Task.FromResult[IImmutableList[IContentReference]](builder.ToImmutable())
         return async_method
 
 class _PyDestinationContentReferenceFinderWrapperBuilder(_PyContentReferenceFinderWrapperBuilderBase):
@@ -400,10 +523,10 @@ class PyDestinationContentReferenceFinderBase(Generic[TContent]):
         """
         return None
     
-    def find_all(self) -> Sequence[PyContentReference]:
+    def find_all(self) -> Iterable[PyContentReference]:
         """Finds all available content references.
         
-        Returns: The found content references.
+        Returns: The found content references. A generator can be returned to avoid building a list of all references in Python.
         """
         return []
 
@@ -456,9 +579,9 @@ class PySourceContentReferenceFinderBase(Generic[TContent]):
         """
         return None
     
-    def find_all(self) -> Sequence[PyContentReference]:
+    def find_all(self) -> Iterable[PyContentReference]:
         """Finds all available content references.
         
-        Returns: The found content references.
+        Returns: The found content references. A generator can be returned to avoid building a list of all references in Python.
         """
         return []
@@ -18,8 +18,12 @@
 # region _generated
 
 from enum import IntEnum # noqa: E402, F401
-from tableau_migration.migration import _generic_wrapper # noqa: E402, F401
+from tableau_migration.migration import (  # noqa: E402, F401
+    _generic_wrapper,
+    _lazy_sequence
+)
 from tableau_migration.migration_engine import PyContentMigrationItem # noqa: E402, F401
+from tableau_migration.migration_interop import _PyWrapperBase # noqa: E402, F401
 from typing import (  # noqa: E402, F401
     Generic,
     TypeVar,
@@ -50,6 +54,7 @@ class PyContentFilterContextItem(Generic[TContent], PyContentMigrationItem[TCont
     """Context for IContentFilter operations, determining whether a content item should be migrated and whether to cascade filtering to dependent content types."""
     
     _dotnet_base = ContentFilterContextItem
+    __slots__ = ()
     
     def __init__(self, content_filter_context_item: ContentFilterContextItem) -> None:
         """Creates a new PyContentFilterContextItem object.
@@ -71,10 +76,11 @@ class PyContentFilterContextItem(Generic[TContent], PyContentMigrationItem[TCont
         """Gets or sets the current filtering status for the content item."""
         self._dotnet.Status = FilterStatus(value)
     
-class PyContentFilterContext(Generic[TContent]):
+class PyContentFilterContext(Generic[TContent], _PyWrapperBase):
     """Context for IContentFilter operations, determining which items should be migrated and whether to cascade filtering to dependent content types."""
     
     _dotnet_base = ContentFilterContext
+    __slots__ = ()
     
     def __init__(self, content_filter_context: ContentFilterContext) -> None:
         """Creates a new PyContentFilterContext object.
@@ -89,7 +95,7 @@ class PyContentFilterContext(Generic[TContent]):
     @property
     def items(self) -> Sequence[PyContentFilterContextItem[TContent]]:
         """Gets the items to potentially filter."""
-        return None if self._dotnet.Items is None else list((None if x is None else PyContentFilterContextItem[TContent](x)) for x in self._dotnet.Items)
+        return _lazy_sequence(self, "Items", self._dotnet.Items, lambda x: None if x is None else PyContentFilterContextItem[TContent](x))
     
 
 # endregion
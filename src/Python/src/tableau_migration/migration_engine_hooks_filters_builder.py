@@ -49,7 +49,7 @@ class PyContentFilterBuilder():
         return self
 
 
-    def add(self, input_0: type, input_1: Union[Callable, None] = None) -> Self:
+    def add(self, input_0: type, input_1: Union[Callable, None] = None, is_batch: bool = False) -> Self:
         """Adds an object or function to execute filters.
 
         Args:
@@ -59,13 +59,18 @@ class PyContentFilterBuilder():
             input_1: Either:
                 1) The callback function to execute, or
                 2) None
+            is_batch: True if the given callback function is a batch filter callback that considers a list of items, otherwise false.
 
         Returns:
             The same mapping builder object for fluent API calls.
         """
-        from migration_engine_hooks_filters_interop import _PyFilterWrapperBuilder
+        from migration_engine_hooks_filters_interop import _PyBatchFilterWrapperBuilder, _PyFilterWrapperBuilder
+
+        if input_1 is None:
+            wrapper_builder = getattr(input_0, "_wrapper_builder", _PyFilterWrapperBuilder)(input_0)
+        else:
+            wrapper_builder = (_PyBatchFilterWrapperBuilder if is_batch else _PyFilterWrapperBuilder)(input_0, input_1)
 
-        wrapper_builder = _PyFilterWrapperBuilder(input_0, input_1)
         self._content_filters_builder.Add[wrapper_builder.wrapper_type, wrapper_builder.dotnet_content_type](Func[IServiceProvider, wrapper_builder.wrapper_type](wrapper_builder.factory))
     
         return self
@@ -15,14 +15,19 @@
 
 """Interoperability utility for filters."""
 
-from inspect import signature
-from typing import Callable, Generic, Optional, TypeVar, Union
+import asyncio
+from functools import partial
+from inspect import isawaitable, signature
+from typing import AbstractSet, Callable, Generic, Optional, Sequence, TypeVar, Union
 
 from migration_engine import PyContentMigrationItem
 from migration_engine_hooks_filters import PyContentFilterContextItem, PyFilterStatus
 from migration_engine_hooks_interop import _PyHookWrapperBuilderBase
+from migration_interop import _unwrap_async
+from tableau_migration.migration_asyncio import _then
+from tableau_migration.migration_location_index import LocationIndex
 
-from Tableau.Migration.Engine.Hooks.Filters import ContentFilterBase, ContentFilterContextItem
+from Tableau.Migration.Engine.Hooks.Filters import ContentFilterBase, ContentFilterContext, ContentFilterContextItem, FilterStatus
 
 TContent = TypeVar("TContent")
 
@@ -60,24 +65,44 @@ def _upgrade_filter_result(ctx, result):
 def _upgrade_callback_result(callback: Callable) -> Callable:
     
     def _upgrade_result(ctx):
-        return _upgrade_filter_result(ctx, callback(ctx))
+        return _then(callback(ctx), lambda result: _upgrade_filter_result(ctx, result))
 
     def _upgrade_result_services(ctx, s):
-        return _upgrade_filter_result(ctx, callback(ctx, s))
+        return _then(callback(ctx, s), lambda result: _upgrade_filter_result(ctx, result))
     
     if len(signature(callback).parameters) == 1:
         return _upgrade_result
     else:
         return _upgrade_result_services
 
+def _filter_item(hook, item: PyContentFilterContextItem):
+    # Async filters can override either filter or should_migrate, and the default filter cannot await should_migrate.
+    if getattr(type(hook), "filter", PyContentFilterBase.filter) is not PyContentFilterBase.filter:
+        return hook.filter(item)
+
+    if item.status != PyFilterStatus.MIGRATE:
+        return None
+
+    return _then(hook.should_migrate(item), lambda result: _upgrade_filter_result(item, result))
+
+async def _gather_filter_items(ctx, results: list):
+    await asyncio.gather(*results)
+    return ctx
+
 class _PyFilterWrapperBuilder(_PyHookWrapperBuilderBase):
     
     def __init__(self, t: Union[type, list], callback: Optional[Callable] = None) -> None:
         if callback is None:
             super().__init__(t)
         else:
+            # The upgraded callback is a new function every time, so wrapper types are named and cached by the user callback.
+            self.source_callback = callback
             super().__init__(t, _upgrade_callback_result(callback))
 
+    @property
+    def user_callback(self) -> Callable:
+        return self.source_callback
+
     @property
     def python_content_type(self) -> type:
         return self.python_generic_types[0]
@@ -89,20 +114,196 @@ class _PyFilterWrapperBuilder(_PyHookWrapperBuilderBase):
     def get_wrapper_base_type(self) -> type:
         return ContentFilterBase[self.dotnet_content_type]
 
+    @property
+    def _hook_method_names(self) -> tuple[str, ...]:
+        return ("filter", "should_migrate")
+
     @property
     def _wrapper_method_name(self) -> str:
-        return "Filter"
+        # Async filters override the whole batch execution so that items are filtered concurrently.
+        return "ExecuteAsync" if self.is_async_hook else "Filter"
 
     @property
     def _wrapper_async(self) -> bool:
-        return False
+        return self.is_async_hook
 
     def _wrapper_context_type(self) -> type:
-        return ContentFilterContextItem[self.dotnet_content_type]
+        context_type = ContentFilterContext if self.is_async_hook else ContentFilterContextItem
+        return context_type[self.dotnet_content_type]
 
     def _wrap_execute_method(self) -> Callable:
+        if self.is_async_hook:
+            return lambda w : partial(_filter_item, w._inner)
+        
         return lambda w : w._inner.filter
     
     def _wrap_context_callback(self) -> Callable:
-        return lambda ctx : PyContentFilterContextItem[self.python_content_type](ctx)
-    
\ No newline at end of file
+        # Subscripting the generic context type allocates a new alias, so it is done once per wrapper type.
+        context_type = PyContentFilterContextItem[self.python_content_type]
+        return lambda ctx : context_type(ctx)
+
+    def build_wrapper_execute(self, wrap_method: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
+        if not is_async:
+            return super().build_wrapper_execute(wrap_method, wrap_context, ctx_type, is_async)
+
+        def _execute_async(s, ctx, cancel):
+            filter_item = wrap_method(s)
+            return self._filter_items_async(ctx, ctx_type, lambda item: filter_item(wrap_context(item)), cancel)
+
+        return _execute_async
+
+    def build_wrapper_execute_callback(self, callback: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
+        if not is_async:
+            return super().build_wrapper_execute_callback(callback, wrap_context, ctx_type, is_async)
+
+        def _execute_async(s, ctx, cancel):
+            return self._filter_items_async(ctx, ctx_type, lambda item: callback(wrap_context(item)), cancel)
+
+        def _execute_services_async(s, ctx, cancel):
+            return self._filter_items_async(ctx, ctx_type, lambda item: callback(wrap_context(item), s.services), cancel)
+
+        return _execute_async if len(signature(callback).parameters) == 1 else _execute_services_async
+
+    @staticmethod
+    def _filter_items_async(ctx, ctx_type: type, filter_item: Callable, cancel):
+        # Python filters are never disabled, so every item is considered like ContentFilterBase.ExecuteAsync does.
+        results = [r for r in (filter_item(item) for item in ctx.Items) if isawaitable(r)]
+        return _unwrap_async(ctx_type, _gather_filter_items(ctx, results) if results else ctx, cancel)
+    
+BatchFilterResult = Optional[Union[AbstractSet[int], Sequence[Union[bool, PyFilterStatus]]]]
+"""Result of a batch filter: None, a set of item indexes to skip, or a status for each item."""
+
+def _apply_batch_filter_result(items: list, result: BatchFilterResult) -> None:
+    if result is None:
+        return
+
+    if isinstance(result, AbstractSet):
+        for index in result:
+            items[index].status = PyFilterStatus.SKIP
+        return
+
+    if len(result) != len(items):
+        raise ValueError(f"Batch filter returned {len(result)} statuses for {len(items)} items.")
+
+    # Only write back changed statuses, every item passed to the filter is already migrating.
+    for item, status in zip(items, result):
+        if isinstance(status, bool):
+            if not status:
+                item.status = PyFilterStatus.SKIP
+        elif status != PyFilterStatus.MIGRATE:
+            item.status = PyFilterStatus(status)
+
+def _apply_batch_result(ctx, items: list, result: BatchFilterResult):
+    _apply_batch_filter_result(items, result)
+    return ctx
+
+class _PyBatchFilterWrapperBuilder(_PyFilterWrapperBuilder):
+    
+    def __init__(self, t: Union[type, list], callback: Optional[Callable] = None) -> None:
+        # Batch callbacks return their results directly, so they are not upgraded like per-item callbacks.
+        _PyHookWrapperBuilderBase.__init__(self, t, callback)
+
+    @property
+    def user_callback(self) -> Callable:
+        return self.callback
+
+    @property
+    def _hook_method_names(self) -> tuple[str, ...]:
+        return ("filter_batch",)
+
+    @property
+    def _wrapper_method_name(self) -> str:
+        return "ExecuteAsync"
+
+    @property
+    def _wrapper_async(self) -> bool:
+        return True
+
+    def _wrapper_context_type(self) -> type:
+        return ContentFilterContext[self.dotnet_content_type]
+
+    def _wrap_execute_method(self) -> Callable:
+        return lambda w : w._inner.filter_batch
+    
+    def _wrap_context_callback(self) -> Callable:
+        context_type = PyContentFilterContextItem[self.python_content_type]
+
+        def _wrap_items(ctx):
+            return [context_type(x) for x in ctx.Items if x.Status == FilterStatus.Migrate]
+
+        return _wrap_items
+
+    def build_wrapper_execute(self, wrap_method: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
+        def _execute_async(s, ctx, cancel):
+            items = wrap_context(ctx)
+            if not items:
+                return _unwrap_async(ctx_type, ctx)
+            return _unwrap_async(ctx_type, _then(wrap_method(s)(items), lambda result: _apply_batch_result(ctx, items, result)), cancel)
+
+        return _execute_async
+
+    def build_wrapper_execute_callback(self, callback: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
+        def _execute_async(s, ctx, cancel):
+            items = wrap_context(ctx)
+            if not items:
+                return _unwrap_async(ctx_type, ctx)
+            return _unwrap_async(ctx_type, _then(callback(items), lambda result: _apply_batch_result(ctx, items, result)), cancel)
+
+        def _execute_services_async(s, ctx, cancel):
+            items = wrap_context(ctx)
+            if not items:
+                return _unwrap_async(ctx_type, ctx)
+            return _unwrap_async(ctx_type, _then(callback(items, s.services), lambda result: _apply_batch_result(ctx, items, result)), cancel)
+
+        return _execute_async if len(signature(callback).parameters) == 1 else _execute_services_async
+
+class PyBatchContentFilterBase(Generic[TContent]):
+    """Generic base class for filters that consider a whole batch of content items in one call.
+    
+    Batch filters are called once per filter execution instead of once per content item,
+    which avoids crossing between .NET and Python for each item.
+    """
+
+    _wrapper_builder = _PyBatchFilterWrapperBuilder
+
+    def filter_batch(self, items: list[PyContentFilterContextItem[TContent]]) -> BatchFilterResult:
+        """Considers a batch of content items for filtering.
+        
+        Args:
+            items: The items to potentially filter. Only items that are currently set to migrate are included.
+            
+        Returns:
+            Either:
+                1) None, if item statuses were set directly or no items are filtered,
+                2) A set of indexes of the items to skip, or
+                3) A status for each item, either a PyFilterStatus or a bool that is False to skip the item.
+        """
+        return None
+
+class PyPrefixSkipFilter(PyBatchContentFilterBase[TContent]):
+    """Generic filter that skips content items within any location of a precomputed location index.
+
+    Subclass with a content type and set location_index to the locations to skip, for example
+    a LocationIndex of project paths, to skip the projects and all content within them.
+    """
+
+    location_index: Optional[LocationIndex] = None
+    """The locations to skip content within."""
+
+    skip_indexed_locations: bool = True
+    """True to also skip content items located at an indexed location, otherwise false to only skip content within them."""
+
+    def filter_batch(self, items: list[PyContentFilterContextItem[TContent]]) -> BatchFilterResult:
+        """Skips the content items within an indexed location.
+        
+        Args:
+            items: The items to potentially filter.
+            
+        Returns:
+            The indexes of the items to skip.
+        """
+        index = self.location_index
+        if index is None:
+            return None
+
+        return {i for i, item in enumerate(items) if index.has_ancestor(item._dotnet.SourceItem.Location, self.skip_indexed_locations)}
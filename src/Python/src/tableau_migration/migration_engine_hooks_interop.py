@@ -17,18 +17,20 @@
 
 from abc import abstractmethod
 from inspect import signature
-from typing import Any, Callable, Generic, Optional, TypeVar, Union
-from uuid import uuid4
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar, Union
 
+from tableau_migration.migration_asyncio import _is_async_callable
 from tableau_migration.migration_engine_actions import PyMigrationActionResult
+from tableau_migration.migration_engine_hooks_profiling import HookProfileKey, _profiled_execute, _profiled_user_callable, _profiled_user_method
 from tableau_migration.migration_engine_hooks_initializemigration import PyInitializeMigrationHookResult
 from tableau_migration.migration_engine_migrators_batch import PyContentBatchMigrationResult
-from tableau_migration.migration_interop import _PyWrapperBuilderBase, _unwrap, _unwrap_async
+from tableau_migration.migration_interop import _PyWrapperBuilderBase, _type_name, _unwrap, _unwrap_async
 
 from System import IServiceProvider
 from Tableau.Migration.Engine.Actions import IMigrationActionResult
+from Tableau.Migration.Engine.Hooks import IContentBatchMigrationCompletedHook, IMigrationActionCompletedHook
 from Tableau.Migration.Engine.Migrators.Batch import IContentBatchMigrationResult
-from Tableau.Migration.Engine.Hooks.InitializeMigration import IInitializeMigrationHookResult
+from Tableau.Migration.Engine.Hooks.InitializeMigration import IInitializeMigrationHook, IInitializeMigrationHookResult
 from Tableau.Migration.Interop.Hooks import ISyncContentBatchMigrationCompletedHook, ISyncInitializeMigrationHook, ISyncMigrationActionCompletedHook
 
 TContent = TypeVar("TContent")
@@ -60,6 +62,24 @@ class _PyHookWrapperBuilderBase(_PyWrapperBuilderBase):
         return hasattr(self, "callback")
 
 
+    @property
+    def user_callback(self) -> Callable:
+        return self.callback
+
+
+    @property
+    def _hook_method_names(self) -> tuple[str, ...]:
+        return ("execute",)
+
+
+    @property
+    def is_async_hook(self) -> bool:
+        if self.is_callback_hook:
+            return _is_async_callable(self.user_callback)
+        else:
+            return any(_is_async_callable(getattr(self.inner_type, name, None)) for name in self._hook_method_names)
+
+
     def __init__(self, t: Union[type, list], callback: Optional[Callable] = None) -> None:
         if callback is None:
             super().__init__(t)
@@ -87,11 +107,18 @@ class _PyHookWrapperBuilderBase(_PyWrapperBuilderBase):
 
     def get_wrapper_type_name(self) -> str:
         if self.is_callback_hook:
-            return self.callback.__name__ + "_InteropWrapper_" + str(uuid4())
+            return "_".join([self.user_callback.__name__, "InteropWrapper"] + [getattr(t, "__name__", str(t)) for t in self.python_generic_types])
         else:
             return super().get_wrapper_type_name()
 
 
+    def get_wrapper_cache_key(self) -> Optional[Hashable]:
+        if self.is_callback_hook:
+            return (type(self), self.user_callback, self.python_generic_types)
+        else:
+            return super().get_wrapper_cache_key()
+
+
     def get_wrapper_init(self) -> Callable:
         if self.is_callback_hook:
             return _wrapper_init_callback()
@@ -99,13 +126,25 @@ class _PyHookWrapperBuilderBase(_PyWrapperBuilderBase):
             return super().get_wrapper_init()            
 
 
+    def get_profile_key(self) -> HookProfileKey:
+        hook = self.user_callback if self.is_callback_hook else self.inner_type
+        return HookProfileKey(getattr(hook, "__qualname__", _type_name(hook)), ", ".join(_type_name(t) for t in self.python_generic_types))
+
+
     def add_wrapper_members(self, members: dict[str, Any]) -> dict[str, Any]:
         wrap_context = self._wrap_context_callback()
 
+        # Wrapper types are cached across migrations, so timing is always wired in and only records while profiling is active.
+        profile_key = self.get_profile_key()
+
         if self.is_callback_hook:
-            members[self._wrapper_method_name] = self.build_wrapper_execute_callback(self.callback, wrap_context, self._wrapper_context_type(), self._wrapper_async)
+            callback = _profiled_user_callable(self.callback, profile_key)
+            execute = self.build_wrapper_execute_callback(callback, wrap_context, self._wrapper_context_type(), self._wrapper_async)
         else:
-            members[self._wrapper_method_name] = self.build_wrapper_execute(self._wrap_execute_method(), wrap_context, self._wrapper_context_type(), self._wrapper_async)
+            wrap_method = _profiled_user_method(self._wrap_execute_method(), profile_key)
+            execute = self.build_wrapper_execute(wrap_method, wrap_context, self._wrapper_context_type(), self._wrapper_async)
+
+        members[self._wrapper_method_name] = _profiled_execute(execute, profile_key)
 
         self.set_extra_wrapper_members(members, wrap_context)
 
@@ -119,7 +158,7 @@ class _PyHookWrapperBuilderBase(_PyWrapperBuilderBase):
     
         def _execute_async(s, ctx, cancel):
             result = wrap_method(s)(wrap_context(ctx))
-            return _unwrap_async(ctx_type, result)
+            return _unwrap_async(ctx_type, result, cancel)
 
         return _execute_async if is_async else _execute
 
@@ -131,7 +170,7 @@ class _PyHookWrapperBuilderBase(_PyWrapperBuilderBase):
 
         def _execute_async(s, ctx, cancel):
             result = callback(wrap_context(ctx))
-            return _unwrap_async(ctx_type, result)
+            return _unwrap_async(ctx_type, result, cancel)
 
         def _execute_services(s, ctx):
             result = callback(wrap_context(ctx), s.services)
@@ -139,7 +178,7 @@ class _PyHookWrapperBuilderBase(_PyWrapperBuilderBase):
 
         def _execute_services_async(s, ctx, cancel):
             result = callback(wrap_context(ctx), s.services)
-            return _unwrap_async(ctx_type, result)
+            return _unwrap_async(ctx_type, result, cancel)
 
         if len(signature(callback).parameters) == 1:
             return _execute_async if is_async else _execute
@@ -170,14 +209,14 @@ class _PyMigrationActionCompletedHookWrapperBuilder(_PyHookWrapperBuilderBase):
 
     @property
     def _wrapper_method_name(self) -> str:
-        return "Execute"
+        return "ExecuteAsync" if self.is_async_hook else "Execute"
 
     @property
     def _wrapper_async(self) -> bool:
-        return False
+        return self.is_async_hook
 
     def get_wrapper_base_type(self) -> type:
-        return ISyncMigrationActionCompletedHook
+        return IMigrationActionCompletedHook if self.is_async_hook else ISyncMigrationActionCompletedHook
 
     def _wrapper_context_type(self) -> type:
         return IMigrationActionResult
@@ -222,14 +261,15 @@ class _PyContentBatchMigrationCompletedHookWrapperBuilder(_PyHookWrapperBuilderB
     
     @property
     def _wrapper_method_name(self) -> str:
-        return "Execute"
+        return "ExecuteAsync" if self.is_async_hook else "Execute"
 
     @property
     def _wrapper_async(self) -> bool:
-        return False
+        return self.is_async_hook
 
     def get_wrapper_base_type(self) -> type:
-        return ISyncContentBatchMigrationCompletedHook[self.dotnet_content_type]
+        base_type = IContentBatchMigrationCompletedHook if self.is_async_hook else ISyncContentBatchMigrationCompletedHook
+        return base_type[self.dotnet_content_type]
 
     def _wrapper_context_type(self) -> type:
         return IContentBatchMigrationResult[self.dotnet_content_type]
@@ -266,14 +306,14 @@ class _PyInitializeMigrationHookWrapperBuilder(_PyHookWrapperBuilderBase):
 
     @property
     def _wrapper_method_name(self) -> str:
-        return "Execute"
+        return "ExecuteAsync" if self.is_async_hook else "Execute"
 
     @property
     def _wrapper_async(self) -> bool:
-        return False
+        return self.is_async_hook
 
     def get_wrapper_base_type(self) -> type:
-        return ISyncInitializeMigrationHook
+        return IInitializeMigrationHook if self.is_async_hook else ISyncInitializeMigrationHook
 
     def _wrapper_context_type(self) -> type:
         return IInitializeMigrationHookResult
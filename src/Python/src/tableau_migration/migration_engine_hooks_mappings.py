@@ -21,6 +21,7 @@ from tableau_migration.migration import (  # noqa: E402, F401
     _generic_wrapper,
     PyContentLocation
 )
+from tableau_migration.migration_interop import _PyWrapperBase # noqa: E402, F401
 from typing import (  # noqa: E402, F401
     Generic,
     TypeVar
@@ -31,10 +32,11 @@ from Tableau.Migration.Engine.Hooks.Mappings import ContentMappingContext # noqa
 
 TContent = TypeVar("TContent")
 
-class PyContentMappingContext(Generic[TContent]):
+class PyContentMappingContext(Generic[TContent], _PyWrapperBase):
     """Context for IContentMapping operations mapping a content item to an intended destination location for publishing and content references."""
     
     _dotnet_base = ContentMappingContext
+    __slots__ = ()
     
     def __init__(self, content_mapping_context: ContentMappingContext) -> None:
         """Creates a new PyContentMappingContext object.
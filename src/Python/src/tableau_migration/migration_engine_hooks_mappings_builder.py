@@ -48,7 +48,7 @@ class PyContentMappingBuilder():
         return self
 
 
-    def add(self, input_0: type, input_1: Union[Callable, None] = None) -> Self:
+    def add(self, input_0: type, input_1: Union[Callable, None] = None, is_batch: bool = False) -> Self:
         """Adds an object or function to execute mappings.
 
         Args:
@@ -58,13 +58,18 @@ class PyContentMappingBuilder():
             input_1: Either:
                 1) The callback function to execute, or
                 2) None
+            is_batch: True if the given callback function is a batch mapping callback that maps a list of contexts, otherwise false.
 
         Returns:
             The same mapping builder object for fluent API calls.
         """
-        from tableau_migration.migration_engine_hooks_mappings_interop import _PyMappingWrapperBuilder
+        from tableau_migration.migration_engine_hooks_mappings_interop import _PyBatchMappingWrapperBuilder, _PyMappingWrapperBuilder
         
-        wrapper_builder = _PyMappingWrapperBuilder(input_0, input_1)
+        if input_1 is None:
+            wrapper_builder = getattr(input_0, "_wrapper_builder", _PyMappingWrapperBuilder)(input_0)
+        else:
+            wrapper_builder = (_PyBatchMappingWrapperBuilder if is_batch else _PyMappingWrapperBuilder)(input_0, input_1)
+
         self._content_mapping_builder.Add[wrapper_builder.wrapper_type, wrapper_builder.dotnet_content_type](Func[IServiceProvider, wrapper_builder.wrapper_type](wrapper_builder.factory))
 
         return self
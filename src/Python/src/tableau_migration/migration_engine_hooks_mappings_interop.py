@@ -15,14 +15,22 @@
 
 """Interoperability utility for mappings."""
 
-from typing import Callable, Generic, TypeVar
+from inspect import signature
+from typing import Callable, Generic, Optional, Sequence, TypeVar
 
+from tableau_migration.migration import PyContentLocation
+from tableau_migration.migration_asyncio import _then
 from tableau_migration.migration_content import PyUser
 from tableau_migration.migration_engine_hooks_mappings import PyContentMappingContext
 from tableau_migration.migration_engine_hooks_interop import _PyHookWrapperBuilderBase
+from tableau_migration.migration_interop import _unwrap, _unwrap_async
+from tableau_migration.migration_location_index import LocationIndex, _join_path, _split_path
 
-from Tableau.Migration.Engine.Hooks.Mappings import ContentMappingBase, ContentMappingContext
+from System.Collections.Generic import IReadOnlyList, List
+from Tableau.Migration import ContentLocation
+from Tableau.Migration.Engine.Hooks.Mappings import ContentMappingBase, ContentMappingContext, IContentBatchMapping
 from Tableau.Migration.Engine.Hooks.Mappings.Default import ITableauCloudUsernameMapping
+from Tableau.Migration.Interop.Hooks import ContentMappingInterop
 
 TContent = TypeVar("TContent")
 
@@ -67,11 +75,152 @@ class _PyMappingWrapperBuilder(_PyHookWrapperBuilderBase):
         return _wrap_execute
     
     def _wrap_context_callback(self) -> Callable:
+        # Subscripting the generic context type allocates a new alias, so it is done once per wrapper type.
+        context_type = PyContentMappingContext[self.python_content_type]
+
         def _wrap_context(ctx):
-            return PyContentMappingContext[self.python_content_type](ctx)
+            return context_type(ctx)
         
         return _wrap_context
 
+BatchMappingResult = Optional[Sequence[Optional[PyContentLocation]]]
+"""Result of a batch mapping: None, or a mapped location for each context where None keeps the context's mapped location."""
+
+def _apply_batch_mapping_result(contexts, result: BatchMappingResult, dotnet_content_type: type):
+    if result is None:
+        return contexts
+
+    if len(result) != contexts.Count:
+        raise ValueError(f"Batch mapping returned {len(result)} locations for {contexts.Count} items.")
+
+    # The mapped locations are applied in .NET with one call for the batch.
+    return ContentMappingInterop.MapBatch[dotnet_content_type](contexts, [None if location is None else _unwrap(location) for location in result])
+
+class _PyBatchMappingWrapperBuilder(_PyMappingWrapperBuilder):
+
+    @property
+    def _hook_method_names(self) -> tuple[str, ...]:
+        return ("map_batch",)
+
+    @property
+    def _wrapper_method_name(self) -> str:
+        return "ExecuteBatchAsync"
+
+    def add_extra_wrapper_base_types(self, types: tuple) -> tuple:
+        return types + (IContentBatchMapping[self.dotnet_content_type],)
+
+    def _wrapper_context_type(self) -> type:
+        return IReadOnlyList[ContentMappingContext[self.dotnet_content_type]]
+
+    def _wrap_execute_method(self) -> Callable:
+        return lambda w : w._inner.map_batch
+
+    def _wrap_context_callback(self) -> Callable:
+        context_type = PyContentMappingContext[self.python_content_type]
+
+        def _wrap_contexts(contexts):
+            return [context_type(ctx) for ctx in contexts]
+
+        return _wrap_contexts
+
+    def build_wrapper_execute(self, wrap_method: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
+        return self._build_batch_execute(lambda s, contexts: wrap_method(s)(wrap_context(contexts)), ctx_type)
+
+    def build_wrapper_execute_callback(self, callback: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
+        if len(signature(callback).parameters) == 1:
+            return self._build_batch_execute(lambda s, contexts: callback(wrap_context(contexts)), ctx_type)
+        else:
+            return self._build_batch_execute(lambda s, contexts: callback(wrap_context(contexts), s.services), ctx_type)
+
+    def _build_batch_execute(self, map_batch: Callable, ctx_type: type) -> Callable:
+        dotnet_content_type = self.dotnet_content_type
+        dotnet_context_type = ContentMappingContext[dotnet_content_type]
+
+        def _map_contexts(s, contexts):
+            return _then(map_batch(s, contexts), lambda result: _apply_batch_mapping_result(contexts, result, dotnet_content_type))
+
+        def _execute_batch_async(s, contexts, cancel):
+            return _unwrap_async(ctx_type, _map_contexts(s, contexts), cancel)
+
+        # The migration engine maps pages of items, single items are mapped as a batch of one.
+        def _map_async(s, ctx, cancel):
+            contexts = List[dotnet_context_type]()
+            contexts.Add(ctx)
+            return _unwrap_async(dotnet_context_type, _then(_map_contexts(s, contexts), lambda mapped: mapped[0]), cancel)
+
+        self._map_async = _map_async
+        return _execute_batch_async
+
+    def set_extra_wrapper_members(self, members: dict, wrap_context: Callable) -> None:
+        members["MapAsync"] = self._map_async
+
+class PyBatchContentMappingBase(Generic[TContent]):
+    """Generic base class for mappings that map a whole batch of content items in one call.
+    
+    Batch mappings are called once for each page of content items instead of once per content item,
+    and the mapped locations are applied to the page in a single .NET call.
+    Each content item is still wrapped in a Python context, and reading its properties calls into .NET.
+    """
+
+    _wrapper_builder = _PyBatchMappingWrapperBuilder
+
+    def map_batch(self, contexts: list[PyContentMappingContext[TContent]]) -> BatchMappingResult:
+        """Executes the mapping for a batch of content items.
+        
+        Args:
+            contexts: The input contexts from the migration engine or previous hook.
+            
+        Returns:
+            Either:
+                1) None, if no items are mapped, or
+                2) A mapped location for each context, or None to keep the context's mapped location.
+        """
+        return None
+
+def _remap_location(location, match, path_separator: str):
+    # Remap with path strings, so only the new location is created in .NET.
+    destination = _unwrap(match.value)
+    if isinstance(destination, str):
+        segments = _split_path(destination, path_separator)
+    else:
+        segments = _split_path(destination.Path, destination.PathSeparator)
+        path_separator = destination.PathSeparator
+
+    segments += _split_path(location.Path, location.PathSeparator)[len(match.path_segments):]
+    return PyContentLocation(ContentLocation.FromPath(_join_path(segments, path_separator), path_separator))
+
+class PyPrefixRemapMapping(PyBatchContentMappingBase[TContent]):
+    """Generic mapping that moves content items within the locations of a precomputed location index.
+
+    Subclass with a content type and set location_index to a LocationIndex that maps each location to move to its new location,
+    as a content location or a location path. Content items within an indexed location keep their path relative to
+    the deepest indexed location they are within.
+    """
+
+    location_index: Optional[LocationIndex] = None
+    """The locations to move, indexed to their new locations."""
+
+    def map_batch(self, contexts: list[PyContentMappingContext[TContent]]) -> BatchMappingResult:
+        """Maps the content items within an indexed location.
+        
+        Args:
+            contexts: The input contexts from the migration engine or previous hook.
+            
+        Returns:
+            The remapped location for each context, or None to keep the context's mapped location.
+        """
+        index = self.location_index
+        if index is None:
+            return None
+
+        result = []
+        for ctx in contexts:
+            location = ctx._dotnet.MappedLocation
+            match = index.find_ancestor(location)
+            result.append(None if match is None or match.value is None else _remap_location(location, match, location.PathSeparator))
+
+        return result
+
 class PyTableauCloudUsernameMappingBase(PyContentMappingBase[PyUser]):
     """Base class for mapping users to supply a Tableau Cloud compatible usernames."""
     pass
@@ -17,8 +17,12 @@
 
 # region _generated
 
-from tableau_migration.migration import _generic_wrapper # noqa: E402, F401
+from tableau_migration.migration import (  # noqa: E402, F401
+    _generic_wrapper,
+    _lazy_sequence
+)
 from tableau_migration.migration_engine_manifest import PyMigrationManifestEntryEditor # noqa: E402, F401
+from tableau_migration.migration_interop import _PyWrapperBase # noqa: E402, F401
 from typing import (  # noqa: E402, F401
     Generic,
     TypeVar,
@@ -33,10 +37,11 @@ from Tableau.Migration.Engine.Hooks.PostPublish import (  # noqa: E402, F401
 TPublish = TypeVar("TPublish")
 TResult = TypeVar("TResult")
 
-class PyBulkPostPublishContext(Generic[TPublish]):
+class PyBulkPostPublishContext(Generic[TPublish], _PyWrapperBase):
     """Context for BulkPostPublishContext operations for published content items."""
     
     _dotnet_base = BulkPostPublishContext
+    __slots__ = ()
     
     def __init__(self, bulk_post_publish_context: BulkPostPublishContext) -> None:
         """Creates a new PyBulkPostPublishContext object.
@@ -51,12 +56,13 @@ class PyBulkPostPublishContext(Generic[TPublish]):
     @property
     def published_items(self) -> Sequence[TPublish]:
         """Gets the content item being published."""
-        return None if self._dotnet.PublishedItems is None else list((None if x is None else _generic_wrapper(x)) for x in self._dotnet.PublishedItems)
+        return _lazy_sequence(self, "PublishedItems", self._dotnet.PublishedItems, lambda x: None if x is None else _generic_wrapper(x))
     
-class PyContentItemPostPublishContext(Generic[TPublish, TResult]):
+class PyContentItemPostPublishContext(Generic[TPublish, TResult], _PyWrapperBase):
     """Context for ContentItemPostPublishHookBase operations for published content items."""
     
     _dotnet_base = ContentItemPostPublishContext
+    __slots__ = ()
     
     def __init__(self, content_item_post_publish_context: ContentItemPostPublishContext) -> None:
         """Creates a new PyContentItemPostPublishContext object.
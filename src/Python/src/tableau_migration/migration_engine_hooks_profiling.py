@@ -0,0 +1,416 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in timing instrumentation for Python hooks."""
+
+import json
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isawaitable
+from threading import Lock
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterator, NamedTuple, Optional
+from uuid import UUID
+
+# Histogram bucket upper bounds in seconds, doubling from 1 microsecond to about 8 seconds.
+HOOK_TIMING_BUCKETS = tuple(1e-6 * 2 ** i for i in range(24))
+
+class HookProfileKey(NamedTuple):
+    """Identifies the timings of a hook."""
+
+    #: The qualified name of the hook class or callback.
+    hook: str
+
+    #: The names of the hook's content types, or an empty string for hooks without content types.
+    content_type: str
+
+class HookTimingStats():
+    """Call count, cumulative time and latency histogram of a hook."""
+
+    def __init__(self, key: HookProfileKey) -> None:
+        """Creates a new HookTimingStats object.
+
+        Args:
+            key: The hook the timings are for.
+        
+        Returns: None.
+        """
+        self.key = key
+        self.count = 0
+        self.total_seconds = 0.0
+        self.user_seconds = 0.0
+        self.min_seconds = None
+        self.max_seconds = None
+        self.bucket_counts = [0] * (len(HOOK_TIMING_BUCKETS) + 1)
+
+    @property
+    def hook(self) -> str:
+        """Gets the qualified name of the hook class or callback."""
+        return self.key.hook
+
+    @property
+    def content_type(self) -> str:
+        """Gets the names of the hook's content types."""
+        return self.key.content_type
+
+    @property
+    def overhead_seconds(self) -> float:
+        """Gets the time spent wrapping and unwrapping objects between .NET and Python, outside of the hook code."""
+        return max(self.total_seconds - self.user_seconds, 0.0)
+
+    @property
+    def mean_seconds(self) -> Optional[float]:
+        """Gets the mean call latency, or None if the hook was not called."""
+        return self.total_seconds / self.count if self.count else None
+
+    @property
+    def p50_seconds(self) -> Optional[float]:
+        """Gets the estimated median call latency."""
+        return self.percentile(0.5)
+
+    @property
+    def p95_seconds(self) -> Optional[float]:
+        """Gets the estimated 95th percentile call latency."""
+        return self.percentile(0.95)
+
+    @property
+    def p99_seconds(self) -> Optional[float]:
+        """Gets the estimated 99th percentile call latency."""
+        return self.percentile(0.99)
+
+    def _record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.min_seconds = seconds if self.min_seconds is None else min(self.min_seconds, seconds)
+        self.max_seconds = seconds if self.max_seconds is None else max(self.max_seconds, seconds)
+        self.bucket_counts[bisect_left(HOOK_TIMING_BUCKETS, seconds)] += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimates a call latency percentile from the histogram.
+
+        The latency is interpolated within the histogram bucket the percentile falls in,
+        and clamped to the observed minimum and maximum latencies.
+
+        Args:
+            q: The percentile to estimate, between 0 and 1.
+
+        Returns: The estimated latency in seconds, or None if the hook was not called.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Percentile must be between 0 and 1.")
+
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            if not bucket_count or cumulative + bucket_count < rank:
+                cumulative += bucket_count
+                continue
+
+            lower = HOOK_TIMING_BUCKETS[i - 1] if i > 0 else 0.0
+            upper = HOOK_TIMING_BUCKETS[i] if i < len(HOOK_TIMING_BUCKETS) else self.max_seconds
+            estimate = lower + (upper - lower) * (rank - cumulative) / bucket_count
+            return min(max(estimate, self.min_seconds), self.max_seconds)
+
+        return self.max_seconds
+
+    def to_dict(self) -> dict:
+        """Gets the timings as a dictionary that can be serialized to JSON.
+
+        Returns: The timings.
+        """
+        return {
+            "hook": self.hook,
+            "content_type": self.content_type,
+            "count": self.count,
+            "total_seconds": self.total_seconds,
+            "user_seconds": self.user_seconds,
+            "overhead_seconds": self.overhead_seconds,
+            "mean_seconds": self.mean_seconds,
+            "min_seconds": self.min_seconds,
+            "max_seconds": self.max_seconds,
+            "p50_seconds": self.p50_seconds,
+            "p95_seconds": self.p95_seconds,
+            "p99_seconds": self.p99_seconds
+        }
+
+def _prometheus_labels(key: HookProfileKey, **extra) -> str:
+    def _escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+    labels = {"hook": key.hook, "content_type": key.content_type, **extra}
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+class HookProfile():
+    """Timings of the Python hooks called during a migration.
+
+    Timings are recorded per hook class or callback and content type.
+    Each call records the total time spent in Python, including wrapping and unwrapping objects between .NET and Python,
+    and the time spent in the hook code itself.
+    """
+
+    def __init__(self) -> None:
+        """Creates a new HookProfile object.
+        
+        Returns: None.
+        """
+        self._lock = Lock()
+        self._stats = {}
+
+    def _get_stats(self, key: HookProfileKey) -> HookTimingStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = HookTimingStats(key)
+        return stats
+
+    def record(self, key: HookProfileKey, seconds: float) -> None:
+        """Records the total time of a hook call.
+
+        Args:
+            key: The hook that was called.
+            seconds: The time of the call, including wrapping overhead.
+        """
+        with self._lock:
+            self._get_stats(key)._record(seconds)
+
+    def record_user(self, key: HookProfileKey, seconds: float) -> None:
+        """Records the time spent in the hook code of a hook call.
+
+        Args:
+            key: The hook that was called.
+            seconds: The time spent in the hook code.
+        """
+        with self._lock:
+            self._get_stats(key).user_seconds += seconds
+
+    def stats(self) -> list[HookTimingStats]:
+        """Gets the timings of each hook, slowest first.
+
+        Returns: The hook timings.
+        """
+        with self._lock:
+            return sorted(self._stats.values(), key = lambda s: s.total_seconds, reverse = True)
+
+    def get(self, hook: str, content_type: str = "") -> Optional[HookTimingStats]:
+        """Gets the timings of a hook.
+
+        Args:
+            hook: The qualified name of the hook class or callback.
+            content_type: The names of the hook's content types.
+
+        Returns: The timings, or None if the hook was not called.
+        """
+        with self._lock:
+            return self._stats.get(HookProfileKey(hook, content_type))
+
+    @property
+    def total_seconds(self) -> float:
+        """Gets the total time spent in Python hooks, including wrapping overhead."""
+        return sum(s.total_seconds for s in self.stats())
+
+    def to_dict(self) -> dict:
+        """Gets the profile as a dictionary that can be serialized to JSON.
+
+        Returns: The profile.
+        """
+        return {"hooks": [s.to_dict() for s in self.stats()]}
+
+    def to_json(self, **kwargs) -> str:
+        """Serializes the profile to JSON.
+
+        Args:
+            **kwargs: Extra arguments passed to json.dumps.
+
+        Returns: The JSON text.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_prometheus(self, prefix: str = "tableau_migration_hook") -> str:
+        """Exports the profile in the Prometheus text exposition format.
+
+        Args:
+            prefix: The prefix of the metric names.
+
+        Returns: The metrics text.
+        """
+        stats = self.stats()
+
+        lines = [
+            f"# HELP {prefix}_duration_seconds Time spent in Python hook calls, including wrapping overhead.",
+            f"# TYPE {prefix}_duration_seconds histogram"
+        ]
+        for s in stats:
+            cumulative = 0
+            for bound, bucket_count in zip(HOOK_TIMING_BUCKETS + (None,), s.bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound is None else repr(bound)
+                lines.append(f"{prefix}_duration_seconds_bucket{_prometheus_labels(s.key, le = le)} {cumulative}")
+            lines.append(f"{prefix}_duration_seconds_sum{_prometheus_labels(s.key)} {s.total_seconds!r}")
+            lines.append(f"{prefix}_duration_seconds_count{_prometheus_labels(s.key)} {s.count}")
+
+        lines.append(f"# HELP {prefix}_user_seconds_total Time spent in Python hook code.")
+        lines.append(f"# TYPE {prefix}_user_seconds_total counter")
+        for s in stats:
+            lines.append(f"{prefix}_user_seconds_total{_prometheus_labels(s.key)} {s.user_seconds!r}")
+
+        return "\n".join(lines) + "\n"
+
+_profiles_lock = Lock()
+
+# The profile hook calls of all migrations are recorded to, or None.
+_global_profile: Optional[HookProfile] = None
+
+# The profiles hook calls are recorded to by migration plan ID.
+_plan_profiles: dict[UUID, HookProfile] = {}
+
+_UNRESOLVED = object()
+
+# The profile of the hook call running in the current context, set for the duration of the wrapper call.
+# Hook calls of concurrent migrations run on different threads, and so in different contexts.
+_current_profile: ContextVar[Any] = ContextVar("_current_profile", default=_UNRESOLVED)
+
+@contextmanager
+def profile_hooks(profile: Optional[HookProfile] = None, plan: Optional[Any] = None) -> Iterator[HookProfile]:
+    """Records the timings of Python hook calls made while the context is active.
+
+    Args:
+        profile: The profile to record to, or None to record to a new profile.
+        plan: The migration plan to record the hook calls of, or None to record the hook calls of all migrations.
+            Hook calls of a migration with a plan profile are only recorded to that profile,
+            so concurrent migrations of different plans record to separate profiles.
+
+    Returns: The profile the timings are recorded to.
+    """
+    global _global_profile
+
+    profile = HookProfile() if profile is None else profile
+    plan_id = None if plan is None else plan.plan_id
+
+    with _profiles_lock:
+        if plan_id is None:
+            previous = _global_profile
+            _global_profile = profile
+        else:
+            previous = _plan_profiles.get(plan_id)
+            _plan_profiles[plan_id] = profile
+    try:
+        yield profile
+    finally:
+        with _profiles_lock:
+            if plan_id is None:
+                _global_profile = previous
+            elif previous is None:
+                del _plan_profiles[plan_id]
+            else:
+                _plan_profiles[plan_id] = previous
+
+def _wrapper_plan_id(wrapper) -> Optional[UUID]:
+    """Gets the ID of the migration plan a hook wrapper was created for, cached on the wrapper."""
+    try:
+        return wrapper._profile_plan_id
+    except AttributeError:
+        pass
+
+    from tableau_migration.migration_interop import _wrap_guid
+    from Tableau.Migration.Engine import IMigrationPlan
+
+    services = getattr(wrapper, "services", None) or getattr(getattr(wrapper, "_inner", None), "services", None)
+    plan_id = None if services is None else _wrap_guid(services._get_service(IMigrationPlan).PlanId)
+    wrapper._profile_plan_id = plan_id
+    return plan_id
+
+def _wrapper_profile(wrapper) -> Optional[HookProfile]:
+    """Gets the profile to record the hook calls of a wrapper to."""
+    if _plan_profiles:
+        profile = _plan_profiles.get(_wrapper_plan_id(wrapper))
+        if profile is not None:
+            return profile
+
+    return _global_profile
+
+def _profiled_execute(execute: Callable, key: HookProfileKey) -> Callable:
+    """Wraps a wrapper type execute method to record the total time of each call."""
+    def _execute(s, *args):
+        profile = _wrapper_profile(s)
+        if profile is None and _current_profile.get() is _UNRESOLVED:
+            return execute(s, *args)
+
+        token = _current_profile.set(profile)
+        start = perf_counter()
+        try:
+            return execute(s, *args)
+        finally:
+            if profile is not None:
+                profile.record(key, perf_counter() - start)
+            _current_profile.reset(token)
+
+    return _execute
+
+def _call_profile() -> Optional[HookProfile]:
+    """Gets the profile of the hook call running in the current context."""
+    profile = _current_profile.get()
+    return _global_profile if profile is _UNRESOLVED else profile
+
+async def _profiled_awaitable(awaitable: Awaitable, profile: HookProfile, key: HookProfileKey, start: float) -> Any:
+    try:
+        return await awaitable
+    finally:
+        profile.record_user(key, perf_counter() - start)
+
+def _profiled_call(f: Callable, args: tuple, profile: HookProfile, key: HookProfileKey) -> Any:
+    # Async hooks are timed until their awaitable completes, so their user time can exceed the total time of the call that started them.
+    start = perf_counter()
+    try:
+        result = f(*args)
+    except BaseException:
+        profile.record_user(key, perf_counter() - start)
+        raise
+
+    if isawaitable(result):
+        return _profiled_awaitable(result, profile, key, start)
+
+    profile.record_user(key, perf_counter() - start)
+    return result
+
+def _profiled_user_callable(f: Callable, key: HookProfileKey) -> Callable:
+    """Wraps a hook method or callback to record the time spent in the hook code."""
+    @wraps(f)
+    def _call(*args):
+        profile = _call_profile()
+        if profile is None:
+            return f(*args)
+
+        return _profiled_call(f, args, profile, key)
+
+    return _call
+
+def _profiled_user_method(wrap_method: Callable, key: HookProfileKey) -> Callable:
+    """Wraps a function that gets a hook method from a wrapper object to record the time spent in the hook code."""
+    def _wrap(w):
+        method = wrap_method(w)
+        profile = _wrapper_profile(w)
+        if profile is None:
+            return method
+
+        def _call(*args):
+            return _profiled_call(method, args, profile, key)
+
+        return _call
+
+    return _wrap
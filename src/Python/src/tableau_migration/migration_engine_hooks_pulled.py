@@ -20,6 +20,7 @@
 from tableau_migration.migration import _generic_wrapper # noqa: E402, F401
 from tableau_migration.migration_engine_hooks_filters import PyFilterStatus # noqa: E402, F401
 from tableau_migration.migration_engine_manifest import PyMigrationManifestEntryEditor # noqa: E402, F401
+from tableau_migration.migration_interop import _PyWrapperBase # noqa: E402, F401
 from typing import (  # noqa: E402, F401
     Generic,
     TypeVar
@@ -30,10 +31,11 @@ from Tableau.Migration.Engine.Hooks.Pulled import ContentItemPulledContext # noq
 
 TPrepare = TypeVar("TPrepare")
 
-class PyContentItemPulledContext(Generic[TPrepare]):
+class PyContentItemPulledContext(Generic[TPrepare], _PyWrapperBase):
     """Context for IContentItemPulledHook operations for pulled content items."""
     
     _dotnet_base = ContentItemPulledContext
+    __slots__ = ()
     
     def __init__(self, content_item_pulled_context: ContentItemPulledContext) -> None:
         """Creates a new PyContentItemPulledContext object.
@@ -15,7 +15,8 @@
 
 """Wrapper for classes in Tableau.Migration.Engine.Hooks.Transformers namespace."""
 
-from typing import Callable, Union
+from concurrent.futures import Executor
+from typing import Callable, Optional, Union
 from typing_extensions import Self
 
 from System import IServiceProvider, Func
@@ -48,7 +49,7 @@ class PyContentTransformerBuilder():
         return self
 
 
-    def add(self, input_0: type, input_1: Union[Callable, None] = None, is_xml: bool = False, is_json: bool = False) -> Self:
+    def add(self, input_0: type, input_1: Union[Callable, None] = None, is_xml: bool = False, is_json: bool = False, live_xml: bool = False, executor: Optional[Executor] = None) -> Self:
         """Adds an object or function to execute transformers.
 
         Args:
@@ -60,23 +61,36 @@ class PyContentTransformerBuilder():
                 2) None
             is_xml: True if the given callback function is an XML transformer callback, otherwise false.
             is_json: True if the given callback function is a JSON transformer callback, otherwise false.
+            live_xml: True if the given XML transformer callback should receive a PyXmlElement over the live XML document 
+                instead of an ElementTree copy, otherwise false.
+            executor: An executor to run an XML or JSON transformer in, such as the process pool from create_transformer_process_pool, 
+                or None to run the transformer on the migration thread.
+                Executor transformers receive a TransformItemInfo instead of the content item, and must be picklable for process pools.
 
         Returns:
             The same mapping builder object for fluent API calls.
         """
-        from migration_engine_hooks_transformers_interop import (
+        from tableau_migration.migration_engine_hooks_transformers_interop import (
             _PyJsonTransformerWrapperBuilder,
+            _PyLiveXmlTransformerWrapperBuilder,
             _PyTransformerWrapperBuilder,
             _PyXmlTransformerWrapperBuilder
         )
 
-        if input_1 is None:
+        if executor is not None:
+            wrapper_builder = self._executor_wrapper_builder(input_0, input_1, is_xml, is_json, live_xml, executor)
+        elif input_1 is None:
             wrapper_builder = input_0._wrapper_builder(input_0)
         else:
             if is_xml and is_json:
                 raise ValueError("A transformer callback cannot be both XML and JSON.")
 
-            if is_xml:
+            if live_xml and not is_xml:
+                raise ValueError("Live XML can only be used with XML transformer callbacks.")
+
+            if live_xml:
+                wrap_builder_type = _PyLiveXmlTransformerWrapperBuilder
+            elif is_xml:
                 wrap_builder_type = _PyXmlTransformerWrapperBuilder
             elif is_json:
                 wrap_builder_type = _PyJsonTransformerWrapperBuilder
@@ -89,6 +103,29 @@ class PyContentTransformerBuilder():
         return self
     
 
+    def _executor_wrapper_builder(self, input_0: type, input_1: Union[Callable, None], is_xml: bool, is_json: bool, live_xml: bool, executor: Executor):
+        from tableau_migration.migration_engine_hooks_transformers_interop import (
+            _PyExecutorJsonTransformerWrapperBuilder,
+            _PyExecutorXmlTransformerWrapperBuilder,
+            PyJsonContentTransformerBase,
+            PyXmlContentTransformerBase
+        )
+
+        if input_1 is None:
+            live_xml = getattr(input_0, "live_xml", False)
+            is_xml = issubclass(input_0, PyXmlContentTransformerBase)
+            is_json = issubclass(input_0, PyJsonContentTransformerBase)
+
+        if live_xml:
+            raise ValueError("Live XML transformers cannot run in an executor.")
+
+        if is_xml == is_json:
+            raise ValueError("Only XML or JSON transformers can run in an executor.")
+
+        wrap_builder_type = _PyExecutorXmlTransformerWrapperBuilder if is_xml else _PyExecutorJsonTransformerWrapperBuilder
+        return wrap_builder_type(input_0, input_1, executor)
+
+
     def by_content_type(self):
         """Gets the currently registered hook factories by their content types.
 
@@ -16,15 +16,22 @@
 """Interoperability utility for transformers."""
 
 import json
+import pickle
+from abc import abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
 from inspect import signature
-from typing import Callable, Generic, TypeVar
+from typing import Callable, Generic, Optional, TypeVar, Union
 from xml.etree import ElementTree
 
 from migration import _generic_wrapper
 from migration_engine_hooks_interop import _PyHookWrapperBuilderBase
+from tableau_migration.migration_json import TrackedJsonDocument
+from tableau_migration.migration_xml import PyXmlElement
+from tableau_migration.migration_engine_hooks_transformers_process import TransformItemInfo, _transform_json_text, _transform_xml_text
+from tableau_migration.migration_asyncio import _is_async_callable, _then
+from tableau_migration.migration_interop import _completed_async, _task_from_future, _wrap_guid
 
 import System # System.Xml.Linq must be imported as System
-from System.Threading.Tasks import Task
 from Tableau.Migration.Engine.Hooks.Transformers import ContentTransformerBase, IJsonContentTransformer, IXmlContentTransformer
 
 TPublish = TypeVar("TPublish")
@@ -89,8 +96,10 @@ class _PyXmlTransformerWrapperBuilder(_PyTransformerWrapperBuilder):
     
     @classmethod
     def write_xml(cls, orig_xml: System.Xml.Linq.XDocument, new_xml: ElementTree.Element) -> None:
-        s = ElementTree.tostring(new_xml, "unicode")
-        
+        cls.write_xml_text(orig_xml, ElementTree.tostring(new_xml, "unicode"))
+
+    @classmethod
+    def write_xml_text(cls, orig_xml: System.Xml.Linq.XDocument, s: str) -> None:
         new_root = System.Xml.Linq.XElement.Parse(s, System.Xml.Linq.LoadOptions.PreserveWhitespace)
         orig_xml.Root.ReplaceWith(new_root)
 
@@ -105,25 +114,20 @@ class _PyXmlTransformerWrapperBuilder(_PyTransformerWrapperBuilder):
     
     def build_wrapper_execute(self, wrap_method: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
         def _transform_async(s, ctx, xml, cancel):
-            wrap_method(s)(wrap_context(ctx), xml)
-            return Task.CompletedTask
+            return _completed_async(wrap_method(s)(wrap_context(ctx), xml), cancel)
 
         return _transform_async
     
     def build_wrapper_execute_callback(self, callback: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
         def _transform_async(s, ctx, xml, cancel):
             py_xml = self.read_xml(xml)
-            callback(wrap_context(ctx), py_xml)
-            self.write_xml(xml, py_xml)
-            
-            return Task.CompletedTask
+            result = callback(wrap_context(ctx), py_xml)
+            return _completed_async(_then(result, lambda _: self.write_xml(xml, py_xml)), cancel)
 
         def _transform_services_async(s, ctx, xml, cancel):
             py_xml = self.read_xml(xml)
-            callback(wrap_context(ctx), py_xml, s.services)
-            self.write_xml(xml, py_xml)
-
-            return Task.CompletedTask
+            result = callback(wrap_context(ctx), py_xml, s.services)
+            return _completed_async(_then(result, lambda _: self.write_xml(xml, py_xml)), cancel)
 
         return _transform_async if len(signature(callback).parameters) == 2 else _transform_services_async
 
@@ -134,29 +138,52 @@ class _PyXmlTransformerWrapperBuilder(_PyTransformerWrapperBuilder):
 
         members["NeedsXmlTransforming"] = _wrap_needs_transforming
 
+class _PyLiveXmlTransformerWrapperBuilder(_PyXmlTransformerWrapperBuilder):
+
+    @classmethod
+    def read_xml(cls, xml: System.Xml.Linq.XDocument) -> PyXmlElement:
+        return PyXmlElement(xml.Root)
+
+    @classmethod
+    def write_xml(cls, orig_xml: System.Xml.Linq.XDocument, new_xml: PyXmlElement) -> None:
+        # Changes are made directly to the live document, so there is nothing to write back.
+        pass
+
 class _PyJsonTransformerWrapperBuilder(_PyTransformerWrapperBuilder):
 
     @classmethod
-    def read_json(cls, json_node: System.Text.Json.Nodes.JsonNode):
-        return json.loads(json_node.ToJsonString())
+    def read_json(cls, json_node: System.Text.Json.Nodes.JsonNode) -> TrackedJsonDocument:
+        return TrackedJsonDocument.loads(json_node.ToJsonString())
 
     @classmethod
     def write_json(cls, orig_json: System.Text.Json.Nodes.JsonNode, new_json) -> None:
-        new_json_node = System.Text.Json.Nodes.JsonNode.Parse(json.dumps(new_json))
-
         # Json transformers operate on file roots, which are expected to be JSON objects.
-        # Copy values into the original root so references held by the SDK remain valid.
-        if isinstance(orig_json, System.Text.Json.Nodes.JsonObject) and isinstance(new_json_node, System.Text.Json.Nodes.JsonObject):
-            orig_obj = orig_json.AsObject()
-            new_obj = new_json_node.AsObject()
+        if not isinstance(orig_json, System.Text.Json.Nodes.JsonObject) or not isinstance(new_json, dict):
+            raise TypeError("JSON transformer root must be a JSON object.")
+
+        orig_obj = orig_json.AsObject()
 
+        # Unchanged documents are left as is, and changed documents only replace their changed top-level values.
+        if isinstance(new_json, TrackedJsonDocument):
+            if not new_json.is_changed:
+                return
+
+            cls.write_json_changes(orig_json, new_json.serialize_changes())
+        else:
+            # Values are serialized before clearing, so a value that cannot be serialized leaves the original document intact.
+            changes = [(k, json.dumps(v)) for k, v in new_json.items()]
             orig_obj.Clear()
-            for kvp in new_obj:
-                value = None if kvp.Value is None else kvp.Value.DeepClone()
-                orig_obj.Add(kvp.Key, value)
-            return
+            cls.write_json_changes(orig_json, changes)
 
-        raise TypeError("JSON transformer root must be a JSON object.")
+    @classmethod
+    def write_json_changes(cls, orig_json: System.Text.Json.Nodes.JsonNode, changes: list[tuple[str, Optional[str]]]) -> None:
+        # Values are replaced in the original root so references held by the SDK remain valid.
+        orig_obj = orig_json.AsObject()
+        for key, value in changes:
+            if value is None:
+                orig_obj.Remove(key)
+            else:
+                orig_obj[key] = System.Text.Json.Nodes.JsonNode.Parse(value)
 
     def get_wrapper_base_type(self) -> type:
         return IJsonContentTransformer[self.dotnet_publish_type]
@@ -169,25 +196,20 @@ class _PyJsonTransformerWrapperBuilder(_PyTransformerWrapperBuilder):
 
     def build_wrapper_execute(self, wrap_method: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
         def _transform_async(s, ctx, json_node, cancel):
-            wrap_method(s)(wrap_context(ctx), json_node)
-            return Task.CompletedTask
+            return _completed_async(wrap_method(s)(wrap_context(ctx), json_node), cancel)
 
         return _transform_async
 
     def build_wrapper_execute_callback(self, callback: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
         def _transform_async(s, ctx, json_node, cancel):
             py_json = self.read_json(json_node)
-            callback(wrap_context(ctx), py_json)
-            self.write_json(json_node, py_json)
-
-            return Task.CompletedTask
+            result = callback(wrap_context(ctx), py_json)
+            return _completed_async(_then(result, lambda _: self.write_json(json_node, py_json)), cancel)
 
         def _transform_services_async(s, ctx, json_node, cancel):
             py_json = self.read_json(json_node)
-            callback(wrap_context(ctx), py_json, s.services)
-            self.write_json(json_node, py_json)
-
-            return Task.CompletedTask
+            result = callback(wrap_context(ctx), py_json, s.services)
+            return _completed_async(_then(result, lambda _: self.write_json(json_node, py_json)), cancel)
 
         return _transform_async if len(signature(callback).parameters) == 2 else _transform_services_async
 
@@ -198,10 +220,80 @@ class _PyJsonTransformerWrapperBuilder(_PyTransformerWrapperBuilder):
 
         members["NeedsJsonTransforming"] = _wrap_needs_transforming
     
+def _executor_transform(executor: Executor, run: Callable, target: Union[type, Callable], is_class: bool, read_text: Callable, write_result: Callable) -> Callable:
+    def _transform_async(s, ctx, document, cancel):
+        info = TransformItemInfo(_wrap_guid(ctx.Id), ctx.Name, ctx.ContentUrl, ctx.Location.Path)
+        future = executor.submit(run, target, is_class, info, read_text(document))
+        return _task_from_future(future, lambda result: write_result(document, result), cancel)
+
+    return _transform_async
+
+class _PyExecutorTransformerWrapperBuilderBase(_PyTransformerWrapperBuilder):
+    """Base class for builders of XML and JSON transformers that run in an executor.
+
+    The document is serialized and sent to the executor with the transformer and a TransformItemInfo for the content item,
+    and the transformed document is written back when the executor completes, without blocking the .NET migration thread.
+    """
+
+    def __init__(self, t: Union[type, list], callback: Optional[Callable] = None, executor: Optional[Executor] = None) -> None:
+        if executor is None:
+            raise ValueError("An executor is required.")
+
+        # The wrapper type is built during init, so the executor must be set first.
+        self.executor = executor
+        target = t if callback is None else callback
+
+        if callback is not None and len(signature(callback).parameters) != 2:
+            raise ValueError("Transformer callbacks that run in an executor must take exactly the content item and document arguments.")
+
+        if _is_async_callable(callback if callback is not None else getattr(t, "transform", None)):
+            raise ValueError("Async transformers run on the hook event loop and cannot run in an executor.")
+
+        if isinstance(executor, ProcessPoolExecutor):
+            try:
+                pickle.dumps(target)
+            except Exception as e:
+                raise ValueError(f"Transformer {target!r} must be picklable to run in a process pool, for example a module level function or class.") from e
+
+        super().__init__(t, callback)
+
+    def get_wrapper_cache_key(self):
+        key = super().get_wrapper_cache_key()
+        return None if key is None else key + (self.executor,)
+
+    def build_wrapper_execute(self, wrap_method: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
+        return self._build_executor_transform(self.inner_type, True)
+
+    def build_wrapper_execute_callback(self, callback: Callable, wrap_context: Callable, ctx_type: type, is_async: bool) -> Callable:
+        # The unwrapped user callback is sent to the executor, profiling only records the time to submit it.
+        return self._build_executor_transform(self.callback, False)
+
+    @abstractmethod
+    def _build_executor_transform(self, target: Union[type, Callable], is_class: bool) -> Callable:
+        ...
+
+class _PyExecutorXmlTransformerWrapperBuilder(_PyExecutorTransformerWrapperBuilderBase, _PyXmlTransformerWrapperBuilder):
+
+    def _build_executor_transform(self, target: Union[type, Callable], is_class: bool) -> Callable:
+        return _executor_transform(self.executor, _transform_xml_text, target, is_class, lambda xml: xml.ToString(), self.write_xml_text)
+
+class _PyExecutorJsonTransformerWrapperBuilder(_PyExecutorTransformerWrapperBuilderBase, _PyJsonTransformerWrapperBuilder):
+
+    def _build_executor_transform(self, target: Union[type, Callable], is_class: bool) -> Callable:
+        return _executor_transform(self.executor, _transform_json_text, target, is_class, lambda json_node: json_node.ToJsonString(), self.write_json_changes)
+
 class PyXmlContentTransformerBase(Generic[TPublish]):
-    """Generic base class for XML transformers."""
+    """Generic base class for XML transformers.
+    
+    By default transform receives an ElementTree copy of the XML that is written back to the file after the transformer runs.
+    Set live_xml to True to receive a PyXmlElement facade over the live XML document instead,
+    which avoids serializing and re-parsing the XML for each transformer.
+    """
 
     _wrapper_builder = _PyXmlTransformerWrapperBuilder
+
+    live_xml: bool = False
+    """Whether transform receives a PyXmlElement over the live XML document instead of an ElementTree copy."""
     
     def needs_xml_transforming(self, ctx: TPublish) -> bool:
         """Finds whether the content item needs any XML changes, returning false prevents file IO from occurring.
@@ -213,17 +305,18 @@ class PyXmlContentTransformerBase(Generic[TPublish]):
         """
         return True
     
-    def _transform_xml(self, ctx: TPublish, xml) -> None:
-        py_xml = _PyXmlTransformerWrapperBuilder.read_xml(xml)
-        self.transform(ctx, py_xml)
-        _PyXmlTransformerWrapperBuilder.write_xml(xml, py_xml)
+    def _transform_xml(self, ctx: TPublish, xml):
+        xml_builder = _PyLiveXmlTransformerWrapperBuilder if self.live_xml else _PyXmlTransformerWrapperBuilder
+        py_xml = xml_builder.read_xml(xml)
+        return _then(self.transform(ctx, py_xml), lambda _: xml_builder.write_xml(xml, py_xml))
 
-    def transform(self, ctx: TPublish, xml: ElementTree.Element) -> None:
+    def transform(self, ctx: TPublish, xml: Union[ElementTree.Element, PyXmlElement]) -> None:
         """Transforms the XML of the content item.
         
         Args:
             ctx: The content item being transformed.
-            xml: The XML of the content item to transform. Any changes made to the XML are persisted back to the file before publishing.
+            xml: The XML of the content item to transform, as a PyXmlElement if live_xml is True. 
+                Any changes made to the XML are persisted back to the file before publishing.
         """
         pass
 
@@ -242,10 +335,9 @@ class PyJsonContentTransformerBase(Generic[TPublish]):
         """
         return True
 
-    def _transform_json(self, ctx: TPublish, json_node) -> None:
+    def _transform_json(self, ctx: TPublish, json_node):
         py_json = _PyJsonTransformerWrapperBuilder.read_json(json_node)
-        self.transform(ctx, py_json)
-        _PyJsonTransformerWrapperBuilder.write_json(json_node, py_json)
+        return _then(self.transform(ctx, py_json), lambda _: _PyJsonTransformerWrapperBuilder.write_json(json_node, py_json))
 
     def transform(self, ctx: TPublish, json_obj) -> None:
         """Transforms the JSON of the content item.
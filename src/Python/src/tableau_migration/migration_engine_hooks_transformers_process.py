@@ -0,0 +1,75 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Out-of-process execution of XML and JSON transformers."""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, NamedTuple, Optional, Union
+from uuid import UUID
+from xml.etree import ElementTree
+
+from tableau_migration.migration_json import TrackedJsonDocument
+
+class TransformItemInfo(NamedTuple):
+    """Picklable summary of the content item passed to transformers that run in an executor."""
+
+    #: The ID of the content item.
+    id: UUID
+
+    #: The name of the content item.
+    name: str
+
+    #: The URL of the content item.
+    content_url: str
+
+    #: The location path of the content item.
+    location: str
+
+def create_transformer_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Creates a process pool to run XML and JSON transformers in.
+
+    Workers are started with the spawn method, so they start a new interpreter instead of forking the migration process.
+    Each worker imports the modules of the transformers it runs, so the main module of the application
+    must guard the migration with if __name__ == "__main__".
+
+    Unpickling the transformer calls in a worker imports the tableau_migration package,
+    which loads the .NET runtime and builds the SDK services in each worker.
+    This is a startup cost paid once per worker, since workers are reused for the whole migration.
+    Set the TABLEAU_MIGRATION_LAZY_IMPORT environment variable to 1 before the pool starts workers
+    to skip building the services in the workers, which only run Python code.
+    Cancelling the migration cancels transforms that have not started, running transforms finish first.
+
+    Args:
+        max_workers: The maximum number of worker processes, or None for the number of processors.
+
+    Returns: The process pool. Shut the pool down after the migration completes.
+    """
+    return ProcessPoolExecutor(max_workers, multiprocessing.get_context("spawn"))
+
+def _transformer_callable(target: Union[type, Callable], is_class: bool) -> Callable:
+    return target().transform if is_class else target
+
+def _transform_xml_text(target: Union[type, Callable], is_class: bool, info: TransformItemInfo, text: str) -> str:
+    """Runs an XML transformer over serialized XML, returning the transformed XML."""
+    xml = ElementTree.fromstring(text)
+    _transformer_callable(target, is_class)(info, xml)
+    return ElementTree.tostring(xml, "unicode")
+
+def _transform_json_text(target: Union[type, Callable], is_class: bool, info: TransformItemInfo, text: str) -> list[tuple[str, Optional[str]]]:
+    """Runs a JSON transformer over serialized JSON, returning the serialized changes."""
+    json_obj = TrackedJsonDocument.loads(text)
+    _transformer_callable(target, is_class)(info, json_obj)
+    return json_obj.serialize_changes()
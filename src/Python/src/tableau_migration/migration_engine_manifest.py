@@ -15,6 +15,10 @@
 
 """Wrapper for classes in Tableau.Migration.Engine.Manifest namespace."""
 
+from array import array
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
 from tableau_migration import (
     cancellation_token
 )
@@ -25,7 +29,11 @@ from tableau_migration.migration import (  # noqa: E402, F401
     get_service
 )
 
+from System import Type as DotnetType
+from System.Collections.Generic import List as DotnetList
+from Tableau.Migration.Interop.Manifest import MigrationManifestColumns
 from Tableau.Migration.Engine.Manifest import (  # noqa: E402, F401
+    MigrationManifestJournalSerializer,
     MigrationManifestSerializer
 )
 
@@ -66,11 +74,297 @@ class PyMigrationManifestSerializer():
         result = self._dotnet.LoadAsync(path, cancellation_token).GetAwaiter().GetResult()
         return None if result is None else PyMigrationManifest(result)
 
+    def save_sharded(self, manifest: PyMigrationManifest, directory: str) -> None:
+        """Saves a manifest in sharded JSON format.
+
+        The entries of each content type partition are written in parallel to a separate file in the directory,
+        followed by an index file with the rest of the manifest. The index file is replaced last,
+        so an interrupted save leaves the previous manifest in the directory.
+
+        A manifest loaded by load_sharded with content_types keeps the partitions that were not loaded.
+        Saving it with entries for those content types raises an error.
+        
+        Args:
+            manifest: The manifest to save.
+            directory: The directory to save the manifest to.
+        """
+        self._dotnet.SaveShardedAsync(manifest._migration_manifest, directory, cancellation_token).GetAwaiter().GetResult()
+
+    def load_sharded(self, directory: str, content_types: Optional[Iterable[type]] = None) -> PyMigrationManifest:
+        """Loads a manifest from sharded JSON format, reading the partition files in parallel.
+        
+        Args:
+            directory: The directory to load the manifest from.
+            content_types: The content types of the partitions to load, either Python wrapper types or .NET types, 
+                or None to load all partitions. Partition files of other content types are not read,
+                so the loaded manifest is partial. save_sharded keeps the partitions that were not loaded,
+                but save writes only the loaded partitions.
+        
+        Returns: The loaded MigrationManifest, or None if the manifest could not be loaded.
+        """
+        dotnet_types = None
+        if content_types is not None:
+            dotnet_types = DotnetList[DotnetType]()
+            for content_type in content_types:
+                dotnet_types.Add(getattr(content_type, "_dotnet_base", content_type))
+
+        result = self._dotnet.LoadShardedAsync(directory, dotnet_types, cancellation_token).GetAwaiter().GetResult()
+        return None if result is None else PyMigrationManifest(result)
+
     @classmethod
     def get_supported_manifest_version(cls) -> int:
         """This is the current MigrationManifest.ManifestVersion that this serializer supports."""
         return MigrationManifestSerializer.SupportedManifestVersion
 
+
+class PyMigrationManifestJournalSerializer():
+    """Provides functionality to save migration manifests incrementally.
+
+    Changed entries are appended to a journal file next to the JSON manifest snapshot,
+    and the journal is periodically compacted into a new snapshot.
+    """
+
+    _dotnet_base = MigrationManifestJournalSerializer
+
+    JOURNAL_FILE_EXTENSION: str = MigrationManifestJournalSerializer.JournalFileExtension
+    """The file extension appended to the snapshot path for the journal file."""
+
+    DEFAULT_COMPACTION_THRESHOLD: int = MigrationManifestJournalSerializer.DefaultCompactionThreshold
+    """The default number of journal records allowed before the journal is compacted."""
+
+    def __init__(self) -> None:
+        """Creates a new PyMigrationManifestJournalSerializer object."""
+        self._services = get_service_provider()
+        self._dotnet = get_service(self._services, MigrationManifestJournalSerializer)
+
+    @classmethod
+    def get_journal_path(cls, path: str) -> str:
+        """Gets the journal file path for a manifest snapshot path.
+
+        Args:
+            path: The manifest snapshot file path.
+
+        Returns: The journal file path.
+        """
+        return MigrationManifestJournalSerializer.GetJournalPath(path)
+
+    def append(self, manifest: PyMigrationManifest, content_type: type, entries, path: str,
+               compaction_threshold: int = DEFAULT_COMPACTION_THRESHOLD) -> bool:
+        """Appends changed manifest entries to the journal, compacting the journal when needed.
+
+        Args:
+            manifest: The manifest the entries belong to.
+            content_type: The content type of the entries, either a Python wrapper type or a .NET type.
+            entries: The changed manifest entries.
+            path: The manifest snapshot file path.
+            compaction_threshold: The number of journal records allowed before the journal is compacted.
+
+        Returns: True if the journal was compacted into a new snapshot, False if the entries were appended.
+        """
+        dotnet_type = getattr(content_type, "_dotnet_base", content_type)
+
+        dotnet_entries = DotnetList[IMigrationManifestEntry]()
+        for entry in entries:
+            dotnet_entries.Add(getattr(entry, "_dotnet", entry))
+
+        return self._dotnet.AppendAsync(manifest._migration_manifest, dotnet_type, dotnet_entries, path,
+                                        compaction_threshold, cancellation_token).GetAwaiter().GetResult()
+
+    def append_batch(self, manifest: PyMigrationManifest, batch_result, path: str,
+                     compaction_threshold: int = DEFAULT_COMPACTION_THRESHOLD) -> bool:
+        """Appends the manifest entries of a completed content batch to the journal.
+
+        Args:
+            manifest: The manifest the batch entries belong to.
+            batch_result: The content batch migration result, such as the context of a batch migration completed hook.
+            path: The manifest snapshot file path.
+            compaction_threshold: The number of journal records allowed before the journal is compacted.
+
+        Returns: True if the journal was compacted into a new snapshot, False if the entries were appended.
+        """
+        dotnet_result = getattr(batch_result, "_dotnet", batch_result)
+        content_type = dotnet_result.GetType().GetInterface("IContentBatchMigrationResult`1").GetGenericArguments()[0]
+        entries = [item.ManifestEntry for item in dotnet_result.ItemResults]
+
+        return self.append(manifest, content_type, entries, path, compaction_threshold)
+
+    def compact(self, manifest: PyMigrationManifest, path: str) -> None:
+        """Saves a new manifest snapshot and removes the journal.
+
+        Args:
+            manifest: The manifest to save.
+            path: The manifest snapshot file path.
+        """
+        self._dotnet.CompactAsync(manifest._migration_manifest, path, cancellation_token).GetAwaiter().GetResult()
+
+    def load(self, path: str) -> PyMigrationManifest:
+        """Loads a manifest snapshot and replays its journal.
+
+        Args:
+            path: The manifest snapshot file path.
+
+        Returns: The loaded MigrationManifest, or None if the manifest could not be loaded.
+        """
+        result = self._dotnet.LoadAsync(path, cancellation_token).GetAwaiter().GetResult()
+        return None if result is None else PyMigrationManifest(result)
+
+
+def _to_int_array(dotnet_array) -> array:
+    """Copies a .NET int array to a Python array through its buffer."""
+    result = array("i")
+    result.frombytes(memoryview(dotnet_array).cast("B"))
+    return result
+
+
+def _uuid_at(ids: bytes, row: int) -> UUID:
+    """Reads the UUID of a row from an ID column buffer."""
+    return UUID(bytes=ids[row * 16:(row + 1) * 16])
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError as e:
+        raise ImportError("Arrow and Parquet output of manifest columns requires the pyarrow package (pip install pyarrow).") from e
+
+    return pyarrow
+
+
+class PyMigrationManifestColumns():
+    """Manifest entry values in column form, for offline analysis without wrapper objects for each entry.
+
+    Columns are stored in contiguous buffers using the Arrow memory layout:
+    content types and skipped reasons are dictionary encoded as int32 codes,
+    statuses are int32 MigrationManifestEntryStatus values,
+    source locations are UTF-8 data with int32 offsets,
+    and IDs are 16 bytes per row in RFC 4122 byte order, as returned by UUID.bytes.
+    """
+
+    _dotnet_base = MigrationManifestColumns
+
+    COLUMN_NAMES = ("content_type", "source_id", "source_location", "destination_id", "status", "error_count", "skipped_reason")
+    """The names of the columns, in the order of to_dict and to_arrow."""
+
+    def __init__(self, columns: MigrationManifestColumns) -> None:
+        """Creates a new PyMigrationManifestColumns object.
+
+        Args:
+            columns: The .NET manifest columns to copy.
+        """
+        self.row_count: int = columns.RowCount
+        """The number of rows, one per manifest entry."""
+
+        self.content_type_names: list[str] = list(columns.ContentTypeNames)
+        """The distinct content type names, for example "IUser", indexed by content_type_codes."""
+
+        self.content_type_codes: array = _to_int_array(columns.ContentTypeCodes)
+        """The index into content_type_names of each row."""
+
+        self.source_ids: bytes = bytes(columns.SourceIds)
+        """The source IDs, 16 bytes per row."""
+
+        self.source_location_data: bytes = bytes(columns.SourceLocationData)
+        """The UTF-8 bytes of the source location paths of all rows."""
+
+        self.source_location_offsets: array = _to_int_array(columns.SourceLocationOffsets)
+        """The offsets into source_location_data where the path of each row starts, followed by the data length."""
+
+        self.destination_ids: bytes = bytes(columns.DestinationIds)
+        """The destination IDs, 16 bytes per row, with zero bytes for rows without a destination."""
+
+        self.has_destination: bytes = bytes(columns.HasDestination)
+        """Whether each row has a destination, 1 if it does and 0 if it does not."""
+
+        self.statuses: array = _to_int_array(columns.Statuses)
+        """The MigrationManifestEntryStatus value of each row."""
+
+        self.error_counts: array = _to_int_array(columns.ErrorCounts)
+        """The number of errors of each row."""
+
+        self.skipped_reason_names: list[str] = list(columns.SkippedReasonNames)
+        """The distinct skipped reasons, indexed by skipped_reason_codes."""
+
+        self.skipped_reason_codes: array = _to_int_array(columns.SkippedReasonCodes)
+        """The index into skipped_reason_names of each row, or -1 if the row has no skipped reason."""
+
+    def __len__(self) -> int:
+        """Gets the number of rows."""
+        return self.row_count
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Gets the columns as lists of Python values, for example to create a pandas DataFrame.
+
+        Returns: The column values by column name. IDs are UUID values, statuses are PyMigrationManifestEntryStatus values,
+            and missing destination IDs and skipped reasons are None.
+        """
+        rows = range(self.row_count)
+        offsets = self.source_location_offsets
+        data = self.source_location_data
+        skipped_reasons = self.skipped_reason_names + [None]
+
+        return {
+            "content_type": [self.content_type_names[c] for c in self.content_type_codes],
+            "source_id": [_uuid_at(self.source_ids, i) for i in rows],
+            "source_location": [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in rows],
+            "destination_id": [_uuid_at(self.destination_ids, i) if self.has_destination[i] else None for i in rows],
+            "status": [PyMigrationManifestEntryStatus(s) for s in self.statuses],
+            "error_count": list(self.error_counts),
+            "skipped_reason": [skipped_reasons[c] for c in self.skipped_reason_codes]
+        }
+
+    def to_arrow(self):
+        """Gets the columns as an Arrow table, sharing the column buffers where the layouts match.
+
+        Requires the pyarrow package. Call to_pandas on the table to create a pandas DataFrame.
+
+        Returns: A pyarrow.Table with a column for each name in COLUMN_NAMES.
+            IDs are 16 byte binary values, and the content type, status and skipped reason columns are dictionary encoded.
+            The status dictionary is indexed by MigrationManifestEntryStatus value, so status codes are the status values.
+        """
+        pa = _import_pyarrow()
+        pc = pa.compute
+
+        count = self.row_count
+
+        def _int32(values: array):
+            return pa.Array.from_buffers(pa.int32(), count, [None, pa.py_buffer(values)])
+
+        def _ids(ids: bytes):
+            return pa.Array.from_buffers(pa.binary(16), count, [None, pa.py_buffer(ids)])
+
+        has_destination = pa.Array.from_buffers(pa.uint8(), count, [None, pa.py_buffer(self.has_destination)])
+        skipped_reason_codes = _int32(self.skipped_reason_codes)
+
+        status_names = [None] * (max(PyMigrationManifestEntryStatus) + 1)
+        for status in PyMigrationManifestEntryStatus:
+            status_names[status.value] = status.name
+
+        return pa.table({
+            "content_type": pa.DictionaryArray.from_arrays(_int32(self.content_type_codes), pa.array(self.content_type_names, pa.string())),
+            "source_id": _ids(self.source_ids),
+            "source_location": pa.Array.from_buffers(pa.string(), count, [None, pa.py_buffer(self.source_location_offsets), pa.py_buffer(self.source_location_data)]),
+            "destination_id": pc.if_else(pc.equal(has_destination, 0), pa.scalar(None, pa.binary(16)), _ids(self.destination_ids)),
+            "status": pa.DictionaryArray.from_arrays(_int32(self.statuses), pa.array(status_names, pa.string())),
+            "error_count": _int32(self.error_counts),
+            "skipped_reason": pa.DictionaryArray.from_arrays(
+                pc.if_else(pc.less(skipped_reason_codes, 0), pa.scalar(None, pa.int32()), skipped_reason_codes),
+                pa.array(self.skipped_reason_names, pa.string()))
+        })
+
+    def write_parquet(self, path: str) -> None:
+        """Writes the columns to a Parquet file.
+
+        Requires the pyarrow package.
+
+        Args:
+            path: The file path to write the columns to.
+        """
+        _import_pyarrow()
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(self.to_arrow(), path)
+
 # region _generated
 
 from enum import IntEnum # noqa: E402, F401
@@ -78,6 +372,7 @@ from tableau_migration.migration import (  # noqa: E402, F401
     PyContentReference,
     PyContentLocation
 )
+from tableau_migration.migration_interop import _PyWrapperBase # noqa: E402, F401
 from typing import (  # noqa: E402, F401
     Optional,
     Sequence
@@ -109,10 +404,11 @@ class PyMigrationManifestEntryStatus(IntEnum):
     #: An attempt was made to migrate the content item, but the process was canceled mid-migration. The content item may be missing on the destination or may be partially migrated.
     CANCELED = 4
     
-class PyMigrationManifestEntry():
+class PyMigrationManifestEntry(_PyWrapperBase):
     """Interface for an entry on a IMigrationManifest that describes the migration state of single content item."""
     
     _dotnet_base = IMigrationManifestEntry
+    __slots__ = ()
     
     def __init__(self, migration_manifest_entry: IMigrationManifestEntry) -> None:
         """Creates a new PyMigrationManifestEntry object.
@@ -168,6 +464,7 @@ class PyMigrationManifestEntryEditor(PyMigrationManifestEntry):
     """Interface for a IMigrationManifestEntry that can be edited."""
     
     _dotnet_base = IMigrationManifestEntryEditor
+    __slots__ = ()
     
     def __init__(self, migration_manifest_entry_editor: IMigrationManifestEntryEditor) -> None:
         """Creates a new PyMigrationManifestEntryEditor object.
@@ -25,6 +25,7 @@ from tableau_migration.migration import (
    get_service
 )
 from tableau_migration.migration_engine import PyMigrationPlan
+from tableau_migration.migration_engine_hooks_profiling import profile_hooks as profile_hook_calls
 
 class PyMigrator():
     """Interface for an object that can migration Tableau data between Tableau sites."""
@@ -39,23 +40,34 @@ class PyMigrator():
         self._services = get_service_provider()
         self._migrator = get_service(self._services, IMigrator)
         
-    def execute(self, plan: PyMigrationPlan, previous_manifest: PyMigrationManifest = None, cancel = None):
+    def execute(self, plan: PyMigrationPlan, previous_manifest: PyMigrationManifest = None, cancel = None, profile_hooks: bool = False):
         """Executes a migration asynchronously.
 
         Args:
             plan: The migration plan to execute.
             previous_manifest: A manifest from a previous migration of the same plan to use to determine what progress has already been made.
             cancel: The cancellation token to obey.
+            profile_hooks: Whether to record the timings of Python hook calls, available through the hook_profile of the result.
+                Only the hook calls of this plan's migrations are recorded.
 
         Returns: The results of the migration.
         """
         if cancel is None:
             cancel = cancellation_token
 
+        if not profile_hooks:
+            return PyMigrationResult(self._execute(plan, previous_manifest, cancel))
+
+        with profile_hook_calls(plan=plan) as hook_profile:
+            result = self._execute(plan, previous_manifest, cancel)
+
+        return PyMigrationResult(result, hook_profile)
+
+    def _execute(self, plan: PyMigrationPlan, previous_manifest: PyMigrationManifest, cancel):
         if(previous_manifest is None):
-            return PyMigrationResult(self._migrator.ExecuteAsync(plan._migration_plan, cancel).GetAwaiter().GetResult())
+            return self._migrator.ExecuteAsync(plan._migration_plan, cancel).GetAwaiter().GetResult()
         else:
-            return PyMigrationResult(self._migrator.ExecuteAsync(plan._migration_plan, previous_manifest._migration_manifest, cancel).GetAwaiter().GetResult())
+            return self._migrator.ExecuteAsync(plan._migration_plan, previous_manifest._migration_manifest, cancel).GetAwaiter().GetResult()
 # region _generated
 
 from tableau_migration.migration import (  # noqa: E402, F401
@@ -77,6 +89,7 @@ class PyContentItemMigrationResult(Generic[TContent], PyResult):
     """IResult object for a content item migration action."""
     
     _dotnet_base = IContentItemMigrationResult
+    __slots__ = ()
     
     def __init__(self, content_item_migration_result: IContentItemMigrationResult) -> None:
         """Creates a new PyContentItemMigrationResult object.
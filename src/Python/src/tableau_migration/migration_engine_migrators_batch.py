@@ -19,6 +19,7 @@
 
 from tableau_migration.migration import (  # noqa: E402, F401
     _generic_wrapper,
+    _lazy_sequence,
     PyResult
 )
 from tableau_migration.migration_engine_migrators import PyContentItemMigrationResult # noqa: E402, F401
@@ -37,6 +38,7 @@ class PyContentBatchMigrationResult(Generic[TContent], PyResult):
     """IResult object for a migration action."""
     
     _dotnet_base = IContentBatchMigrationResult
+    __slots__ = ()
     
     def __init__(self, content_batch_migration_result: IContentBatchMigrationResult) -> None:
         """Creates a new PyContentBatchMigrationResult object.
@@ -56,7 +58,7 @@ class PyContentBatchMigrationResult(Generic[TContent], PyResult):
     @property
     def item_results(self) -> Sequence[PyContentItemMigrationResult[TContent]]:
         """Gets the migration result of each item in the batch, in the order they finished."""
-        return None if self._dotnet.ItemResults is None else list((None if x is None else PyContentItemMigrationResult[TContent](x)) for x in self._dotnet.ItemResults)
+        return _lazy_sequence(self, "ItemResults", self._dotnet.ItemResults, lambda x: None if x is None else PyContentItemMigrationResult[TContent](x))
     
     def for_next_batch(self, perform_next_batch: bool) -> Self:
         """Creates a new PerformNextBatch value.
@@ -18,6 +18,7 @@
 # region _generated
 
 from tableau_migration.migration import PyPipelineProfile # noqa: E402, F401
+from tableau_migration.migration_interop import _PyWrapperBase # noqa: E402, F401
 from typing import Sequence # noqa: E402, F401
 from typing_extensions import Self # noqa: E402, F401
 
@@ -28,10 +29,11 @@ from Tableau.Migration.Engine.Pipelines import (  # noqa: E402, F401
     ServerToCloudMigrationPipeline
 )
 
-class PyMigrationPipelineContentType():
+class PyMigrationPipelineContentType(_PyWrapperBase):
     """Object that represents a definition of a content type that a pipeline migrates."""
     
     _dotnet_base = MigrationPipelineContentType
+    __slots__ = ()
     
     def __init__(self, migration_pipeline_content_type: MigrationPipelineContentType) -> None:
         """Creates a new PyMigrationPipelineContentType object.
@@ -214,10 +216,11 @@ class PyMigrationPipelineContentType():
         result = MigrationPipelineContentType.GetAllMigrationPipelineContentTypes()
         return None if result is None else list((None if x is None else PyMigrationPipelineContentType(x)) for x in result)
     
-class PyServerToCloudMigrationPipeline():
+class PyServerToCloudMigrationPipeline(_PyWrapperBase):
     """IMigrationPipeline implementation to perform migrations from Tableau Server to Tableau Cloud."""
     
     _dotnet_base = ServerToCloudMigrationPipeline
+    __slots__ = ()
     
     def __init__(self, server_to_cloud_migration_pipeline: ServerToCloudMigrationPipeline) -> None:
         """Creates a new PyServerToCloudMigrationPipeline object.
@@ -0,0 +1,172 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Friendly top-level names of the Migration SDK, re-exported by the tableau_migration package."""
+
+# Friendly renames for common top-level imports
+from tableau_migration.migration import PyMigrationResult as MigrationResult # noqa: E402, F401
+from tableau_migration.migration_engine import PyMigrationPlanBuilder as MigrationPlanBuilder # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_filters_interop import ( # noqa: E402, F401
+    PyBatchContentFilterBase as BatchContentFilterBase,
+    PyContentFilterBase as ContentFilterBase,
+    PyPrefixSkipFilter as PrefixSkipFilter
+)
+from tableau_migration.migration_engine_hooks_interop import ( # noqa: E402, F401
+    PyContentBatchMigrationCompletedHookBase as ContentBatchMigrationCompletedHookBase,
+    PyInitializeMigrationHookBase as InitializeMigrationHookBase,
+    PyMigrationActionCompletedHookBase as MigrationActionCompletedHookBase
+)
+from tableau_migration.migration_engine_hooks_mappings_interop import ( # noqa: E402, F401
+    PyBatchContentMappingBase as BatchContentMappingBase,
+    PyContentMappingBase as ContentMappingBase,
+    PyPrefixRemapMapping as PrefixRemapMapping,
+    PyTableauCloudUsernameMappingBase as TableauCloudUsernameMappingBase
+)
+from tableau_migration.migration_engine_hooks_postpublish_interop import ( # noqa: E402, F401
+    PyBulkPostPublishHookBase as BulkPostPublishHookBase,
+    PyContentItemPostPublishHookBase as ContentItemPostPublishHookBase
+)
+from tableau_migration.migration_engine_hooks_pulled_interop import ( # noqa: E402, F401
+    PyContentItemPulledHookBase as ContentItemPulledHookBase
+)
+from tableau_migration.migration_engine_hooks_initializemigration import PyInitializeMigrationHookResult as IInitializeMigrationHookResult # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_transformers_interop import ( # noqa: E402, F401
+    PyContentTransformerBase as ContentTransformerBase,
+    PyJsonContentTransformerBase as JsonContentTransformerBase,
+    PyXmlContentTransformerBase as XmlContentTransformerBase
+)
+from tableau_migration.migration_engine_hooks_transformers_process import TransformItemInfo, create_transformer_process_pool # noqa: E402, F401
+from tableau_migration.migration_xml import PyXmlElement as XmlElement # noqa: E402, F401
+from tableau_migration.migration_engine_migrators import PyMigrator as Migrator # noqa: E402, F401
+from tableau_migration.migration_engine_endpoints_caching import ( # noqa: E402, F401
+    BulkContentReferenceCacheLoadStrategyProvider,
+    LazyContentReferenceCacheLoadStrategyProvider,
+    PersistentContentReferenceCacheLoadStrategyProvider,
+    ContentReferenceCacheLoadStrategyProviderBase
+)
+from tableau_migration.migration_engine_endpoints_search import PyDestinationContentReferenceFinder as IDestinationContentReferenceFinder # noqa: E402, F401
+from tableau_migration.migration_engine_endpoints_search import PyDestinationContentReferenceFinderFactory as IDestinationContentReferenceFinderFactory # noqa: E402, F401
+from tableau_migration.migration_engine_endpoints_search import PySourceContentReferenceFinder as ISourceContentReferenceFinder # noqa: E402, F401
+from tableau_migration.migration_engine_endpoints_search import PySourceContentReferenceFinderFactory as ISourceContentReferenceFinderFactory # noqa: E402, F401
+from tableau_migration.migration_content_schedules_cloud import PyCloudExtractRefreshTask as ICloudExtractRefreshTask # noqa: E402, F401
+from tableau_migration.migration_content_schedules_server import PyServerExtractRefreshTask as IServerExtractRefreshTask # noqa: E402, F401
+from tableau_migration.migration_engine_manifest import PyMigrationManifest as MigrationManifest # noqa: E402, F401
+from tableau_migration.migration_engine_manifest import PyMigrationManifestSerializer as MigrationManifestSerializer # noqa: E402, F401
+from tableau_migration.migration_engine_manifest import PyMigrationManifestJournalSerializer as MigrationManifestJournalSerializer # noqa: E402, F401
+from tableau_migration.migration_engine_manifest import PyMigrationManifestColumns as MigrationManifestColumns # noqa: E402, F401
+from tableau_migration.migration_engine_endpoints_search import PyDestinationContentReferenceFinderBase as DestinationContentReferenceFinderBase # noqa: E402, F401
+from tableau_migration.migration_engine_endpoints_search import PySourceContentReferenceFinderBase as SourceContentReferenceFinderBase # noqa: E402, F401
+from tableau_migration.migration_engine_services import PyMigrationContentLoaderBase as MigrationContentLoaderBase # noqa: E402, F401
+from tableau_migration.migration_paging import empty_pager, memory_pager, streaming_pager # noqa: E402, F401
+from tableau_migration.migration_interop import clear_wrapper_type_cache, wrapper_type_cache_info # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_profiling import HookProfile, HookTimingStats, profile_hooks # noqa: E402, F401
+from tableau_migration.migration_logger import refresh_log_levels, start_queued_logging, stop_queued_logging # noqa: E402, F401
+from tableau_migration.migration_asyncio import get_hook_event_loop, stop_hook_event_loop # noqa: E402, F401
+from tableau_migration.migration_location_index import LocationIndex, LocationMatch # noqa: E402, F401
+
+# region _generated
+
+from tableau_migration.migration import PyContentLocation as ContentLocation # noqa: E402, F401
+from tableau_migration.migration import PyContentReference as IContentReference # noqa: E402, F401
+from tableau_migration.migration import PyEmptyIdContentReference as IEmptyIdContentReference # noqa: E402, F401
+from tableau_migration.migration import PyMigrationCompletionStatus as MigrationCompletionStatus # noqa: E402, F401
+from tableau_migration.migration import PyPipelineProfile as PipelineProfile # noqa: E402, F401
+from tableau_migration.migration import PyResult as IResult # noqa: E402, F401
+from tableau_migration.migration_api_rest import PyRestIdentifiable as IRestIdentifiable # noqa: E402, F401
+from tableau_migration.migration_api_rest_models import PyAdministratorLevels as AdministratorLevels # noqa: E402, F401
+from tableau_migration.migration_api_rest_models import PyContentPermissions as ContentPermissions # noqa: E402, F401
+from tableau_migration.migration_api_rest_models import PyExtractEncryptionModes as ExtractEncryptionModes # noqa: E402, F401
+from tableau_migration.migration_api_rest_models import PyLabelCategories as LabelCategories # noqa: E402, F401
+from tableau_migration.migration_api_rest_models import PyLicenseLevels as LicenseLevels # noqa: E402, F401
+from tableau_migration.migration_api_rest_models import PyPermissionsCapabilityModes as PermissionsCapabilityModes # noqa: E402, F401
+from tableau_migration.migration_api_rest_models import PyPermissionsCapabilityNames as PermissionsCapabilityNames # noqa: E402, F401
+from tableau_migration.migration_api_rest_models import PySiteRoles as SiteRoles # noqa: E402, F401
+from tableau_migration.migration_api_rest_models_types import PyAuthenticationTypes as AuthenticationTypes # noqa: E402, F401
+from tableau_migration.migration_api_rest_models_types import PyDataSourceFileTypes as DataSourceFileTypes # noqa: E402, F401
+from tableau_migration.migration_api_rest_models_types import PyFlowFileTypes as FlowFileTypes # noqa: E402, F401
+from tableau_migration.migration_api_rest_models_types import PyWorkbookFileTypes as WorkbookFileTypes # noqa: E402, F401
+from tableau_migration.migration_content import PyCloudSubscription as ICloudSubscription # noqa: E402, F401
+from tableau_migration.migration_content import PyConnection as IConnection # noqa: E402, F401
+from tableau_migration.migration_content import PyConnectionsContent as IConnectionsContent # noqa: E402, F401
+from tableau_migration.migration_content import PyContainerContent as IContainerContent # noqa: E402, F401
+from tableau_migration.migration_content import PyCustomView as ICustomView # noqa: E402, F401
+from tableau_migration.migration_content import PyDataSource as IDataSource # noqa: E402, F401
+from tableau_migration.migration_content import PyDataSourceDetails as IDataSourceDetails # noqa: E402, F401
+from tableau_migration.migration_content import PyDescriptionContent as IDescriptionContent # noqa: E402, F401
+from tableau_migration.migration_content import PyExtractContent as IExtractContent # noqa: E402, F401
+from tableau_migration.migration_content import PyFavorite as IFavorite # noqa: E402, F401
+from tableau_migration.migration_content import PyFavoriteContentType as FavoriteContentType # noqa: E402, F401
+from tableau_migration.migration_content import PyFlow as IFlow # noqa: E402, F401
+from tableau_migration.migration_content import PyFlowDetails as IFlowDetails # noqa: E402, F401
+from tableau_migration.migration_content import PyFlowOutputStep as IFlowOutputStep # noqa: E402, F401
+from tableau_migration.migration_content import PyGroup as IGroup # noqa: E402, F401
+from tableau_migration.migration_content import PyGroupSet as IGroupSet # noqa: E402, F401
+from tableau_migration.migration_content import PyGroupUser as IGroupUser # noqa: E402, F401
+from tableau_migration.migration_content import PyLabel as ILabel # noqa: E402, F401
+from tableau_migration.migration_content import PyProject as IProject # noqa: E402, F401
+from tableau_migration.migration_content import PyPublishableCustomView as IPublishableCustomView # noqa: E402, F401
+from tableau_migration.migration_content import PyPublishableDataSource as IPublishableDataSource # noqa: E402, F401
+from tableau_migration.migration_content import PyPublishableFlow as IPublishableFlow # noqa: E402, F401
+from tableau_migration.migration_content import PyPublishableGroup as IPublishableGroup # noqa: E402, F401
+from tableau_migration.migration_content import PyPublishableGroupSet as IPublishableGroupSet # noqa: E402, F401
+from tableau_migration.migration_content import PyPublishableWorkbook as IPublishableWorkbook # noqa: E402, F401
+from tableau_migration.migration_content import PyPublishedContent as IPublishedContent # noqa: E402, F401
+from tableau_migration.migration_content import PyServerSubscription as IServerSubscription # noqa: E402, F401
+from tableau_migration.migration_content import PySizeContent as ISizeContent # noqa: E402, F401
+from tableau_migration.migration_content import PySubscription as ISubscription # noqa: E402, F401
+from tableau_migration.migration_content import PySubscriptionContent as ISubscriptionContent # noqa: E402, F401
+from tableau_migration.migration_content import PyTag as ITag # noqa: E402, F401
+from tableau_migration.migration_content import PyUser as IUser # noqa: E402, F401
+from tableau_migration.migration_content import PyUserAuthenticationType as UserAuthenticationType # noqa: E402, F401
+from tableau_migration.migration_content import PyUsernameContent as IUsernameContent # noqa: E402, F401
+from tableau_migration.migration_content import PyView as IView # noqa: E402, F401
+from tableau_migration.migration_content import PyWithDomain as IWithDomain # noqa: E402, F401
+from tableau_migration.migration_content import PyWithOwner as IWithOwner # noqa: E402, F401
+from tableau_migration.migration_content import PyWithTags as IWithTags # noqa: E402, F401
+from tableau_migration.migration_content import PyWithWorkbook as IWithWorkbook # noqa: E402, F401
+from tableau_migration.migration_content import PyWorkbook as IWorkbook # noqa: E402, F401
+from tableau_migration.migration_content import PyWorkbookDetails as IWorkbookDetails # noqa: E402, F401
+from tableau_migration.migration_content_permissions import PyCapability as ICapability # noqa: E402, F401
+from tableau_migration.migration_content_permissions import PyGranteeCapability as IGranteeCapability # noqa: E402, F401
+from tableau_migration.migration_content_permissions import PyGranteeType as GranteeType # noqa: E402, F401
+from tableau_migration.migration_content_permissions import PyPermissions as IPermissions # noqa: E402, F401
+from tableau_migration.migration_content_permissions import PyPermissionSet as IPermissionSet # noqa: E402, F401
+from tableau_migration.migration_content_schedules import PyExtractRefreshContentType as ExtractRefreshContentType # noqa: E402, F401
+from tableau_migration.migration_content_schedules import PyExtractRefreshTask as IExtractRefreshTask # noqa: E402, F401
+from tableau_migration.migration_content_schedules import PyFrequencyDetails as IFrequencyDetails # noqa: E402, F401
+from tableau_migration.migration_content_schedules import PyInterval as IInterval # noqa: E402, F401
+from tableau_migration.migration_content_schedules import PySchedule as ISchedule # noqa: E402, F401
+from tableau_migration.migration_content_schedules import PyWithSchedule as IWithSchedule # noqa: E402, F401
+from tableau_migration.migration_content_schedules_cloud import PyCloudSchedule as ICloudSchedule # noqa: E402, F401
+from tableau_migration.migration_content_schedules_server import PyServerSchedule as IServerSchedule # noqa: E402, F401
+from tableau_migration.migration_content_search import PyContentReferenceFinder as IContentReferenceFinder # noqa: E402, F401
+from tableau_migration.migration_engine import PyContentMigrationItem as ContentMigrationItem # noqa: E402, F401
+from tableau_migration.migration_engine_actions import PyMigrationActionResult as IMigrationActionResult # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_filters import PyContentFilterContext as ContentFilterContext # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_filters import PyContentFilterContextItem as ContentFilterContextItem # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_filters import PyFilterStatus as FilterStatus # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_mappings import PyContentMappingContext as ContentMappingContext # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_postpublish import PyBulkPostPublishContext as BulkPostPublishContext # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_postpublish import PyContentItemPostPublishContext as ContentItemPostPublishContext # noqa: E402, F401
+from tableau_migration.migration_engine_hooks_pulled import PyContentItemPulledContext as ContentItemPulledContext # noqa: E402, F401
+from tableau_migration.migration_engine_manifest import PyMigrationManifestEntry as IMigrationManifestEntry # noqa: E402, F401
+from tableau_migration.migration_engine_manifest import PyMigrationManifestEntryEditor as IMigrationManifestEntryEditor # noqa: E402, F401
+from tableau_migration.migration_engine_manifest import PyMigrationManifestEntryStatus as MigrationManifestEntryStatus # noqa: E402, F401
+from tableau_migration.migration_engine_migrators import PyContentItemMigrationResult as IContentItemMigrationResult # noqa: E402, F401
+from tableau_migration.migration_engine_migrators_batch import PyContentBatchMigrationResult as IContentBatchMigrationResult # noqa: E402, F401
+from tableau_migration.migration_engine_pipelines import PyMigrationPipelineContentType as MigrationPipelineContentType # noqa: E402, F401
+from tableau_migration.migration_engine_pipelines import PyServerToCloudMigrationPipeline as ServerToCloudMigrationPipeline # noqa: E402, F401
+
+# endregion
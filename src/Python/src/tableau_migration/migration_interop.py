@@ -15,11 +15,17 @@
 
 """Interoperability utility."""
 
+import re
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from typing import Any, Callable, get_args, Optional, Union
-from uuid import uuid4
+from inspect import isawaitable
+from threading import Lock
+from typing import Any, Callable, get_args, Hashable, NamedTuple, Optional, Union
+from uuid import UUID
 
-from System import IServiceProvider
+from tableau_migration.migration_asyncio import _run_coroutine
+
+from System import Array, Byte, Guid, IServiceProvider
 
 def _get_type_args(t: Union[type, Any]) -> tuple[type, ...]:
     if hasattr(t, "__orig_bases__"):
@@ -52,6 +58,123 @@ def _wrapper_factory(t: type) -> Callable:
     return _create
 
 
+class WrapperTypeCacheInfo(NamedTuple):
+    """Statistics of the process-wide interop wrapper type cache."""
+
+    #: The number of wrapper builders that reused a cached wrapper type.
+    hits: int
+
+    #: The number of wrapper builders that generated a new wrapper type.
+    misses: int
+
+    #: The number of wrapper types currently cached.
+    size: int
+
+    #: The maximum number of wrapper types cached, least recently used types are evicted first.
+    max_size: int
+
+
+WRAPPER_TYPE_CACHE_MAX_SIZE: int = 1024
+"""The default maximum number of cached interop wrapper types."""
+
+
+class _WrapperTypeCache():
+    """Process-wide cache of generated interop wrapper types.
+
+    Generating a wrapper type emits a new .NET type through pythonnet, 
+    so wrapper types are generated once per wrapper builder, inner type, generic arguments and callback.
+    Keys hold strong references to callbacks, so the cache is bounded to release callbacks of plans
+    that are no longer built, for example closures created for each plan.
+    """
+
+    def __init__(self, max_size: int = WRAPPER_TYPE_CACHE_MAX_SIZE) -> None:
+        self._lock = Lock()
+        self._types: OrderedDict[Hashable, type] = OrderedDict()
+        self.max_size = max_size
+        # Generated type names are never reused, even after clearing, because the .NET types remain loaded.
+        self._names = set()
+        self.hits = 0
+        self.misses = 0
+
+    def _unique_name(self, name: str) -> str:
+        name = re.sub(r"\W", "_", name)
+        unique_name = name
+        suffix = 1
+        while unique_name in self._names:
+            suffix += 1
+            unique_name = f"{name}_{suffix}"
+
+        self._names.add(unique_name)
+        return unique_name
+
+    def get_or_add(self, key: Union[Hashable, None], name: str, factory: Callable[[str], type]) -> type:
+        with self._lock:
+            if key is not None and key in self._types:
+                self.hits += 1
+                self._types.move_to_end(key)
+                return self._types[key]
+
+            self.misses += 1
+            t = factory(self._unique_name(name))
+            if key is not None:
+                self._types[key] = t
+                if len(self._types) > self.max_size:
+                    self._types.popitem(last=False)
+
+            return t
+
+    def info(self) -> WrapperTypeCacheInfo:
+        with self._lock:
+            return WrapperTypeCacheInfo(self.hits, self.misses, len(self._types), self.max_size)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._types.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_wrapper_type_cache = _WrapperTypeCache()
+
+
+def wrapper_type_cache_info() -> WrapperTypeCacheInfo:
+    """Gets the statistics of the interop wrapper type cache.
+
+    Returns: The cache hits, misses and current size.
+    """
+    return _wrapper_type_cache.info()
+
+
+def clear_wrapper_type_cache() -> None:
+    """Clears the interop wrapper type cache and its statistics.
+
+    Wrapper types that were already registered with a migration plan remain valid.
+    """
+    _wrapper_type_cache.clear()
+
+
+def _type_name(t: Any) -> str:
+    return getattr(t, "__name__", str(t))
+
+
+def _is_hashable(key: Any) -> bool:
+    try:
+        hash(key)
+        return True
+    except TypeError:
+        return False
+
+
+class _PyWrapperBase():
+    """Base class of generated wrapper classes, declaring the slots shared by all wrappers.
+
+    Generated wrappers declare their own __slots__, so wrapper objects do not carry an instance dictionary.
+    Wrappers inheriting from multiple generated wrappers share this base so their slot layouts are compatible.
+    """
+
+    __slots__ = ("_dotnet", "_lazy_sequences", "__weakref__")
+
+
 class _PyWrapperBuilderBase(ABC):
 
 
@@ -67,6 +190,15 @@ class _PyWrapperBuilderBase(ABC):
         self.python_generic_types = self.get_python_generic_types()
         self.dotnet_generic_types = tuple([t._dotnet_base if hasattr(t, "_dotnet_base") else t for t in self.python_generic_types])
 
+        key = self.get_wrapper_cache_key()
+        if not _is_hashable(key):
+            key = None
+
+        self.wrapper_type = _wrapper_type_cache.get_or_add(key, self.get_wrapper_type_name(), self._build_wrapper_type)
+        self.factory = _wrapper_factory(self.wrapper_type)
+
+
+    def _build_wrapper_type(self, type_name: str) -> type:
         base_types = (self.get_wrapper_base_type(),)
         base_types = self.add_extra_wrapper_base_types(base_types)
 
@@ -77,8 +209,7 @@ class _PyWrapperBuilderBase(ABC):
 
         members = self.add_wrapper_members(members)        
 
-        self.wrapper_type = type(self.get_wrapper_type_name(), base_types, members)
-        self.factory = _wrapper_factory(self.wrapper_type)
+        return type(type_name, base_types, members)
 
 
     def _enforce_inner_type(self) -> type:
@@ -97,7 +228,12 @@ class _PyWrapperBuilderBase(ABC):
 
 
     def get_wrapper_type_name(self) -> str:
-        return self._enforce_inner_type().__name__ + "_InteropWrapper_" + str(uuid4())
+        return "_".join([self._enforce_inner_type().__name__, "InteropWrapper"] + [_type_name(t) for t in self.python_generic_types])
+
+
+    # Builders with equal keys generate equivalent wrapper types. None always generates a new wrapper type.
+    def get_wrapper_cache_key(self) -> Optional[Hashable]:
+        return (type(self), self.inner_type, self.python_generic_types)
 
 
     def get_wrapper_init(self) -> Callable:
@@ -121,13 +257,74 @@ def _unwrap(result):
     return result._dotnet if hasattr(result, "_dotnet") else result
 
 
-def _unwrap_async(ctx_type: type, result):
-    """Wraps a Python result in a completed Task for C# async interop."""
+def _unwrap_async(ctx_type: type, result, cancel = None):
+    """Wraps a Python result in a Task for C# async interop.
+
+    Awaitable results from async hooks are run on the hook event loop, and the task completes when they complete.
+    """
     from System.Threading.Tasks import Task
+    if isawaitable(result):
+        return _task_from_future(_run_coroutine(result), _unwrap, cancel, ctx_type)
+
     dotnet_result = _unwrap(result)
     return Task.FromResult[ctx_type](dotnet_result)
 
 
+def _completed_async(result, cancel = None):
+    """Wraps a Python result without a value in a Task for C# async interop.
+
+    Awaitable results from async hooks are run on the hook event loop, and the task completes when they complete.
+    """
+    from System.Threading.Tasks import Task
+    if isawaitable(result):
+        return _task_from_future(_run_coroutine(result), lambda _: None, cancel)
+
+    return Task.CompletedTask
+
+
+def _task_from_future(future, on_result: Callable[[Any], Any], cancel = None, result_type: Optional[type] = None):
+    """Creates a .NET Task that completes when a concurrent.futures Future completes.
+
+    Args:
+        future: The future to wait for.
+        on_result: The function to call with the result of the future before the task completes. 
+            When result_type is set it returns the result of the task.
+        cancel: The cancellation token that cancels the future, or None.
+            Cancelling calls future.cancel, so an executor future that has started running is not cancelled, 
+            and the task completes when it finishes. Futures of coroutines submitted to an event loop stay pending
+            until the coroutine finishes, so they are cancelled while running.
+        result_type: The result type of the task, or None to create a task without a result.
+
+    Returns: The task.
+    """
+    from System import Action, Exception as DotNetException
+    from System.Threading.Tasks import TaskCompletionSource
+
+    tcs = TaskCompletionSource() if result_type is None else TaskCompletionSource[result_type]()
+    registration = None if cancel is None else cancel.Register(Action(future.cancel))
+
+    def _complete(f) -> None:
+        if registration is not None:
+            registration.Dispose()
+
+        if f.cancelled():
+            tcs.TrySetCanceled()
+            return
+
+        try:
+            result = on_result(f.result())
+        except Exception as e:
+            tcs.TrySetException(DotNetException(f"{type(e).__name__}: {e}"))
+        else:
+            if result_type is None:
+                tcs.TrySetResult()
+            else:
+                tcs.TrySetResult(result)
+
+    future.add_done_callback(_complete)
+    return tcs.Task
+
+
 def _wrap_content_location(location):
     """Wrap C# ContentLocation to Python PyContentLocation."""
     from tableau_migration.migration import PyContentLocation
@@ -141,6 +338,13 @@ def _wrap_content_reference(reference):
 
 
 def _wrap_guid(guid):
-    """Convert C# Guid to Python UUID."""
-    from uuid import UUID
-    return UUID(str(guid)) if guid is not None else None
\ No newline at end of file
+    """Convert C# Guid to Python UUID.
+
+    The 16 bytes of the Guid are copied directly, instead of formatting and parsing a GUID string.
+    """
+    return UUID(bytes_le=bytes(guid.ToByteArray())) if guid is not None else None
+
+
+def _to_dotnet_guid(uuid):
+    """Convert Python UUID to C# Guid."""
+    return Guid(Array[Byte](uuid.bytes_le)) if uuid is not None else None
\ No newline at end of file
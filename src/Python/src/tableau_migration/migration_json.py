@@ -0,0 +1,251 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Change-tracking containers for JSON documents passed to Python transformers."""
+
+import json
+from functools import partial
+from typing import Any, Callable, Optional
+
+
+def _track(value: Any, on_change: Callable[[], None]) -> Any:
+    """Wraps parsed JSON containers in change-tracking containers."""
+    if isinstance(value, dict):
+        return TrackedJsonDict(value, on_change)
+    if isinstance(value, list):
+        return TrackedJsonList(value, on_change)
+    return value
+
+
+class TrackedJsonDict(dict):
+    """JSON object that reports any change made to it or its nested containers."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, values: dict, on_change: Callable[[], None]) -> None:
+        """Creates a new TrackedJsonDict object.
+
+        Args:
+            values: The parsed JSON object values.
+            on_change: The function to call when the object changes.
+
+        Returns: None.
+        """
+        super().__init__((k, _track(v, on_change)) for k, v in values.items())
+        self._on_change = on_change
+
+    def _changed(self, result: Any = None) -> Any:
+        self._on_change()
+        return result
+
+    def __setitem__(self, key, value) -> None:
+        """Sets a value and reports the change."""
+        self._changed(super().__setitem__(key, value))
+
+    def __delitem__(self, key) -> None:
+        """Deletes a value and reports the change."""
+        self._changed(super().__delitem__(key))
+
+    def __ior__(self, other):
+        """Merges values and reports the change."""
+        return self._changed(super().__ior__(other))
+
+    def clear(self) -> None:
+        """Removes all values and reports the change."""
+        self._changed(super().clear())
+
+    def pop(self, *args):
+        """Removes a value and reports the change."""
+        return self._changed(super().pop(*args))
+
+    def popitem(self):
+        """Removes the last value and reports the change."""
+        return self._changed(super().popitem())
+
+    def setdefault(self, key, default=None):
+        """Gets a value, adding the default value and reporting the change if the key does not exist."""
+        return super().setdefault(key, default) if key in self else self._changed(super().setdefault(key, default))
+
+    def update(self, *args, **kwargs) -> None:
+        """Updates values and reports the change."""
+        self._changed(super().update(*args, **kwargs))
+
+
+class TrackedJsonList(list):
+    """JSON array that reports any change made to it or its nested containers."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, values: list, on_change: Callable[[], None]) -> None:
+        """Creates a new TrackedJsonList object.
+
+        Args:
+            values: The parsed JSON array values.
+            on_change: The function to call when the array changes.
+
+        Returns: None.
+        """
+        super().__init__(_track(v, on_change) for v in values)
+        self._on_change = on_change
+
+    def _changed(self, result: Any = None) -> Any:
+        self._on_change()
+        return result
+
+    def __setitem__(self, index, value) -> None:
+        """Sets a value and reports the change."""
+        self._changed(super().__setitem__(index, value))
+
+    def __delitem__(self, index) -> None:
+        """Deletes a value and reports the change."""
+        self._changed(super().__delitem__(index))
+
+    def __iadd__(self, other):
+        """Extends the array and reports the change."""
+        return self._changed(super().__iadd__(other))
+
+    def __imul__(self, count):
+        """Repeats the array and reports the change."""
+        return self._changed(super().__imul__(count))
+
+    def append(self, value) -> None:
+        """Appends a value and reports the change."""
+        self._changed(super().append(value))
+
+    def extend(self, values) -> None:
+        """Extends the array and reports the change."""
+        self._changed(super().extend(values))
+
+    def insert(self, index, value) -> None:
+        """Inserts a value and reports the change."""
+        self._changed(super().insert(index, value))
+
+    def pop(self, *args):
+        """Removes a value and reports the change."""
+        return self._changed(super().pop(*args))
+
+    def remove(self, value) -> None:
+        """Removes a value and reports the change."""
+        self._changed(super().remove(value))
+
+    def clear(self) -> None:
+        """Removes all values and reports the change."""
+        self._changed(super().clear())
+
+    def sort(self, *args, **kwargs) -> None:
+        """Sorts the array and reports the change."""
+        self._changed(super().sort(*args, **kwargs))
+
+    def reverse(self) -> None:
+        """Reverses the array and reports the change."""
+        self._changed(super().reverse())
+
+
+class TrackedJsonDocument(dict):
+    """JSON root object that records which of its top-level keys have changed.
+
+    Changes to nested containers are recorded against the top-level key that contains them,
+    so only changed top-level values need to be written back.
+    """
+
+    __slots__ = ("changed_keys",)
+
+    def __init__(self, values: dict) -> None:
+        """Creates a new TrackedJsonDocument object.
+
+        Args:
+            values: The parsed JSON root object values.
+
+        Returns: None.
+        """
+        super().__init__((k, _track(v, partial(self._mark, k))) for k, v in values.items())
+        self.changed_keys: set = set()
+
+    @classmethod
+    def loads(cls, s: str) -> "TrackedJsonDocument":
+        """Parses a JSON object into a tracked document.
+
+        Args:
+            s: The JSON text of an object.
+
+        Returns: The tracked document.
+        """
+        values = json.loads(s)
+        if not isinstance(values, dict):
+            raise TypeError("JSON transformer root must be a JSON object.")
+
+        return cls(values)
+
+    @property
+    def is_changed(self) -> bool:
+        """Gets whether any value has changed since the document was loaded."""
+        return len(self.changed_keys) > 0
+
+    def serialize_changes(self) -> list[tuple[str, Optional[str]]]:
+        """Serializes the changed top-level values.
+
+        Returns: The changed keys in document order, followed by removed keys, 
+            each with the JSON text of its value or None if the key was removed.
+        """
+        changes = [(k, json.dumps(self[k])) for k in self if k in self.changed_keys]
+        changes.extend((k, None) for k in self.changed_keys if k not in self)
+        return changes
+
+    def _mark(self, key) -> None:
+        self.changed_keys.add(key)
+
+    def __setitem__(self, key, value) -> None:
+        """Sets a value and records the key as changed."""
+        super().__setitem__(key, value)
+        self._mark(key)
+
+    def __delitem__(self, key) -> None:
+        """Deletes a value and records the key as changed."""
+        super().__delitem__(key)
+        self._mark(key)
+
+    def __ior__(self, other):
+        """Merges values and records their keys as changed."""
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        """Removes all values and records their keys as changed."""
+        self.changed_keys.update(self.keys())
+        super().clear()
+
+    def pop(self, key, *args):
+        """Removes a value and records the key as changed."""
+        if key in self:
+            self._mark(key)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        """Removes the last value and records the key as changed."""
+        item = super().popitem()
+        self._mark(item[0])
+        return item
+
+    def setdefault(self, key, default=None):
+        """Gets a value, adding the default value and recording the key as changed if the key does not exist."""
+        if key not in self:
+            self._mark(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        """Updates values and records their keys as changed."""
+        values = dict(*args, **kwargs)
+        super().update(values)
+        self.changed_keys.update(values.keys())
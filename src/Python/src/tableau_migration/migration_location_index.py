@@ -0,0 +1,240 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Precomputed lookup of content locations for location-based hooks."""
+
+from typing import Any, Generic, Iterable, Iterator, Mapping, NamedTuple, Optional, Sequence, TypeVar, Union
+
+from tableau_migration.migration import PyContentLocation, PyContentReference, _ordinal_ignore_case_key
+from tableau_migration.migration_interop import _unwrap
+
+from Tableau.Migration import ContentLocation
+
+TValue = TypeVar("TValue")
+
+LocationKey = Union[PyContentLocation, ContentLocation, str, Sequence[str]]
+"""A location to index or look up: a content location, a location path, or a sequence of path segments."""
+
+_BACKSLASH_PLACEHOLDER = "\ue000"
+_SEPARATOR_PLACEHOLDER = "\ue001"
+
+def _split_path(path: str, path_separator: str) -> tuple[str, ...]:
+    """Splits a location path into its segments, unescaping them like ContentLocation.FromPath."""
+    if not path:
+        return ()
+
+    if path_separator == "/":
+        path = path.replace("\\\\", _BACKSLASH_PLACEHOLDER).replace("\\/", _SEPARATOR_PLACEHOLDER)
+    elif path_separator == "\\":
+        path = path.replace("\\\\", _BACKSLASH_PLACEHOLDER)
+
+    segments = (segment.strip() for segment in path.split(path_separator))
+    return tuple(segment.replace(_SEPARATOR_PLACEHOLDER, "/").replace(_BACKSLASH_PLACEHOLDER, "\\") for segment in segments if segment)
+
+def _join_path(segments: Iterable[str], path_separator: str) -> str:
+    """Joins location path segments, escaping them like ContentLocation.Path."""
+    if path_separator == "/":
+        segments = (segment.replace("\\", "\\\\").replace("/", "\\/") for segment in segments)
+    elif path_separator == "\\":
+        segments = (segment.replace("\\", "\\\\") for segment in segments)
+
+    return path_separator.join(segments)
+
+class LocationMatch(NamedTuple):
+    """An indexed location found by a location index query."""
+
+    path_segments: tuple[str, ...]
+    """The path segments of the indexed location, as they were added to the index."""
+
+    value: Any
+    """The value indexed for the location."""
+
+class _LocationNode():
+    __slots__ = ("children", "indexed", "path_segments", "value")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _LocationNode] = {}
+        self.indexed = False
+        self.path_segments: tuple[str, ...] = ()
+        self.value = None
+
+class LocationIndex(Generic[TValue]):
+    """Index of content locations for prefix and ancestor lookups.
+
+    The index is a trie keyed on location path segments, so queries take time proportional to the depth of the queried location
+    regardless of how many locations are indexed. Path segments are compared case-insensitively, like content locations.
+
+    Build the index once, for example from configuration or from a content finder's find_all results,
+    and share it between hook calls instead of comparing locations for each content item.
+    """
+
+    def __init__(self, locations: Union[Iterable[LocationKey], Mapping[LocationKey, TValue], None] = None, path_separator: str = "/") -> None:
+        """Creates a new LocationIndex object.
+
+        Args:
+            locations: The locations to index, or a mapping of locations to the values to index for them.
+            path_separator: The separator used to parse locations given as path strings.
+
+        Returns: None.
+        """
+        self._root = _LocationNode()
+        self._count = 0
+        self._path_separator = path_separator
+
+        if isinstance(locations, Mapping):
+            for location, value in locations.items():
+                self.add(location, value)
+        elif locations is not None:
+            for location in locations:
+                self.add(location)
+
+    @classmethod
+    def from_references(cls, references: Iterable[PyContentReference], path_separator: str = "/") -> "LocationIndex[PyContentReference]":
+        """Creates a new LocationIndex from content references, such as the results of a content finder's find_all.
+
+        Args:
+            references: The content references to index by their locations.
+            path_separator: The separator used to parse locations given as path strings.
+
+        Returns: The new LocationIndex, with each location indexed to its content reference.
+        """
+        index = cls(path_separator=path_separator)
+        for reference in references:
+            index.add(reference._dotnet.Location, reference)
+        return index
+
+    def _segments(self, location: LocationKey) -> Sequence[str]:
+        location = _unwrap(location)
+
+        if isinstance(location, str):
+            return _split_path(location, self._path_separator)
+
+        if isinstance(location, ContentLocation):
+            # Path and PathSeparator are single strings, unlike PathSegments which copies the .NET array.
+            return _split_path(location.Path, location.PathSeparator)
+
+        return tuple(location)
+
+    def add(self, location: LocationKey, value: Optional[TValue] = None) -> "LocationIndex[TValue]":
+        """Adds a location to the index, replacing the value of an already indexed location.
+
+        Args:
+            location: The location to index.
+            value: The value to index for the location.
+
+        Returns: The same location index for fluent API calls.
+        """
+        segments = self._segments(location)
+
+        node = self._root
+        for segment in segments:
+            key = _ordinal_ignore_case_key(segment)
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = _LocationNode()
+            node = child
+
+        if not node.indexed:
+            node.indexed = True
+            self._count += 1
+
+        node.path_segments = segments
+        node.value = value
+        return self
+
+    def _find_node(self, location: LocationKey) -> Optional[_LocationNode]:
+        node = self._root
+        for segment in self._segments(location):
+            node = node.children.get(_ordinal_ignore_case_key(segment))
+            if node is None:
+                return None
+        return node
+
+    def __len__(self) -> int:
+        """Gets the number of indexed locations."""
+        return self._count
+
+    def __contains__(self, location: LocationKey) -> bool:
+        """Checks if a location is indexed."""
+        node = self._find_node(location)
+        return node is not None and node.indexed
+
+    def __iter__(self) -> Iterator[LocationMatch]:
+        """Iterates the indexed locations and their values."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.indexed:
+                yield LocationMatch(node.path_segments, node.value)
+            stack.extend(node.children.values())
+
+    def get(self, location: LocationKey, default: Optional[TValue] = None) -> Optional[TValue]:
+        """Gets the value indexed for a location.
+
+        Args:
+            location: The location to look up.
+            default: The value to return if the location is not indexed.
+
+        Returns: The indexed value, or the default if the location is not indexed.
+        """
+        node = self._find_node(location)
+        return node.value if node is not None and node.indexed else default
+
+    def find_ancestor(self, location: LocationKey, include_self: bool = True) -> Optional[LocationMatch]:
+        """Finds the deepest indexed location that contains a location.
+
+        Args:
+            location: The location to look up.
+            include_self: True to also match the location itself if it is indexed, otherwise false.
+
+        Returns: The deepest indexed location that the location is within, or None if there is none.
+        """
+        segments = self._segments(location)
+        depth = len(segments) if include_self else len(segments) - 1
+        if depth < 0:
+            return None
+
+        node = self._root
+        match = node if node.indexed else None
+        for segment in segments[:depth]:
+            node = node.children.get(_ordinal_ignore_case_key(segment))
+            if node is None:
+                break
+            if node.indexed:
+                match = node
+
+        return None if match is None else LocationMatch(match.path_segments, match.value)
+
+    def has_ancestor(self, location: LocationKey, include_self: bool = True) -> bool:
+        """Checks if a location is within any indexed location.
+
+        Args:
+            location: The location to look up.
+            include_self: True to also match the location itself if it is indexed, otherwise false.
+
+        Returns: True if the location is within an indexed location, otherwise false.
+        """
+        return self.find_ancestor(location, include_self) is not None
+
+    def has_descendant(self, location: LocationKey) -> bool:
+        """Checks if any indexed location is within a location, i.e. the location is a prefix of an indexed location.
+
+        Args:
+            location: The location to look up.
+
+        Returns: True if an indexed location is within the location, otherwise false.
+        """
+        node = self._find_node(location)
+        return node is not None and len(node.children) > 0
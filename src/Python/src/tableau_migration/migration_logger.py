@@ -14,11 +14,24 @@
 # limitations under the License.
 
 """Migration Logger implementation."""
+import atexit
 import logging
-from Tableau.Migration.Interop.Logging import NonGenericLoggerBase
+import logging.handlers
+import queue
+from collections import deque
+from threading import Lock
+from typing import Optional
 
-class MigrationLogger(NonGenericLoggerBase):
-    """Migration Logger implementation."""
+from Microsoft.Extensions.Logging import LogLevel
+from Tableau.Migration.Interop.Logging import BufferedLogRecord, BufferedNonGenericLoggerBase, LogRecordBuffer
+
+class MigrationLogger(BufferedNonGenericLoggerBase):
+    """Migration Logger implementation.
+    
+    Entries are written to Python logging directly from the .NET thread that logged them,
+    unless queued logging is started with start_queued_logging.
+    Direct entries are filtered by the Python logger when written, so Python level changes apply immediately.
+    """
     __namespace__ = "Tableau.Migration.Interop.Logging"
 
     def __init__(self, name) -> None:
@@ -31,9 +44,15 @@ class MigrationLogger(NonGenericLoggerBase):
         """
         logging.basicConfig(format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', level=logging.INFO)
         self._logger = logging.getLogger(name)
+        self.CategoryName = name
+
+        with _lock:
+            _loggers.append(self)
+            if _listener is not None:
+                _attach_buffer(self, _listener.queue.buffer)
 
 
-    def Log(self, log_level, event_id, state, exception, message):  # noqa: N802 - Must be named like this for dotnet inheritance to work
+    def WriteLog(self, log_level, event_id, state, exception, message):  # noqa: N802 - Must be named like this for dotnet inheritance to work
         """Writes a log entry with a pre-formatted state object.
 
         https://learn.microsoft.com/en-us/dotnet/api/microsoft.extensions.logging.ilogger.log?view=dotnet-plat-ext-7.0
@@ -45,21 +64,132 @@ class MigrationLogger(NonGenericLoggerBase):
             exception: The exception related to this entry.
             message: The pre-formatted message to write.
         """
-        if(self.IsEnabled(log_level) is False):
-            return # shortcut
-
         # Python log level are 10x the C# level, multiplying here and passing along the message
         # Python: https://docs.python.org/3/howto/logging.html#logging-levels
         # C#: https://learn.microsoft.com/en-us/dotnet/api/microsoft.extensions.logging.loglevel
         self._logger.log(int(log_level) * 10, message)
 
 
-    def IsEnabled(self, log_level): # noqa: N802 - Must be named like this for dotnet inheritance to work
-        """Checks if the given log level" is enabled.
+def _minimum_dotnet_level(logger: logging.Logger) -> LogLevel:
+    """Gets the lowest .NET level that the Python logger has enabled."""
+    level = logger.getEffectiveLevel()
+    # Python levels between .NET levels enable the next .NET level up, and levels above critical disable logging.
+    return LogLevel(min(-(-level // 10), int(getattr(LogLevel, "None"))))
 
-        Args:
-            log_level: Level to be checked.
+def _attach_buffer(logger: MigrationLogger, buffer: Optional[LogRecordBuffer]) -> None:
+    # Drained entries are checked against the Python logger level again, so a briefly mismatched level only costs buffer space.
+    logger.MinimumLevel = LogLevel.Trace if buffer is None else _minimum_dotnet_level(logger._logger)
+    logger.Buffer = buffer
 
-        Returns: True if enabled
-        """
-        return (int(log_level) * 10 >= self._logger.level)
+def _to_log_record(record: BufferedLogRecord) -> logging.LogRecord:
+    log_record = logging.LogRecord(record.CategoryName, int(record.LogLevel) * 10, "", 0, record.Message, None, None)
+    log_record.created = record.Created
+    log_record.msecs = (record.Created - int(record.Created)) * 1000
+    log_record.relativeCreated = (record.Created - logging._startTime) * 1000
+    log_record.thread = record.ThreadId
+    log_record.threadName = f"DotNet-{record.ThreadId}"
+    return log_record
+
+class _LogRecordBufferQueue():
+    """Adapts a .NET LogRecordBuffer to the queue interface used by QueueListener."""
+
+    def __init__(self, buffer: LogRecordBuffer, batch_size: int, flush_interval: float) -> None:
+        self.buffer = buffer
+        self._batch_size = batch_size
+        self._timeout = int(flush_interval * 1000)
+        self._pending = deque()
+        self._sentinel = None
+        self._stopping = False
+
+    def put_nowait(self, item) -> None:
+        # QueueListener only puts its stop sentinel, which is returned after the remaining entries are drained.
+        self._sentinel = item
+        self._stopping = True
+        self.buffer.Wake()
+
+    def get(self, block: bool = True):
+        while not self._pending:
+            records = self.buffer.Drain(self._batch_size, 0 if self._stopping or not block else self._timeout)
+            if len(records) > 0:
+                self._pending.extend(_to_log_record(r) for r in records)
+            elif self._stopping:
+                return self._sentinel
+            elif not block:
+                raise queue.Empty
+            else:
+                # Nothing was logged for a flush interval, use the idle time to pick up Python level changes.
+                refresh_log_levels()
+
+        return self._pending.popleft()
+
+class _LoggerHandler(logging.Handler):
+    """Passes drained records to the Python logger of their category."""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        logger = logging.getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+        return True
+
+_lock = Lock()
+_loggers: list[MigrationLogger] = []
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def refresh_log_levels() -> None:
+    """Updates the cached enabled levels of the queued migration loggers from Python logging.
+
+    The cached levels are refreshed automatically when the migration is idle for a flush interval,
+    call this after changing Python logger levels to apply the new levels immediately.
+    """
+    with _lock:
+        if _listener is None:
+            return
+
+        for logger in _loggers:
+            logger.MinimumLevel = _minimum_dotnet_level(logger._logger)
+
+def start_queued_logging(batch_size: int = 1000, capacity: int = LogRecordBuffer.DefaultCapacity, flush_interval: float = 0.1) -> None:
+    """Starts queued logging for the migration SDK.
+
+    Log entries are buffered by the .NET threads that write them without acquiring the GIL,
+    and a single Python thread drains them in batches to the Python loggers.
+    Enabled levels are cached from the Python loggers' effective levels.
+
+    Args:
+        batch_size: The maximum number of entries to drain at once.
+        capacity: The maximum number of buffered entries. Entries logged while the buffer is full are dropped.
+        flush_interval: The maximum time in seconds to wait for entries before refreshing the cached levels.
+    """
+    global _listener
+
+    with _lock:
+        if _listener is not None:
+            return
+
+        _listener = logging.handlers.QueueListener(_LogRecordBufferQueue(LogRecordBuffer(capacity), batch_size, flush_interval), _LoggerHandler())
+        for logger in _loggers:
+            _attach_buffer(logger, _listener.queue.buffer)
+
+        _listener.start()
+
+def stop_queued_logging() -> None:
+    """Stops queued logging, writing any buffered entries, and writes entries directly again."""
+    global _listener
+
+    with _lock:
+        listener = _listener
+        if listener is None:
+            return
+
+        for logger in _loggers:
+            _attach_buffer(logger, None)
+        _listener = None
+
+    listener.stop()
+
+    buffer = listener.queue.buffer
+    if buffer.DroppedCount > 0:
+        logging.getLogger(__name__).warning("%d migration SDK log entries were dropped because the log buffer was full.", buffer.DroppedCount)
+    buffer.Dispose()
+
+atexit.register(stop_queued_logging)
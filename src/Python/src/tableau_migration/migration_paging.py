@@ -15,12 +15,14 @@
 
 """Python wrappers for C# paging classes."""
 
-from typing import Callable, Generic, TypeVar, List, Union
+from itertools import islice
+from typing import Callable, Generic, Iterable, Optional, TypeVar, List, Union
 
 
-from System.Collections.Generic import List as DotNetList
-from System.Collections.Immutable import ImmutableList
-from Tableau.Migration.Paging import MemoryPager, IPager
+from System import Array
+from System.Collections.Immutable import IImmutableList, ImmutableArray, ImmutableList
+from System.Threading.Tasks import Task
+from Tableau.Migration.Paging import MemoryPager, IPager, StreamingPager
 
 
 from tableau_migration.migration_interop import _PyWrapperBuilderBase, _unwrap
@@ -78,24 +80,26 @@ def empty_pager(content_type: type):
     return _PyEmptyPagerWrapperBuilder(_PyEmptyPager[content_type]).factory(None)
 
 
+def _to_dotnet_array(dotnet_type: type, python_items: Iterable) -> Array:
+    """Converts a Python collection to a C# array in a single call, instead of adding each item to a C# collection."""
+    return Array[dotnet_type]([_unwrap(item) for item in python_items])
+
+
 class _PyMemoryPagerWrapperBuilder(_PyPagerWrapperBuilderBase):
     def __init__(self, inner_type: type, python_items: list, page_size: int) -> None:
         super().__init__(inner_type)
         self._python_items = python_items
         self._page_size = page_size
 
-    def add_extra_wrapper_init(self) -> Union[Callable, None]:
-        def init_pager(wrapper):
-            dotnet_type = wrapper.dotnet_generic_types[0]
+        # The wrapper type is shared between memory pagers, so the pager is created per wrapper object.
+        self.factory = self._create_pager
 
-            # Convert Python collection to C# collection
-            dotnet_list = DotNetList[dotnet_type]()
-            for item in self._python_items:
-                dotnet_list.Add(_unwrap(item))
+    def _create_pager(self, scoped_services):
+        wrapper = self.wrapper_type(scoped_services)
+        dotnet_type = wrapper.dotnet_generic_types[0]
 
-            wrapper._pager = MemoryPager[dotnet_type](dotnet_list, self._page_size)
-
-        return init_pager
+        wrapper._pager = MemoryPager[dotnet_type](_to_dotnet_array(dotnet_type, self._python_items), self._page_size)
+        return wrapper
 
 
 class _PyMemoryPager(Generic[T]):
@@ -114,4 +118,59 @@ def memory_pager(content_type: type, python_items: List[T], page_size: int = 100
 
     Returns: The pager.
     """
-    return _PyMemoryPagerWrapperBuilder(_PyMemoryPager[content_type], python_items, page_size).factory(None)
\ No newline at end of file
+    return _PyMemoryPagerWrapperBuilder(_PyMemoryPager[content_type], python_items, page_size).factory(None)
+
+
+class _PyStreamingPagerWrapperBuilder(_PyPagerWrapperBuilderBase):
+    def __init__(self, inner_type: type, python_items: Iterable, page_size: int, total_count: Optional[int]) -> None:
+        super().__init__(inner_type)
+        self._python_items = python_items
+        self._page_size = page_size
+        self._total_count = total_count
+
+        # The wrapper type is shared between streaming pagers, so the pager is created per wrapper object.
+        self.factory = self._create_pager
+
+    def _create_pager(self, scoped_services):
+        wrapper = self.wrapper_type(scoped_services)
+        dotnet_type = wrapper.dotnet_generic_types[0]
+
+        # Each pager reads from its own iterator, so only the requested page is converted at a time.
+        python_iterator = iter(self._python_items)
+
+        def next_items(count, cancel):
+            page = _to_dotnet_array(dotnet_type, islice(python_iterator, count))
+            return Task.FromResult[IImmutableList[dotnet_type]](ImmutableArray.CreateRange[dotnet_type](page))
+
+        callback = StreamingPager[dotnet_type].NextItemsCallback(next_items)
+        wrapper._pager = StreamingPager[dotnet_type](callback, self._page_size, self._total_count)
+        return wrapper
+
+
+class _PyStreamingPager(Generic[T]):
+    _wrapper_builder = _PyStreamingPagerWrapperBuilder
+
+    # Stub object, paging is defined in the wrapper-created _pager
+
+
+def streaming_pager(content_type: type, python_items: Iterable[T], page_size: int = 100, total_count: Optional[int] = None):
+    """Creates a Python-wrapped pager that reads pages from a Python iterable as they are requested.
+
+    Unlike memory_pager, items are only converted when their page is requested,
+    so generators can be used to load large numbers of items with memory use bounded by the page size.
+        
+    Args:
+        content_type: The content type of the pager items.
+        python_items: Python iterable, such as a generator, to paginate.
+        page_size: Size of each page.
+        total_count: The total number of items, or None to use the length of python_items if it has one.
+
+    Returns: The pager.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1.")
+
+    if total_count is None and hasattr(python_items, "__len__"):
+        total_count = len(python_items)
+
+    return _PyStreamingPagerWrapperBuilder(_PyStreamingPager[content_type], python_items, page_size, total_count).factory(None)
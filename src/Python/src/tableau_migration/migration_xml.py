@@ -0,0 +1,285 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Python facade over System.Xml.Linq elements, for editing XML documents in place."""
+
+import re
+from typing import Iterator, Mapping, Optional, Union
+
+import clr
+
+# XPath extensions for System.Xml.Linq are implemented in the same assembly as XDocument.
+clr.AddReference("System.Private.Xml.Linq")
+
+import System # noqa: E402
+from System.Xml import NameTable, XmlNamespaceManager # noqa: E402
+from System.Xml.Linq import XElement, XName # noqa: E402
+from System.Xml.XPath import Extensions as XPathExtensions # noqa: E402
+
+_EXPANDED_NAME = re.compile(r"\{([^}]*)\}")
+
+
+def _to_xname(tag: str, namespaces: Optional[Mapping[str, str]] = None) -> XName:
+    """Converts an ElementTree style tag ("{uri}name", "prefix:name" or "name") to an XName."""
+    match = _EXPANDED_NAME.match(tag)
+    if match:
+        return XName.Get(tag[match.end():], match.group(1))
+
+    if namespaces and ":" in tag:
+        prefix, local_name = tag.split(":", 1)
+        if prefix in namespaces:
+            return XName.Get(local_name, namespaces[prefix])
+
+    return XName.Get(tag)
+
+
+def _to_xpath(path: str, namespaces: Optional[Mapping[str, str]] = None) -> tuple[str, XmlNamespaceManager]:
+    """Converts an ElementTree style path to an XPath expression and the namespace resolver to evaluate it with."""
+    resolver = XmlNamespaceManager(NameTable())
+    if namespaces:
+        for prefix, uri in namespaces.items():
+            resolver.AddNamespace(prefix, uri)
+
+    # XPath has no syntax for expanded names, so give each "{uri}" its own prefix.
+    uri_prefixes = { }
+
+    def _replace_uri(match: re.Match) -> str:
+        uri = match.group(1)
+        if uri not in uri_prefixes:
+            uri_prefixes[uri] = f"_ns{len(uri_prefixes)}"
+            resolver.AddNamespace(uri_prefixes[uri], uri)
+        return uri_prefixes[uri] + ":"
+
+    return _EXPANDED_NAME.sub(_replace_uri, path), resolver
+
+
+class PyXmlElement():
+    """Lightweight facade over a live System.Xml.Linq XElement.
+
+    Changes are made directly to the underlying XML document, so no serialization is needed to persist them.
+    Paths use XPath syntax, with ElementTree style "{uri}name" expanded names also supported.
+    """
+
+    __slots__ = ("_dotnet",)
+
+    def __init__(self, element: XElement) -> None:
+        """Creates a new PyXmlElement object.
+
+        Args:
+            element: The XElement to wrap.
+
+        Returns: None.
+        """
+        self._dotnet = element
+
+    def __eq__(self, other) -> bool:
+        """Gets whether the other object wraps the same XElement."""
+        return isinstance(other, PyXmlElement) and self._dotnet.Equals(other._dotnet)
+
+    def __hash__(self) -> int:
+        """Gets the hash code of the wrapped XElement."""
+        return self._dotnet.GetHashCode()
+
+    def __iter__(self) -> Iterator["PyXmlElement"]:
+        """Iterates the child elements."""
+        return (PyXmlElement(e) for e in self._dotnet.Elements())
+
+    def __len__(self) -> int:
+        """Gets the number of child elements."""
+        return sum(1 for _ in self._dotnet.Elements())
+
+    def __repr__(self) -> str:
+        """Gets the string representation of the element."""
+        return f"<PyXmlElement {self.tag}>"
+
+    @property
+    def tag(self) -> str:
+        """Gets the element name, in "{uri}name" form if the element has a namespace."""
+        name = self._dotnet.Name
+        return name.LocalName if not name.NamespaceName else f"{{{name.NamespaceName}}}{name.LocalName}"
+
+    @property
+    def text(self) -> Optional[str]:
+        """Gets or sets the text content of the element. Setting the text replaces any child nodes."""
+        return None if self._dotnet.IsEmpty else self._dotnet.Value
+
+    @text.setter
+    def text(self, value: Optional[str]) -> None:
+        """Gets or sets the text content of the element. Setting the text replaces any child nodes."""
+        if value is None:
+            self._dotnet.RemoveNodes()
+        else:
+            self._dotnet.Value = value
+
+    @property
+    def attrib(self) -> dict[str, str]:
+        """Gets a copy of the element attributes, excluding namespace declarations."""
+        return {PyXmlElement._attribute_name(a.Name): a.Value for a in self._dotnet.Attributes() if not a.IsNamespaceDeclaration}
+
+    @property
+    def parent(self) -> Optional["PyXmlElement"]:
+        """Gets the parent element, or None for the root element."""
+        parent = self._dotnet.Parent
+        return None if parent is None else PyXmlElement(parent)
+
+    @staticmethod
+    def _attribute_name(name: XName) -> str:
+        return name.LocalName if not name.NamespaceName else f"{{{name.NamespaceName}}}{name.LocalName}"
+
+    def get(self, key: str, default: Optional[str] = None, namespaces: Optional[Mapping[str, str]] = None) -> Optional[str]:
+        """Gets an attribute value.
+
+        Args:
+            key: The attribute name.
+            default: The value to return if the attribute does not exist.
+            namespaces: Optional mapping of namespace prefixes to URIs.
+
+        Returns: The attribute value, or the default value.
+        """
+        attribute = self._dotnet.Attribute(_to_xname(key, namespaces))
+        return default if attribute is None else attribute.Value
+
+    def set(self, key: str, value: Optional[str], namespaces: Optional[Mapping[str, str]] = None) -> None:
+        """Sets an attribute value.
+
+        Args:
+            key: The attribute name.
+            value: The attribute value, or None to remove the attribute.
+            namespaces: Optional mapping of namespace prefixes to URIs.
+        """
+        self._dotnet.SetAttributeValue(_to_xname(key, namespaces), value)
+
+    def keys(self) -> list[str]:
+        """Gets the attribute names.
+
+        Returns: The attribute names.
+        """
+        return list(self.attrib.keys())
+
+    def items(self) -> list[tuple[str, str]]:
+        """Gets the attribute names and values.
+
+        Returns: The attribute names and values.
+        """
+        return list(self.attrib.items())
+
+    def find(self, path: str, namespaces: Optional[Mapping[str, str]] = None) -> Optional["PyXmlElement"]:
+        """Finds the first element matching a path.
+
+        Args:
+            path: The path to match, relative to this element.
+            namespaces: Optional mapping of namespace prefixes to URIs.
+
+        Returns: The first matching element, or None if no element matches.
+        """
+        xpath, resolver = _to_xpath(path, namespaces)
+        result = XPathExtensions.XPathSelectElement(self._dotnet, xpath, resolver)
+        return None if result is None else PyXmlElement(result)
+
+    def iterfind(self, path: str, namespaces: Optional[Mapping[str, str]] = None) -> Iterator["PyXmlElement"]:
+        """Iterates the elements matching a path.
+
+        Args:
+            path: The path to match, relative to this element.
+            namespaces: Optional mapping of namespace prefixes to URIs.
+
+        Returns: An iterator of the matching elements, in document order.
+        """
+        xpath, resolver = _to_xpath(path, namespaces)
+        return (PyXmlElement(e) for e in XPathExtensions.XPathSelectElements(self._dotnet, xpath, resolver))
+
+    def findall(self, path: str, namespaces: Optional[Mapping[str, str]] = None) -> list["PyXmlElement"]:
+        """Finds all elements matching a path.
+
+        Args:
+            path: The path to match, relative to this element.
+            namespaces: Optional mapping of namespace prefixes to URIs.
+
+        Returns: The matching elements, in document order.
+        """
+        return list(self.iterfind(path, namespaces))
+
+    def findtext(self, path: str, default: Optional[str] = None, namespaces: Optional[Mapping[str, str]] = None) -> Optional[str]:
+        """Finds the text content of the first element matching a path.
+
+        Args:
+            path: The path to match, relative to this element.
+            default: The value to return if no element matches.
+            namespaces: Optional mapping of namespace prefixes to URIs.
+
+        Returns: The text content of the first matching element, or the default value.
+        """
+        result = self.find(path, namespaces)
+        return default if result is None else result._dotnet.Value
+
+    def iter(self, tag: Optional[str] = None, namespaces: Optional[Mapping[str, str]] = None) -> Iterator["PyXmlElement"]:
+        """Iterates this element and all its descendants, in document order.
+
+        Args:
+            tag: The element name to match, or None or "*" to match all elements.
+            namespaces: Optional mapping of namespace prefixes to URIs.
+
+        Returns: An iterator of the matching elements.
+        """
+        if tag is None or tag == "*":
+            elements = self._dotnet.DescendantsAndSelf()
+        else:
+            elements = self._dotnet.DescendantsAndSelf(_to_xname(tag, namespaces))
+
+        return (PyXmlElement(e) for e in elements)
+
+    def add_element(self, tag: str, attrib: Optional[Mapping[str, str]] = None, namespaces: Optional[Mapping[str, str]] = None) -> "PyXmlElement":
+        """Creates a new element and appends it as the last child of this element.
+
+        Args:
+            tag: The new element name.
+            attrib: Optional attributes of the new element.
+            namespaces: Optional mapping of namespace prefixes to URIs.
+
+        Returns: The new element.
+        """
+        element = XElement(_to_xname(tag, namespaces))
+        if attrib:
+            for key, value in attrib.items():
+                element.SetAttributeValue(_to_xname(key, namespaces), value)
+
+        self._dotnet.Add(element)
+        return PyXmlElement(element)
+
+    def append(self, element: Union["PyXmlElement", XElement]) -> None:
+        """Appends an element as the last child of this element.
+
+        Args:
+            element: The element to append. Elements that already have a parent are copied.
+        """
+        self._dotnet.Add(element._dotnet if isinstance(element, PyXmlElement) else element)
+
+    def remove(self, element: "PyXmlElement") -> None:
+        """Removes a child element.
+
+        Args:
+            element: The child element to remove.
+        """
+        if not self._dotnet.Equals(element._dotnet.Parent):
+            raise ValueError("Element is not a child of this element.")
+
+        element._dotnet.Remove()
+
+    def to_string(self) -> str:
+        """Gets the XML text of this element.
+
+        Returns: The XML text.
+        """
+        return self._dotnet.ToString(System.Xml.Linq.SaveOptions.DisableFormatting)
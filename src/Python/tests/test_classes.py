@@ -70,6 +70,7 @@ from tableau_migration.migration_engine_options import (
     PyMigrationPlanOptionsCollection)
 
 from tableau_migration.migration_engine_manifest import (
+    PyMigrationManifestJournalSerializer,
     PyMigrationManifestSerializer)
 
 from tableau_migration.migration_engine_migrators import (
@@ -474,8 +475,8 @@ _generated_enum_data = [
 _test_class_data = {
     PyMigrationPlanBuilder: (PyMigrationPlanBuilder, [ "ForCustomPipeline", "ForCustomPipelineFactory" ], []),
     PyServerToCloudMigrationPlanBuilder: (PyServerToCloudMigrationPlanBuilder, [ "ForCustomPipeline", "ForCustomPipelineFactory" ], []),
-    PyMigrationResult: (PyMigrationResult, None, []),
-    PyMigrationManifest: (PyMigrationManifest, None, []),
+    PyMigrationResult: (PyMigrationResult, None, ["hook_profile"]),
+    PyMigrationManifest: (PyMigrationManifest, None, [ "stats", "stats_by_content_type" ]),
     PyMigrator: (PyMigrator, None, []),
     PyMigrationPlan: (PyMigrationPlan, [ "PipelineFactoryOverride" ], []),
     PyMigrationHookBuilder: (PyMigrationHookBuilder, None, []),
@@ -490,6 +491,7 @@ _test_class_data = {
     PySourceContentReferenceFinder: (PySourceContentReferenceFinder, None, []),
     PySourceContentReferenceFinderFactory: (PySourceContentReferenceFinderFactory, [ "ForContentType" ], []),
     PyMigrationManifestSerializer: (PyMigrationManifestSerializer, None, []),
+    PyMigrationManifestJournalSerializer: (PyMigrationManifestJournalSerializer, [ "JournalFileExtension", "DefaultCompactionThreshold" ], [ "append_batch", "JOURNAL_FILE_EXTENSION", "DEFAULT_COMPACTION_THRESHOLD" ]),
 }
 _test_class_data.update(_generated_class_data)
 
@@ -20,10 +20,14 @@ from pathlib import Path
 import uuid
 import pytest
 
+import clr
+
 from tableau_migration.migration import (
     PyContentLocation,
+    PyContentReference,
     PyMigrationManifest, 
     PyMigrationResult)
+from tableau_migration.migration_content import PyUser
 from tableau_migration.migration_engine import (
     PyMigrationPlan)
 
@@ -32,11 +36,13 @@ from tableau_migration.migration_engine_migrators import PyMigrator
 import System
 from Tableau.Migration import (
     ContentLocation,
+    IContentReference,
     IMigrator, 
     IMigrationManifest, 
     IMigrationPlan,
     MigrationResult,
     MigrationCompletionStatus)
+from Tableau.Migration.Content import IUser
 from Tableau.Migration.Engine.Manifest import (
     MigrationManifest, 
     IMigrationManifestEditor)
@@ -102,6 +108,17 @@ class TestPyMigrationResult():
 
         PyMigrationResult(result)
 
+    def test_hook_profile(self):
+        from tableau_migration.migration_engine_hooks_profiling import HookProfile
+
+        status = MigrationCompletionStatus.Completed
+        manifest_mock = Moq.Mock[IMigrationManifestEditor]()
+        result = MigrationResult(status, manifest_mock.Object)
+        profile = HookProfile()
+
+        assert PyMigrationResult(result).hook_profile is None
+        assert PyMigrationResult(result, profile).hook_profile is profile
+
 class TestPyMigrationManifest():
     def test_init(self):
         manifest_mock = Moq.Mock[IMigrationManifestEditor]()
@@ -141,6 +158,87 @@ class TestPyMigrationManifest():
         # a python exception
         assert not invokedMethodNames
         
+class TestPyMigrationManifestStats(AutoFixtureTestBase):
+    def test_stats(self):
+        from tableau_migration.migration_engine_manifest import PyMigrationManifestEntry, PyMigrationManifestEntryStatus
+
+        manifest = PyMigrationManifest(self.create(IMigrationManifest))
+        entries = [PyMigrationManifestEntry(x) for x in manifest.entries]
+        assert len(entries) > 0
+
+        stats = manifest.stats()
+
+        assert stats["total"] == len(entries)
+        for status in PyMigrationManifestEntryStatus:
+            assert stats["statuses"][status] == len([e for e in entries if e.status == status])
+        assert stats["entries_with_errors"] == len([e for e in entries if len(e.errors) > 0])
+        assert stats["errors"] == sum(len(e.errors) for e in entries)
+        assert sum(stats["skipped_reasons"].values()) <= stats["statuses"][PyMigrationManifestEntryStatus.SKIPPED]
+
+    def test_stats_by_content_type(self):
+        manifest = PyMigrationManifest(self.create(IMigrationManifest))
+
+        stats = manifest.stats_by_content_type()
+
+        assert set(stats.keys()) == {t.Name for t in manifest.entries.GetPartitionTypes()}
+        for content_type in manifest.entries.GetPartitionTypes():
+            assert stats[content_type.Name]["total"] == manifest.entries.ForContentType(content_type).Count
+        assert sum(s["total"] for s in stats.values()) == manifest.stats()["total"]
+
+class TestPyMigrationManifestColumns(AutoFixtureTestBase):
+    def test_to_columns(self):
+        from tableau_migration.migration_engine_manifest import PyMigrationManifestEntry
+
+        manifest = PyMigrationManifest(self.create(IMigrationManifest))
+        entries = [PyMigrationManifestEntry(x)
+                   for t in manifest.entries.GetPartitionTypes()
+                   for x in manifest.entries.ForContentType(t)]
+        assert len(entries) > 0
+
+        columns = manifest.to_columns()
+
+        assert len(columns) == len(entries)
+        assert len(columns.source_ids) == 16 * len(entries)
+
+        values = columns.to_dict()
+        assert list(values.keys()) == list(columns.COLUMN_NAMES)
+        assert values["source_id"] == [e.source.id for e in entries]
+        assert values["source_location"] == [e.source.location.path for e in entries]
+        assert values["destination_id"] == [None if e.destination is None else e.destination.id for e in entries]
+        assert values["status"] == [e.status for e in entries]
+        assert values["error_count"] == [len(e.errors) for e in entries]
+        assert values["skipped_reason"] == [e.skipped_reason or None for e in entries]
+
+    def test_to_columns_content_types(self):
+        manifest = PyMigrationManifest(self.create(IMigrationManifest))
+
+        columns = manifest.to_columns()
+
+        assert columns.content_type_names == [t.Name for t in manifest.entries.GetPartitionTypes()]
+        for content_type in manifest.entries.GetPartitionTypes():
+            assert columns.to_dict()["content_type"].count(content_type.Name) == manifest.entries.ForContentType(content_type).Count
+
+    def test_to_arrow(self):
+        pytest.importorskip("pyarrow")
+        manifest = PyMigrationManifest(self.create(IMigrationManifest))
+        columns = manifest.to_columns()
+
+        table = columns.to_arrow()
+
+        assert table.num_rows == len(columns)
+        assert table.column_names == list(columns.COLUMN_NAMES)
+        assert table.column("source_location").to_pylist() == columns.to_dict()["source_location"]
+        assert table.column("status").to_pylist() == [s.name for s in columns.to_dict()["status"]]
+
+    def test_write_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        columns = PyMigrationManifest(self.create(IMigrationManifest)).to_columns()
+        path = str(tmp_path / "manifest.parquet")
+
+        columns.write_parquet(path)
+
+        assert pq.read_table(path).num_rows == len(columns)
+
 class TestPyContentLocation():    
     def test_path_segments(self):
         dotnet = ContentLocation(["parent", "child", "item"])
@@ -153,6 +251,231 @@ class TestPyContentLocation():
         py = PyContentLocation.create("|", ["parent", "child", "item"])
         assert "parent|child|item" == py.path
 
+    def test_path_segments_cached(self):
+        py = PyContentLocation.from_path("parent/child/item", "/")
+
+        py.path_segments.append("other")
+
+        assert py.path_segments == ["parent", "child", "item"]
+        assert py._path_segments == ("parent", "child", "item")
+
+    def test_equality(self):
+        py = PyContentLocation.from_path("parent/child/item", "/")
+
+        assert py == PyContentLocation.from_path("Parent/Child/ITEM", "/")
+        assert py != PyContentLocation.from_path("parent/child", "/")
+        assert py != "parent/child/item"
+
+    @pytest.mark.parametrize("path, other_path", [
+        ("straße", "STRASSE"),
+        ("straße", "STRAßE"),
+        ("ärger", "ÄRGER"),
+        ("ﬁle", "FILE")
+    ])
+    def test_equality_matches_dotnet(self, path, other_path):
+        py = PyContentLocation.from_path(path, "/")
+        other = PyContentLocation.from_path(other_path, "/")
+
+        assert (py == other) == py._dotnet.Equals(other._dotnet)
+        assert (hash(py) == hash(other)) == py._dotnet.Equals(other._dotnet)
+
+    def test_hash(self):
+        locations = {PyContentLocation.from_path("parent/child", "/"): 1}
+
+        assert locations[PyContentLocation.from_path("Parent/Child", "/")] == 1
+        assert PyContentLocation.from_path("parent/other", "/") not in locations
+
+    def test_slots(self):
+        py = PyContentLocation.from_path("parent/child/item", "/")
+
+        with pytest.raises(AttributeError):
+            py.other = 1
+
+class TestPyContentReference(AutoFixtureTestBase):
+    def test_location_cached(self):
+        py = PyContentReference(self.create(IContentReference))
+
+        assert py.location is py.location
+        assert py.location == PyContentLocation(py._dotnet.Location)
+
+    def test_mappable_content_location_not_cached(self):
+        py = PyUser(self.create(IUser))
+
+        assert py.location is not py.location
+        assert py.location == PyContentLocation(py._dotnet.Location)
+
+    def test_equality(self):
+        dotnet = self.create(IContentReference)
+
+        assert PyContentReference(dotnet) == PyContentReference(dotnet)
+        assert PyContentReference(dotnet) != PyContentReference(self.create(IContentReference))
+
+    def test_hash(self):
+        dotnet = self.create(IContentReference)
+        references = {PyContentReference(dotnet)}
+
+        assert PyContentReference(dotnet) in references
+
+class TestWrapperSlots(AutoFixtureTestBase):
+    def test_no_instance_dict(self):
+        py = PyUser(self.create(IUser))
+
+        assert not hasattr(py, "__dict__")
+        with pytest.raises(AttributeError):
+            py.other = 1
+
+    def test_multiple_inheritance(self):
+        from tableau_migration.migration_content import PyCustomView
+        from Tableau.Migration.Content import ICustomView
+
+        py = PyCustomView(self.create(ICustomView))
+
+        assert not hasattr(py, "__dict__")
+        assert py.location == PyContentLocation(py._dotnet.Location)
+
+    def test_id_cached(self):
+        py = PyContentReference(self.create(IContentReference))
+
+        assert py.id is py.id
+        assert py.id == uuid.UUID(py._dotnet.Id.ToString())
+
+    def test_lazy_sequence_cached(self):
+        from tableau_migration.migration import _lazy_sequence
+
+        owner = PyContentReference(self.create(IContentReference))
+        dotnet = System.Collections.Generic.List[System.String](["a", "b"])
+
+        assert _lazy_sequence(owner, "Items", dotnet, str) is _lazy_sequence(owner, "Items", dotnet, str)
+
+class _PyTestWrapper():
+    _dotnet_base = System.Text.StringBuilder
+
+    def __init__(self, dotnet) -> None:
+        self._dotnet = dotnet
+
+class TestGenericWrapperType():
+    def test_resolves_interface(self):
+        from tableau_migration.migration import _generic_wrapper_type
+        from tableau_migration.migration_content import PyUser
+        from Tableau.Migration.Content import IUser
+
+        assert _generic_wrapper_type(IUser) is PyUser
+
+    def test_resolves_system_type(self):
+        from tableau_migration.migration import _generic_wrapper_type
+        from tableau_migration.migration_content import PyUser
+        from Tableau.Migration.Content import IUser
+
+        assert _generic_wrapper_type(clr.GetClrType(IUser)) is PyUser
+
+    def test_resolves_generic_definition(self):
+        from tableau_migration.migration import _generic_wrapper_type
+        from tableau_migration.migration_engine_migrators_batch import PyContentBatchMigrationResult
+        from Tableau.Migration.Content import IUser
+        from Tableau.Migration.Engine.Migrators.Batch import IContentBatchMigrationResult
+
+        assert _generic_wrapper_type(clr.GetClrType(IContentBatchMigrationResult[IUser])) is PyContentBatchMigrationResult
+
+    def test_not_found(self):
+        from tableau_migration.migration import _generic_wrapper, _generic_wrapper_type
+
+        assert _generic_wrapper_type(System.Random) is None
+        assert _generic_wrapper_type(System.Random) is None
+
+        with pytest.raises(Exception):
+            _generic_wrapper(System.Random())
+
+    def test_indexes_loaded_modules(self):
+        from tableau_migration.migration import _generic_wrapper
+
+        dotnet = System.Text.StringBuilder()
+        py = _generic_wrapper(dotnet)
+
+        assert isinstance(py, _PyTestWrapper)
+        assert py._dotnet == dotnet
+
+class _TestResult():
+    def __init__(self, success: bool) -> None:
+        self.Success = success
+
+class TestPyLazySequence():
+    def test_wraps_on_access(self):
+        from tableau_migration.migration import PyLazySequence
+
+        wrapped = []
+        def wrap(x):
+            wrapped.append(x)
+            return str(x)
+
+        seq = PyLazySequence([1, 2, 3], wrap)
+
+        assert len(seq) == 3
+        assert wrapped == []
+
+        assert seq[1] == "2"
+        assert seq[-1] == "3"
+        assert seq[1] is seq[1]
+        assert wrapped == [2, 3]
+
+        assert list(seq) == ["1", "2", "3"]
+        assert wrapped == [2, 3, 1]
+
+    def test_slice(self):
+        from tableau_migration.migration import PyLazySequence
+
+        seq = PyLazySequence([1, 2, 3, 4], str)
+        first = seq[0]
+
+        assert list(seq[1:3]) == ["2", "3"]
+        assert list(seq[::-2]) == ["4", "2"]
+        assert seq[:1][0] is first
+
+    def test_failed_succeeded(self):
+        from tableau_migration.migration import PyLazySequence
+
+        items = [_TestResult(True), _TestResult(False), _TestResult(True)]
+        seq = PyLazySequence(items, lambda x: x)
+
+        assert list(seq.failed()) == [items[1]]
+        assert list(seq.succeeded()) == [items[0], items[2]]
+        assert seq.failed() is seq.failed()
+
+    def test_failed_succeeded_slice(self):
+        from tableau_migration.migration import PyLazySequence
+
+        items = [_TestResult(True), _TestResult(False), _TestResult(True), _TestResult(False)]
+        seq = PyLazySequence(items, lambda x: x)
+
+        assert list(seq[::-1].failed()) == [items[3], items[1]]
+        assert list(seq[1:3].succeeded()) == [items[2]]
+
+    def test_dotnet_collection_wraps_on_access(self):
+        from tableau_migration.migration import PyLazySequence
+
+        dotnet = System.Collections.Generic.List[System.String]()
+        for x in ["a", "b", "c"]:
+            dotnet.Add(x)
+
+        seq = PyLazySequence(dotnet, str)
+
+        assert len(seq) == 3
+        assert seq[-1] == "c"
+        assert seq[1:][1] is seq[2]
+        assert list(seq) == ["a", "b", "c"]
+
+    def test_cached_per_collection(self):
+        from tableau_migration.migration import _lazy_sequence
+
+        owner = _TestResult(True)
+        dotnet = System.Collections.Generic.List[System.String]()
+        dotnet.Add("a")
+
+        seq = _lazy_sequence(owner, "Items", dotnet, str)
+
+        assert _lazy_sequence(owner, "Items", dotnet, str) is seq
+        assert _lazy_sequence(owner, "Items", System.Collections.Generic.List[System.String](dotnet), str) is not seq
+        assert _lazy_sequence(owner, "Items", None, str) is None
+
 # region _generated
 
 from enum import IntEnum # noqa: E402, F401
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+
 # region _generated
 
 from tableau_migration import cancellation_token # noqa: E402, F401
@@ -51,3 +53,29 @@ class TestPyContentReferenceFinderAsync(AutoFixtureTestBase):
         result = py.find_all()
         assert result
 
+
+    def test_iter_all_pages(self):
+        dotnet = self.create(IContentReferenceFinder)
+        py = PyContentReferenceFinder(dotnet)
+
+        expected = py.find_all()
+        pages = list(py.iter_all(page_size=2))
+
+        assert all(0 < len(page) <= 2 for page in pages)
+        assert sum(len(page) for page in pages) == len(expected)
+
+    def test_iter_all_single_page(self):
+        dotnet = self.create(IContentReferenceFinder)
+        py = PyContentReferenceFinder(dotnet)
+
+        pages = list(py.iter_all(page_size=1000))
+
+        assert len(pages) == 1
+        assert all(isinstance(x, PyContentReference) for x in pages[0])
+
+    def test_iter_all_invalid_page_size(self):
+        dotnet = self.create(IContentReferenceFinder)
+        py = PyContentReferenceFinder(dotnet)
+
+        with pytest.raises(ValueError):
+            list(py.iter_all(page_size=0))
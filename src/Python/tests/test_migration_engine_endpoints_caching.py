@@ -0,0 +1,73 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+from tableau_migration.migration_engine_endpoints_caching import PersistentContentReferenceCacheLoadStrategyProvider
+
+from System import Uri
+from Tableau.Migration.Api import TableauSiteConnectionConfiguration
+from Tableau.Migration.Content import IUser
+from Tableau.Migration.Engine.Endpoints import TableauApiEndpointConfiguration
+from Tableau.Migration.Engine.Endpoints.Caching import PersistentContentReferenceCacheSnapshotPaths
+
+def _endpoint(server_url: str, site_content_url: str) -> TableauApiEndpointConfiguration:
+    connection = TableauSiteConnectionConfiguration(Uri(server_url), site_content_url, "tokenName", "token", None)
+    return TableauApiEndpointConfiguration(connection, TableauApiEndpointConfiguration.Empty.Services)
+
+class TestPersistentContentReferenceCacheLoadStrategyProvider():
+
+    def _create_provider(self, snapshot_directory, max_age = None) -> PersistentContentReferenceCacheLoadStrategyProvider:
+        class TestProvider(PersistentContentReferenceCacheLoadStrategyProvider[IUser]):
+            pass
+
+        TestProvider.snapshot_directory = snapshot_directory
+        if max_age is not None:
+            TestProvider.max_age = max_age
+
+        plan = SimpleNamespace(source=_endpoint("https://server", "sourceSite"), destination=_endpoint("https://online.tableau.com", "destinationSite"))
+
+        provider = TestProvider()
+        provider.dotnet_generic_types = (IUser,)
+        provider.services = SimpleNamespace(get_plan=lambda: plan)
+        return provider
+
+    def test_no_directory_uses_bulk(self):
+        provider = self._create_provider(None)
+
+        assert provider.get_source_cache_load_strategy().GetType().Name == "BulkContentReferenceCacheLoadStrategy`1"
+        assert provider.get_destination_cache_load_strategy().GetType().Name == "BulkContentReferenceCacheLoadStrategy`1"
+
+    def test_directory_uses_persistent(self, tmp_path):
+        provider = self._create_provider(str(tmp_path))
+
+        assert provider.get_source_cache_load_strategy().GetType().Name == "PersistentContentReferenceCacheLoadStrategy`1"
+        assert provider.get_destination_cache_load_strategy().GetType().Name == "PersistentContentReferenceCacheLoadStrategy`1"
+
+    def test_max_age(self, tmp_path):
+        provider = self._create_provider(str(tmp_path), timedelta(hours=12))
+
+        assert provider.get_destination_cache_load_strategy().GetType().Name == "PersistentContentReferenceCacheLoadStrategy`1"
+
+    def test_default_max_age_is_finite(self):
+        assert PersistentContentReferenceCacheLoadStrategyProvider.max_age == timedelta(days=1)
+
+    def test_snapshot_path_per_site(self, tmp_path):
+        site1 = PersistentContentReferenceCacheSnapshotPaths.GetSnapshotPath[IUser](str(tmp_path), "destination", _endpoint("https://server", "site1"))
+        site2 = PersistentContentReferenceCacheSnapshotPaths.GetSnapshotPath[IUser](str(tmp_path), "destination", _endpoint("https://server", "site2"))
+
+        assert site1 != site2
+        assert "site1" in site1
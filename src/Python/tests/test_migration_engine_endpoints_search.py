@@ -16,10 +16,12 @@
 
 import pytest
 
+from types import SimpleNamespace
 from uuid import UUID
 
 from tableau_migration.migration import (
-    PyContentLocation
+    PyContentLocation,
+    PyContentReference
 )
 
 from tableau_migration.migration_engine_endpoints_search import (
@@ -28,7 +30,8 @@ from tableau_migration.migration_engine_endpoints_search import (
     PySourceContentReferenceFinderFactory,
     PySourceContentReferenceFinder,
     PyDestinationContentReferenceFinderBase,
-    PySourceContentReferenceFinderBase
+    PySourceContentReferenceFinderBase,
+    _PySourceContentReferenceFinderWrapperBuilder
 )
 
 from tableau_migration.migration_content import (
@@ -57,7 +60,8 @@ from Microsoft.Extensions.DependencyInjection import (
 import Moq
 
 from Tableau.Migration import (
-    ContentLocation
+    ContentLocation,
+    IContentReference
 )
 
 from Tableau.Migration.Content import ( 
@@ -73,6 +77,8 @@ from Tableau.Migration.Engine import (
 )
 
 from Tableau.Migration.Engine.Endpoints.Search import (
+    IBulkContentReferenceFinder,
+    IBulkMappedContentReferenceFinder,
     IDestinationContentReferenceFinder,
     ISourceContentReferenceFinder,
     DestinationContentReferenceFinderFactory,
@@ -188,6 +194,57 @@ class TestPySourceContentReferenceFinder(AutoFixtureTestBase):
         
         assert result is not None
             
+    def test_find_many_by_ids_empty(self):
+        dotnet_source_finder = Moq.Mock[ISourceContentReferenceFinder[IUser]]()
+        finder = PySourceContentReferenceFinder(dotnet_source_finder.Object, IUser)
+
+        result = finder.find_many_by_ids([None])
+
+        assert result == {}
+        assert [methodInfo.Method.Name for methodInfo in dotnet_source_finder.Invocations] == []
+
+    def test_find_many_by_ids_fallback(self):
+        dotnet_source_finder = self.create(ISourceContentReferenceFinder[IUser])
+        finder = PySourceContentReferenceFinder(dotnet_source_finder, IUser)
+
+        ids = [UUID('{12345678-0000-0000-0000-000000000000}'), UUID('{87654321-0000-0000-0000-000000000000}')]
+        result = finder.find_many_by_ids(ids)
+
+        assert list(result.keys()) == ids
+        assert all(r is not None for r in result.values())
+
+    def test_find_many_by_ids_bulk(self):
+        dotnet_source_finder = Moq.Mock[ISourceContentReferenceFinder[IUser]]()
+        dotnet_source_finder.As[IBulkContentReferenceFinder]()
+        finder = PySourceContentReferenceFinder(dotnet_source_finder.Object, IUser)
+
+        ids = [UUID('{12345678-0000-0000-0000-000000000000}')]
+        result = finder.find_many_by_ids(ids)
+
+        assert result == {ids[0]: None}
+        assert [methodInfo.Method.Name for methodInfo in dotnet_source_finder.Invocations] == ["FindManyByIdsAsync"]
+
+    def test_find_many_by_source_locations_fallback(self):
+        dotnet_source_finder = self.create(ISourceContentReferenceFinder[IProject])
+        finder = PySourceContentReferenceFinder(dotnet_source_finder, IProject)
+
+        locations = [PyContentLocation.from_path("parent/child", "/"), PyContentLocation.from_path("parent/other", "/")]
+        result = finder.find_many_by_source_locations(locations, CancellationToken(True))
+
+        assert list(result.keys()) == locations
+        assert all(r is not None for r in result.values())
+
+    def test_find_many_by_source_locations_bulk(self):
+        dotnet_source_finder = Moq.Mock[ISourceContentReferenceFinder[IProject]]()
+        dotnet_source_finder.As[IBulkContentReferenceFinder]()
+        finder = PySourceContentReferenceFinder(dotnet_source_finder.Object, IProject)
+
+        location = PyContentLocation.from_path("parent/child", "/")
+        result = finder.find_many_by_source_locations([location])
+
+        assert result == {location: None}
+        assert [methodInfo.Method.Name for methodInfo in dotnet_source_finder.Invocations] == ["FindManyBySourceLocationsAsync"]
+
 class TestPyDestinationContentReferenceFinder(AutoFixtureTestBase):
     _empty_test_data = [
         (""),
@@ -337,6 +394,37 @@ class TestPyDestinationContentReferenceFinder(AutoFixtureTestBase):
         assert result is not None
 
 
+    def test_find_many_by_ids_fallback(self):
+        dotnet_destination_finder = self.create(IDestinationContentReferenceFinder[IGroup])
+        finder = PyDestinationContentReferenceFinder(dotnet_destination_finder, IGroup)
+
+        ids = [UUID('{12345678-0000-0000-0000-000000000000}'), UUID('{87654321-0000-0000-0000-000000000000}')]
+        result = finder.find_many_by_ids(ids)
+
+        assert list(result.keys()) == ids
+        assert all(r is not None for r in result.values())
+
+    def test_find_many_by_source_ids_bulk(self):
+        dotnet_destination_finder = Moq.Mock[IDestinationContentReferenceFinder[IGroup]]()
+        dotnet_destination_finder.As[IBulkMappedContentReferenceFinder]()
+        finder = PyDestinationContentReferenceFinder(dotnet_destination_finder.Object, IGroup)
+
+        ids = [UUID('{12345678-0000-0000-0000-000000000000}')]
+        result = finder.find_many_by_source_ids(ids)
+
+        assert result == {ids[0]: None}
+        assert [methodInfo.Method.Name for methodInfo in dotnet_destination_finder.Invocations] == ["FindManyBySourceIdsAsync"]
+
+    def test_find_many_by_source_locations_fallback(self):
+        dotnet_destination_finder = self.create(IDestinationContentReferenceFinder[IProject])
+        finder = PyDestinationContentReferenceFinder(dotnet_destination_finder, IProject)
+
+        locations = [PyContentLocation.from_path("parent/child", "/")]
+        result = finder.find_many_by_source_locations(locations)
+
+        assert list(result.keys()) == locations
+        assert result[locations[0]] is not None
+
 class TestCustomFinderBaseClasses(AutoFixtureTestBase):
     """Test the custom finder base classes functionality."""
     
@@ -438,6 +526,23 @@ class TestCustomFinderBaseClasses(AutoFixtureTestBase):
         assert len(all_results) == 2
         assert all_results == ["reference1", "reference2"]
     
+    def test_find_all_async_from_generator(self):
+        """Test that a generator returned by find_all is built into a single .NET list."""
+        references = [PyContentReference(self.create(IContentReference)) for _ in range(3)]
+
+        class TestSourceFinder(PySourceContentReferenceFinderBase[PyUser]):
+            def find_all(self):
+                for r in references:
+                    yield r
+
+        builder = _PySourceContentReferenceFinderWrapperBuilder(TestSourceFinder)
+        find_all_async = builder._build_find_all_async()
+
+        result = find_all_async(SimpleNamespace(_inner=TestSourceFinder()), CancellationToken(False)).Result
+
+        assert result.Count == 3
+        assert [r for r in result] == [r._dotnet for r in references]
+
     def test_custom_source_finder_implementation(self):
         """Test implementing a custom source finder."""
         class TestSourceFinder(PySourceContentReferenceFinderBase):
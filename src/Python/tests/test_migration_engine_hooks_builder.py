@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import pytest
+import time
 from uuid import UUID
 from typing import TypeVar
 
@@ -33,7 +36,7 @@ from tableau_migration.migration_services import ScopedMigrationServices
 from tests.helpers.autofixture import AutoFixtureTestBase
 
 from System import IServiceProvider
-from System.Threading import CancellationToken
+from System.Threading import CancellationToken, CancellationTokenSource
 from Tableau.Migration.Content import IUser
 from Tableau.Migration.Engine.Actions import IMigrationActionResult
 from Tableau.Migration.Engine.Hooks import (
@@ -241,4 +244,81 @@ class TestInitializeMigrationHookInterop(AutoFixtureTestBase):
         hook = hook_factories[0].Create[IMigrationHook[IInitializeMigrationHookResult]](services)
         hook_result = hook.ExecuteAsync(ctx, CancellationToken(False)).GetAwaiter().GetResult()
 
-        assert hook_result.Success == False
\ No newline at end of file
+        assert hook_result.Success == False
+class PyAsyncActionCompletedHook(PyMigrationActionCompletedHookBase):
+
+    async def execute(self, ctx: PyMigrationActionResult) -> PyMigrationActionResult:
+        await asyncio.sleep(0)
+        return ctx.for_next_action(False)
+
+async def action_completed_async(ctx: PyMigrationActionResult) -> PyMigrationActionResult:
+    await asyncio.sleep(0)
+    return ctx.for_next_action(False)
+
+class TestAsyncHookInterop(AutoFixtureTestBase):
+    def _create_hook(self, hook_builder: PyMigrationHookBuilder):
+        hook_factories = hook_builder.build().get_hooks(IMigrationActionCompletedHook)
+        assert len(hook_factories) == 1
+
+        services = self.create(IServiceProvider)
+        return hook_factories[0].Create[IMigrationHook[IMigrationActionResult]](services)
+
+    def test_interop_class(self):
+        hook_builder = PyMigrationHookBuilder(MigrationHookBuilder())
+        hook_builder.add(PyAsyncActionCompletedHook)
+
+        hook = self._create_hook(hook_builder)
+        hook_result = hook.ExecuteAsync(self.create(IMigrationActionResult), CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert hook_result.PerformNextAction == False
+
+    def test_interop_callback(self):
+        hook_builder = PyMigrationHookBuilder(MigrationHookBuilder())
+        hook_builder.add(PyMigrationActionResult, action_completed_async)
+
+        hook = self._create_hook(hook_builder)
+        hook_result = hook.ExecuteAsync(self.create(IMigrationActionResult), CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert hook_result.PerformNextAction == False
+
+    def test_interop_callback_exception(self):
+        async def action_completed_error(ctx: PyMigrationActionResult) -> PyMigrationActionResult:
+            raise ValueError("async hook failed")
+
+        hook_builder = PyMigrationHookBuilder(MigrationHookBuilder())
+        hook_builder.add(PyMigrationActionResult, action_completed_error)
+
+        hook = self._create_hook(hook_builder)
+
+        with pytest.raises(Exception, match="async hook failed"):
+            hook.ExecuteAsync(self.create(IMigrationActionResult), CancellationToken(False)).GetAwaiter().GetResult()
+
+    def test_interop_callback_cancel(self):
+        cancelled = []
+
+        async def action_completed_wait(ctx: PyMigrationActionResult) -> PyMigrationActionResult:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return ctx
+
+        hook_builder = PyMigrationHookBuilder(MigrationHookBuilder())
+        hook_builder.add(PyMigrationActionResult, action_completed_wait)
+
+        hook = self._create_hook(hook_builder)
+
+        cancel_source = CancellationTokenSource()
+        task = hook.ExecuteAsync(self.create(IMigrationActionResult), cancel_source.Token)
+        time.sleep(0.05)
+        cancel_source.Cancel()
+
+        with pytest.raises(Exception):
+            task.GetAwaiter().GetResult()
+
+        assert task.IsCanceled
+
+        # The asyncio task is cancelled on the hook event loop after the .NET task completes.
+        time.sleep(0.05)
+        assert cancelled == [True]
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import pytest
 from typing import Optional, TypeVar
 from uuid import UUID
 
@@ -20,7 +22,8 @@ from tableau_migration.migration_content import PyUser
 from tableau_migration.migration_engine import PyContentMigrationItem
 from tableau_migration.migration_engine_hooks_filters import PyContentFilterContext, PyContentFilterContextItem, PyFilterStatus
 from tableau_migration.migration_engine_hooks_filters_builder import PyContentFilterBuilder
-from tableau_migration.migration_engine_hooks_filters_interop import PyContentFilterBase
+from tableau_migration.migration_engine_hooks_filters_interop import PyBatchContentFilterBase, PyContentFilterBase, PyPrefixSkipFilter
+from tableau_migration.migration_location_index import LocationIndex
 from tableau_migration.migration_services import ScopedMigrationServices
 
 from tests.helpers.autofixture import AutoFixtureTestBase
@@ -113,4 +116,225 @@ class TestFilterInterop(AutoFixtureTestBase):
         hook = hook_factories[0].Create[IMigrationHook[ContentFilterContext[IUser]]](services)
         hook_result = PyContentFilterContext[PyUser](hook.ExecuteAsync(ctx._dotnet, CancellationToken(False)).GetAwaiter().GetResult())
 
-        assert len([x for x in hook_result.items if x.status != PyFilterStatus.MIGRATE]) == 1
\ No newline at end of file
+        assert len([x for x in hook_result.items if x.status != PyFilterStatus.MIGRATE]) == 1
+class PyUserBatchFilter(PyBatchContentFilterBase[PyUser]):
+
+    search_id: Optional[UUID]  = None
+
+    def filter_batch(self, items: list[PyContentFilterContextItem[PyUser]]):
+        return {i for i, item in enumerate(items) if item.source_item.id == self.search_id}
+
+def create_batch_filter_users(search_id: UUID):
+    def filter_users(items: list[PyContentFilterContextItem[PyUser]]):
+        return [item.source_item.id != search_id for item in items]
+
+    return filter_users
+
+def create_batch_filter_users_services(search_id: UUID):
+    def filter_users_services(items: list[PyContentFilterContextItem[PyUser]], services: ScopedMigrationServices):
+        return [PyFilterStatus.CASCADE_SKIP if item.source_item.id == search_id else PyFilterStatus.MIGRATE for item in items]
+
+    return filter_users_services
+
+class TestBatchFilterInterop(AutoFixtureTestBase):
+    def _execute(self, hook_builder: PyContentFilterBuilder, ctx: PyContentFilterContext) -> PyContentFilterContext:
+        hook_factories = hook_builder.build().get_hooks(IContentFilter[IUser])
+        assert len(hook_factories) == 1
+
+        services = self.create(IServiceProvider)
+
+        hook = hook_factories[0].Create[IMigrationHook[ContentFilterContext[IUser]]](services)
+        return PyContentFilterContext[PyUser](hook.ExecuteAsync(ctx._dotnet, CancellationToken(False)).GetAwaiter().GetResult())
+
+    def test_batch_filter_interop_class(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+        
+        result = hook_builder.add(PyUserBatchFilter)
+        assert result is hook_builder
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        PyUserBatchFilter.search_id = ctx.items[0].source_item.id
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert [x.status for x in hook_result.items if x.status != PyFilterStatus.MIGRATE] == [PyFilterStatus.SKIP]
+
+    def test_batch_filter_interop_callback(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        search_id = ctx.items[0].source_item.id
+
+        result = hook_builder.add(PyUser, create_batch_filter_users(search_id), is_batch = True)
+        assert result is hook_builder
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert [x.status for x in hook_result.items if x.status != PyFilterStatus.MIGRATE] == [PyFilterStatus.SKIP]
+
+    def test_batch_filter_interop_callback_services(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        search_id = ctx.items[0].source_item.id
+
+        hook_builder.add(PyUser, create_batch_filter_users_services(search_id), is_batch = True)
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert [x.status for x in hook_result.items if x.status != PyFilterStatus.MIGRATE] == [PyFilterStatus.CASCADE_SKIP]
+
+    def test_batch_filter_skips_filtered_items(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        ctx.items[0].status = PyFilterStatus.SKIP
+        batches = []
+
+        def filter_users(items):
+            batches.append([item.source_item.id for item in items])
+
+        hook_builder.add(PyUser, filter_users, is_batch = True)
+        self._execute(hook_builder, ctx)
+
+        assert batches == [[item.source_item.id for item in ctx.items[1:]]]
+
+    def test_batch_filter_status_count_mismatch(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+
+        hook_builder.add(PyUser, lambda items: [False], is_batch = True)
+
+        with pytest.raises(Exception):
+            self._execute(hook_builder, ctx)
+
+class PyAsyncUserFilter(PyContentFilterBase[PyUser]):
+
+    search_id: Optional[UUID]  = None
+
+    async def should_migrate(self, item: PyContentMigrationItem[PyUser]) -> bool:
+        await asyncio.sleep(0)
+        return item.source_item.id != self.search_id
+
+class PyAsyncUserBatchFilter(PyBatchContentFilterBase[PyUser]):
+
+    search_id: Optional[UUID]  = None
+
+    async def filter_batch(self, items: list[PyContentFilterContextItem[PyUser]]):
+        await asyncio.sleep(0)
+        return {i for i, item in enumerate(items) if item.source_item.id == self.search_id}
+
+class TestAsyncFilterInterop(AutoFixtureTestBase):
+    def _execute(self, hook_builder: PyContentFilterBuilder, ctx: PyContentFilterContext) -> PyContentFilterContext:
+        hook_factories = hook_builder.build().get_hooks(IContentFilter[IUser])
+        assert len(hook_factories) == 1
+
+        services = self.create(IServiceProvider)
+
+        hook = hook_factories[0].Create[IMigrationHook[ContentFilterContext[IUser]]](services)
+        return PyContentFilterContext[PyUser](hook.ExecuteAsync(ctx._dotnet, CancellationToken(False)).GetAwaiter().GetResult())
+
+    def test_async_filter_interop_class(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+        hook_builder.add(PyAsyncUserFilter)
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        PyAsyncUserFilter.search_id = ctx.items[0].source_item.id
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert [x.status for x in hook_result.items if x.status != PyFilterStatus.MIGRATE] == [PyFilterStatus.SKIP]
+
+    def test_async_filter_interop_callback(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        search_id = ctx.items[0].source_item.id
+
+        async def filter_users(item: PyContentMigrationItem[PyUser]) -> bool:
+            await asyncio.sleep(0)
+            return item.source_item.id != search_id
+
+        hook_builder.add(PyUser, filter_users)
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert [x.status for x in hook_result.items if x.status != PyFilterStatus.MIGRATE] == [PyFilterStatus.SKIP]
+
+    def test_async_filter_items_run_concurrently(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        started = []
+
+        async def filter_users(item: PyContentMigrationItem[PyUser]) -> bool:
+            started.append(item.source_item.id)
+            await asyncio.sleep(0.01)
+            # Every item has started before any item completes.
+            return len(started) == len(ctx.items)
+
+        hook_builder.add(PyUser, filter_users)
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert all(x.status == PyFilterStatus.MIGRATE for x in hook_result.items)
+
+    def test_async_batch_filter_interop_class(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+        hook_builder.add(PyAsyncUserBatchFilter)
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        PyAsyncUserBatchFilter.search_id = ctx.items[0].source_item.id
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert [x.status for x in hook_result.items if x.status != PyFilterStatus.MIGRATE] == [PyFilterStatus.SKIP]
+
+class PyUserPrefixSkipFilter(PyPrefixSkipFilter[PyUser]):
+    pass
+
+class PyUserPrefixChildSkipFilter(PyPrefixSkipFilter[PyUser]):
+    skip_indexed_locations = False
+
+class TestPrefixSkipFilterInterop(AutoFixtureTestBase):
+    def _execute(self, hook_builder: PyContentFilterBuilder, ctx: PyContentFilterContext) -> PyContentFilterContext:
+        hook_factories = hook_builder.build().get_hooks(IContentFilter[IUser])
+        assert len(hook_factories) == 1
+
+        hook = hook_factories[0].Create[IMigrationHook[ContentFilterContext[IUser]]](self.create(IServiceProvider))
+        return PyContentFilterContext[PyUser](hook.ExecuteAsync(ctx._dotnet, CancellationToken(False)).GetAwaiter().GetResult())
+
+    def test_skips_indexed_locations(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+        hook_builder.add(PyUserPrefixSkipFilter)
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        PyUserPrefixSkipFilter.location_index = LocationIndex([ctx.items[0].source_item.location])
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert [x.status for x in hook_result.items] == [PyFilterStatus.SKIP] + [PyFilterStatus.MIGRATE] * (len(ctx.items) - 1)
+
+    def test_skips_within_indexed_locations(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+        hook_builder.add(PyUserPrefixChildSkipFilter)
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        location = ctx.items[0].source_item.location
+        PyUserPrefixChildSkipFilter.location_index = LocationIndex([location, location.parent()])
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert hook_result.items[0].status == PyFilterStatus.SKIP
+
+    def test_no_index(self):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+        hook_builder.add(PyUserPrefixChildSkipFilter)
+
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+        PyUserPrefixChildSkipFilter.location_index = None
+
+        hook_result = self._execute(hook_builder, ctx)
+
+        assert all(x.status == PyFilterStatus.MIGRATE for x in hook_result.items)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
 from typing import TypeVar
 from uuid import UUID
 
@@ -21,17 +22,19 @@ from tableau_migration.migration_engine import PyMigrationPlanBuilder
 from tableau_migration.migration_content import PyUser
 from tableau_migration.migration_engine_hooks_mappings import PyContentMappingContext
 from tableau_migration.migration_engine_hooks_mappings_builder import PyContentMappingBuilder
-from tableau_migration.migration_engine_hooks_mappings_interop import PyContentMappingBase, PyTableauCloudUsernameMappingBase
+from tableau_migration.migration_engine_hooks_mappings_interop import PyBatchContentMappingBase, PyContentMappingBase, PyPrefixRemapMapping, PyTableauCloudUsernameMappingBase
+from tableau_migration.migration_location_index import LocationIndex
 from tableau_migration.migration_services import ScopedMigrationServices
 
 from tests.helpers.autofixture import AutoFixtureTestBase
 
 from System import IServiceProvider
+from System.Collections.Generic import List
 from System.Threading import CancellationToken
 from Tableau.Migration import ContentLocation
 from Tableau.Migration.Content import IUser
 from Tableau.Migration.Engine.Hooks import IMigrationHook
-from Tableau.Migration.Engine.Hooks.Mappings import ContentMappingBuilder, ContentMappingContext, IContentMapping
+from Tableau.Migration.Engine.Hooks.Mappings import ContentMappingBuilder, ContentMappingContext, IContentBatchMapping, IContentMapping
 
 T = TypeVar("T")
 
@@ -103,6 +106,113 @@ class TestMappingInterop(AutoFixtureTestBase):
 
         assert hook_result.MappedLocation.Name == map_ctx.MappedLocation.Name + "4"        
         
+class PyUserBatchMapping(PyBatchContentMappingBase[PyUser]):
+
+    def map_batch(self, contexts: list[PyContentMappingContext[PyUser]]):
+        return [ctx.mapped_location.rename(ctx.mapped_location.name + "5") if i % 2 == 0 else None for i, ctx in enumerate(contexts)]
+
+def map_users_batch(contexts: list[PyContentMappingContext[PyUser]]):
+    return [ctx.mapped_location.rename(ctx.mapped_location.name + "6") for ctx in contexts]
+
+class TestBatchMappingInterop(AutoFixtureTestBase):
+    def _create_hook(self, hook_builder: PyContentMappingBuilder):
+        hook_factories = hook_builder.build().get_hooks(IContentMapping[IUser])
+        assert len(hook_factories) == 1
+
+        return hook_factories[0].Create[IContentBatchMapping[IUser]](self.create(IServiceProvider))
+
+    def _create_contexts(self, count: int):
+        contexts = List[ContentMappingContext[IUser]]()
+        for _ in range(count):
+            contexts.Add(self.create(ContentMappingContext[IUser]))
+        return contexts
+
+    def test_batch_mapping_interop_class(self):
+        hook_builder = PyContentMappingBuilder(ContentMappingBuilder())
+        
+        result = hook_builder.add(PyUserBatchMapping)
+        assert result is hook_builder
+
+        contexts = self._create_contexts(3)
+        hook_result = self._create_hook(hook_builder).ExecuteBatchAsync(contexts, CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert [x.MappedLocation.Name for x in hook_result] == [
+            contexts[0].MappedLocation.Name + "5", 
+            contexts[1].MappedLocation.Name, 
+            contexts[2].MappedLocation.Name + "5"
+        ]
+
+    def test_batch_mapping_interop_callback(self):
+        hook_builder = PyContentMappingBuilder(ContentMappingBuilder())
+
+        result = hook_builder.add(PyUser, map_users_batch, is_batch = True)
+        assert result is hook_builder
+
+        contexts = self._create_contexts(3)
+        hook_result = self._create_hook(hook_builder).ExecuteBatchAsync(contexts, CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert [x.MappedLocation.Name for x in hook_result] == [x.MappedLocation.Name + "6" for x in contexts]
+
+    def test_batch_mapping_single_item(self):
+        hook_builder = PyContentMappingBuilder(ContentMappingBuilder())
+        hook_builder.add(PyUser, map_users_batch, is_batch = True)
+
+        map_ctx = self.create(ContentMappingContext[IUser])
+        hook_result = self._create_hook(hook_builder).ExecuteAsync(map_ctx, CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert hook_result.MappedLocation.Name == map_ctx.MappedLocation.Name + "6"
+
+    def test_batch_mapping_count_mismatch(self):
+        hook_builder = PyContentMappingBuilder(ContentMappingBuilder())
+        hook_builder.add(PyUser, lambda contexts: [None], is_batch = True)
+
+        with pytest.raises(Exception):
+            self._create_hook(hook_builder).ExecuteBatchAsync(self._create_contexts(2), CancellationToken(False)).GetAwaiter().GetResult()
+
+class PyUserPrefixRemapMapping(PyPrefixRemapMapping[PyUser]):
+    pass
+
+class TestPrefixRemapMappingInterop(AutoFixtureTestBase):
+    def _execute(self, count: int):
+        hook_builder = PyContentMappingBuilder(ContentMappingBuilder())
+        hook_builder.add(PyUserPrefixRemapMapping)
+
+        hook_factories = hook_builder.build().get_hooks(IContentMapping[IUser])
+        hook = hook_factories[0].Create[IContentBatchMapping[IUser]](self.create(IServiceProvider))
+
+        contexts = List[ContentMappingContext[IUser]]()
+        for _ in range(count):
+            contexts.Add(self.create(ContentMappingContext[IUser]))
+
+        return contexts, (lambda: hook.ExecuteBatchAsync(contexts, CancellationToken(False)).GetAwaiter().GetResult())
+
+    def test_remaps_within_indexed_location(self):
+        contexts, execute = self._execute(3)
+        location = contexts[0].MappedLocation
+        PyUserPrefixRemapMapping.location_index = LocationIndex({PyContentLocation(location.Parent()): PyContentLocation.from_path("Mapped/Domain", "/")})
+
+        hook_result = execute()
+
+        assert list(hook_result[0].MappedLocation.PathSegments) == ["Mapped", "Domain", location.Name]
+        assert [x.MappedLocation for x in hook_result][1:] == [x.MappedLocation for x in contexts][1:]
+
+    def test_remaps_to_path(self):
+        contexts, execute = self._execute(1)
+        location = contexts[0].MappedLocation
+        PyUserPrefixRemapMapping.location_index = LocationIndex({PyContentLocation(location): "Mapped"})
+
+        hook_result = execute()
+
+        assert list(hook_result[0].MappedLocation.PathSegments) == ["Mapped"]
+
+    def test_no_index(self):
+        contexts, execute = self._execute(2)
+        PyUserPrefixRemapMapping.location_index = None
+
+        hook_result = execute()
+
+        assert [x.MappedLocation for x in hook_result] == [x.MappedLocation for x in contexts]
+
 class TestContentMigrationItem(AutoFixtureTestBase):
     def test_wrapper_init(self):
         dotnet_content_item = self.create(IUser)
@@ -0,0 +1,179 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+
+from tableau_migration.migration_content import PyUser
+from tableau_migration.migration_engine import PyMigrationPlan
+from tableau_migration.migration_engine_hooks_filters import PyContentFilterContext
+from tableau_migration.migration_engine_hooks_filters_builder import PyContentFilterBuilder
+from tableau_migration.migration_engine_hooks_profiling import HOOK_TIMING_BUCKETS, HookProfile, HookProfileKey, _profiled_user_callable, profile_hooks
+
+from tests.helpers.autofixture import AutoFixtureTestBase
+
+from Microsoft.Extensions.DependencyInjection import (
+    ServiceCollection,
+    ServiceCollectionContainerBuilderExtensions,
+    ServiceCollectionServiceExtensions,
+    ServiceProviderServiceExtensions
+)
+from System import IServiceProvider
+from System.Threading import CancellationToken
+from Tableau.Migration.Content import IUser
+from Tableau.Migration.Engine import IMigrationPlan
+from Tableau.Migration.Engine.Hooks import IMigrationHook
+from Tableau.Migration.Engine.Hooks.Filters import ContentFilterBuilder, ContentFilterContext, IContentFilter
+
+KEY = HookProfileKey("PyUserFilter", "PyUser")
+
+def profiled_filter_users(item) -> bool:
+    return True
+
+class TestHookTimingStats():
+    def test_no_calls(self):
+        profile = HookProfile()
+
+        assert profile.get("PyUserFilter", "PyUser") is None
+        assert profile.stats() == []
+        assert profile.total_seconds == 0
+
+    def test_record(self):
+        profile = HookProfile()
+
+        profile.record(KEY, 0.003)
+        profile.record(KEY, 0.001)
+        profile.record_user(KEY, 0.002)
+
+        stats = profile.get("PyUserFilter", "PyUser")
+        assert stats.count == 2
+        assert stats.total_seconds == 0.004
+        assert stats.user_seconds == 0.002
+        assert stats.overhead_seconds == 0.002
+        assert stats.mean_seconds == 0.002
+        assert stats.min_seconds == 0.001
+        assert stats.max_seconds == 0.003
+
+    def test_percentiles(self):
+        profile = HookProfile()
+
+        for i in range(1, 101):
+            profile.record(KEY, i / 1000)
+
+        stats = profile.get("PyUserFilter", "PyUser")
+        assert stats.percentile(0) == 0.001
+        assert stats.percentile(1) == 0.1
+        assert 0.04 <= stats.p50_seconds <= 0.07
+        assert 0.08 <= stats.p95_seconds <= 0.1
+        assert stats.p50_seconds <= stats.p95_seconds <= stats.p99_seconds <= 0.1
+
+    def test_percentile_overflow_bucket(self):
+        profile = HookProfile()
+
+        profile.record(KEY, HOOK_TIMING_BUCKETS[-1] * 4)
+
+        assert profile.get("PyUserFilter", "PyUser").p99_seconds == HOOK_TIMING_BUCKETS[-1] * 4
+
+    def test_stats_slowest_first(self):
+        profile = HookProfile()
+
+        profile.record(KEY, 0.001)
+        profile.record(HookProfileKey("slow_hook", ""), 0.01)
+
+        assert [s.hook for s in profile.stats()] == ["slow_hook", "PyUserFilter"]
+
+class TestHookProfileExport():
+    def test_json(self):
+        profile = HookProfile()
+        profile.record(KEY, 0.001)
+
+        result = json.loads(profile.to_json())
+
+        assert len(result["hooks"]) == 1
+        assert result["hooks"][0]["hook"] == "PyUserFilter"
+        assert result["hooks"][0]["content_type"] == "PyUser"
+        assert result["hooks"][0]["count"] == 1
+
+    def test_prometheus(self):
+        profile = HookProfile()
+        profile.record(KEY, 0.001)
+        profile.record(KEY, 1.0)
+
+        lines = profile.to_prometheus().splitlines()
+
+        assert "# TYPE tableau_migration_hook_duration_seconds histogram" in lines
+        assert 'tableau_migration_hook_duration_seconds_bucket{hook="PyUserFilter",content_type="PyUser",le="+Inf"} 2' in lines
+        assert 'tableau_migration_hook_duration_seconds_count{hook="PyUserFilter",content_type="PyUser"} 2' in lines
+        assert 'tableau_migration_hook_user_seconds_total{hook="PyUserFilter",content_type="PyUser"} 0.0' in lines
+
+    def test_prometheus_escapes_labels(self):
+        profile = HookProfile()
+        profile.record(HookProfileKey('hook"\\', ""), 0.001)
+
+        assert 'hook="hook\\"\\\\"' in profile.to_prometheus()
+
+class TestProfileHooks(AutoFixtureTestBase):
+    def _execute_filter(self, services = None):
+        hook_builder = PyContentFilterBuilder(ContentFilterBuilder())
+        hook_builder.add(PyUser, profiled_filter_users)
+
+        hook_factories = hook_builder.build().get_hooks(IContentFilter[IUser])
+        ctx = PyContentFilterContext[PyUser](self.create(ContentFilterContext[IUser]))
+
+        services = self.create(IServiceProvider) if services is None else services
+        hook = hook_factories[0].Create[IMigrationHook[ContentFilterContext[IUser]]](services)
+        hook.ExecuteAsync(ctx._dotnet, CancellationToken(False)).GetAwaiter().GetResult()
+
+        return len(ctx.items)
+
+    def test_records_hook_calls(self):
+        with profile_hooks() as profile:
+            item_count = self._execute_filter()
+
+        stats = profile.get("profiled_filter_users", "PyUser")
+        assert stats.count == item_count
+        assert stats.total_seconds >= stats.user_seconds > 0
+
+    def test_plan_profile(self):
+        services = ServiceCollection()
+        ServiceCollectionServiceExtensions.AddSingleton[IMigrationPlan](services, self.create(IMigrationPlan))
+        service_provider = ServiceCollectionContainerBuilderExtensions.BuildServiceProvider(services)
+        plan = PyMigrationPlan(ServiceProviderServiceExtensions.GetRequiredService[IMigrationPlan](service_provider))
+        other_plan = PyMigrationPlan(self.create(IMigrationPlan))
+
+        with profile_hooks(plan=other_plan) as other_profile, profile_hooks(plan=plan) as profile:
+            item_count = self._execute_filter(service_provider)
+
+        assert profile.get("profiled_filter_users", "PyUser").count == item_count
+        assert other_profile.stats() == []
+
+    def test_disabled(self):
+        with profile_hooks() as profile:
+            pass
+
+        self._execute_filter()
+
+        assert profile.stats() == []
+
+    def test_async_user_time_includes_await(self):
+        key = HookProfileKey("async_hook", "")
+
+        async def async_hook():
+            await asyncio.sleep(0.01)
+
+        with profile_hooks() as profile:
+            asyncio.run(_profiled_user_callable(async_hook, key)())
+
+        assert profile.get("async_hook").user_seconds >= 0.01
@@ -13,22 +13,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
 from typing import TypeVar
 from uuid import UUID, uuid4
 from xml.etree import ElementTree
 import json
+import pytest
+
+import tableau_migration
 
 from tableau_migration.migration import PyContentReference
 from tableau_migration.migration_api_rest_models import PyPermissionsCapabilityModes, PyPermissionsCapabilityNames
 from tableau_migration.migration_content import PyPublishableWorkbook, PyUser
 from tableau_migration.migration_content_permissions import PyCapability, PyGranteeCapability, PyGranteeType, PyPermissionSet
 from tableau_migration.migration_engine_hooks_transformers_builder import PyContentTransformerBuilder
-from tableau_migration.migration_engine_hooks_transformers_interop import PyContentTransformerBase, PyJsonContentTransformerBase, PyXmlContentTransformerBase
+from tableau_migration.migration_engine_hooks_transformers_interop import (
+    _PyJsonTransformerWrapperBuilder,
+    PyContentTransformerBase,
+    PyJsonContentTransformerBase,
+    PyXmlContentTransformerBase
+)
+from tableau_migration.migration_engine_hooks_transformers_process import TransformItemInfo, _transform_json_text, _transform_xml_text
 from tableau_migration.migration_services import ScopedMigrationServices
+from tableau_migration.migration_xml import PyXmlElement
 
 from tests.helpers.autofixture import AutoFixtureTestBase
 
-from System import IServiceProvider
+from System import IServiceProvider, Object
 from System.IO import MemoryStream, StreamReader
 from System.Threading import CancellationToken
 from System.Text.Json.Nodes import JsonNode
@@ -160,6 +172,31 @@ def transform_workbook_xml_services(ctx: PyPublishableWorkbook, xml: ElementTree
     ctx.description = xml.get("version")
     _transform_xml_content(xml)
 
+_expected_live_twb = """<?xml version="1.0" encoding="utf-8"?>
+
+<!-- build 20231.24.0312.1557                               -->
+<workbook source-build="2023.1.11 (20231.24.0312.1557)" source-platform="win" version="18.1" xmlns:user="http://www.tableausoftware.com/xml/user">
+  <user:test a="b" />
+<test2 a="b" /></workbook>
+
+"""
+
+def _transform_live_xml_content(xml: PyXmlElement) -> None:
+    xml.find("user:test", {"user": "http://www.tableausoftware.com/xml/user"}).set("a", "b")
+    xml.add_element("test2", { "a": "b" })
+
+class PyWorkbookLiveXmlTransformer(PyXmlTransformer[PyPublishableWorkbook]):
+
+    live_xml = True
+
+    def transform(self, ctx: PyPublishableWorkbook, xml: PyXmlElement) -> None:
+        ctx.description = xml.get("version")
+        _transform_live_xml_content(xml)
+
+def transform_workbook_live_xml(ctx: PyPublishableWorkbook, xml: PyXmlElement) -> None:
+    ctx.description = xml.get("version")
+    _transform_live_xml_content(xml)
+
 class TestXmlTransformerInterop(AutoFixtureTestBase):
     
     def _clean_xml_text(self, xml_text: str) -> str:
@@ -258,6 +295,58 @@ class TestXmlTransformerInterop(AutoFixtureTestBase):
         assert ctx.Description == "18.1"
         assert self._save_xml(xml) == self._clean_xml_text(_expected_twb)
 
+    def test_transformer_interop_class_live_xml(self):
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+
+        hook_builder.add(PyWorkbookLiveXmlTransformer)
+
+        hook_factories = hook_builder.build().get_hooks(IContentTransformer[IPublishableWorkbook])
+        assert len(hook_factories) == 1
+
+        services = self.create(IServiceProvider)
+        ctx = self.create(IPublishableWorkbook)
+        xml = XDocument.Parse(_test_twb, LoadOptions.PreserveWhitespace)
+        root = xml.Root
+
+        hook = hook_factories[0].Create[IXmlContentTransformer[IPublishableWorkbook]](services)
+        hook.TransformAsync(ctx, xml, CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert ctx.Description == "18.1"
+        assert xml.Root.Equals(root)
+        assert self._save_xml(xml) == self._clean_xml_text(_expected_live_twb)
+
+    def test_transformer_interop_callback_live_xml(self):
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+
+        ctx = self.create(IPublishableWorkbook)
+        xml = XDocument.Parse(_test_twb, LoadOptions.PreserveWhitespace)
+
+        received = []
+
+        def _transform(ctx: PyPublishableWorkbook, xml: PyXmlElement) -> None:
+            received.append(type(xml))
+            transform_workbook_live_xml(ctx, xml)
+
+        hook_builder.add(PyPublishableWorkbook, _transform, is_xml = True, live_xml = True)
+
+        hook_factories = hook_builder.build().get_hooks(IContentTransformer[IPublishableWorkbook])
+        assert len(hook_factories) == 1
+
+        services = self.create(IServiceProvider)
+
+        hook = hook_factories[0].Create[IXmlContentTransformer[IPublishableWorkbook]](services)
+        hook.TransformAsync(ctx, xml, CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert ctx.Description == "18.1"
+        assert self._save_xml(xml) == self._clean_xml_text(_expected_live_twb)
+        assert received == [tableau_migration.XmlElement]
+
+    def test_live_xml_requires_xml_callback(self):
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+
+        with pytest.raises(ValueError):
+            hook_builder.add(PyPublishableWorkbook, transform_workbook_live_xml, live_xml = True)
+
 class PyJsonTransformer(PyJsonContentTransformerBase[T]):
     def transform(self, ctx: T, json_obj) -> None:
         pass
@@ -272,6 +361,17 @@ _test_json = """{
   }
 }"""
 
+_test_multi_key_json = """{
+  "connections": {
+    "c1": {
+      "connectionAttributes": {
+        "server": "source-server"
+      }
+    }
+  },
+  "datasources": ["ds1"]
+}"""
+
 class PyWorkbookJsonTransformer(PyJsonTransformer[PyPublishableWorkbook]):
 
     def needs_json_transforming(self, ctx: PyPublishableWorkbook) -> bool:
@@ -286,6 +386,16 @@ def transform_workbook_json(ctx: PyPublishableWorkbook, json_obj) -> None:
 def transform_workbook_json_services(ctx: PyPublishableWorkbook, json_obj, services: ScopedMigrationServices) -> None:
     json_obj["connections"]["c1"]["connectionAttributes"]["server"] = "services-server"
 
+class PyAsyncWorkbookJsonTransformer(PyJsonTransformer[PyPublishableWorkbook]):
+
+    async def transform(self, ctx: PyPublishableWorkbook, json_obj) -> None:
+        await asyncio.sleep(0)
+        json_obj["connections"]["c1"]["connectionAttributes"]["server"] = "async-class-server"
+
+async def transform_workbook_json_async(ctx: PyPublishableWorkbook, json_obj) -> None:
+    await asyncio.sleep(0)
+    json_obj["connections"]["c1"]["connectionAttributes"]["server"] = "async-callback-server"
+
 class TestJsonTransformerInterop(AutoFixtureTestBase):
 
     def _parse_json(self, json_node: JsonNode):
@@ -364,7 +474,239 @@ class TestJsonTransformerInterop(AutoFixtureTestBase):
         hook.TransformAsync(ctx, json_node, CancellationToken(False)).GetAwaiter().GetResult()
 
         assert self._parse_json(json_node) == "services-server"
-    
+
+    def _transform_json_callback(self, callback) -> JsonNode:
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+        hook_builder.add(PyPublishableWorkbook, callback, is_json = True)
+
+        hook_factories = hook_builder.build().get_hooks(IContentTransformer[IPublishableWorkbook])
+        services = self.create(IServiceProvider)
+        ctx = self.create(IPublishableWorkbook)
+        json_node = JsonNode.Parse(_test_multi_key_json)
+        self._original_nodes = {kvp.Key: kvp.Value for kvp in json_node.AsObject()}
+
+        hook = hook_factories[0].Create[IJsonContentTransformer[IPublishableWorkbook]](services)
+        hook.TransformAsync(ctx, json_node, CancellationToken(False)).GetAwaiter().GetResult()
+
+        return json_node
+
+    def _is_original_node(self, json_node: JsonNode, key: str) -> bool:
+        return Object.ReferenceEquals(json_node[key], self._original_nodes[key])
+
+    def test_transformer_unchanged_json_not_written(self):
+        def _read_only(ctx, json_obj):
+            assert json_obj["connections"]["c1"]["connectionAttributes"]["server"] == "source-server"
+
+        json_node = self._transform_json_callback(_read_only)
+
+        assert self._is_original_node(json_node, "connections")
+        assert self._is_original_node(json_node, "datasources")
+
+    def test_transformer_changed_json_replaces_changed_keys(self):
+        def _append(ctx, json_obj):
+            json_obj["datasources"].append("ds2")
+
+        json_node = self._transform_json_callback(_append)
+
+        assert self._is_original_node(json_node, "connections")
+        assert not self._is_original_node(json_node, "datasources")
+        assert json.loads(json_node.ToJsonString())["datasources"] == ["ds1", "ds2"]
+
+    def test_write_json_unserializable_value_keeps_original(self):
+        json_node = JsonNode.Parse(_test_multi_key_json)
+
+        with pytest.raises(TypeError):
+            _PyJsonTransformerWrapperBuilder.write_json(json_node, { "connections": {}, "bad": object() })
+
+        assert json.loads(json_node.ToJsonString()) == json.loads(_test_multi_key_json)
+
+    def test_transformer_removed_json_key(self):
+        def _remove(ctx, json_obj):
+            del json_obj["datasources"]
+            json_obj["added"] = { "a": 1 }
+
+        json_node = self._transform_json_callback(_remove)
+
+        assert self._is_original_node(json_node, "connections")
+        assert json.loads(json_node.ToJsonString()) == {
+            "connections": json.loads(_test_json)["connections"],
+            "added": { "a": 1 }
+        }
+
+def transform_xml_info(info: TransformItemInfo, xml: ElementTree.Element) -> None:
+    xml.set("item", info.name)
+    _transform_xml_content(xml)
+
+class PyExecutorXmlTransformer(PyXmlTransformer[PyPublishableWorkbook]):
+    def transform(self, info: TransformItemInfo, xml: ElementTree.Element) -> None:
+        xml.set("item", str(info.id))
+
+def transform_json_info(info: TransformItemInfo, json_obj) -> None:
+    json_obj["connections"]["c1"]["connectionAttributes"]["server"] = info.content_url
+
+class ExportedExecutorXmlTransformer(tableau_migration.XmlContentTransformerBase[tableau_migration.IPublishableWorkbook]):
+    def transform(self, info: TransformItemInfo, xml: ElementTree.Element) -> None:
+        xml.set("item", info.name)
+
+class ExportedExecutorJsonTransformer(tableau_migration.JsonContentTransformerBase[tableau_migration.IPublishableWorkbook]):
+    def transform(self, info: TransformItemInfo, json_obj) -> None:
+        json_obj["connections"]["c1"]["connectionAttributes"]["server"] = info.content_url
+
+class TestAsyncJsonTransformerInterop(AutoFixtureTestBase):
+
+    def _transform(self, input_0: type, input_1 = None, **kwargs) -> str:
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+        hook_builder.add(input_0, input_1, **kwargs)
+
+        hook_factories = hook_builder.build().get_hooks(IContentTransformer[IPublishableWorkbook])
+        assert len(hook_factories) == 1
+
+        json_node = JsonNode.Parse(_test_json)
+        hook = hook_factories[0].Create[IJsonContentTransformer[IPublishableWorkbook]](self.create(IServiceProvider))
+        hook.TransformAsync(self.create(IPublishableWorkbook), json_node, CancellationToken(False)).GetAwaiter().GetResult()
+
+        return json.loads(json_node.ToJsonString())["connections"]["c1"]["connectionAttributes"]["server"]
+
+    def test_transformer_interop_class(self):
+        assert self._transform(PyAsyncWorkbookJsonTransformer) == "async-class-server"
+
+    def test_transformer_interop_callback(self):
+        assert self._transform(PyPublishableWorkbook, transform_workbook_json_async, is_json = True) == "async-callback-server"
+
+    def test_async_transformer_rejects_executor(self):
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+
+        with ThreadPoolExecutor(1) as executor:
+            with pytest.raises(ValueError):
+                hook_builder.add(PyPublishableWorkbook, transform_workbook_json_async, is_json = True, executor = executor)
+
+class TestExecutorTransformerInterop(AutoFixtureTestBase):
+
+    def _create_hook(self, hook_type: type, input_0: type, input_1 = None, **kwargs):
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+        result = hook_builder.add(input_0, input_1, **kwargs)
+        assert result is hook_builder
+
+        hook_factories = hook_builder.build().get_hooks(IContentTransformer[IPublishableWorkbook])
+        assert len(hook_factories) == 1
+
+        return hook_factories[0].Create[hook_type[IPublishableWorkbook]](self.create(IServiceProvider))
+
+    def test_xml_callback(self):
+        with ThreadPoolExecutor(2) as executor:
+            hook = self._create_hook(IXmlContentTransformer, PyPublishableWorkbook, transform_xml_info, is_xml = True, executor = executor)
+            ctx = self.create(IPublishableWorkbook)
+            xml = XDocument.Parse(_test_twb, LoadOptions.PreserveWhitespace)
+
+            hook.TransformAsync(ctx, xml, CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert xml.Root.Attribute(XName.Get("item")).Value == ctx.Name
+        assert xml.Root.Element(XName.Get("test2")) is not None
+
+    def test_xml_class(self):
+        with ThreadPoolExecutor(2) as executor:
+            hook = self._create_hook(IXmlContentTransformer, PyExecutorXmlTransformer, executor = executor)
+            ctx = self.create(IPublishableWorkbook)
+            xml = XDocument.Parse(_test_twb, LoadOptions.PreserveWhitespace)
+
+            hook.TransformAsync(ctx, xml, CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert UUID(xml.Root.Attribute(XName.Get("item")).Value) == UUID(ctx.Id.ToString())
+
+    def test_exported_xml_class(self):
+        with ThreadPoolExecutor(2) as executor:
+            hook = self._create_hook(IXmlContentTransformer, ExportedExecutorXmlTransformer, executor = executor)
+            ctx = self.create(IPublishableWorkbook)
+            xml = XDocument.Parse(_test_twb, LoadOptions.PreserveWhitespace)
+
+            hook.TransformAsync(ctx, xml, CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert xml.Root.Attribute(XName.Get("item")).Value == ctx.Name
+
+    def test_exported_json_class(self):
+        with ThreadPoolExecutor(2) as executor:
+            hook = self._create_hook(IJsonContentTransformer, ExportedExecutorJsonTransformer, executor = executor)
+            ctx = self.create(IPublishableWorkbook)
+            json_node = JsonNode.Parse(_test_multi_key_json)
+
+            hook.TransformAsync(ctx, json_node, CancellationToken(False)).GetAwaiter().GetResult()
+
+        assert json.loads(json_node.ToJsonString())["connections"]["c1"]["connectionAttributes"]["server"] == ctx.ContentUrl
+
+    def test_json_callback(self):
+        with ThreadPoolExecutor(2) as executor:
+            hook = self._create_hook(IJsonContentTransformer, PyPublishableWorkbook, transform_json_info, is_json = True, executor = executor)
+            ctx = self.create(IPublishableWorkbook)
+            json_node = JsonNode.Parse(_test_multi_key_json)
+            datasources = json_node["datasources"]
+
+            hook.TransformAsync(ctx, json_node, CancellationToken(False)).GetAwaiter().GetResult()
+
+        result = json.loads(json_node.ToJsonString())
+        assert result["connections"]["c1"]["connectionAttributes"]["server"] == ctx.ContentUrl
+        assert Object.ReferenceEquals(json_node["datasources"], datasources)
+
+    def test_transformer_error(self):
+        def _fail(info, xml):
+            raise KeyError("missing")
+
+        with ThreadPoolExecutor(1) as executor:
+            hook = self._create_hook(IXmlContentTransformer, PyPublishableWorkbook, _fail, is_xml = True, executor = executor)
+            xml = XDocument.Parse(_test_twb, LoadOptions.PreserveWhitespace)
+
+            task = hook.TransformAsync(self.create(IPublishableWorkbook), xml, CancellationToken(False))
+            with pytest.raises(Exception, match = "KeyError"):
+                task.GetAwaiter().GetResult()
+
+    def test_requires_xml_or_json(self):
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+
+        with ThreadPoolExecutor(1) as executor:
+            with pytest.raises(ValueError):
+                hook_builder.add(PyUser, transform_users, executor = executor)
+
+            with pytest.raises(ValueError):
+                hook_builder.add(PyUserTransformer, executor = executor)
+
+            with pytest.raises(ValueError):
+                hook_builder.add(PyWorkbookLiveXmlTransformer, executor = executor)
+
+    def test_rejects_services_callback(self):
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+
+        with ThreadPoolExecutor(1) as executor:
+            with pytest.raises(ValueError):
+                hook_builder.add(PyPublishableWorkbook, transform_workbook_xml_services, is_xml = True, executor = executor)
+
+    def test_process_pool_requires_picklable(self):
+        hook_builder = PyContentTransformerBuilder(ContentTransformerBuilder())
+
+        with ProcessPoolExecutor(1) as executor:
+            with pytest.raises(ValueError):
+                hook_builder.add(PyPublishableWorkbook, lambda info, xml: None, is_xml = True, executor = executor)
+
+class TestTransformerProcess():
+    _info = TransformItemInfo(uuid4(), "name", "url", "project/name")
+
+    def test_transform_xml_text(self):
+        result = _transform_xml_text(transform_xml_info, False, self._info, "<workbook />")
+
+        assert ElementTree.fromstring(result).get("item") == "name"
+
+    def test_transform_xml_text_class(self):
+        result = _transform_xml_text(PyExecutorXmlTransformer, True, self._info, "<workbook />")
+
+        assert ElementTree.fromstring(result).get("item") == str(self._info.id)
+
+    def test_transform_json_text_changes(self):
+        changes = _transform_json_text(transform_json_info, False, self._info, _test_multi_key_json)
+
+        assert [k for k, _ in changes] == ["connections"]
+        assert json.loads(changes[0][1])["c1"]["connectionAttributes"]["server"] == "url"
+
+    def test_transform_json_text_unchanged(self):
+        assert _transform_json_text(lambda info, json_obj: None, False, self._info, _test_json) == []
+
 test_grantee_id = uuid4()
 class PyPermissionTransformer(PyContentTransformerBase[PyPermissionSet]):
     def transform(self, item_to_transform: PyPermissionSet) -> PyPermissionSet:
@@ -17,9 +17,11 @@ import os
 import tempfile
 from tests.helpers.autofixture import AutoFixtureTestBase # noqa: E402, F401
 from Tableau.Migration import IMigrationManifest # noqa: E402, F401
+from Tableau.Migration.Engine.Manifest import IMigrationManifestEntryEditor # noqa: E402, F401
 from tableau_migration import (
     IMigrationManifestEntry,
     MigrationManifest,
+    MigrationManifestJournalSerializer,
     MigrationManifestSerializer)
 
 class TestManifestSaveLoad(AutoFixtureTestBase):
@@ -47,6 +49,75 @@ class TestManifestSaveLoad(AutoFixtureTestBase):
         assert loaded.errors.Count > 0
         assert manifest.errors.Count == loaded.errors.Count
 
+    def test_saveload_sharded(self):
+        serializer = MigrationManifestSerializer()
+        manifest = MigrationManifest(self.create(IMigrationManifest))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            serializer.save_sharded(manifest, temp_dir)
+            loaded = serializer.load_sharded(temp_dir)
+
+        assert manifest.plan_id == loaded.plan_id
+        assert manifest.migration_id == loaded.migration_id
+        assert len([x for x in manifest.entries]) == len([x for x in loaded.entries])
+        assert manifest.errors.Count == loaded.errors.Count
+
+    def test_load_sharded_content_types(self):
+        serializer = MigrationManifestSerializer()
+        manifest = MigrationManifest(self.create(IMigrationManifest))
+
+        content_type = list(manifest.entries.GetPartitionTypes())[0]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            serializer.save_sharded(manifest, temp_dir)
+            loaded = serializer.load_sharded(temp_dir, [content_type])
+
+        assert [x for x in loaded.entries.GetPartitionTypes()] == [content_type]
+        assert len(list(loaded.entries.ForContentType(content_type))) == len(list(manifest.entries.ForContentType(content_type)))
+
+    def test_load_sharded_missing(self):
+        serializer = MigrationManifestSerializer()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert serializer.load_sharded(temp_dir) is None
+
+class TestManifestJournal(AutoFixtureTestBase):
+
+    def test_append_load(self):
+        serializer = MigrationManifestJournalSerializer()
+        manifest = MigrationManifest(self.create(IMigrationManifest))
+
+        content_type = list(manifest.entries.GetPartitionTypes())[0]
+        entry = IMigrationManifestEntryEditor(list(manifest.entries.ForContentType(content_type))[0])
+        entry.SetSkipped(False, "journal")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file_path = os.path.join(temp_dir, 'manifest.json')
+            serializer.compact(manifest, temp_file_path)
+
+            assert not serializer.append(manifest, content_type, [entry], temp_file_path)
+            assert os.path.exists(MigrationManifestJournalSerializer.get_journal_path(temp_file_path))
+
+            loaded = serializer.load(temp_file_path)
+
+        loaded_entries = [IMigrationManifestEntry(x) for x in loaded.entries]
+        assert len(loaded_entries) == len([x for x in manifest.entries])
+        assert "journal" in [x.skipped_reason for x in loaded_entries]
+
+    def test_append_compacts(self):
+        serializer = MigrationManifestJournalSerializer()
+        manifest = MigrationManifest(self.create(IMigrationManifest))
+
+        content_type = list(manifest.entries.GetPartitionTypes())[0]
+        entries = list(manifest.entries.ForContentType(content_type))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file_path = os.path.join(temp_dir, 'manifest.json')
+
+            assert serializer.append(manifest, content_type, entries, temp_file_path)
+            assert os.path.exists(temp_file_path)
+            assert not os.path.exists(MigrationManifestJournalSerializer.get_journal_path(temp_file_path))
+
 
 # region _generated
 
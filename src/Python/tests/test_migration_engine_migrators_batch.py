@@ -32,4 +32,23 @@ class TestPyContentBatchMigrationResult(AutoFixtureTestBase):
         
         assert len(dotnet.ItemResults) != 0
         assert len(py.item_results) == len(dotnet.ItemResults)
-        assert py.item_results[0].manifest_entry.source.id == uuid.UUID(dotnet.ItemResults[0].ManifestEntry.Source.Id.ToString())
\ No newline at end of file
+        assert py.item_results[0].manifest_entry.source.id == uuid.UUID(dotnet.ItemResults[0].ManifestEntry.Source.Id.ToString())
+
+    def test_item_results_cached(self):
+        dotnet = self.create(IContentBatchMigrationResult[IUser])
+        
+        py = PyContentBatchMigrationResult[PyUser](dotnet)
+        
+        assert py.item_results is py.item_results
+        assert py.item_results[0] is py.item_results[0]
+
+    def test_item_results_failed_succeeded(self):
+        dotnet = self.create(IContentBatchMigrationResult[IUser])
+        
+        py = PyContentBatchMigrationResult[PyUser](dotnet)
+        results = py.item_results
+        
+        assert len(results.failed()) + len(results.succeeded()) == len(results)
+        assert all(not x.success for x in results.failed())
+        assert all(x.success for x in results.succeeded())
+        assert results.failed() is results.failed()
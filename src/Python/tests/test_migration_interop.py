@@ -0,0 +1,140 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from uuid import UUID, uuid4
+
+from tableau_migration import cancellation_token
+from tableau_migration.migration_content import PyUser
+from tableau_migration.migration_engine_hooks_filters_interop import _PyFilterWrapperBuilder, PyContentFilterBase
+from tableau_migration.migration_engine_hooks_mappings_interop import _PyMappingWrapperBuilder
+from tableau_migration.migration_engine_hooks_transformers_interop import _PyJsonTransformerWrapperBuilder, _PyTransformerWrapperBuilder
+from tableau_migration.migration_interop import (
+    _to_dotnet_guid,
+    _wrap_guid,
+    _WrapperTypeCache,
+    clear_wrapper_type_cache,
+    wrapper_type_cache_info
+)
+from tableau_migration.migration_paging import memory_pager
+
+from System import Guid
+from System.Collections.Generic import List as DotnetList
+from Tableau.Migration.Content import IUser
+
+from tests.helpers.autofixture import AutoFixtureTestBase
+
+class PyCachedUserFilter(PyContentFilterBase[PyUser]):
+    pass
+
+def filter_users(item) -> bool:
+    return True
+
+def transform_users(ctx):
+    return ctx
+
+class TestWrapperTypeCache(AutoFixtureTestBase):
+    def test_reuses_type_for_class(self):
+        first = _PyFilterWrapperBuilder(PyCachedUserFilter)
+        info = wrapper_type_cache_info()
+
+        second = _PyFilterWrapperBuilder(PyCachedUserFilter)
+
+        assert first.wrapper_type is second.wrapper_type
+        assert wrapper_type_cache_info().hits == info.hits + 1
+        assert wrapper_type_cache_info().misses == info.misses
+
+    def test_reuses_type_for_callback(self):
+        first = _PyFilterWrapperBuilder(PyUser, filter_users)
+        second = _PyFilterWrapperBuilder(PyUser, filter_users)
+
+        assert first.wrapper_type is second.wrapper_type
+
+    def test_stable_type_name(self):
+        builder = _PyMappingWrapperBuilder(PyUser, transform_users)
+
+        assert builder.wrapper_type.__name__.startswith("transform_users_InteropWrapper_PyUser")
+
+    def test_separates_builder_types(self):
+        transformer = _PyTransformerWrapperBuilder(PyUser, transform_users)
+        json_transformer = _PyJsonTransformerWrapperBuilder(PyUser, transform_users)
+        mapping = _PyMappingWrapperBuilder(PyUser, transform_users)
+
+        assert transformer.wrapper_type is not json_transformer.wrapper_type
+        assert transformer.wrapper_type is not mapping.wrapper_type
+        assert transformer.wrapper_type.__name__ != mapping.wrapper_type.__name__
+
+    def test_separates_callbacks(self):
+        first = _PyFilterWrapperBuilder(PyUser, lambda item: True)
+        second = _PyFilterWrapperBuilder(PyUser, lambda item: False)
+
+        assert first.wrapper_type is not second.wrapper_type
+
+    def test_clear(self):
+        first = _PyFilterWrapperBuilder(PyCachedUserFilter)
+
+        clear_wrapper_type_cache()
+        info = wrapper_type_cache_info()
+
+        assert info.hits == 0
+        assert info.misses == 0
+        assert info.size == 0
+
+        second = _PyFilterWrapperBuilder(PyCachedUserFilter)
+
+        assert first.wrapper_type is not second.wrapper_type
+        assert first.wrapper_type.__name__ != second.wrapper_type.__name__
+        assert wrapper_type_cache_info().misses == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = _WrapperTypeCache(max_size=2)
+
+        first = cache.get_or_add("first", "first", lambda name: type(name, (), {}))
+        cache.get_or_add("second", "second", lambda name: type(name, (), {}))
+        assert cache.get_or_add("first", "first", lambda name: type(name, (), {})) is first
+
+        cache.get_or_add("third", "third", lambda name: type(name, (), {}))
+
+        assert cache.info().size == 2
+        assert cache.get_or_add("first", "first", lambda name: type(name, (), {})) is first
+        assert cache.info().misses == 3
+        assert cache.get_or_add("second", "second", lambda name: type(name, (), {})) is not None
+        assert cache.info().misses == 4
+
+    def test_memory_pagers_keep_items(self):
+        first = memory_pager(PyUser, [PyUser(self.create(IUser))], 10)
+        second = memory_pager(PyUser, [PyUser(self.create(IUser)), PyUser(self.create(IUser))], 10)
+
+        assert type(first) is type(second)
+
+        assert len(first.NextPageAsync(cancellation_token).GetAwaiter().GetResult().Value) == 1
+        assert len(second.NextPageAsync(cancellation_token).GetAwaiter().GetResult().Value) == 2
+
+class TestGuidConversion():
+    def test_wrap_guid(self):
+        guid = Guid.NewGuid()
+
+        assert _wrap_guid(guid) == UUID(guid.ToString())
+        assert _wrap_guid(None) is None
+
+    def test_to_dotnet_guid(self):
+        uuid = uuid4()
+
+        assert _to_dotnet_guid(uuid).Equals(Guid.Parse(str(uuid)))
+        assert _to_dotnet_guid(None) is None
+
+    def test_round_trip(self):
+        uuid = uuid4()
+
+        assert _wrap_guid(_to_dotnet_guid(uuid)) == uuid
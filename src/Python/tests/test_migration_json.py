@@ -0,0 +1,89 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pytest
+
+from tableau_migration.migration_json import TrackedJsonDict, TrackedJsonDocument, TrackedJsonList
+
+_test_json = """{
+  "a": { "b": [1, { "c": 2 }] },
+  "d": [3],
+  "e": "f"
+}"""
+
+class TestTrackedJsonDocument():
+    def test_loads_tracked_containers(self):
+        doc = TrackedJsonDocument.loads(_test_json)
+
+        assert doc == json.loads(_test_json)
+        assert isinstance(doc["a"], TrackedJsonDict)
+        assert isinstance(doc["a"]["b"], TrackedJsonList)
+        assert isinstance(doc["a"]["b"][1], TrackedJsonDict)
+        assert not doc.is_changed
+
+    def test_loads_non_object(self):
+        with pytest.raises(TypeError):
+            TrackedJsonDocument.loads("[1, 2]")
+
+    def test_reads_unchanged(self):
+        doc = TrackedJsonDocument.loads(_test_json)
+
+        _ = doc["a"]["b"][1]["c"]
+        _ = list(doc.items())
+        json.dumps(doc)
+
+        assert not doc.is_changed
+
+    @pytest.mark.parametrize("change", [
+        lambda doc: doc["a"]["b"][1].__setitem__("c", 3),
+        lambda doc: doc["a"]["b"].append(4),
+        lambda doc: doc["a"]["b"].pop(),
+        lambda doc: doc["a"]["b"].sort(key=str),
+        lambda doc: doc["a"].update(x=1),
+        lambda doc: doc["a"].setdefault("x", 1),
+        lambda doc: doc["a"].clear(),
+        lambda doc: doc["a"].__delitem__("b"),
+    ])
+    def test_nested_changes(self, change):
+        doc = TrackedJsonDocument.loads(_test_json)
+
+        change(doc)
+
+        assert doc.changed_keys == {"a"}
+
+    def test_setdefault_existing_unchanged(self):
+        doc = TrackedJsonDocument.loads(_test_json)
+
+        doc.setdefault("e", "x")
+        doc["a"].setdefault("b", [])
+
+        assert not doc.is_changed
+
+    def test_top_level_changes(self):
+        doc = TrackedJsonDocument.loads(_test_json)
+
+        doc["e"] = "g"
+        del doc["d"]
+        doc.update(h=1)
+
+        assert doc.changed_keys == {"e", "d", "h"}
+
+    def test_clear(self):
+        doc = TrackedJsonDocument.loads(_test_json)
+
+        doc.clear()
+
+        assert doc.changed_keys == {"a", "d", "e"}
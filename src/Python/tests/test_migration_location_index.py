@@ -0,0 +1,104 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tableau_migration.migration import PyContentLocation, PyContentReference
+from tableau_migration.migration_location_index import LocationIndex, LocationMatch
+
+from tests.helpers.autofixture import AutoFixtureTestBase
+
+from Tableau.Migration import ContentLocation, IContentReference
+
+class TestLocationIndex(AutoFixtureTestBase):
+    def test_add_locations(self):
+        index = LocationIndex(["Parent/Child", PyContentLocation.from_path("Other", "/"), ContentLocation.FromPath("A/B", "/"), ("X", "Y")])
+
+        assert len(index) == 4
+        assert "Parent/Child" in index
+        assert ("Other",) in index
+        assert PyContentLocation.from_path("A/B", "/") in index
+        assert ["X", "Y"] in index
+        assert "Parent" not in index
+
+    def test_add_replaces_value(self):
+        index = LocationIndex({"Parent": 1})
+        index.add("Parent", 2)
+
+        assert len(index) == 1
+        assert index.get("Parent") == 2
+
+    def test_case_insensitive(self):
+        index = LocationIndex({"Parent/Child": 1})
+
+        assert index.get("parent/CHILD") == 1
+        assert list(index) == [LocationMatch(("Parent", "Child"), 1)]
+
+    def test_case_insensitive_ordinal(self):
+        index = LocationIndex({"Straße": 1})
+
+        assert index.get("STRAßE") == 1
+        assert index.get("STRASSE") is None
+
+    def test_get_default(self):
+        index = LocationIndex({"Parent/Child": 1})
+
+        assert index.get("Parent") is None
+        assert index.get("Other", 2) == 2
+
+    def test_find_ancestor(self):
+        index = LocationIndex({"Parent": 1, "Parent/Child/Grandchild": 2})
+
+        assert index.find_ancestor("Parent/Child/Grandchild/Workbook") == LocationMatch(("Parent", "Child", "Grandchild"), 2)
+        assert index.find_ancestor("Parent/Child/Workbook") == LocationMatch(("Parent",), 1)
+        assert index.find_ancestor("Parent") == LocationMatch(("Parent",), 1)
+        assert index.find_ancestor("Parent", include_self=False) is None
+        assert index.find_ancestor("Other/Parent") is None
+
+    def test_has_ancestor(self):
+        index = LocationIndex(["Parent/Child"])
+
+        assert index.has_ancestor("Parent/Child/Workbook")
+        assert index.has_ancestor("Parent/Child")
+        assert not index.has_ancestor("Parent/Child", include_self=False)
+        assert not index.has_ancestor("Parent/Other")
+
+    def test_has_descendant(self):
+        index = LocationIndex(["Parent/Child/Grandchild"])
+
+        assert index.has_descendant("Parent")
+        assert index.has_descendant("Parent/Child")
+        assert not index.has_descendant("Parent/Child/Grandchild")
+        assert not index.has_descendant("Other")
+
+    def test_path_separator(self):
+        index = LocationIndex(["Parent|Child"], path_separator="|")
+
+        assert ("Parent", "Child") in index
+
+    def test_from_references(self):
+        references = [PyContentReference(self.create(IContentReference)) for _ in range(3)]
+
+        index = LocationIndex.from_references(references)
+
+        assert len(index) == 3
+        for reference in references:
+            assert index.get(reference.location) is reference
+
+    def test_escaped_segments(self):
+        location = ContentLocation.FromPath("Parent/A\\/B/Child", "/")
+        index = LocationIndex([location])
+
+        assert ("Parent", "A/B", "Child") in index
+        assert index.has_ancestor(location.Append("Grandchild"))
+
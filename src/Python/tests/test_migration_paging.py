@@ -17,7 +17,7 @@ import pytest
 
 from tableau_migration import cancellation_token
 from tableau_migration.migration_content import PyUser
-from tableau_migration.migration_paging import empty_pager, memory_pager
+from tableau_migration.migration_paging import empty_pager, memory_pager, streaming_pager
 
 from Tableau.Migration.Content import IUser
 from Tableau.Migration.Paging import IPager
@@ -52,4 +52,88 @@ class TestMemoryPager(AutoFixtureTestBase):
         assert page is not None
 
         assert page.PageSize == 50
-        assert len(page.Value) == len(items)
\ No newline at end of file
+        assert len(page.Value) == len(items)
+
+    def test_memory_pager_pages(self):
+        items = [PyUser(self.create(IUser)) for _ in range(5)]
+
+        pager = memory_pager(PyUser, items, 2)
+
+        pages = [pager.NextPageAsync(cancellation_token).GetAwaiter().GetResult() for _ in range(3)]
+
+        assert [[u.Id for u in page.Value] for page in pages] == [[i._dotnet.Id for i in items[0:2]], [i._dotnet.Id for i in items[2:4]], [items[4]._dotnet.Id]]
+        assert [page.FetchedAllPages for page in pages] == [False, False, True]
+
+class TestStreamingPager(AutoFixtureTestBase):
+    def _next_page(self, pager):
+        return pager.NextPageAsync(cancellation_token).GetAwaiter().GetResult()
+
+    def test_creates_streaming_pager(self):
+        items = [PyUser(self.create(IUser)), PyUser(self.create(IUser)), PyUser(self.create(IUser))]
+
+        pager = streaming_pager(PyUser, items, 50)
+
+        assert pager is not None
+        assert isinstance(pager, IPager[IUser])
+
+        page = self._next_page(pager)
+
+        assert page.PageSize == 50
+        assert page.TotalCount == len(items)
+        assert len(page.Value) == len(items)
+        assert page.FetchedAllPages
+
+    def test_pages_generator_on_demand(self):
+        items = [PyUser(self.create(IUser)) for _ in range(5)]
+        consumed = []
+
+        def generate():
+            for item in items:
+                consumed.append(item)
+                yield item
+
+        pager = streaming_pager(PyUser, generate(), 2)
+
+        assert consumed == []
+
+        first = self._next_page(pager)
+
+        assert [u.Id for u in first.Value] == [i._dotnet.Id for i in items[0:2]]
+        assert first.PageNumber == 1
+        assert first.TotalCount == 2
+        assert not first.FetchedAllPages
+        assert len(consumed) == 2
+
+        second = self._next_page(pager)
+        third = self._next_page(pager)
+
+        assert [u.Id for u in second.Value] == [i._dotnet.Id for i in items[2:4]]
+        assert [u.Id for u in third.Value] == [items[4]._dotnet.Id]
+        assert third.PageNumber == 3
+        assert third.TotalCount == 5
+        assert third.FetchedAllPages
+
+    def test_total_count(self):
+        items = (PyUser(self.create(IUser)) for _ in range(4))
+
+        pager = streaming_pager(PyUser, items, 2, total_count=4)
+
+        first = self._next_page(pager)
+        second = self._next_page(pager)
+
+        assert first.TotalCount == 4
+        assert not first.FetchedAllPages
+        assert second.TotalCount == 4
+        assert second.FetchedAllPages
+
+    def test_empty(self):
+        pager = streaming_pager(PyUser, iter([]), 10)
+
+        page = self._next_page(pager)
+
+        assert len(page.Value) == 0
+        assert page.FetchedAllPages
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            streaming_pager(PyUser, [], 0)
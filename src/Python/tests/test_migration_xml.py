@@ -0,0 +1,110 @@
+# Copyright (c) 2026, Salesforce, Inc.
+# SPDX-License-Identifier: Apache-2
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from tableau_migration.migration_xml import PyXmlElement
+
+from System.Xml.Linq import LoadOptions, XDocument
+
+_USER_NS = "http://www.tableausoftware.com/xml/user"
+
+_test_xml = f"""<workbook version='18.1' xmlns:user='{_USER_NS}'>
+  <datasources>
+    <datasource name='a' user:caption='A'>
+      <column name='x' datatype='string' />
+      <column name='y' datatype='integer' />
+    </datasource>
+    <datasource name='b' />
+  </datasources>
+  <user:test>text</user:test>
+</workbook>"""
+
+def _load() -> tuple[XDocument, PyXmlElement]:
+    xml = XDocument.Parse(_test_xml, LoadOptions.PreserveWhitespace)
+    return xml, PyXmlElement(xml.Root)
+
+class TestPyXmlElement():
+    def test_tag(self):
+        _, root = _load()
+
+        assert root.tag == "workbook"
+        assert root.find("user:test", {"user": _USER_NS}).tag == f"{{{_USER_NS}}}test"
+
+    def test_get_set_attributes(self):
+        xml, root = _load()
+
+        datasource = root.find("datasources/datasource[@name='a']")
+        assert datasource.get("name") == "a"
+        assert datasource.get("missing", "default") == "default"
+        assert datasource.get("user:caption", namespaces={"user": _USER_NS}) == "A"
+        assert datasource.get(f"{{{_USER_NS}}}caption") == "A"
+
+        datasource.set("name", "c")
+        datasource.set(f"{{{_USER_NS}}}caption", None)
+
+        assert xml.Root.Element("datasources").Element("datasource").Attribute("name").Value == "c"
+        assert datasource.attrib == {"name": "c"}
+
+    def test_find_expanded_name(self):
+        _, root = _load()
+
+        assert root.findtext(f"{{{_USER_NS}}}test") == "text"
+        assert root.findtext("missing", "default") == "default"
+
+    def test_findall(self):
+        _, root = _load()
+
+        columns = root.findall(".//column")
+        assert [c.get("name") for c in columns] == ["x", "y"]
+        assert all(c.parent.get("name") == "a" for c in columns)
+
+    def test_iter(self):
+        _, root = _load()
+
+        assert [e.get("name") for e in root.iter("datasource")] == ["a", "b"]
+        assert next(root.iter()) == root
+        assert len(list(root.iter("*"))) == 7
+
+    def test_children(self):
+        _, root = _load()
+
+        datasources = root.find("datasources")
+        assert len(datasources) == 2
+        assert [d.get("name") for d in datasources] == ["a", "b"]
+
+    def test_add_remove_element(self):
+        xml, root = _load()
+
+        datasources = root.find("datasources")
+        added = datasources.add_element("datasource", {"name": "c"})
+
+        assert added.parent == datasources
+        assert xml.Root.Element("datasources").LastNode.Equals(added._dotnet)
+
+        datasources.remove(added)
+        assert [d.get("name") for d in datasources] == ["a", "b"]
+
+        with pytest.raises(ValueError):
+            root.remove(datasources.find("datasource"))
+
+    def test_text(self):
+        _, root = _load()
+
+        test = root.find("user:test", {"user": _USER_NS})
+        assert test.text == "text"
+
+        test.text = "changed"
+        assert test.to_string() == f'<user:test xmlns:user="{_USER_NS}">changed</user:test>'
@@ -15,7 +15,14 @@
 
 import os
 import logging
+import subprocess
+import sys
+import textwrap
+from importlib import import_module
+
+import tableau_migration
 from tableau_migration import _logger_names
+from tableau_migration.migration_logger import MigrationLogger, refresh_log_levels, start_queued_logging, stop_queued_logging
 from tableau_migration.migration import (
     get_service_provider,
     get_service
@@ -24,6 +31,7 @@ from tableau_migration.migration import (
 from tableau_migration.migration_engine import (
     PyMigrationPlanBuilder)
 
+from Microsoft.Extensions.Logging import EventId, LogLevel
 from Tableau.Migration.Config import IConfigReader
 from Tableau.Migration.Content import IUser
 from Tableau.Migration.Content import IWorkbook
@@ -57,6 +65,56 @@ class TestLogging():
             # Given that we have a name, we should have a logger
             assert logging.getLogger(name)            
 
+    def test_queued_logging(self):
+        records = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        python_logger = logging.getLogger("test_queued_logging")
+        python_logger.setLevel(logging.WARNING)
+        python_logger.addHandler(ListHandler())
+
+        logger = MigrationLogger("test_queued_logging")
+
+        start_queued_logging()
+        try:
+            assert logger.Buffer is not None
+            assert not logger.IsEnabled(LogLevel.Information)
+
+            logger.Log(LogLevel.Information, EventId(0), "info", None, "info")
+            logger.Log(LogLevel.Warning, EventId(0), "warning", None, "warning")
+        finally:
+            stop_queued_logging()
+
+        assert logger.Buffer is None
+        assert [r.getMessage() for r in records] == ["warning"]
+        assert records[0].levelno == logging.WARNING
+
+    def test_direct_logging_levels(self):
+        records = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        python_logger = logging.getLogger("test_direct_logging_levels")
+        python_logger.setLevel(logging.WARNING)
+        python_logger.addHandler(ListHandler())
+
+        logger = MigrationLogger("test_direct_logging_levels")
+        refresh_log_levels()
+
+        assert logger.Buffer is None
+        assert logger.IsEnabled(LogLevel.Trace)
+
+        logger.Log(LogLevel.Debug, EventId(0), "hidden", None, "hidden")
+        python_logger.setLevel(logging.DEBUG)
+        logger.Log(LogLevel.Debug, EventId(0), "debug", None, "debug")
+
+        assert [r.getMessage() for r in records] == ["debug"]
+
 class TestConfig():
     def test_config(self):
         '''
@@ -73,3 +131,75 @@ class TestConfig():
         batch_size = config_reader.Get[IUser]().BatchSize
 
         assert batch_size == 102
+
+class TestLazyImport():
+    def _run_lazy(self, script: str) -> subprocess.CompletedProcess:
+        env = dict(os.environ)
+        env["TABLEAU_MIGRATION_LAZY_IMPORT"] = "1"
+        env["PYTHONPATH"] = os.pathsep.join(sys.path)
+
+        return subprocess.run([sys.executable, "-c", textwrap.dedent(script)], env=env, capture_output=True, text=True)
+
+    def test_exports_match_eager_imports(self):
+        exports = tableau_migration._get_exports()
+
+        assert "MigrationPlanBuilder" in exports
+        assert "IUser" in exports
+
+        for name, (module_name, member_name) in exports.items():
+            assert getattr(tableau_migration, name) is getattr(import_module(module_name), member_name)
+
+    def test_defers_imports_and_services(self):
+        result = self._run_lazy("""
+            import sys
+            import tableau_migration
+
+            assert tableau_migration._lazy_import
+            assert tableau_migration._services is None
+            assert "tableau_migration.migration_engine" not in sys.modules
+            assert "MigrationPlanBuilder" in dir(tableau_migration)
+
+            from tableau_migration import MigrationPlanBuilder
+            from tableau_migration.migration_engine import PyMigrationPlanBuilder
+
+            assert MigrationPlanBuilder is PyMigrationPlanBuilder
+            assert tableau_migration._services is None
+
+            MigrationPlanBuilder()
+
+            assert tableau_migration._services is not None
+        """)
+
+        assert result.returncode == 0, result.stderr
+
+    def test_unknown_name(self):
+        result = self._run_lazy("""
+            import tableau_migration
+
+            try:
+                tableau_migration.NotAnExport
+            except AttributeError:
+                pass
+            else:
+                raise AssertionError()
+        """)
+
+        assert result.returncode == 0, result.stderr
+
+    def test_wrapper_lookup_loads_exports(self):
+        result = self._run_lazy("""
+            import sys
+            import tableau_migration
+            from tableau_migration.migration import _generic_wrapper_type
+
+            from Tableau.Migration.Content import IUser
+
+            assert "tableau_migration.migration_content" not in sys.modules
+
+            wrapper_type = _generic_wrapper_type(IUser)
+
+            assert wrapper_type is not None
+            assert wrapper_type.__name__ == "PyUser"
+        """)
+
+        assert result.returncode == 0, result.stderr
@@ -26,5 +26,9 @@ namespace Tableau.Migration.PythonGenerator.Config.Hints
         public string[] ExcludeMembers { get; set; } = Array.Empty<string>();
 
         public string[] ExcludeInheritedTypes { get; set; } = Array.Empty<string>();
+
+        public string[] Slots { get; set; } = Array.Empty<string>();
+
+        public string[] CachedProperties { get; set; } = Array.Empty<string>();
     }
 }
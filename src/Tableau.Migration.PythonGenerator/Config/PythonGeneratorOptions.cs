@@ -26,5 +26,10 @@ namespace Tableau.Migration.PythonGenerator.Config
         public string OutputPath { get; set; } = string.Empty;
 
         public GeneratorHints Hints { get; set; } = new();
+
+        /// <summary>
+        /// Gets or sets whether wrapper classes declare <c>__slots__</c>, so wrapper objects do not have a per-instance <c>__dict__</c>.
+        /// </summary>
+        public bool EmitSlots { get; set; }
     }
 }
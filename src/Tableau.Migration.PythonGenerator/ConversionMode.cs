@@ -25,6 +25,8 @@ namespace Tableau.Migration.PythonGenerator
 
         WrapSerialized,
 
+        WrapGuid,
+
         WrapGeneric,
 
         Enum,
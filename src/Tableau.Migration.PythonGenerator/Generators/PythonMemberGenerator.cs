@@ -36,10 +36,13 @@ namespace Tableau.Migration.PythonGenerator.Generators
         private static readonly PythonTypeReference UUID = new(
             Py.Types.UUID,
             ImportModule: Py.Modules.UUID,
-            ConversionMode.WrapSerialized,
-            DotNetParseFunction: "Guid.Parse",
+            ConversionMode.WrapGuid,
+            WrapType: "_wrap_guid",
+            DotNetParseFunction: "_to_dotnet_guid",
             ExtraImports: ImmutableArray.Create(
-                new PythonTypeReference(Dotnet.Types.GUID, ImportModule: Dotnet.Namespaces.SYSTEM, ConversionMode.Direct)));
+                new PythonTypeReference(Dotnet.Types.GUID, ImportModule: Dotnet.Namespaces.SYSTEM, ConversionMode.Direct),
+                new PythonTypeReference("_to_dotnet_guid", ImportModule: "tableau_migration.migration_interop", ConversionMode.Direct),
+                new PythonTypeReference("_wrap_guid", ImportModule: "tableau_migration.migration_interop", ConversionMode.Direct)));
 
         internal static readonly PythonTypeReference LIST_REFERENCE = new PythonTypeReference(
             Dotnet.Types.LIST,
@@ -59,6 +62,11 @@ namespace Tableau.Migration.PythonGenerator.Generators
             ConversionMode: ConversionMode.Direct,
             ImportAlias: Dotnet.TypeAliases.STRING);
 
+        private static readonly PythonTypeReference LAZY_SEQUENCE = new(
+            "_lazy_sequence",
+            ImportModule: "tableau_migration.migration",
+            ConversionMode.Direct);
+
         private static readonly PythonTypeReference EXCEPTION = new(
             Dotnet.Namespaces.SYSTEM_EXCEPTION,
             Dotnet.Namespaces.SYSTEM,
@@ -81,6 +89,12 @@ namespace Tableau.Migration.PythonGenerator.Generators
             _options = options.Value;
         }
 
+        protected bool IsCachedMember(ITypeSymbol type, ISymbol member)
+        {
+            var typeHints = _options.Hints.ForType(type);
+            return typeHints is not null && typeHints.CachedProperties.Contains(member.Name);
+        }
+
         protected bool IgnoreMember(ITypeSymbol type, ISymbol member)
         {
             if(member.DeclaredAccessibility is not Accessibility.Public)
@@ -188,12 +202,15 @@ namespace Tableau.Migration.PythonGenerator.Generators
                 case nameof(IImmutableList<int>):
                 case nameof(IReadOnlyList<int>):
                 case nameof(IEnumerable<int>):
+                    var immutableGenericTypes = GetGenericTypes(t);
                     return new(
                         Py.Types.SEQUENCE,
                         ImportModule: Py.Modules.TYPING,
                         ConversionMode.WrapImmutableCollection,
                         WrapType: "list",
-                        GenericTypes: GetGenericTypes(t));
+                        GenericTypes: immutableGenericTypes,
+                        ExtraImports: immutableGenericTypes?.Any(g => g.ConversionMode is not ConversionMode.Direct) == true
+                            ? ImmutableArray.Create(LAZY_SEQUENCE) : null);
                 case Dotnet.Types.INT:
                 case nameof(Int32):
                 case Dotnet.Types.LONG:
@@ -80,8 +80,10 @@ namespace Tableau.Migration.PythonGenerator.Generators
                 var type = ToPythonType(dotNetMemberType);
                 var docs = _docGenerator.Generate(dotNetMember);
 
+                var isCached = hasGetter && !isStatic && IsCachedMember(dotNetType, dotNetMember);
+
                 var pyProperty = new PythonProperty(dotNetMember.Name.ToSnakeCase(), type,
-                    hasGetter, hasSetter, isStatic, docs, dotNetMember, dotNetMemberType);
+                    hasGetter, hasSetter, isStatic, docs, dotNetMember, dotNetMemberType, isCached);
 
                 results.Add(pyProperty);
             }
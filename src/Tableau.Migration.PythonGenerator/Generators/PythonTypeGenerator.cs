@@ -27,6 +27,8 @@ namespace Tableau.Migration.PythonGenerator.Generators
 {
     internal sealed class PythonTypeGenerator : IPythonTypeGenerator
     {
+        internal static readonly PythonTypeReference WRAPPER_BASE_REFERENCE = new("_PyWrapperBase", "tableau_migration.migration_interop", ConversionMode.Direct);
+
         private readonly PythonGeneratorOptions _options;
         private readonly IPythonPropertyGenerator _propertyGenerator;
         private readonly IPythonMethodGenerator _methodGenerator;
@@ -139,6 +141,13 @@ namespace Tableau.Migration.PythonGenerator.Generators
 
             inheritedTypes.AddRange(interfaces.Select(PythonTypeReference.ForDotNetType));
 
+            // Slotted wrapper classes without a wrapper base class share a common base that declares the _dotnet slot,
+            // so that classes with multiple base classes do not have conflicting slot layouts.
+            if (_options.EmitSlots && !dotNetType.IsAnyEnum() && inheritedTypes.All(t => t.Name == "Generic"))
+            {
+                inheritedTypes.Add(WRAPPER_BASE_REFERENCE);
+            }
+
             return (inheritedTypes.ToImmutable(), excludedInterfaces.ToImmutable());
         }
 
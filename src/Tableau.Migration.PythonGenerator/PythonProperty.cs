@@ -20,6 +20,6 @@ using Microsoft.CodeAnalysis;
 namespace Tableau.Migration.PythonGenerator
 {
     internal sealed record PythonProperty(string Name, PythonTypeReference Type, bool Getter, bool Setter,
-        bool IsStatic, PythonDocstring? Documentation, ISymbol DotNetProperty, ITypeSymbol DotNetPropertyType)
+        bool IsStatic, PythonDocstring? Documentation, ISymbol DotNetProperty, ITypeSymbol DotNetPropertyType, bool IsCached = false)
     { }
 }
@@ -63,6 +63,9 @@ namespace Tableau.Migration.PythonGenerator.Writers
                     return BuildWrapExpression(expression, wrapCtor, expression);
                 case ConversionMode.WrapSerialized:
                     return BuildWrapExpression(expression, wrapCtor, $"{expression}.ToString()");
+                case ConversionMode.WrapGuid:
+                    // The conversion function handles None, so the .NET property is only read once.
+                    return $"{wrapCtor}({expression})";
                 case ConversionMode.WrapGeneric:
                     return BuildWrapExpression(expression, "_generic_wrapper", expression);
                 case ConversionMode.WrapImmutableCollection:
@@ -121,6 +124,36 @@ namespace Tableau.Migration.PythonGenerator.Writers
             }
         }
 
+        // Converts without the interop conversion functions, so generated tests check them against an independent conversion.
+        protected static string ToSerializedPythonType(PythonTypeReference typeRef, string expression)
+        {
+            var valueType = typeRef.ConversionMode is ConversionMode.Optional && typeRef.GenericTypes?.Length == 1
+                ? typeRef.GenericTypes.Value[0]
+                : typeRef;
+
+            return valueType.ConversionMode is ConversionMode.WrapGuid
+                ? BuildWrapExpression(expression, valueType.Name, $"{expression}.ToString()")
+                : ToPythonType(typeRef, expression);
+        }
+
+        protected static string? ToLazyPythonSequence(PythonTypeReference typeRef, string cacheName, string expression)
+        {
+            if (typeRef.ConversionMode is not ConversionMode.WrapImmutableCollection ||
+                typeRef.GenericTypes is null || typeRef.GenericTypes.Value.Length != 1)
+            {
+                return null;
+            }
+
+            var itemType = typeRef.GenericTypes.Value[0];
+            if (itemType.ConversionMode is ConversionMode.Direct)
+            {
+                return null;
+            }
+
+            var itemExpression = ToPythonType(itemType, "x");
+            return $"_lazy_sequence(self, \"{cacheName}\", {expression}, lambda x: {itemExpression})";
+        }
+
         protected static string ToDotNetType(PythonTypeReference typeRef, string expression, bool skipNoneCheck = false)
         {
             switch (typeRef.ConversionMode)
@@ -135,6 +168,8 @@ namespace Tableau.Migration.PythonGenerator.Writers
                         return BuildWrapExpression(expression, $"{expression}.{PythonTypeWriter.DOTNET_OBJECT}");
                 case ConversionMode.WrapSerialized:
                     return BuildWrapExpression(expression, typeRef.DotNetParseFunction!, $"str({expression})");
+                case ConversionMode.WrapGuid:
+                    return $"{typeRef.DotNetParseFunction}({expression})";
                 case ConversionMode.WrapTimeOnly:
                     return BuildWrapExpression(expression, typeRef.DotNetParseFunction!, $"str({expression})");
                 case ConversionMode.Optional:
@@ -140,7 +140,7 @@ namespace Tableau.Migration.PythonGenerator.Writers
 
                         builder.AppendLine();
 
-                        var wrapExp = ToPythonType(typeRef, "testValue");
+                        var wrapExp = ToSerializedPythonType(typeRef, "testValue");
                         builder.AppendLine("# set property to new test value");
                         if (property.IsStatic)
                         {
@@ -187,10 +187,11 @@ namespace Tableau.Migration.PythonGenerator.Writers
                     break;
                 case ConversionMode.Wrap:
                 case ConversionMode.WrapSerialized:
+                case ConversionMode.WrapGuid:
                 case ConversionMode.WrapGeneric:
                 case ConversionMode.Direct:
                 default:
-                    var wrapExp = ToPythonType(typeRef, dotnetPropValue);
+                    var wrapExp = ToSerializedPythonType(typeRef, dotnetPropValue);
                     builder.AppendLine($"assert {pythonPropValue} == {wrapExp}");
                     break;
             }
@@ -78,6 +78,7 @@ namespace Tableau.Migration.PythonGenerator.Writers
                 using (var setterBuilder = builder.AppendLineAndIndent($"def {setterPrefix}{property.Name}({thisParam}, {paramName}: {typeDeclaration}) -> None:"))
                 {
                     BuildSetterBody(type, property, setterBuilder, paramName);
+                    BuildCacheInvalidation(setterBuilder, property);
                 }
 
                 builder.AppendLine();
@@ -88,11 +89,49 @@ namespace Tableau.Migration.PythonGenerator.Writers
         {
             _docWriter.Write(getterBuilder, property.Documentation);
 
-            var getterExpression = ToPythonType(property.Type, DotNetPropertyInvocation(type, property));
+            var dotNetInvocation = DotNetPropertyInvocation(type, property);
+
+            var getterExpression = (property.IsStatic ? null : ToLazyPythonSequence(property.Type, property.DotNetProperty.Name, dotNetInvocation))
+                ?? ToPythonType(property.Type, dotNetInvocation);
+
+            if (property.IsCached)
+            {
+                // Cached properties convert the .NET value once per wrapper object, until the setter is called.
+                var cacheAttribute = $"self.{CacheAttributeName(property)}";
+
+                using (var tryBuilder = getterBuilder.AppendLineAndIndent("try:"))
+                {
+                    tryBuilder.AppendLine($"return {cacheAttribute}");
+                }
+
+                using (var exceptBuilder = getterBuilder.AppendLineAndIndent("except AttributeError:"))
+                {
+                    exceptBuilder.AppendLine($"value = {cacheAttribute} = {getterExpression}");
+                    exceptBuilder.AppendLine("return value");
+                }
+
+                return;
+            }
 
             getterBuilder.AppendLine($"return {getterExpression}");
         }
 
+        internal static string CacheAttributeName(PythonProperty property) => $"_cached_{property.Name}";
+
+        private static void BuildCacheInvalidation(IndentingStringBuilder setterBuilder, PythonProperty property)
+        {
+            if (!property.IsCached)
+            {
+                return;
+            }
+
+            var cacheAttribute = $"self.{CacheAttributeName(property)}";
+            BuildIfBlock(setterBuilder, $"hasattr(self, \"{CacheAttributeName(property)}\")", (builder) =>
+            {
+                builder.AppendLine($"del {cacheAttribute}");
+            });
+        }
+
         private static string DotNetPropertyReference(PythonType type, PythonProperty property)
             => property.IsStatic ? DotNetTypeName(type) : $"self.{PythonTypeWriter.DOTNET_OBJECT}";
 
@@ -15,7 +15,10 @@
 //  limitations under the License.
 //
 
+using System;
 using System.Linq;
+using Microsoft.Extensions.Options;
+using Tableau.Migration.PythonGenerator.Config;
 
 namespace Tableau.Migration.PythonGenerator.Writers
 {
@@ -24,16 +27,19 @@ namespace Tableau.Migration.PythonGenerator.Writers
         internal const string DOTNET_OBJECT = "_dotnet";
         private const string DOTNET_BASE = "_dotnet_base";
 
+        private readonly PythonGeneratorOptions _options;
         private readonly IPythonDocstringWriter _docWriter;
         private readonly IPythonPropertyWriter _propertyWriter;
         private readonly IPythonMethodWriter _methodWriter;
         private readonly IPythonEnumValueWriter _enumValueWriter;
 
-        public PythonTypeWriter(IPythonDocstringWriter docWriter,
+        public PythonTypeWriter(IOptions<PythonGeneratorOptions> options,
+            IPythonDocstringWriter docWriter,
             IPythonPropertyWriter propertyWriter,
             IPythonMethodWriter methodWriter,
             IPythonEnumValueWriter enumValueWriter)
         {
+            _options = options.Value;
             _docWriter = docWriter;
             _propertyWriter = propertyWriter;
             _methodWriter = methodWriter;
@@ -48,6 +54,27 @@ namespace Tableau.Migration.PythonGenerator.Writers
             return dotNetTypeName.ToSnakeCase();
         }
 
+        private void WriteSlots(IndentingStringBuilder classBuilder, PythonType type)
+        {
+            var hintSlots = _options.Hints.ForType(type.DotNetType)?.Slots ?? Array.Empty<string>();
+            var slots = hintSlots
+                .Concat(type.Properties.Where(p => p.IsCached).Select(PythonPropertyWriter.CacheAttributeName))
+                .ToArray();
+
+            if (_options.EmitSlots)
+            {
+                // The _dotnet slot is declared by the shared wrapper base class.
+                var slotNames = slots.Select(s => $"\"{s}\"");
+                var trailingComma = slots.Length == 1 ? "," : string.Empty;
+                classBuilder.AppendLine($"__slots__ = ({string.Join(", ", slotNames)}{trailingComma})");
+            }
+            else if (hintSlots.Length != 0)
+            {
+                var slotNames = new[] { DOTNET_OBJECT }.Concat(slots).Select(s => $"\"{s}\"");
+                classBuilder.AppendLine($"__slots__ = ({string.Join(", ", slotNames)})");
+            }
+        }
+
         public void Write(IndentingStringBuilder builder, PythonType type)
         {
             var inheritedTypeNames = type.InheritedTypes.Select(t => t.GenericDefinitionName);
@@ -70,6 +97,9 @@ namespace Tableau.Migration.PythonGenerator.Writers
                     var dotNetType = type.DotNetType.Name;
 
                     classBuilder.AppendLine($"{DOTNET_BASE} = {dotNetType}");
+
+                    WriteSlots(classBuilder, type);
+
                     classBuilder.AppendLine();
 
                     var dotNetParam = ToParamName(dotNetType);
@@ -115,8 +115,8 @@ namespace Tableau.Migration.PythonGenerator.Writers
 
         private async Task WritePublicAliasesAsync(IEnumerable<PythonType> moduleTypes, CancellationToken cancel)
         {
-            var initFilePath = Path.Combine(_options.OutputPath, "__init__.py");
-            await using var segment = await GeneratedPythonSegment.OpenAsync(initFilePath, cancel);
+            var exportsFilePath = Path.Combine(_options.OutputPath, "migration_exports.py");
+            await using var segment = await GeneratedPythonSegment.OpenAsync(exportsFilePath, cancel);
 
             foreach (var type in moduleTypes.OrderBy(x => x.Module).ThenBy(x => x.Name))
             {
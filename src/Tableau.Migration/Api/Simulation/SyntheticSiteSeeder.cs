@@ -0,0 +1,292 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Tableau.Migration.Api.Rest.Models;
+using Tableau.Migration.Api.Rest.Models.Responses;
+using Tableau.Migration.Api.Rest.Models.Types;
+using Tableau.Migration.Content.Permissions;
+
+using ServerResponse = Tableau.Migration.Api.Rest.Models.Responses.Server;
+
+namespace Tableau.Migration.Api.Simulation
+{
+    /// <summary>
+    /// Seeds an API simulator with a synthetic Tableau Server site, for example to benchmark migrations without a real server.
+    /// </summary>
+    public static class SyntheticSiteSeeder
+    {
+        /// <summary>
+        /// The number of projects nested under each top-level project.
+        /// </summary>
+        public const int ProjectsPerTopLevelProject = 10;
+
+        /// <summary>
+        /// Seeds a simulator with synthetic content.
+        /// Every user is added to one group, and data sources and workbooks are spread over the projects.
+        /// </summary>
+        /// <param name="simulator">The API simulator to seed.</param>
+        /// <param name="users">The number of users to create.</param>
+        /// <param name="groups">The number of groups to create.</param>
+        /// <param name="projects">The number of projects to create.</param>
+        /// <param name="dataSources">The number of data sources to create.</param>
+        /// <param name="workbooks">The number of workbooks to create, each with a single view.</param>
+        /// <param name="extractRefreshTasks">
+        /// The number of extract refresh tasks to create, 
+        /// alternating between data sources and workbooks when both exist.
+        /// </param>
+        public static void Seed(TableauApiSimulator simulator, int users, int groups, int projects,
+            int dataSources, int workbooks, int extractRefreshTasks)
+        {
+            ArgumentNullException.ThrowIfNull(simulator);
+
+            var data = simulator.Data;
+
+            var seededUsers = SeedUsers(data, users);
+            SeedGroups(data, groups, seededUsers);
+
+            var ownerIds = seededUsers.Count > 0
+                ? seededUsers.Select(u => u.Id).ToArray()
+                : [data.SignIn?.User?.Id ?? Guid.Empty];
+
+            var seededProjects = SeedProjects(data, projects, ownerIds);
+            if (seededProjects.Count == 0)
+            {
+                seededProjects.Add(data.DefaultProject);
+            }
+
+            var seededDataSources = SeedDataSources(data, dataSources, seededProjects, ownerIds);
+            var seededWorkbooks = SeedWorkbooks(data, workbooks, seededProjects, ownerIds);
+
+            SeedExtractRefreshTasks(data, extractRefreshTasks, seededDataSources, seededWorkbooks);
+        }
+
+        private static List<UsersResponse.UserType> SeedUsers(TableauData data, int count)
+        {
+            var siteRoles = SiteRoles.GetAll().Where(r => r != SiteRoles.SupportUser).ToArray();
+            var users = new List<UsersResponse.UserType>(count);
+
+            for (var i = 0; i < count; i++)
+            {
+                var user = data.AddUser(new UsersResponse.UserType
+                {
+                    Id = Guid.NewGuid(),
+                    Name = $"user{i}",
+                    FullName = $"User {i}",
+                    Email = $"user{i}@example.com",
+                    SiteRole = siteRoles[i % siteRoles.Length],
+                    Domain = new() { Name = Constants.LocalDomain }
+                });
+
+                users.Add(user);
+            }
+
+            return users;
+        }
+
+        private static void SeedGroups(TableauData data, int count, List<UsersResponse.UserType> users)
+        {
+            var groups = new List<GroupsResponse.GroupType>(count);
+
+            for (var i = 0; i < count; i++)
+            {
+                var group = new GroupsResponse.GroupType
+                {
+                    Id = Guid.NewGuid(),
+                    Name = $"group{i}",
+                    Domain = new() { Name = Constants.LocalDomain }
+                };
+
+                data.AddGroup(group);
+                groups.Add(group);
+            }
+
+            if (groups.Count == 0)
+            {
+                return;
+            }
+
+            for (var i = 0; i < users.Count; i++)
+            {
+                data.AddUserToGroup(users[i].Id, groups[i % groups.Count].Id);
+            }
+        }
+
+        private static List<ProjectsResponse.ProjectType> SeedProjects(TableauData data, int count, Guid[] ownerIds)
+        {
+            var projects = new List<ProjectsResponse.ProjectType>(count);
+
+            for (var i = 0; i < count; i++)
+            {
+                var project = new ProjectsResponse.ProjectType
+                {
+                    Id = Guid.NewGuid(),
+                    Name = $"project{i}",
+                    Description = $"Synthetic project {i}",
+                    ContentPermissions = ContentPermissions.ManagedByOwner,
+                    Owner = new() { Id = ownerIds[i % ownerIds.Length] }
+                };
+
+                var parentProject = i % ProjectsPerTopLevelProject == 0 ? null : projects[i - i % ProjectsPerTopLevelProject];
+                project.ParentProjectId = parentProject?.Id.ToString();
+
+                data.AddProject(project);
+                data.AddProjectPermissions(project, new PermissionsType());
+
+                foreach (var contentType in DefaultPermissionsContentTypeUrlSegments.GetAll())
+                {
+                    data.AddDefaultProjectPermissions(project.Id, contentType, new PermissionsType());
+                }
+
+                projects.Add(project);
+            }
+
+            return projects;
+        }
+
+        private static List<DataSourceResponse.DataSourceType> SeedDataSources(TableauData data, int count,
+            List<ProjectsResponse.ProjectType> projects, Guid[] ownerIds)
+        {
+            var dataSources = new List<DataSourceResponse.DataSourceType>(count);
+            var fileData = Constants.DefaultEncoding.GetBytes(new SimulatedDataSourceData().ToXml());
+
+            for (var i = 0; i < count; i++)
+            {
+                var dataSource = new DataSourceResponse.DataSourceType
+                {
+                    Id = Guid.NewGuid(),
+                    Name = $"datasource{i}",
+                    ContentUrl = $"datasource{i}",
+                    Description = $"Synthetic data source {i}",
+                    Project = new(projects[i % projects.Count]),
+                    Owner = new() { Id = ownerIds[i % ownerIds.Length] }
+                };
+
+                data.AddDataSource(dataSource, fileData);
+                data.AddDataSourcePermissions(dataSource, new PermissionsType());
+
+                dataSources.Add(dataSource);
+            }
+
+            return dataSources;
+        }
+
+        private static List<WorkbookResponse.WorkbookType> SeedWorkbooks(TableauData data, int count,
+            List<ProjectsResponse.ProjectType> projects, Guid[] ownerIds)
+        {
+            var workbooks = new List<WorkbookResponse.WorkbookType>(count);
+
+            for (var i = 0; i < count; i++)
+            {
+                var project = projects[i % projects.Count];
+
+                var workbook = new WorkbookResponse.WorkbookType
+                {
+                    Id = Guid.NewGuid(),
+                    Name = $"workbook{i}",
+                    ContentUrl = $"workbook{i}",
+                    Description = $"Synthetic workbook {i}",
+                    ShowTabs = true,
+                    Project = new(project),
+                    Owner = new() { Id = ownerIds[i % ownerIds.Length] }
+                };
+
+                var view = new ViewResponse.ViewType
+                {
+                    Id = Guid.NewGuid(),
+                    Name = $"view{i}",
+                    ContentUrl = $"{workbook.Name}{Constants.PathSeparator}view{i}",
+                    Workbook = new() { Id = workbook.Id },
+                    Project = new() { Id = project.Id }
+                };
+
+                var viewPermissions = new PermissionsType();
+                var workbookFileData = new SimulatedWorkbookData();
+                workbookFileData.Views.Add(new SimulatedWorkbookData.SimulatedViewType(view, false, viewPermissions));
+
+                workbook.Views = [new WorkbookResponse.WorkbookType.WorkbookViewReferenceType(view)];
+                workbook.DefaultViewId = view.Id;
+
+                data.AddView(view);
+                data.AddViewPermissions(view.Id, viewPermissions);
+                data.AddWorkbook(workbook, Constants.DefaultEncoding.GetBytes(workbookFileData.ToXml()));
+                data.AddWorkbookPermissions(workbook, new PermissionsType());
+
+                workbooks.Add(workbook);
+            }
+
+            return workbooks;
+        }
+
+        private static void SeedExtractRefreshTasks(TableauData data, int count,
+            List<DataSourceResponse.DataSourceType> dataSources, List<WorkbookResponse.WorkbookType> workbooks)
+        {
+            if (count <= 0 || (dataSources.Count == 0 && workbooks.Count == 0))
+            {
+                return;
+            }
+
+            var schedule = data.AddSchedule(new ServerResponse.ScheduleResponse.ScheduleType
+            {
+                Id = Guid.NewGuid(),
+                Name = "Synthetic Hourly",
+                Type = ScheduleTypes.Extract,
+                Frequency = ScheduleFrequencies.Hourly,
+                State = "Active",
+                Priority = 50,
+                ExecutionOrder = "Parallel",
+                FrequencyDetails = new()
+                {
+                    Start = "00:30:00",
+                    End = "23:30:00",
+                    Intervals = [new() { Hours = "1" }]
+                }
+            });
+
+            for (var i = 0; i < count; i++)
+            {
+                var extractRefresh = new ServerResponse.ExtractRefreshTasksResponse.TaskType.ExtractRefreshType
+                {
+                    Id = Guid.NewGuid(),
+                    Priority = 50,
+                    Type = ExtractRefreshType.FullRefresh,
+                    Schedule = new() { Id = schedule.Id }
+                };
+
+                var useDataSource = workbooks.Count == 0 || (dataSources.Count > 0 && i % 2 == 0);
+                if (useDataSource)
+                {
+                    extractRefresh.DataSource = new() { Id = dataSources[i / 2 % dataSources.Count].Id };
+                }
+                else
+                {
+                    extractRefresh.Workbook = new() { Id = workbooks[i / 2 % workbooks.Count].Id };
+                }
+
+                data.ServerExtractRefreshTasks.Add(new() { ExtractRefresh = extractRefresh });
+                data.AddExtractToSchedule(new ServerResponse.ScheduleExtractRefreshTasksResponse.ExtractType
+                {
+                    Id = extractRefresh.Id,
+                    Priority = 50,
+                    Type = ExtractRefreshType.FullRefresh
+                }, schedule);
+            }
+        }
+    }
+}
@@ -18,6 +18,7 @@
 using System;
 using System.Collections.Generic;
 using System.Collections.Immutable;
+using System.Linq;
 using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
@@ -33,6 +34,7 @@ namespace Tableau.Migration.Content.Search
         private readonly Dictionary<ContentLocation, ContentReferenceStub?> _locationCache = new();
         private readonly Dictionary<Guid, ContentReferenceStub?> _idCache = new();
         private readonly Dictionary<string, ContentReferenceStub?> _contentUrlCache = new();
+        private readonly List<ContentReferenceStub> _addedReferences = new();
 
         private readonly SemaphoreSlim _writeSemaphore = new(1, 1);
 
@@ -81,23 +83,73 @@ namespace Tableau.Migration.Content.Search
         /// <returns>A task to await.</returns>
         protected virtual Task ItemsLoadedAsync(IImmutableList<TContent> items, CancellationToken cancel) => Task.CompletedTask;
 
-        private async Task ProcessLoadResultsAsync(IImmutableList<TContent> loadResults, CancellationToken cancel)
+        private void CacheReference(IContentReference reference)
         {
-            foreach(var loadResult in loadResults)
+            var stub = reference.ToStub();
+
+            if (reference.Id != Guid.Empty)
             {
-                var stub = loadResult.ToStub();
+                _idCache[reference.Id] = stub;
+            }
 
-                if (loadResult.Id != Guid.Empty)
-                {
-                    _idCache[loadResult.Id] = stub;
-                }
+            if (!string.IsNullOrEmpty(reference.ContentUrl))
+            {
+                _contentUrlCache[reference.ContentUrl] = stub;
+            }
+
+            _locationCache[reference.Location] = stub;
+        }
+
+        private void AddReferences(IEnumerable<IContentReference> references)
+        {
+            var count = 0;
+            foreach (var reference in references)
+            {
+                CacheReference(reference);
+                _addedReferences.Add(reference.ToStub());
+                count++;
+            }
+
+            _logger.LogDebug("{Name} content reference cache added {Count} previously loaded items.", Name, count);
+        }
+
+        private static void RemoveCachedReference<TKey>(Dictionary<TKey, ContentReferenceStub?> cache, TKey key, ContentReferenceStub reference)
+            where TKey : notnull
+        {
+            if (cache.TryGetValue(key, out var cached) && reference.Equals(cached))
+            {
+                cache.Remove(key);
+            }
+        }
 
-                if (!string.IsNullOrEmpty(loadResult.ContentUrl))
+        private void RemoveAddedReferences()
+        {
+            // Previously loaded items are superseded by a bulk load, so items that no longer exist or have moved are not found.
+            // Items that were reloaded since they were added have a new value and are kept.
+            foreach (var reference in _addedReferences)
+            {
+                RemoveCachedReference(_idCache, reference.Id, reference);
+                RemoveCachedReference(_locationCache, reference.Location, reference);
+
+                if (!string.IsNullOrEmpty(reference.ContentUrl))
                 {
-                    _contentUrlCache[loadResult.ContentUrl] = stub;
+                    RemoveCachedReference(_contentUrlCache, reference.ContentUrl, reference);
                 }
+            }
+
+            _addedReferences.Clear();
+        }
+
+        private IImmutableList<IContentReference> GetLoadedReferences()
+            => _locationCache.Values
+                .ExceptNulls()
+                .ToImmutableArray<IContentReference>();
 
-                _locationCache[loadResult.Location] = stub;
+        private async Task ProcessLoadResultsAsync(IImmutableList<TContent> loadResults, CancellationToken cancel)
+        {
+            foreach(var loadResult in loadResults)
+            {
+                CacheReference(loadResult);
             }            
 
             await ItemsLoadedAsync(loadResults, cancel).ConfigureAwait(false);
@@ -105,7 +157,7 @@ namespace Tableau.Migration.Content.Search
             _logger.LogDebug("{Name} content reference cache processed {Count} items.", Name, loadResults.Count);
         }
 
-        private async ValueTask<IContentReference?> SearchCacheAsync<TKey>(Dictionary<TKey, ContentReferenceStub?> cache, TKey search,
+        private async ValueTask<IContentReference?> SearchLockedCacheAsync<TKey>(Dictionary<TKey, ContentReferenceStub?> cache, TKey search,
             Func<TKey, CancellationToken, ValueTask<ContentReferenceLoadResult<TContent>>> loadByKeyAsync,
             CancellationToken cancel)
             where TKey : notnull
@@ -120,6 +172,38 @@ namespace Tableau.Migration.Content.Search
                 return loadResult;
             }
 
+            // Retry lookup in case a semaphore wait means the populated for this attempt.
+            if (cache.TryGetValue(search, out var cachedResult))
+            {
+                return cachedResult;
+            }
+
+            _logger.LogInformation("{Name} content reference cache miss on search key {Key}.", Name, search);
+
+            // Run the load strategy to call the store and perform fall-back operations.
+            var loadAttempt = new ContentReferenceCacheLoadAttempt<TContent>(() => cache.ContainsKey(search), SearchAllAsync, SearchByKeyAsync,
+                AddReferences, GetLoadedReferences);
+            await _loadStrategy.LoadAsync(loadAttempt, cancel).ConfigureAwait(false);
+
+            // Retry lookup now that this attempt populated.
+            if (cache.TryGetValue(search, out cachedResult))
+            {
+                return cachedResult;
+            }
+            else
+            {
+                // Assign an explicit null if load failed, to avoid repeated loading that will likely also fail.
+                cache[search] = null;
+            }
+
+            return cachedResult;
+        }
+
+        private async ValueTask<IContentReference?> SearchCacheAsync<TKey>(Dictionary<TKey, ContentReferenceStub?> cache, TKey search,
+            Func<TKey, CancellationToken, ValueTask<ContentReferenceLoadResult<TContent>>> loadByKeyAsync,
+            CancellationToken cancel)
+            where TKey : notnull
+        {
             // First-chance cache test.
             if (cache.TryGetValue(search, out var cachedResult))
             {
@@ -131,35 +215,58 @@ namespace Tableau.Migration.Content.Search
 
             try
             {
-                // Retry lookup in case a semaphore wait means the populated for this attempt.
-                if (cache.TryGetValue(search, out cachedResult))
-                {
-                    return cachedResult;
-                }
-
-                _logger.LogInformation("{Name} content reference cache miss on search key {Key}.", Name, search);
+                return await SearchLockedCacheAsync(cache, search, loadByKeyAsync, cancel).ConfigureAwait(false);
+            }
+            finally
+            {
+                _writeSemaphore.Release();
+            }
+        }
 
-                // Run the load strategy to call the store and perform fall-back operations.
-                var loadAttempt = new ContentReferenceCacheLoadAttempt<TContent>(() => cache.ContainsKey(search), SearchAllAsync, SearchByKeyAsync);
-                await _loadStrategy.LoadAsync(loadAttempt, cancel).ConfigureAwait(false);
+        private async ValueTask<IImmutableDictionary<TKey, IContentReference?>> SearchCacheManyAsync<TKey>(Dictionary<TKey, ContentReferenceStub?> cache, 
+            IEnumerable<TKey> searches, Func<TKey, CancellationToken, ValueTask<ContentReferenceLoadResult<TContent>>> loadByKeyAsync,
+            CancellationToken cancel)
+            where TKey : notnull
+        {
+            var results = ImmutableDictionary.CreateBuilder<TKey, IContentReference?>(cache.Comparer);
+            var misses = new List<TKey>();
 
-                // Retry lookup now that this attempt populated.
-                if (cache.TryGetValue(search, out cachedResult))
+            // First-chance cache test for every key.
+            foreach (var search in searches.Distinct(cache.Comparer))
+            {
+                if (cache.TryGetValue(search, out var cachedResult))
                 {
-                    return cachedResult;
+                    results[search] = cachedResult;
                 }
                 else
                 {
-                    // Assign an explicit null if load failed, to avoid repeated loading that will likely also fail.
-                    cache[search] = null;
+                    misses.Add(search);
                 }
+            }
 
-                return cachedResult;
+            if (misses.Count == 0)
+            {
+                return results.ToImmutable();
+            }
+
+            // Cache misses, obtain a single write lock to populate the cache for all of them.
+            await _writeSemaphore.WaitAsync(cancel).ConfigureAwait(false);
+
+            try
+            {
+                _logger.LogDebug("{Name} content reference cache populating {Count} missed search keys.", Name, misses.Count);
+
+                foreach (var search in misses)
+                {
+                    results[search] = await SearchLockedCacheAsync(cache, search, loadByKeyAsync, cancel).ConfigureAwait(false);
+                }
             }
             finally
             {
                 _writeSemaphore.Release();
             }
+
+            return results.ToImmutable();
         }
 
         /// <summary>
@@ -175,6 +282,8 @@ namespace Tableau.Migration.Content.Search
                 _logger.LogDebug("{Name} content reference cache making bulk search.", Name);
 
                 var searchResults = await Store.LoadAllAsync(cancel).ConfigureAwait(false);
+
+                RemoveAddedReferences();
                 await ProcessLoadResultsAsync(searchResults, cancel).ConfigureAwait(false);
 
                 LoadedAll = true;
@@ -200,11 +309,7 @@ namespace Tableau.Migration.Content.Search
                 }
             }
 
-            var results = _locationCache.Values
-                .ExceptNulls()
-                .ToImmutableArray<IContentReference>();
-
-            return results;
+            return GetLoadedReferences();
         }
 
         /// <inheritdoc />
@@ -221,6 +326,20 @@ namespace Tableau.Migration.Content.Search
             return await SearchCacheAsync(_idCache, id, Store.LoadAsync, cancel).ConfigureAwait(false);
         }
 
+        /// <inheritdoc />
+        public virtual async Task<IImmutableDictionary<ContentLocation, IContentReference?>> ForLocationsAsync(IEnumerable<ContentLocation> locations, CancellationToken cancel)
+            => await SearchCacheManyAsync(_locationCache, locations, Store.LoadAsync, cancel).ConfigureAwait(false);
+
+        /// <inheritdoc />
+        public virtual async Task<IImmutableDictionary<Guid, IContentReference?>> ForIdsAsync(IEnumerable<Guid> ids, CancellationToken cancel)
+        {
+            var searchIds = ids.ToImmutableArray();
+            var results = await SearchCacheManyAsync(_idCache, searchIds.Where(id => id != Guid.Empty), Store.LoadAsync, cancel).ConfigureAwait(false);
+
+            // Empty IDs are never searched, but are included in the results for consistency with ForIdAsync.
+            return searchIds.Contains(Guid.Empty) ? results.SetItem(Guid.Empty, null) : results;
+        }
+
         /// <inheritdoc />
         public virtual async Task<IContentReference?> ForContentUrlAsync(string contentUrl, CancellationToken cancel)
         {
@@ -16,6 +16,8 @@
 //
 
 using System;
+using System.Collections.Generic;
+using System.Collections.Immutable;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -27,14 +29,20 @@ namespace Tableau.Migration.Content.Search
         private readonly Func<bool> _isItemLoaded;
         private readonly Func<CancellationToken, ValueTask> _loadAllAsync;
         private readonly Func<CancellationToken, ValueTask<ContentReferenceLoadResult<TContent>>> _loadItemAsync;
+        private readonly Action<IEnumerable<IContentReference>> _addReferences;
+        private readonly Func<IImmutableList<IContentReference>> _getLoadedReferences;
 
         public ContentReferenceCacheLoadAttempt(Func<bool> isItemLoaded,
             Func<CancellationToken, ValueTask> loadAllAsync,
-            Func<CancellationToken, ValueTask<ContentReferenceLoadResult<TContent>>> loadItemAsync)
+            Func<CancellationToken, ValueTask<ContentReferenceLoadResult<TContent>>> loadItemAsync,
+            Action<IEnumerable<IContentReference>> addReferences,
+            Func<IImmutableList<IContentReference>> getLoadedReferences)
         {
             _isItemLoaded = isItemLoaded;
             _loadAllAsync = loadAllAsync;
             _loadItemAsync = loadItemAsync;
+            _addReferences = addReferences;
+            _getLoadedReferences = getLoadedReferences;
         }
 
         public bool IsItemLoaded()
@@ -47,5 +55,13 @@ namespace Tableau.Migration.Content.Search
         /// <inheritdoc />
         public async ValueTask<ContentReferenceLoadResult<TContent>> LoadItemAsync(CancellationToken cancel)
             => await _loadItemAsync(cancel);
+
+        /// <inheritdoc />
+        public void AddReferences(IEnumerable<IContentReference> references)
+            => _addReferences(references);
+
+        /// <inheritdoc />
+        public IImmutableList<IContentReference> GetLoadedReferences()
+            => _getLoadedReferences();
     }
 }
@@ -16,6 +16,7 @@
 //
 
 using System;
+using System.Collections.Generic;
 using System.Collections.Immutable;
 using System.Threading;
 using System.Threading.Tasks;
@@ -51,6 +52,50 @@ namespace Tableau.Migration.Content.Search
         /// <returns>The content reference, or null if no item was found.</returns>
         Task<IContentReference?> ForIdAsync(Guid id, CancellationToken cancel);
 
+        /// <summary>
+        /// Finds the content reference items for a set of endpoint locations,
+        /// populating the cache for all cache misses in a single pass.
+        /// </summary>
+        /// <param name="locations">The locations.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <returns>The content references by location, with a null value for each location where no item was found.</returns>
+        /// <remarks>The default implementation calls <see cref="ForLocationAsync(ContentLocation, CancellationToken)"/> for each location.</remarks>
+        async Task<IImmutableDictionary<ContentLocation, IContentReference?>> ForLocationsAsync(IEnumerable<ContentLocation> locations, CancellationToken cancel)
+        {
+            var results = ImmutableDictionary.CreateBuilder<ContentLocation, IContentReference?>();
+            foreach (var location in locations)
+            {
+                if (!results.ContainsKey(location))
+                {
+                    results.Add(location, await ForLocationAsync(location, cancel).ConfigureAwait(false));
+                }
+            }
+
+            return results.ToImmutable();
+        }
+
+        /// <summary>
+        /// Finds the content reference items for a set of endpoint IDs,
+        /// populating the cache for all cache misses in a single pass.
+        /// </summary>
+        /// <param name="ids">The IDs.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <returns>The content references by ID, with a null value for each ID where no item was found.</returns>
+        /// <remarks>The default implementation calls <see cref="ForIdAsync(Guid, CancellationToken)"/> for each ID.</remarks>
+        async Task<IImmutableDictionary<Guid, IContentReference?>> ForIdsAsync(IEnumerable<Guid> ids, CancellationToken cancel)
+        {
+            var results = ImmutableDictionary.CreateBuilder<Guid, IContentReference?>();
+            foreach (var id in ids)
+            {
+                if (!results.ContainsKey(id))
+                {
+                    results.Add(id, await ForIdAsync(id, cancel).ConfigureAwait(false));
+                }
+            }
+
+            return results.ToImmutable();
+        }
+
         /// <summary>
         /// Finds the content reference item for a given endpoint content URL.
         /// </summary>
@@ -15,6 +15,8 @@
 //  limitations under the License.
 //
 
+using System.Collections.Generic;
+using System.Collections.Immutable;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -47,5 +49,18 @@ namespace Tableau.Migration.Content.Search
         /// <param name="cancel">The cancellation token to obey</param>
         /// <returns>The task to await.</returns>
         ValueTask LoadAllAsync(CancellationToken cancel);
+
+        /// <summary>
+        /// Adds previously loaded content references to the cache, without loading them from the content reference store.
+        /// </summary>
+        /// <remarks>Added references are replaced by the results of the next bulk load.</remarks>
+        /// <param name="references">The content references to add.</param>
+        void AddReferences(IEnumerable<IContentReference> references);
+
+        /// <summary>
+        /// Gets all content references currently in the cache.
+        /// </summary>
+        /// <returns>The cached content references.</returns>
+        IImmutableList<IContentReference> GetLoadedReferences();
     }
 }
@@ -0,0 +1,274 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.Collections.Immutable;
+using System.IO;
+using System.IO.Abstractions;
+using System.Linq;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Tableau.Migration.Content.Search
+{
+    /// <summary>
+    /// Content reference cache load strategy that persists loaded content references to a local snapshot file,
+    /// so that later migration runs start from the snapshot instead of listing every item again.
+    /// </summary>
+    /// <remarks>
+    /// The first cache miss loads the snapshot, when one exists and is not older than the maximum age.
+    /// Items missing from the snapshot are then searched individually, 
+    /// and appended to the snapshot when found.
+    /// Items in the snapshot are not searched again, so the maximum age limits how long 
+    /// deleted or moved items can still be found from a snapshot.
+    /// Without a usable snapshot the strategy bulk loads like <see cref="BulkContentReferenceCacheLoadStrategy{TContent}"/>
+    /// and writes the bulk loaded references to a new snapshot, sorted by ID.
+    /// A bulk load replaces the snapshot items in the cache.
+    /// A snapshot file should only be used for a single site and content type.
+    /// </remarks>
+    /// <typeparam name="TContent">The content type.</typeparam>
+    public sealed class PersistentContentReferenceCacheLoadStrategy<TContent> : IContentReferenceCacheLoadStrategy<TContent>
+        where TContent : IContentReference
+    {
+        private const int SNAPSHOT_FORMAT = 0x31524354; // "TCR1"
+
+        private readonly IFileSystem _fileSystem;
+        private readonly string _snapshotPath;
+        private readonly TimeSpan _maxAge;
+
+        private bool _snapshotRead;
+        private bool _warmStarted;
+        private bool _snapshotWritten;
+
+        /// <summary>
+        /// The default maximum age of a snapshot file before it is ignored and re-written.
+        /// </summary>
+        public static readonly TimeSpan DefaultMaxAge = TimeSpan.FromDays(1);
+
+        /// <summary>
+        /// Creates a new <see cref="PersistentContentReferenceCacheLoadStrategy{TContent}"/> object
+        /// with the <see cref="DefaultMaxAge"/>.
+        /// </summary>
+        /// <param name="snapshotPath">The path of the snapshot file.</param>
+        public PersistentContentReferenceCacheLoadStrategy(string snapshotPath)
+            : this(new FileSystem(), snapshotPath, DefaultMaxAge)
+        { }
+
+        /// <summary>
+        /// Creates a new <see cref="PersistentContentReferenceCacheLoadStrategy{TContent}"/> object.
+        /// </summary>
+        /// <param name="snapshotPath">The path of the snapshot file.</param>
+        /// <param name="maxAge">The maximum age of a snapshot file before it is ignored and re-written.</param>
+        public PersistentContentReferenceCacheLoadStrategy(string snapshotPath, TimeSpan maxAge)
+            : this(new FileSystem(), snapshotPath, maxAge)
+        { }
+
+        /// <summary>
+        /// Creates a new <see cref="PersistentContentReferenceCacheLoadStrategy{TContent}"/> object.
+        /// </summary>
+        /// <param name="fileSystem">The file system.</param>
+        /// <param name="snapshotPath">The path of the snapshot file.</param>
+        /// <param name="maxAge">The maximum age of a snapshot file before it is ignored and re-written.</param>
+        public PersistentContentReferenceCacheLoadStrategy(IFileSystem fileSystem, string snapshotPath, TimeSpan maxAge)
+        {
+            _fileSystem = fileSystem;
+            _snapshotPath = snapshotPath;
+            _maxAge = maxAge;
+        }
+
+        #region - Snapshot File -
+
+        private static void WriteReference(BinaryWriter writer, IContentReference reference)
+        {
+            writer.Write(reference.Id.ToByteArray());
+            writer.Write(reference.ContentUrl ?? string.Empty);
+            writer.Write(reference.Name ?? string.Empty);
+            writer.Write(reference.Location.PathSeparator);
+            writer.Write7BitEncodedInt(reference.Location.PathSegments.Length);
+            foreach (var segment in reference.Location.PathSegments)
+            {
+                writer.Write(segment);
+            }
+        }
+
+        private static ContentReferenceStub ReadReference(BinaryReader reader)
+        {
+            var id = new Guid(reader.ReadBytes(16));
+            var contentUrl = reader.ReadString();
+            var name = reader.ReadString();
+            var pathSeparator = reader.ReadString();
+
+            var segments = ImmutableArray.CreateBuilder<string>(reader.Read7BitEncodedInt());
+            for (var i = 0; i < segments.Capacity; i++)
+            {
+                segments.Add(reader.ReadString());
+            }
+
+            return new(id, contentUrl, new ContentLocation(segments.MoveToImmutable(), pathSeparator), name);
+        }
+
+        private IImmutableList<IContentReference>? ReadSnapshot()
+        {
+            if (!_fileSystem.File.Exists(_snapshotPath))
+            {
+                return null;
+            }
+
+            try
+            {
+                using var reader = new BinaryReader(_fileSystem.File.OpenRead(_snapshotPath), Encoding.UTF8);
+
+                if (reader.ReadInt32() != SNAPSHOT_FORMAT)
+                {
+                    return null;
+                }
+
+                var created = new DateTime(reader.ReadInt64(), DateTimeKind.Utc);
+                if (DateTime.UtcNow - created >= _maxAge)
+                {
+                    return null;
+                }
+
+                // Later records are appended individual loads, and replace earlier records with the same ID.
+                var references = new Dictionary<Guid, IContentReference>();
+                while (reader.BaseStream.Position < reader.BaseStream.Length)
+                {
+                    var reference = ReadReference(reader);
+                    references[reference.Id] = reference;
+                }
+
+                return references.Values.ToImmutableArray();
+            }
+            catch (Exception ex) when (IsFileError(ex) || ex is ArgumentException or FormatException)
+            {
+                // An unreadable snapshot is re-written by the next bulk load.
+                return null;
+            }
+        }
+
+        private static bool IsFileError(Exception ex)
+            => ex is IOException or UnauthorizedAccessException;
+
+        private void WriteSnapshot(IEnumerable<IContentReference> references)
+        {
+            try
+            {
+                var dir = _fileSystem.Path.GetDirectoryName(_snapshotPath);
+                if (!string.IsNullOrEmpty(dir) && !_fileSystem.Directory.Exists(dir))
+                {
+                    _fileSystem.Directory.CreateDirectory(dir);
+                }
+
+                // Write to a temporary file first so that an interrupted write never leaves a partial snapshot.
+                var tempPath = _snapshotPath + ".tmp";
+                using (var writer = new BinaryWriter(_fileSystem.File.Create(tempPath), Encoding.UTF8))
+                {
+                    writer.Write(SNAPSHOT_FORMAT);
+                    writer.Write(DateTime.UtcNow.Ticks);
+
+                    foreach (var reference in references.OrderBy(r => r.Id))
+                    {
+                        WriteReference(writer, reference);
+                    }
+                }
+
+                _fileSystem.File.Move(tempPath, _snapshotPath, true);
+            }
+            catch (Exception ex) when (IsFileError(ex))
+            {
+                // The snapshot only speeds up later runs, so failing to write it does not fail the migration.
+            }
+        }
+
+        private void AppendSnapshot(IEnumerable<TContent> references)
+        {
+            if (!references.Any() || !_fileSystem.File.Exists(_snapshotPath))
+            {
+                return;
+            }
+
+            try
+            {
+                using var writer = new BinaryWriter(_fileSystem.File.Open(_snapshotPath, FileMode.Append), Encoding.UTF8);
+                foreach (var reference in references)
+                {
+                    WriteReference(writer, reference);
+                }
+            }
+            catch (Exception ex) when (IsFileError(ex))
+            {
+                // Items missing from the snapshot are searched for again on the next run.
+            }
+        }
+
+        #endregion
+
+        /// <inheritdoc />
+        public async Task LoadAsync(IContentReferenceCacheLoadAttempt<TContent> attempt, CancellationToken cancel)
+        {
+            if (!_snapshotRead)
+            {
+                _snapshotRead = true;
+
+                var snapshot = ReadSnapshot();
+                if (snapshot is not null)
+                {
+                    attempt.AddReferences(snapshot);
+                    _warmStarted = true;
+
+                    if (attempt.IsItemLoaded())
+                    {
+                        return;
+                    }
+                }
+            }
+
+            ContentReferenceLoadResult<TContent> itemResult;
+            if (_warmStarted)
+            {
+                // Only revalidate the delta from the snapshot with an individual search, if it's supported.
+                itemResult = await attempt.LoadItemAsync(cancel).ConfigureAwait(false);
+                if (itemResult.IsSupported)
+                {
+                    AppendSnapshot(itemResult.Items);
+                    return;
+                }
+            }
+
+            // Bulk load. The cache may elide loading to avoid repeated listing.
+            // The bulk load replaces the snapshot items in the cache, so stale snapshot items are not written back.
+            await attempt.LoadAllAsync(cancel).ConfigureAwait(false);
+
+            if (!_snapshotWritten)
+            {
+                WriteSnapshot(attempt.GetLoadedReferences());
+                _snapshotWritten = true;
+            }
+
+            if (_warmStarted || attempt.IsItemLoaded())
+            {
+                return;
+            }
+
+            // Fall back to an immediate individual lookup for items the bulk load can't see.
+            itemResult = await attempt.LoadItemAsync(cancel).ConfigureAwait(false);
+            AppendSnapshot(itemResult.Items);
+        }
+    }
+}
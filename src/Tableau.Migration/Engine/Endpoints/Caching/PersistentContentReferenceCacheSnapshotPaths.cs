@@ -0,0 +1,76 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System.IO;
+using System.Linq;
+using Tableau.Migration.Content.Search;
+
+namespace Tableau.Migration.Engine.Endpoints.Caching
+{
+    /// <summary>
+    /// Static class that builds the snapshot file paths of <see cref="PersistentContentReferenceCacheLoadStrategy{TContent}"/>.
+    /// </summary>
+    public static class PersistentContentReferenceCacheSnapshotPaths
+    {
+        /// <summary>
+        /// The file extension of snapshot files.
+        /// </summary>
+        public const string SnapshotFileExtension = ".refs";
+
+        /// <summary>
+        /// The directory name used for the default site, which has an empty site content URL.
+        /// </summary>
+        public const string DefaultSiteDirectoryName = "_default";
+
+        private static string ToDirectoryName(string value)
+        {
+            var invalidChars = Path.GetInvalidFileNameChars();
+            return new string(value.Select(c => invalidChars.Contains(c) ? '_' : c).ToArray());
+        }
+
+        /// <summary>
+        /// Gets the snapshot file path for a content type and endpoint.
+        /// </summary>
+        /// <remarks>
+        /// For Tableau API endpoints the path contains the server host and site content URL,
+        /// so that snapshots of different sites in the same snapshot directory are kept apart.
+        /// </remarks>
+        /// <typeparam name="TContent">The content type.</typeparam>
+        /// <param name="snapshotDirectory">The root snapshot directory.</param>
+        /// <param name="endpointName">The name of the endpoint, such as "source" or "destination".</param>
+        /// <param name="endpoint">The endpoint configuration.</param>
+        /// <returns>The snapshot file path.</returns>
+        public static string GetSnapshotPath<TContent>(string snapshotDirectory, string endpointName, IMigrationPlanEndpointConfiguration endpoint)
+            where TContent : IContentReference
+        {
+            var fileName = typeof(TContent).Name + SnapshotFileExtension;
+
+            if (endpoint is not ITableauApiEndpointConfiguration apiEndpoint)
+            {
+                return Path.Combine(snapshotDirectory, endpointName, fileName);
+            }
+
+            var serverUrl = apiEndpoint.SiteConnectionConfiguration.ServerUrl;
+            var server = serverUrl.IsDefaultPort ? serverUrl.Host : $"{serverUrl.Host}_{serverUrl.Port}";
+
+            var siteContentUrl = apiEndpoint.SiteConnectionConfiguration.SiteContentUrl;
+            var site = string.IsNullOrEmpty(siteContentUrl) ? DefaultSiteDirectoryName : siteContentUrl;
+
+            return Path.Combine(snapshotDirectory, endpointName, ToDirectoryName(server.ToLowerInvariant()), ToDirectoryName(site), fileName);
+        }
+    }
+}
@@ -0,0 +1,52 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.Collections.Immutable;
+using System.Threading;
+using System.Threading.Tasks;
+using Tableau.Migration.Content.Search;
+
+namespace Tableau.Migration.Engine.Endpoints.Search
+{
+    /// <summary>
+    /// Interface for a content reference finder that can find many content references in a single call.
+    /// </summary>
+    /// <remarks>
+    /// Bulk lookups resolve every key with one cache population pass,
+    /// instead of one cache lock and store search per key.
+    /// </remarks>
+    public interface IBulkContentReferenceFinder : IContentReferenceFinder
+    {
+        /// <summary>
+        /// Finds the content references by their unique identifiers.
+        /// </summary>
+        /// <param name="ids">The unique identifiers.</param>
+        /// <param name="cancel">A cancellation token to obey.</param>
+        /// <returns>The found content references by ID, with a null value for each ID where no content reference was found.</returns>
+        Task<IImmutableDictionary<Guid, IContentReference?>> FindManyByIdsAsync(IEnumerable<Guid> ids, CancellationToken cancel);
+
+        /// <summary>
+        /// Finds the content references for the source content reference locations.
+        /// </summary>
+        /// <param name="sourceLocations">The source content reference locations.</param>
+        /// <param name="cancel">A cancellation token to obey.</param>
+        /// <returns>The found content references by source location, with a null value for each location where no content reference was found.</returns>
+        Task<IImmutableDictionary<ContentLocation, IContentReference?>> FindManyBySourceLocationsAsync(IEnumerable<ContentLocation> sourceLocations, CancellationToken cancel);
+    }
+}
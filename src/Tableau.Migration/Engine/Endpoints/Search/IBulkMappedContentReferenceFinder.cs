@@ -0,0 +1,39 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.Collections.Immutable;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Tableau.Migration.Engine.Endpoints.Search
+{
+    /// <summary>
+    /// Interface for a destination content reference finder that can find many content references in a single call.
+    /// </summary>
+    public interface IBulkMappedContentReferenceFinder : IBulkContentReferenceFinder
+    {
+        /// <summary>
+        /// Finds the destination content references for the source content reference unique identifiers.
+        /// </summary>
+        /// <param name="sourceIds">The source content reference unique identifiers.</param>
+        /// <param name="cancel">A cancellation token to obey.</param>
+        /// <returns>The found destination content references by source ID, with a null value for each ID where no content reference was found.</returns>
+        Task<IImmutableDictionary<Guid, IContentReference?>> FindManyBySourceIdsAsync(IEnumerable<Guid> sourceIds, CancellationToken cancel);
+    }
+}
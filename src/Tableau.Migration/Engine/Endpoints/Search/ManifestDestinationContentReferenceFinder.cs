@@ -16,6 +16,7 @@
 //
 
 using System;
+using System.Collections.Generic;
 using System.Collections.Immutable;
 using System.Threading;
 using System.Threading.Tasks;
@@ -33,7 +34,7 @@ namespace Tableau.Migration.Engine.Endpoints.Search
     /// </summary>
     /// <typeparam name="TContent">The content type.</typeparam>
     public class ManifestDestinationContentReferenceFinder<TContent>
-        : IDestinationContentReferenceFinder<TContent>
+        : IDestinationContentReferenceFinder<TContent>, IBulkMappedContentReferenceFinder
         where TContent : class, IContentReference
     {
         private readonly IMigrationManifestEditor _manifest;
@@ -147,6 +148,109 @@ namespace Tableau.Migration.Engine.Endpoints.Search
 
         #endregion
 
+        #region - IBulkMappedContentReferenceFinder Implementation -
+
+        private async Task<IImmutableDictionary<TKey, IContentReference?>> FindManyBySourceAsync<TKey>(IEnumerable<TKey> sourceKeys,
+            IReadOnlyDictionary<TKey, IMigrationManifestEntryEditor> manifestEntries,
+            Func<TKey, CancellationToken, Task<IMigrationManifestEntryEditor?>> updateManifestAsync,
+            CancellationToken cancel)
+            where TKey : notnull
+        {
+            var results = ImmutableDictionary.CreateBuilder<TKey, IContentReference?>();
+            var mappedMisses = new Dictionary<TKey, ContentLocation>();
+
+            foreach (var sourceKey in sourceKeys)
+            {
+                if (results.ContainsKey(sourceKey) || mappedMisses.ContainsKey(sourceKey))
+                {
+                    continue;
+                }
+
+                if (!manifestEntries.TryGetValue(sourceKey, out var manifestEntry))
+                {
+                    // Attempt to dynamically add a manifest entry if the item wasn't included in the source content loader.
+                    if ((manifestEntry = await updateManifestAsync(sourceKey, cancel).ConfigureAwait(false)) is null)
+                    {
+                        results[sourceKey] = null;
+                        continue;
+                    }
+                }
+
+                if (manifestEntry.Destination is not null)
+                {
+                    results[sourceKey] = manifestEntry.Destination;
+                }
+                else
+                {
+                    mappedMisses[sourceKey] = manifestEntry.MappedLocation;
+                }
+            }
+
+            if (mappedMisses.Count > 0)
+            {
+                var destinations = await _destinationCache.ForLocationsAsync(mappedMisses.Values, cancel).ConfigureAwait(false);
+                foreach (var mappedMiss in mappedMisses)
+                {
+                    results[mappedMiss.Key] = destinations.GetValueOrDefault(mappedMiss.Value);
+                }
+            }
+
+            return results.ToImmutable();
+        }
+
+        /// <inheritdoc />
+        public async Task<IImmutableDictionary<ContentLocation, IContentReference?>> FindManyBySourceLocationsAsync(IEnumerable<ContentLocation> sourceLocations, CancellationToken cancel)
+        {
+            // Get the DESTINATION references for the SOURCE locations.
+            var manifestEntries = _manifest.Entries.GetOrCreatePartition<TContent>();
+            return await FindManyBySourceAsync(sourceLocations, manifestEntries.BySourceLocation, 
+                _sourceManifestUpdateCache.UpdateManifestByLocationAsync, cancel).ConfigureAwait(false);
+        }
+
+        /// <inheritdoc />
+        public async Task<IImmutableDictionary<Guid, IContentReference?>> FindManyBySourceIdsAsync(IEnumerable<Guid> sourceIds, CancellationToken cancel)
+        {
+            // Get the DESTINATION references for the SOURCE IDs.
+            var manifestEntries = _manifest.Entries.GetOrCreatePartition<TContent>();
+            return await FindManyBySourceAsync(sourceIds, manifestEntries.BySourceId, 
+                _sourceManifestUpdateCache.UpdateManifestByIdAsync, cancel).ConfigureAwait(false);
+        }
+
+        /// <inheritdoc />
+        public async Task<IImmutableDictionary<Guid, IContentReference?>> FindManyByIdsAsync(IEnumerable<Guid> ids, CancellationToken cancel)
+        {
+            //Get the DESTINATION references for the DESTINATION IDs.
+            var manifestEntries = _manifest.Entries.GetOrCreatePartition<TContent>();
+
+            var results = ImmutableDictionary.CreateBuilder<Guid, IContentReference?>();
+            var misses = new List<Guid>();
+
+            foreach (var id in ids)
+            {
+                if (manifestEntries.ByDestinationId.TryGetValue(id, out var entry) && entry.Destination is not null)
+                {
+                    results[id] = entry.Destination;
+                }
+                else
+                {
+                    misses.Add(id);
+                }
+            }
+
+            if (misses.Count > 0)
+            {
+                var cacheResults = await _destinationCache.ForIdsAsync(misses, cancel).ConfigureAwait(false);
+                foreach (var cacheResult in cacheResults)
+                {
+                    results[cacheResult.Key] = cacheResult.Value;
+                }
+            }
+
+            return results.ToImmutable();
+        }
+
+        #endregion
+
         #region - IContentReferenceFinder Implementation -
 
         /// <inheritdoc />
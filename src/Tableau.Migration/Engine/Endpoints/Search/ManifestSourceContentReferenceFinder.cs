@@ -16,6 +16,7 @@
 //
 
 using System;
+using System.Collections.Generic;
 using System.Collections.Immutable;
 using System.Linq;
 using System.Threading;
@@ -32,7 +33,7 @@ namespace Tableau.Migration.Engine.Endpoints.Search
     /// </summary>
     /// <typeparam name="TContent">The content type.</typeparam>
     public class ManifestSourceContentReferenceFinder<TContent>
-        : ISourceContentReferenceFinder<TContent>
+        : ISourceContentReferenceFinder<TContent>, IBulkContentReferenceFinder
         where TContent : class, IContentReference
     {
         private readonly IMigrationManifestEditor _manifest;
@@ -85,5 +86,54 @@ namespace Tableau.Migration.Engine.Endpoints.Search
 
             return await _sourceCache.ForIdAsync(id, cancel).ConfigureAwait(false);
         }
+
+        private static async Task<IImmutableDictionary<TKey, IContentReference?>> FindManyAsync<TKey>(IEnumerable<TKey> keys,
+            IReadOnlyDictionary<TKey, IMigrationManifestEntryEditor> manifestEntries,
+            Func<IEnumerable<TKey>, CancellationToken, Task<IImmutableDictionary<TKey, IContentReference?>>> cacheSearchAsync,
+            CancellationToken cancel)
+            where TKey : notnull
+        {
+            var results = ImmutableDictionary.CreateBuilder<TKey, IContentReference?>();
+            var misses = new List<TKey>();
+
+            foreach (var key in keys)
+            {
+                if (manifestEntries.TryGetValue(key, out var entry))
+                {
+                    results[key] = entry.Source;
+                }
+                else
+                {
+                    misses.Add(key);
+                }
+            }
+
+            if (misses.Count > 0)
+            {
+                var cacheResults = await cacheSearchAsync(misses, cancel).ConfigureAwait(false);
+                foreach (var cacheResult in cacheResults)
+                {
+                    results[cacheResult.Key] = cacheResult.Value;
+                }
+            }
+
+            return results.ToImmutable();
+        }
+
+        /// <inheritdoc />
+        public async Task<IImmutableDictionary<Guid, IContentReference?>> FindManyByIdsAsync(IEnumerable<Guid> ids, CancellationToken cancel)
+        {
+            //Get the SOURCE references for the SOURCE IDs.
+            var partition = _manifest.Entries.GetOrCreatePartition<TContent>();
+            return await FindManyAsync(ids, partition.BySourceId, _sourceCache.ForIdsAsync, cancel).ConfigureAwait(false);
+        }
+
+        /// <inheritdoc />
+        public async Task<IImmutableDictionary<ContentLocation, IContentReference?>> FindManyBySourceLocationsAsync(IEnumerable<ContentLocation> sourceLocations, CancellationToken cancel)
+        {
+            //Get the SOURCE references for the SOURCE locations.
+            var partition = _manifest.Entries.GetOrCreatePartition<TContent>();
+            return await FindManyAsync(sourceLocations, partition.BySourceLocation, _sourceCache.ForLocationsAsync, cancel).ConfigureAwait(false);
+        }
     }
 }
@@ -16,7 +16,10 @@
 //
 
 using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
 using System.Collections.Immutable;
+using System.Linq;
 using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
@@ -25,11 +28,13 @@ using Tableau.Migration.Resources;
 namespace Tableau.Migration.Engine.Hooks.Mappings
 {
     internal class ContentMappingRunner
-        : MigrationHookRunnerBase, IContentMappingRunner
+        : MigrationHookRunnerBase, IContentBatchMappingRunner
     {
         private readonly ISharedResourcesLocalizer _localizer;
         private readonly ILogger<ContentMappingRunner> _logger;
 
+        private readonly ConcurrentDictionary<Type, ImmutableArray<bool>> _batchMappingFlags = new();
+
         /// <summary>
         /// Default constructor for this class.
         /// </summary>
@@ -54,6 +59,113 @@ namespace Tableau.Migration.Engine.Hooks.Mappings
             where TContent : IContentReference
             => await ExecuteAsync<IContentMapping<TContent>, ContentMappingContext<TContent>>(location, LogMappingAction, cancel).ConfigureAwait(false);
 
+        /// <inheritdoc />
+        public bool HasBatchMappings<TContent>()
+            where TContent : IContentReference
+            => GetBatchMappingFlags<TContent>().Contains(true);
+
+        /// <inheritdoc />
+        public async Task<IReadOnlyList<ContentMappingContext<TContent>>> ExecuteBatchAsync<TContent>(IReadOnlyList<ContentMappingContext<TContent>> contexts, CancellationToken cancel)
+            where TContent : IContentReference
+        {
+            if (contexts.Count == 0)
+            {
+                return contexts;
+            }
+
+            var batchFlags = GetBatchMappingFlags<TContent>();
+            if (!batchFlags.Contains(true))
+            {
+                // Without batch mappings each item runs through all mappings before the next item, like ExecuteAsync.
+                var results = new ContentMappingContext<TContent>[contexts.Count];
+                for (var i = 0; i < contexts.Count; i++)
+                {
+                    results[i] = await ExecuteAsync(contexts[i], cancel).ConfigureAwait(false);
+                }
+
+                return results;
+            }
+
+            var currentContexts = contexts;
+
+            var hookFactories = GetFactoryCollection<IContentMapping<TContent>, ContentMappingContext<TContent>>();
+            var hookIndex = 0;
+            while (hookIndex < hookFactories.Length)
+            {
+                if (batchFlags[hookIndex])
+                {
+                    // Batch mappings are created once for the batch instead of once for each item.
+                    var batchHook = hookFactories[hookIndex].Create<IContentBatchMapping<TContent>>(Services);
+                    currentContexts = await ExecuteBatchMappingAsync(batchHook, currentContexts, cancel).ConfigureAwait(false);
+                    hookIndex++;
+                    continue;
+                }
+
+                // Consecutive per-item mappings keep their per-item order and per-item mapping instances.
+                var runEnd = hookIndex;
+                while (runEnd < hookFactories.Length && !batchFlags[runEnd])
+                {
+                    runEnd++;
+                }
+
+                var results = new ContentMappingContext<TContent>[currentContexts.Count];
+                for (var i = 0; i < currentContexts.Count; i++)
+                {
+                    var currentContext = currentContexts[i];
+                    for (var runIndex = hookIndex; runIndex < runEnd; runIndex++)
+                    {
+                        var hook = hookFactories[runIndex].Create<IContentMapping<TContent>>(Services);
+
+                        var inputContext = currentContext;
+                        currentContext = (await hook.ExecuteAsync(inputContext, cancel).ConfigureAwait(false)) ?? inputContext;
+
+                        LogMappingAction(hook.GetType().GetFormattedName(), inputContext, currentContext);
+                    }
+
+                    results[i] = currentContext;
+                }
+
+                currentContexts = results;
+                hookIndex = runEnd;
+            }
+
+            return currentContexts;
+        }
+
+        private async Task<IReadOnlyList<ContentMappingContext<TContent>>> ExecuteBatchMappingAsync<TContent>(IContentBatchMapping<TContent> hook,
+            IReadOnlyList<ContentMappingContext<TContent>> inputContexts, CancellationToken cancel)
+            where TContent : IContentReference
+        {
+            var hookName = hook.GetType().GetFormattedName();
+
+            var batchResults = await hook.ExecuteBatchAsync(inputContexts, cancel).ConfigureAwait(false);
+            if (batchResults is null)
+            {
+                return inputContexts;
+            }
+
+            if (batchResults.Count != inputContexts.Count)
+            {
+                throw new InvalidOperationException($"Batch mapping {hookName} returned {batchResults.Count} contexts for {inputContexts.Count} items.");
+            }
+
+            // Null elements keep the input context, like null results of per-item mappings.
+            var results = new ContentMappingContext<TContent>[inputContexts.Count];
+            for (var i = 0; i < inputContexts.Count; i++)
+            {
+                results[i] = batchResults[i] ?? inputContexts[i];
+                LogMappingAction(hookName, inputContexts[i], results[i]);
+            }
+
+            return results;
+        }
+
+        private ImmutableArray<bool> GetBatchMappingFlags<TContent>()
+            where TContent : IContentReference
+            => _batchMappingFlags.GetOrAdd(typeof(TContent), _ => GetFactoryCollection<IContentMapping<TContent>, ContentMappingContext<TContent>>()
+                .Select(f => f.Create<IContentMapping<TContent>>(Services) is IContentBatchMapping<TContent>)
+                .ToImmutableArray());
+
         protected sealed override ImmutableArray<IMigrationHookFactory> GetFactoryCollection<THook, TContext>()
             => Plan.Mappings.GetHooks<THook>();
 
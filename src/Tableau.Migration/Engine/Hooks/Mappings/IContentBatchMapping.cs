@@ -0,0 +1,41 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Tableau.Migration.Engine.Hooks.Mappings
+{
+    /// <summary>
+    /// Interface for an object that can map a batch of content items of a specific content type in one call.
+    /// </summary>
+    /// <typeparam name="TContent"><inheritdoc/></typeparam>
+    public interface IContentBatchMapping<TContent> : IContentMapping<TContent>
+        where TContent : IContentReference
+    {
+        /// <summary>
+        /// Executes the mapping for a batch of content items.
+        /// </summary>
+        /// <param name="contexts">The input contexts from the migration engine or previous hook.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <returns>
+        /// A task to await containing a context for each input context in the same order, 
+        /// potentially modified to pass on to the next hook or migration engine.
+        /// </returns>
+        Task<IReadOnlyList<ContentMappingContext<TContent>>> ExecuteBatchAsync(IReadOnlyList<ContentMappingContext<TContent>> contexts, CancellationToken cancel);
+    }
+}
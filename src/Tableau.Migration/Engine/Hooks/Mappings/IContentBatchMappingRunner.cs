@@ -0,0 +1,49 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Tableau.Migration.Engine.Hooks.Mappings
+{
+    /// <summary>
+    /// Interface for an object that can run mappings for a batch of content items.
+    /// </summary>
+    public interface IContentBatchMappingRunner : IContentMappingRunner
+    {
+        /// <summary>
+        /// Gets whether any mapping for the content type implements <see cref="IContentBatchMapping{TContent}"/>.
+        /// </summary>
+        /// <typeparam name="TContent">The content type.</typeparam>
+        /// <returns>True if any mapping for the content type is a batch mapping, otherwise false.</returns>
+        bool HasBatchMappings<TContent>()
+            where TContent : IContentReference;
+
+        /// <summary>
+        /// Executes all mappings for the content type in order for a batch of content items.
+        /// Mappings that implement <see cref="IContentBatchMapping{TContent}"/> are called once for the batch,
+        /// other mappings are called once for each content item,
+        /// and each content item runs through consecutive per-item mappings before the next content item.
+        /// </summary>
+        /// <typeparam name="TContent">The content type.</typeparam>
+        /// <param name="contexts">The mapping contexts.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <returns>The result contexts with the mapped content locations, in the same order as <paramref name="contexts"/>.</returns>
+        Task<IReadOnlyList<ContentMappingContext<TContent>>> ExecuteBatchAsync<TContent>(IReadOnlyList<ContentMappingContext<TContent>> contexts, CancellationToken cancel)
+            where TContent : IContentReference;
+    }
+}
@@ -76,6 +76,7 @@ namespace Tableau.Migration.Engine
             .AddConversionServices()
             .AddContentClientServices()
             .AddSingleton<MigrationManifestSerializer>() // Serializer
+            .AddSingleton<MigrationManifestJournalSerializer>()
             .AddCacheServices()
             .AddContentFinderServices()
             .AddPipelineServices()
@@ -184,6 +184,29 @@ namespace Tableau.Migration.Engine.Manifest
         public async Task<IMigrationManifestEntryBuilder> MapEntriesAsync<TItem>(IEnumerable<TItem> sourceContentItems, IContentMappingRunner mapper, CancellationToken cancel)
             where TItem : IContentReference
         {
+            // Without batch mappings each entry is mapped before the next item's mappings run.
+            if (mapper is IContentBatchMappingRunner batchMapper && batchMapper.HasBatchMappings<TItem>())
+            {
+                var entries = new List<IMigrationManifestEntryEditor>();
+                var mappings = new List<ContentMappingContext<TItem>>();
+                foreach (var sourceItem in sourceContentItems)
+                {
+                    if (_entriesBySourceLocation.TryGetValue(sourceItem.Location, out var entry))
+                    {
+                        entries.Add(entry);
+                        mappings.Add(new ContentMappingContext<TItem>(sourceItem, entry.Source.Location));
+                    }
+                }
+
+                var results = await batchMapper.ExecuteBatchAsync<TItem>(mappings, cancel).ConfigureAwait(false);
+                for (var i = 0; i < entries.Count; i++)
+                {
+                    MapEntry(entries[i], results[i].MappedLocation);
+                }
+
+                return this;
+            }
+
             foreach (var sourceItem in sourceContentItems)
             {
                 var sourceLocation = sourceItem.Location;
@@ -192,14 +215,19 @@ namespace Tableau.Migration.Engine.Manifest
                     var mapping = new ContentMappingContext<TItem>(sourceItem, entry.Source.Location);
                     mapping = await mapper.ExecuteAsync(mapping, cancel).ConfigureAwait(false);
 
-                    entry.MapToDestination(mapping.MappedLocation);
-                    _entriesByMappedLocation[mapping.MappedLocation] = entry;
+                    MapEntry(entry, mapping.MappedLocation);
                 }
             }
 
             return this;
         }
 
+        private void MapEntry(IMigrationManifestEntryEditor entry, ContentLocation mappedLocation)
+        {
+            entry.MapToDestination(mappedLocation);
+            _entriesByMappedLocation[mappedLocation] = entry;
+        }
+
         /// <inheritdoc />
         public void DestinationInfoUpdated(IMigrationManifestEntryEditor entry, IContentReference? oldDestinationInfo)
         {
@@ -0,0 +1,346 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.Abstractions;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using Tableau.Migration.JsonConverters.SerializableObjects;
+
+namespace Tableau.Migration.Engine.Manifest
+{
+    /// <summary>
+    /// Provides functionality to save migration manifests incrementally, 
+    /// as a JSON snapshot in the <see cref="MigrationManifestSerializer"/> format plus an append-only journal of changed entries.
+    /// </summary>
+    /// <remarks>
+    /// The journal is stored next to the snapshot with the <see cref="JournalFileExtension"/> extension, one JSON entry record per line.
+    /// Compaction folds the journal into a new snapshot, so manifests saved by this serializer can always be loaded 
+    /// by <see cref="MigrationManifestSerializer"/> after compaction.
+    /// Each snapshot has a new generation ID that is also written to the header line of its journal,
+    /// so a journal left behind by an interrupted compaction is never replayed onto the newer snapshot.
+    /// </remarks>
+    public class MigrationManifestJournalSerializer
+    {
+        /// <summary>
+        /// The extension appended to the snapshot file path to get the journal file path.
+        /// </summary>
+        public const string JournalFileExtension = ".journal";
+
+        /// <summary>
+        /// The default number of journal records after which the journal is compacted into the snapshot.
+        /// </summary>
+        public const int DefaultCompactionThreshold = 10_000;
+
+        private const string TempFileExtension = ".tmp";
+
+        private readonly IFileSystem _fileSystem;
+        private readonly MigrationManifestSerializer _snapshotSerializer;
+        private readonly JsonSerializerOptions _journalJsonOptions;
+
+        private readonly SemaphoreSlim _writeLock = new(1, 1);
+        private readonly Dictionary<string, Guid> _snapshotGenerations = new(StringComparer.Ordinal);
+        private readonly Dictionary<string, int> _journalRecordCounts = new(StringComparer.Ordinal);
+
+        /// <summary>
+        /// Creates a new <see cref="MigrationManifestJournalSerializer"/> object.
+        /// </summary>
+        /// <param name="fileSystem">The file system to use.</param>
+        /// <param name="snapshotSerializer">The serializer to save and load manifest snapshots with.</param>
+        public MigrationManifestJournalSerializer(IFileSystem fileSystem, MigrationManifestSerializer snapshotSerializer)
+        {
+            _fileSystem = fileSystem;
+            _snapshotSerializer = snapshotSerializer;
+
+            _journalJsonOptions = snapshotSerializer.MergeJsonOptions(new JsonSerializerOptions { WriteIndented = false });
+        }
+
+        /// <summary>
+        /// Gets the journal file path for a manifest snapshot file path.
+        /// </summary>
+        /// <param name="path">The manifest snapshot file path.</param>
+        /// <returns>The journal file path.</returns>
+        public static string GetJournalPath(string path) => path + JournalFileExtension;
+
+        /// <summary>
+        /// Appends the latest state of manifest entries to the journal.
+        /// If no snapshot was saved or loaded by this serializer yet, or the journal would exceed the compaction threshold, 
+        /// the manifest is compacted instead.
+        /// </summary>
+        /// <param name="manifest">The manifest the entries belong to.</param>
+        /// <param name="contentType">The content type of the entries' manifest partition.</param>
+        /// <param name="entries">The entries that changed since the last append or compaction.</param>
+        /// <param name="path">The manifest snapshot file path.</param>
+        /// <param name="compactionThreshold">The number of journal records after which the journal is compacted.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <returns>True if the manifest was compacted, false if the entries were appended to the journal.</returns>
+        public async Task<bool> AppendAsync(IMigrationManifest manifest, Type contentType, IEnumerable<IMigrationManifestEntry> entries,
+            string path, int compactionThreshold, CancellationToken cancel)
+        {
+            var contentTypeName = Guard.AgainstNullOrEmpty(contentType.FullName, () => contentType.FullName);
+
+            var records = new List<SerializableManifestJournalRecord>();
+            foreach (var entry in entries)
+            {
+                records.Add(new(contentTypeName, new SerializableManifestEntry(entry)));
+            }
+
+            await _writeLock.WaitAsync(cancel).ConfigureAwait(false);
+            try
+            {
+                var snapshotPath = _fileSystem.Path.GetFullPath(path);
+                var journalPath = GetJournalPath(snapshotPath);
+
+                // The generation of a snapshot is only known once it was saved or loaded by this serializer.
+                if (!_fileSystem.File.Exists(snapshotPath) || !_snapshotGenerations.TryGetValue(snapshotPath, out var generation))
+                {
+                    await CompactInternalAsync(manifest, snapshotPath, cancel).ConfigureAwait(false);
+                    return true;
+                }
+
+                var recordCount = _journalRecordCounts.GetValueOrDefault(journalPath);
+                if (recordCount + records.Count > compactionThreshold)
+                {
+                    await CompactInternalAsync(manifest, snapshotPath, cancel).ConfigureAwait(false);
+                    return true;
+                }
+
+                var journal = _fileSystem.File.Open(journalPath, FileMode.Append, FileAccess.Write);
+                await using (journal.ConfigureAwait(false))
+                {
+                    if (journal.Length == 0)
+                    {
+                        await JsonSerializer.SerializeAsync(journal, new SerializableManifestJournalHeader(generation), _journalJsonOptions, cancel).ConfigureAwait(false);
+                        journal.WriteByte((byte)'\n');
+                    }
+
+                    foreach (var record in records)
+                    {
+                        await JsonSerializer.SerializeAsync(journal, record, _journalJsonOptions, cancel).ConfigureAwait(false);
+                        journal.WriteByte((byte)'\n');
+                    }
+                }
+
+                _journalRecordCounts[journalPath] = recordCount + records.Count;
+                return false;
+            }
+            finally
+            {
+                _writeLock.Release();
+            }
+        }
+
+        /// <summary>
+        /// Appends the latest state of manifest entries to the journal, using the <see cref="DefaultCompactionThreshold"/>.
+        /// </summary>
+        /// <param name="manifest">The manifest the entries belong to.</param>
+        /// <param name="contentType">The content type of the entries' manifest partition.</param>
+        /// <param name="entries">The entries that changed since the last append or compaction.</param>
+        /// <param name="path">The manifest snapshot file path.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <returns>True if the manifest was compacted, false if the entries were appended to the journal.</returns>
+        public Task<bool> AppendAsync(IMigrationManifest manifest, Type contentType, IEnumerable<IMigrationManifestEntry> entries, string path, CancellationToken cancel)
+            => AppendAsync(manifest, contentType, entries, path, DefaultCompactionThreshold, cancel);
+
+        /// <summary>
+        /// Saves a full snapshot of the manifest and removes the journal.
+        /// </summary>
+        /// <param name="manifest">The manifest to save.</param>
+        /// <param name="path">The manifest snapshot file path.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        public async Task CompactAsync(IMigrationManifest manifest, string path, CancellationToken cancel)
+        {
+            await _writeLock.WaitAsync(cancel).ConfigureAwait(false);
+            try
+            {
+                await CompactInternalAsync(manifest, _fileSystem.Path.GetFullPath(path), cancel).ConfigureAwait(false);
+            }
+            finally
+            {
+                _writeLock.Release();
+            }
+        }
+
+        private async Task CompactInternalAsync(IMigrationManifest manifest, string snapshotPath, CancellationToken cancel)
+        {
+            var generation = Guid.NewGuid();
+
+            // Write the snapshot to a temporary file first so an interrupted compaction never leaves a partial snapshot.
+            var tempPath = snapshotPath + TempFileExtension;
+            await _snapshotSerializer.SaveSerializableAsync(new SerializableJournaledMigrationManifest(manifest, generation), tempPath, cancel)
+                .ConfigureAwait(false);
+            _fileSystem.File.Move(tempPath, snapshotPath, true);
+
+            var journalPath = GetJournalPath(snapshotPath);
+            if (_fileSystem.File.Exists(journalPath))
+            {
+                _fileSystem.File.Delete(journalPath);
+            }
+
+            _snapshotGenerations[snapshotPath] = generation;
+            _journalRecordCounts[journalPath] = 0;
+        }
+
+        /// <summary>
+        /// Loads a manifest from its snapshot and journal.
+        /// Manifests saved by <see cref="MigrationManifestSerializer"/> without a journal are also supported.
+        /// </summary>
+        /// <param name="path">The manifest snapshot file path.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <returns>The loaded <see cref="MigrationManifest"/>, or null if the manifest could not be loaded.</returns>
+        public async Task<MigrationManifest?> LoadAsync(string path, CancellationToken cancel)
+        {
+            var snapshotPath = _fileSystem.Path.GetFullPath(path);
+            if (!_fileSystem.File.Exists(snapshotPath))
+            {
+                return null;
+            }
+
+            SerializableJournaledMigrationManifest? manifest;
+
+            var file = _fileSystem.File.OpenRead(snapshotPath);
+            await using (file.ConfigureAwait(false))
+            {
+                manifest = await _snapshotSerializer.DeserializeAsync<SerializableJournaledMigrationManifest>(file, cancel).ConfigureAwait(false);
+            }
+
+            if (manifest is null)
+            {
+                return null;
+            }
+
+            var journalPath = GetJournalPath(snapshotPath);
+            int? recordCount = 0;
+
+            if (_fileSystem.File.Exists(journalPath))
+            {
+                // A journal with another generation was already folded into the snapshot by a compaction 
+                // that was interrupted before the journal was removed.
+                recordCount = await ReplayJournalAsync(manifest, journalPath, cancel).ConfigureAwait(false);
+            }
+
+            // Later appends continue the journal of a snapshot with a known generation, otherwise they compact first.
+            if (manifest.JournalGeneration is not null && recordCount is not null)
+            {
+                await _writeLock.WaitAsync(cancel).ConfigureAwait(false);
+                try
+                {
+                    _snapshotGenerations[snapshotPath] = manifest.JournalGeneration.Value;
+                    _journalRecordCounts[journalPath] = recordCount.Value;
+                }
+                finally
+                {
+                    _writeLock.Release();
+                }
+            }
+
+            return manifest.ToMigrationManifest() as MigrationManifest;
+        }
+
+        // Returns the number of replayed records, or null if the journal does not apply to the snapshot or can not be continued.
+        private async Task<int?> ReplayJournalAsync(SerializableJournaledMigrationManifest manifest, string journalPath, CancellationToken cancel)
+        {
+            var entries = manifest.Entries ??= new();
+            var indexesByContentType = new Dictionary<string, Dictionary<string, int>>(StringComparer.Ordinal);
+
+            using var reader = new StreamReader(_fileSystem.File.OpenRead(journalPath));
+
+            SerializableManifestJournalHeader? header;
+            try
+            {
+                var headerLine = await reader.ReadLineAsync(cancel).ConfigureAwait(false);
+                header = headerLine is null ? null : JsonSerializer.Deserialize<SerializableManifestJournalHeader>(headerLine, _journalJsonOptions);
+            }
+            catch (JsonException)
+            {
+                header = null;
+            }
+
+            if (header?.SnapshotGeneration is null || header.SnapshotGeneration != manifest.JournalGeneration)
+            {
+                return null;
+            }
+
+            int? recordCount = 0;
+            string? line;
+            while ((line = await reader.ReadLineAsync(cancel).ConfigureAwait(false)) is not null)
+            {
+                if (string.IsNullOrWhiteSpace(line))
+                {
+                    continue;
+                }
+
+                SerializableManifestJournalRecord? record;
+                try
+                {
+                    record = JsonSerializer.Deserialize<SerializableManifestJournalRecord>(line, _journalJsonOptions);
+                }
+                catch (JsonException)
+                {
+                    // The last record of an interrupted append may be incomplete, stop at the first unreadable record.
+                    // Records appended after it could not be replayed, so the journal is not continued.
+                    recordCount = null;
+                    break;
+                }
+
+                if (record?.ContentType is null || record.Entry is null)
+                {
+                    continue;
+                }
+
+                recordCount++;
+
+                if (!entries.TryGetValue(record.ContentType, out var partitionEntries))
+                {
+                    partitionEntries = new();
+                    entries.Add(record.ContentType, partitionEntries);
+                }
+
+                if (!indexesByContentType.TryGetValue(record.ContentType, out var index))
+                {
+                    index = new(StringComparer.OrdinalIgnoreCase);
+                    for (var i = 0; i < partitionEntries.Count; i++)
+                    {
+                        index[GetEntryKey(partitionEntries[i])] = i;
+                    }
+
+                    indexesByContentType.Add(record.ContentType, index);
+                }
+
+                var key = GetEntryKey(record.Entry);
+                if (index.TryGetValue(key, out var existingIndex))
+                {
+                    partitionEntries[existingIndex] = record.Entry;
+                }
+                else
+                {
+                    index.Add(key, partitionEntries.Count);
+                    partitionEntries.Add(record.Entry);
+                }
+            }
+
+            return recordCount;
+        }
+
+        // Manifest partitions key entries by source location, which compares paths ignoring case.
+        private static string GetEntryKey(SerializableManifestEntry entry)
+            => entry.Source?.Location?.Path ?? string.Empty;
+    }
+}
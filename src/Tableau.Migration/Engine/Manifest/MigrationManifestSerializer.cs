@@ -16,9 +16,12 @@
 //
 
 using System;
+using System.Collections.Generic;
 using System.Collections.Immutable;
 using System.IO;
 using System.IO.Abstractions;
+using System.Linq;
+using System.Runtime.CompilerServices;
 using System.Text.Json;
 using System.Text.Json.Serialization;
 using System.Threading;
@@ -37,6 +40,14 @@ namespace Tableau.Migration.Engine.Manifest
 
         private readonly ImmutableArray<JsonConverter> _converters;
 
+        /// <summary>
+        /// The partition files of sharded manifests that were loaded without some content types,
+        /// so that saving the manifest keeps them.
+        /// </summary>
+        private readonly ConditionalWeakTable<IMigrationManifest, UnloadedPartitions> _unloadedPartitions = new();
+
+        private sealed record UnloadedPartitions(string Directory, IReadOnlyDictionary<string, string> Files);
+
         /// <summary>
         /// Initializes a new instance of the <see cref="MigrationManifestSerializer"/> class.
         /// </summary>
@@ -52,6 +63,10 @@ namespace Tableau.Migration.Engine.Manifest
         /// </summary>
         public const uint SupportedManifestVersion = MigrationManifest.LatestManifestVersion;
 
+        /// <summary>
+        /// The file name of the index file of a sharded manifest directory.
+        /// </summary>
+        public const string ShardedManifestIndexFileName = "manifest.json";
 
         /// <summary>
         /// Creates the list of JSON converters used by the MigrationManifestSerializer.
@@ -75,7 +90,7 @@ namespace Tableau.Migration.Engine.Manifest
             }.ToImmutableArray();
         }
 
-        private JsonSerializerOptions MergeJsonOptions(JsonSerializerOptions? jsonOptions)
+        internal JsonSerializerOptions MergeJsonOptions(JsonSerializerOptions? jsonOptions)
         {
             jsonOptions ??= new() { WriteIndented = true };
 
@@ -143,6 +158,25 @@ namespace Tableau.Migration.Engine.Manifest
                 .ConfigureAwait(false);
         }
 
+        /// <summary>
+        /// Saves a serializable manifest in JSON format.
+        /// </summary>
+        /// <typeparam name="TManifest">The serializable manifest type.</typeparam>
+        /// <param name="manifest">The serializable manifest to save.</param>
+        /// <param name="path">The file path to save the manifest to.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        internal async Task SaveSerializableAsync<TManifest>(TManifest manifest, string path, CancellationToken cancel)
+            where TManifest : SerializableMigrationManifest
+        {
+            var dir = _fileSystem.Path.GetDirectoryName(path);
+            if (!string.IsNullOrEmpty(dir) && !_fileSystem.Directory.Exists(dir))
+            {
+                _fileSystem.Directory.CreateDirectory(dir);
+            }
+
+            await SerializeFileAsync(path, manifest, MergeJsonOptions(null), cancel).ConfigureAwait(false);
+        }
+
         /// <summary>
         /// Loads a manifest from JSON format.
         /// </summary>
@@ -172,21 +206,277 @@ namespace Tableau.Migration.Engine.Manifest
         /// <param name="jsonOptions">Optional JSON options to use.</param>
         /// <returns>The loaded <see cref="MigrationManifest"/>, or null if the manifest could not be loaded.</returns>
         public async Task<MigrationManifest?> LoadAsync(Stream stream, CancellationToken cancel, JsonSerializerOptions? jsonOptions = null)
+        {
+            var manifest = await DeserializeAsync(stream, cancel, jsonOptions).ConfigureAwait(false);
+
+            return manifest?.ToMigrationManifest() as MigrationManifest;
+        }
+
+        /// <summary>
+        /// Deserializes a manifest from JSON format without converting it to a <see cref="MigrationManifest"/>.
+        /// </summary>
+        /// <param name="stream">The stream to load the manifest from.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <param name="jsonOptions">Optional JSON options to use.</param>
+        /// <returns>The deserialized manifest, or null if the manifest could not be loaded.</returns>
+        internal Task<SerializableMigrationManifest?> DeserializeAsync(Stream stream, CancellationToken cancel, JsonSerializerOptions? jsonOptions = null)
+            => DeserializeAsync<SerializableMigrationManifest>(stream, cancel, jsonOptions);
+
+        /// <summary>
+        /// Deserializes a manifest from JSON format into a serializable manifest type without converting it to a <see cref="MigrationManifest"/>.
+        /// </summary>
+        /// <typeparam name="TManifest">The serializable manifest type.</typeparam>
+        /// <param name="stream">The stream to load the manifest from.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <param name="jsonOptions">Optional JSON options to use.</param>
+        /// <returns>The deserialized manifest, or null if the manifest could not be loaded.</returns>
+        internal async Task<TManifest?> DeserializeAsync<TManifest>(Stream stream, CancellationToken cancel, JsonSerializerOptions? jsonOptions = null)
+            where TManifest : SerializableMigrationManifest
         {
             jsonOptions = MergeJsonOptions(jsonOptions);
 
-            var manifest = await JsonSerializer.DeserializeAsync<SerializableMigrationManifest>(stream, jsonOptions, cancel)
+            var manifest = await JsonSerializer.DeserializeAsync<TManifest>(stream, jsonOptions, cancel)
                     .ConfigureAwait(false);
 
             if (manifest is not null)
+                VerifyManifestVersion(manifest);
+
+            return manifest;
+        }
+
+        private static void VerifyManifestVersion(SerializableMigrationManifest manifest)
+        {
+            if (manifest.ManifestVersion is not SupportedManifestVersion)
+                throw new NotSupportedException($"This {nameof(MigrationManifestSerializer)} only supports Manifest version {SupportedManifestVersion}. The manifest being loaded is version {manifest.ManifestVersion}");
+        }
+
+        /// <summary>
+        /// Saves a manifest in sharded JSON format, 
+        /// where the entries of each content type partition are written in parallel to a separate file in the directory.
+        /// </summary>
+        /// <remarks>
+        /// Partition files get new names on each save, and the index file <see cref="ShardedManifestIndexFileName"/> 
+        /// is replaced last, so an interrupted save leaves the previous index and partition files in place.
+        /// Partition files that are no longer referenced by the index are then removed.
+        /// A manifest loaded by <see cref="LoadShardedAsync"/> with a subset of content types keeps the partitions that were not loaded,
+        /// which are copied from the directory the manifest was loaded from.
+        /// </remarks>
+        /// <param name="manifest">The manifest to save.</param>
+        /// <param name="directory">The directory to save the manifest to.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <param name="jsonOptions">Optional JSON options to use.</param>
+        /// <exception cref="InvalidOperationException">
+        /// The manifest was loaded without a content type partition, and has entries for that content type.
+        /// </exception>
+        public async Task SaveShardedAsync(IMigrationManifest manifest, string directory, CancellationToken cancel, JsonSerializerOptions? jsonOptions = null)
+        {
+            directory = _fileSystem.Path.GetFullPath(directory);
+            if (!_fileSystem.Directory.Exists(directory))
+            {
+                _fileSystem.Directory.CreateDirectory(directory);
+            }
+
+            var options = MergeJsonOptions(jsonOptions);
+            var indexPath = _fileSystem.Path.Combine(directory, ShardedManifestIndexFileName);
+            var previousPartitions = await ReadPartitionFileNamesAsync(indexPath, options, cancel).ConfigureAwait(false);
+
+            var generation = Guid.NewGuid().ToString("N");
+            var partitions = new Dictionary<string, string>(StringComparer.Ordinal);
+            var saveTasks = new List<Task>();
+
+            _unloadedPartitions.TryGetValue(manifest, out var unloaded);
+
+            foreach (var partitionType in manifest.Entries.GetPartitionTypes())
+            {
+                Guard.AgainstNull(partitionType, nameof(partitionType));
+                Guard.AgainstNullOrEmpty(partitionType.FullName, nameof(partitionType.FullName));
+
+                var partition = manifest.Entries.ForContentType(partitionType);
+
+                if (unloaded is not null && unloaded.Files.ContainsKey(partitionType.FullName))
+                {
+                    if (partition.Any())
+                    {
+                        throw new InvalidOperationException($"The manifest was loaded without the {partitionType.FullName} partition, and can not be saved with entries for it.");
+                    }
+
+                    continue;
+                }
+
+                var fileName = GetPartitionFileName(partitionType.FullName, generation);
+                partitions.Add(partitionType.FullName, fileName);
+
+                var path = _fileSystem.Path.Combine(directory, fileName);
+
+                saveTasks.Add(Task.Run(async () =>
+                {
+                    var entries = partition.Select(entry => new SerializableManifestEntry(entry)).ToList();
+                    await SerializeFileAsync(path, entries, options, cancel).ConfigureAwait(false);
+                }, cancel));
+            }
+
+            if (unloaded is not null)
+            {
+                foreach (var (contentType, fileName) in unloaded.Files)
+                {
+                    var sourcePath = _fileSystem.Path.Combine(unloaded.Directory, fileName);
+                    if (string.Equals(unloaded.Directory, directory, StringComparison.Ordinal) && previousPartitions.Contains(fileName))
+                    {
+                        partitions.Add(contentType, fileName);
+                    }
+                    else
+                    {
+                        var copyFileName = GetPartitionFileName(contentType, generation);
+                        partitions.Add(contentType, copyFileName);
+
+                        _fileSystem.File.Copy(sourcePath, _fileSystem.Path.Combine(directory, copyFileName), true);
+                    }
+                }
+            }
+
+            await Task.WhenAll(saveTasks).ConfigureAwait(false);
+
+            var index = new SerializableShardedMigrationManifest(manifest, partitions);
+            var tempIndexPath = indexPath + ".tmp";
+            await SerializeFileAsync(tempIndexPath, index, options, cancel).ConfigureAwait(false);
+            _fileSystem.File.Move(tempIndexPath, indexPath, true);
+
+            foreach (var fileName in previousPartitions.Except(partitions.Values))
+            {
+                try
+                {
+                    _fileSystem.File.Delete(_fileSystem.Path.Combine(directory, fileName));
+                }
+                catch (IOException)
+                {
+                    // Unreferenced partition files do not affect loading.
+                }
+            }
+
+            if (unloaded is not null && string.Equals(unloaded.Directory, directory, StringComparison.Ordinal))
+            {
+                _unloadedPartitions.AddOrUpdate(manifest, unloaded with
+                {
+                    Files = unloaded.Files.Keys.ToDictionary(k => k, k => partitions[k], StringComparer.Ordinal)
+                });
+            }
+        }
+
+        /// <summary>
+        /// Loads a manifest from sharded JSON format, reading the partition files in parallel.
+        /// </summary>
+        /// <remarks>
+        /// A manifest loaded with a subset of content types is partial.
+        /// <see cref="SaveShardedAsync"/> on this serializer keeps the partitions that were not loaded,
+        /// but other ways of saving the manifest drop them.
+        /// </remarks>
+        /// <param name="directory">The directory to load the manifest from.</param>
+        /// <param name="contentTypes">
+        /// The content types of the partitions to load, 
+        /// or null to load all partitions.
+        /// Partition files of other content types are not read.
+        /// </param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <param name="jsonOptions">Optional JSON options to use.</param>
+        /// <returns>The loaded <see cref="MigrationManifest"/>, or null if the manifest could not be loaded.</returns>
+        public async Task<MigrationManifest?> LoadShardedAsync(string directory, IEnumerable<Type>? contentTypes, CancellationToken cancel, JsonSerializerOptions? jsonOptions = null)
+        {
+            directory = _fileSystem.Path.GetFullPath(directory);
+
+            var indexPath = _fileSystem.Path.Combine(directory, ShardedManifestIndexFileName);
+            if (!_fileSystem.File.Exists(indexPath))
+            {
+                return null;
+            }
+
+            var options = MergeJsonOptions(jsonOptions);
+
+            var index = await DeserializeFileAsync<SerializableShardedMigrationManifest>(indexPath, options, cancel)
+                .ConfigureAwait(false);
+
+            if (index is null)
+            {
+                return null;
+            }
+
+            VerifyManifestVersion(index);
+            Guard.AgainstNull(index.Partitions, nameof(index.Partitions));
+
+            var partitions = index.Partitions.ToList();
+            var unloadedPartitions = new Dictionary<string, string>(StringComparer.Ordinal);
+
+            if (contentTypes is not null)
+            {
+                var contentTypeNames = contentTypes.Select(t => t.FullName).ToHashSet(StringComparer.Ordinal);
+                foreach (var partition in partitions.Where(p => !contentTypeNames.Contains(p.Key)))
+                {
+                    unloadedPartitions.Add(partition.Key, partition.Value);
+                }
+
+                partitions.RemoveAll(p => unloadedPartitions.ContainsKey(p.Key));
+            }
+
+            var loadTasks = partitions
+                .Select(p => Task.Run(async () =>
+                {
+                    var path = _fileSystem.Path.Combine(directory, p.Value);
+                    var entries = await DeserializeFileAsync<List<SerializableManifestEntry>>(path, options, cancel)
+                        .ConfigureAwait(false);
+
+                    return new KeyValuePair<string, List<SerializableManifestEntry>>(p.Key, entries ?? new());
+                }, cancel))
+                .ToList();
+
+            var loadedPartitions = await Task.WhenAll(loadTasks).ConfigureAwait(false);
+
+            index.Entries = new SerializableEntryCollection(loadedPartitions.ToDictionary(p => p.Key, p => p.Value));
+
+            var manifest = index.ToMigrationManifest() as MigrationManifest;
+            if (manifest is not null && unloadedPartitions.Count > 0)
             {
-                if (manifest.ManifestVersion is not SupportedManifestVersion)
-                    throw new NotSupportedException($"This {nameof(MigrationManifestSerializer)} only supports Manifest version {SupportedManifestVersion}. The manifest being loaded is version {manifest.ManifestVersion}");
+                _unloadedPartitions.AddOrUpdate(manifest, new(directory, unloadedPartitions));
+            }
 
-                return manifest.ToMigrationManifest() as MigrationManifest;
+            return manifest;
+        }
+
+        internal static string GetPartitionFileName(string contentType, string generation)
+            => $"{contentType}.{generation}.json";
+
+        private async Task<IImmutableSet<string>> ReadPartitionFileNamesAsync(string indexPath, JsonSerializerOptions jsonOptions, CancellationToken cancel)
+        {
+            if (!_fileSystem.File.Exists(indexPath))
+            {
+                return ImmutableHashSet<string>.Empty;
             }
 
-            return null;
+            try
+            {
+                var index = await DeserializeFileAsync<SerializableShardedMigrationManifest>(indexPath, jsonOptions, cancel).ConfigureAwait(false);
+                return index?.Partitions?.Values.ToImmutableHashSet(StringComparer.Ordinal) ?? ImmutableHashSet<string>.Empty;
+            }
+            catch (JsonException)
+            {
+                return ImmutableHashSet<string>.Empty;
+            }
+        }
+
+        private async Task SerializeFileAsync<T>(string path, T value, JsonSerializerOptions jsonOptions, CancellationToken cancel)
+        {
+            var file = _fileSystem.File.Create(path);
+            await using (file.ConfigureAwait(false))
+            {
+                await JsonSerializer.SerializeAsync(file, value, jsonOptions, cancel).ConfigureAwait(false);
+            }
+        }
+
+        private async Task<T?> DeserializeFileAsync<T>(string path, JsonSerializerOptions jsonOptions, CancellationToken cancel)
+        {
+            var file = _fileSystem.File.OpenRead(path);
+            await using (file.ConfigureAwait(false))
+            {
+                return await JsonSerializer.DeserializeAsync<T>(file, jsonOptions, cancel).ConfigureAwait(false);
+            }
         }
     }
 }
@@ -0,0 +1,67 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using Tableau.Migration.Engine.Hooks.Mappings;
+
+namespace Tableau.Migration.Interop.Hooks
+{
+    /// <summary>
+    /// Applies the results of batch mappings written in other languages,
+    /// so a batch of mapped locations is passed through interop in a single call instead of one call per content item.
+    /// </summary>
+    public static class ContentMappingInterop
+    {
+        /// <summary>
+        /// Maps each context to its mapped location.
+        /// </summary>
+        /// <typeparam name="TContent">The content type.</typeparam>
+        /// <param name="contexts">The contexts to map.</param>
+        /// <param name="mappedLocations">
+        /// The mapped location for each context, 
+        /// or null to keep the context's mapped location.
+        /// </param>
+        /// <returns>The mapped contexts.</returns>
+        /// <exception cref="ArgumentException">
+        /// The number of mapped locations does not match the number of contexts, 
+        /// or a mapped location is not a <see cref="ContentLocation"/>.
+        /// </exception>
+        public static IReadOnlyList<ContentMappingContext<TContent>> MapBatch<TContent>(
+            IReadOnlyList<ContentMappingContext<TContent>> contexts, object?[] mappedLocations)
+            where TContent : IContentReference
+        {
+            if (mappedLocations.Length != contexts.Count)
+            {
+                throw new ArgumentException($"{mappedLocations.Length} mapped locations were given for {contexts.Count} contexts.", nameof(mappedLocations));
+            }
+
+            var results = new ContentMappingContext<TContent>[contexts.Count];
+            for (var i = 0; i < results.Length; i++)
+            {
+                results[i] = mappedLocations[i] switch
+                {
+                    null => contexts[i],
+                    ContentLocation location => contexts[i].MapTo(location),
+                    var other => throw new ArgumentException($"Mapped location {i} is a {other.GetType().Name}, not a {nameof(ContentLocation)}.", nameof(mappedLocations))
+                };
+            }
+
+            return results;
+        }
+    }
+}
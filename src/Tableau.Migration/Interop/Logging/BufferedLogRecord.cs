@@ -0,0 +1,33 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using Microsoft.Extensions.Logging;
+
+namespace Tableau.Migration.Interop.Logging
+{
+    /// <summary>
+    /// A pre-formatted log entry buffered by a <see cref="BufferedNonGenericLoggerBase"/>.
+    /// </summary>
+    /// <param name="CategoryName">The category name of the logger that wrote the entry.</param>
+    /// <param name="LogLevel">The level of the entry.</param>
+    /// <param name="EventId">The ID of the event.</param>
+    /// <param name="Message">The pre-formatted message.</param>
+    /// <param name="Created">The time the entry was written, in seconds since the Unix epoch.</param>
+    /// <param name="ThreadId">The managed ID of the thread that wrote the entry.</param>
+    public readonly record struct BufferedLogRecord(string CategoryName, LogLevel LogLevel, int EventId, string Message, double Created, int ThreadId)
+    { }
+}
@@ -0,0 +1,90 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Threading;
+using Microsoft.Extensions.Logging;
+
+namespace Tableau.Migration.Interop.Logging
+{
+    /// <summary>
+    /// <see cref="NonGenericLoggerBase"/> that can buffer entries instead of writing them directly.
+    /// Enabled levels are checked against a cached minimum level, so neither logging to a buffer nor 
+    /// <see cref="IsEnabled(LogLevel)"/> calls into the implementing language.
+    /// </summary>
+    public abstract class BufferedNonGenericLoggerBase : NonGenericLoggerBase
+    {
+        private int _minimumLevel = (int)LogLevel.Trace;
+        private LogRecordBuffer? _buffer;
+
+        /// <summary>
+        /// Gets or sets the category name of the logger, included with buffered entries.
+        /// </summary>
+        public string CategoryName { get; set; } = string.Empty;
+
+        /// <summary>
+        /// Gets or sets the cached minimum enabled level.
+        /// </summary>
+        public LogLevel MinimumLevel
+        {
+            get => (LogLevel)Volatile.Read(ref _minimumLevel);
+            set => Volatile.Write(ref _minimumLevel, (int)value);
+        }
+
+        /// <summary>
+        /// Gets or sets the buffer to write entries to, or null to write entries directly with <see cref="WriteLog"/>.
+        /// </summary>
+        public LogRecordBuffer? Buffer
+        {
+            get => Volatile.Read(ref _buffer);
+            set => Volatile.Write(ref _buffer, value);
+        }
+
+        /// <inheritdoc />
+        public sealed override void Log(LogLevel logLevel, EventId eventId, string state, Exception? exception, string message)
+        {
+            if (!IsEnabled(logLevel))
+            {
+                return;
+            }
+
+            var buffer = Buffer;
+            if (buffer is null)
+            {
+                WriteLog(logLevel, eventId, state, exception, message);
+                return;
+            }
+
+            var created = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds() / 1000d;
+            buffer.TryAdd(new(CategoryName, logLevel, eventId.Id, message, created, Environment.CurrentManagedThreadId));
+        }
+
+        /// <inheritdoc />
+        public sealed override bool IsEnabled(LogLevel logLevel)
+            => logLevel != LogLevel.None && logLevel >= MinimumLevel;
+
+        /// <summary>
+        /// Writes a log entry directly, when no buffer is set.
+        /// </summary>
+        /// <param name="logLevel">Entry will be written on this level.</param>
+        /// <param name="eventId">Id of the event.</param>
+        /// <param name="state">The pre-formatted entry to be written.</param>
+        /// <param name="exception">The exception related to this entry.</param>
+        /// <param name="message">The pre-formatted message to write.</param>
+        public abstract void WriteLog(LogLevel logLevel, EventId eventId, string state, Exception? exception, string message);
+    }
+}
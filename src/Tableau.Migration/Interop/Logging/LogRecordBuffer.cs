@@ -0,0 +1,131 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Threading;
+
+namespace Tableau.Migration.Interop.Logging
+{
+    /// <summary>
+    /// Bounded, lock-free buffer of log entries written by many threads and drained in batches by a single reader.
+    /// </summary>
+    public sealed class LogRecordBuffer : IDisposable
+    {
+        /// <summary>
+        /// The default maximum number of buffered entries.
+        /// </summary>
+        public const int DefaultCapacity = 65536;
+
+        private readonly ConcurrentQueue<BufferedLogRecord> _records = new();
+        private readonly ManualResetEventSlim _available = new(false);
+
+        private int _count;
+        private int _signaled;
+        private long _droppedCount;
+
+        /// <summary>
+        /// Creates a new <see cref="LogRecordBuffer"/> object.
+        /// </summary>
+        /// <param name="capacity">The maximum number of buffered entries. Entries written while the buffer is full are dropped.</param>
+        public LogRecordBuffer(int capacity = DefaultCapacity)
+        {
+            if (capacity <= 0)
+            {
+                throw new ArgumentOutOfRangeException(nameof(capacity), capacity, "Capacity must be greater than zero.");
+            }
+
+            Capacity = capacity;
+        }
+
+        /// <summary>
+        /// Gets the maximum number of buffered entries.
+        /// </summary>
+        public int Capacity { get; }
+
+        /// <summary>
+        /// Gets the number of buffered entries.
+        /// </summary>
+        public int Count => Volatile.Read(ref _count);
+
+        /// <summary>
+        /// Gets the number of entries that were dropped because the buffer was full.
+        /// </summary>
+        public long DroppedCount => Interlocked.Read(ref _droppedCount);
+
+        /// <summary>
+        /// Adds an entry to the buffer without blocking.
+        /// </summary>
+        /// <param name="record">The entry to add.</param>
+        /// <returns>True if the entry was added, false if the buffer was full and the entry was dropped.</returns>
+        public bool TryAdd(BufferedLogRecord record)
+        {
+            if (Interlocked.Increment(ref _count) > Capacity)
+            {
+                Interlocked.Decrement(ref _count);
+                Interlocked.Increment(ref _droppedCount);
+                return false;
+            }
+
+            _records.Enqueue(record);
+
+            // Only the first writer after the reader resets the signal pays for waking the reader.
+            if (Interlocked.Exchange(ref _signaled, 1) == 0)
+            {
+                _available.Set();
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        /// Removes a batch of entries from the buffer, waiting for entries if the buffer is empty.
+        /// </summary>
+        /// <param name="maxCount">The maximum number of entries to remove.</param>
+        /// <param name="millisecondsTimeout">The time to wait for entries if the buffer is empty.</param>
+        /// <returns>The removed entries, in the order they were added, or an empty array if no entries were written before the timeout.</returns>
+        public BufferedLogRecord[] Drain(int maxCount, int millisecondsTimeout)
+        {
+            if (Count == 0 && millisecondsTimeout != 0)
+            {
+                _available.Wait(millisecondsTimeout);
+            }
+
+            // Reset before draining so entries added during the drain signal the next wait.
+            _available.Reset();
+            Volatile.Write(ref _signaled, 0);
+
+            var batch = new List<BufferedLogRecord>(Math.Min(maxCount, Math.Max(Count, 1)));
+            while (batch.Count < maxCount && _records.TryDequeue(out var record))
+            {
+                Interlocked.Decrement(ref _count);
+                batch.Add(record);
+            }
+
+            return batch.ToArray();
+        }
+
+        /// <summary>
+        /// Wakes a reader waiting in <see cref="Drain(int, int)"/>.
+        /// </summary>
+        public void Wake() => _available.Set();
+
+        /// <inheritdoc />
+        public void Dispose() => _available.Dispose();
+    }
+}
@@ -0,0 +1,191 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Text;
+using Tableau.Migration.Engine.Manifest;
+
+namespace Tableau.Migration.Interop.Manifest
+{
+    /// <summary>
+    /// Manifest entry values stored in column arrays, built in a single pass over the entries
+    /// so they can be read through interop as contiguous buffers without per-entry calls.
+    /// </summary>
+    /// <remarks>
+    /// String columns with few distinct values are dictionary encoded as codes into a name array.
+    /// Source locations are stored as UTF-8 bytes with row offsets, matching the Arrow string column layout.
+    /// GUIDs are stored as <see cref="GuidSize"/> big endian bytes per row, the RFC 4122 byte order used by Python UUID bytes and Arrow UUID columns.
+    /// </remarks>
+    public sealed class MigrationManifestColumns
+    {
+        /// <summary>
+        /// The number of bytes of each GUID.
+        /// </summary>
+        public const int GuidSize = 16;
+
+        /// <summary>
+        /// Gets the number of rows, one per manifest entry.
+        /// </summary>
+        public int RowCount { get; }
+
+        /// <summary>
+        /// Gets the distinct content type names, indexed by <see cref="ContentTypeCodes"/>.
+        /// </summary>
+        public string[] ContentTypeNames { get; }
+
+        /// <summary>
+        /// Gets the index into <see cref="ContentTypeNames"/> of each row.
+        /// </summary>
+        public int[] ContentTypeCodes { get; }
+
+        /// <summary>
+        /// Gets the source IDs of the rows.
+        /// </summary>
+        public byte[] SourceIds { get; }
+
+        /// <summary>
+        /// Gets the UTF-8 bytes of the source location paths of all rows.
+        /// </summary>
+        public byte[] SourceLocationData { get; }
+
+        /// <summary>
+        /// Gets the offsets into <see cref="SourceLocationData"/> where the source location path of each row starts, followed by the data length.
+        /// </summary>
+        public int[] SourceLocationOffsets { get; }
+
+        /// <summary>
+        /// Gets the destination IDs of the rows, with empty GUID bytes for rows without a destination.
+        /// </summary>
+        public byte[] DestinationIds { get; }
+
+        /// <summary>
+        /// Gets whether each row has a destination, 1 if it does and 0 if it does not.
+        /// </summary>
+        public byte[] HasDestination { get; }
+
+        /// <summary>
+        /// Gets the <see cref="MigrationManifestEntryStatus"/> value of each row.
+        /// </summary>
+        public int[] Statuses { get; }
+
+        /// <summary>
+        /// Gets the number of errors of each row.
+        /// </summary>
+        public int[] ErrorCounts { get; }
+
+        /// <summary>
+        /// Gets the distinct skipped reasons, indexed by <see cref="SkippedReasonCodes"/>.
+        /// </summary>
+        public string[] SkippedReasonNames { get; }
+
+        /// <summary>
+        /// Gets the index into <see cref="SkippedReasonNames"/> of each row, or -1 if the row has no skipped reason.
+        /// </summary>
+        public int[] SkippedReasonCodes { get; }
+
+        /// <summary>
+        /// Creates a new <see cref="MigrationManifestColumns"/> object.
+        /// </summary>
+        /// <param name="partitions">The manifest entry partitions to read, one per content type.</param>
+        public MigrationManifestColumns(IReadOnlyCollection<IMigrationManifestContentTypePartition> partitions)
+        {
+            RowCount = partitions.Sum(p => p.Count);
+
+            ContentTypeNames = partitions.Select(p => p.ContentType.Name).ToArray();
+            ContentTypeCodes = new int[RowCount];
+            SourceIds = new byte[RowCount * GuidSize];
+            SourceLocationOffsets = new int[RowCount + 1];
+            DestinationIds = new byte[RowCount * GuidSize];
+            HasDestination = new byte[RowCount];
+            Statuses = new int[RowCount];
+            ErrorCounts = new int[RowCount];
+            SkippedReasonCodes = new int[RowCount];
+
+            var skippedReasons = new Dictionary<string, int>(StringComparer.Ordinal);
+            using var locationData = new MemoryStream();
+
+            var row = 0;
+            var contentTypeCode = 0;
+            foreach (var partition in partitions)
+            {
+                foreach (var entry in partition)
+                {
+                    if (row == RowCount)
+                    {
+                        throw new InvalidOperationException("The manifest entries changed while the columns were built.");
+                    }
+
+                    ContentTypeCodes[row] = contentTypeCode;
+
+                    entry.Source.Id.TryWriteBytes(SourceIds.AsSpan(row * GuidSize, GuidSize), bigEndian: true, out _);
+
+                    SourceLocationOffsets[row] = (int)locationData.Length;
+                    var path = entry.Source.Location.Path;
+                    var pathBytes = Encoding.UTF8.GetBytes(path);
+                    locationData.Write(pathBytes, 0, pathBytes.Length);
+
+                    if (entry.Destination is not null)
+                    {
+                        entry.Destination.Id.TryWriteBytes(DestinationIds.AsSpan(row * GuidSize, GuidSize), bigEndian: true, out _);
+                        HasDestination[row] = 1;
+                    }
+
+                    Statuses[row] = (int)entry.Status;
+                    ErrorCounts[row] = entry.Errors.Count;
+
+                    if (string.IsNullOrEmpty(entry.SkippedReason))
+                    {
+                        SkippedReasonCodes[row] = -1;
+                    }
+                    else
+                    {
+                        if (!skippedReasons.TryGetValue(entry.SkippedReason, out var skippedReasonCode))
+                        {
+                            skippedReasonCode = skippedReasons[entry.SkippedReason] = skippedReasons.Count;
+                        }
+
+                        SkippedReasonCodes[row] = skippedReasonCode;
+                    }
+
+                    row++;
+                }
+
+                contentTypeCode++;
+            }
+
+            if (row != RowCount)
+            {
+                throw new InvalidOperationException("The manifest entries changed while the columns were built.");
+            }
+
+            SourceLocationOffsets[RowCount] = (int)locationData.Length;
+            SourceLocationData = locationData.ToArray();
+            SkippedReasonNames = skippedReasons.OrderBy(r => r.Value).Select(r => r.Key).ToArray();
+        }
+
+        /// <summary>
+        /// Builds the columns for all entries of a manifest.
+        /// </summary>
+        /// <param name="manifest">The manifest to read.</param>
+        /// <returns>The columns.</returns>
+        public static MigrationManifestColumns ForManifest(IMigrationManifest manifest)
+            => new(manifest.Entries.GetPartitionTypes().Select(t => manifest.Entries.ForContentType(t)).ToArray());
+    }
+}
@@ -0,0 +1,120 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Tableau.Migration.Engine.Manifest;
+
+namespace Tableau.Migration.Interop.Manifest
+{
+    /// <summary>
+    /// Status statistics for a set of manifest entries,
+    /// aggregated in a single pass and stored in array form so they can be read through interop without per-entry calls.
+    /// </summary>
+    public sealed class MigrationManifestStatistics
+    {
+        private static readonly int _statusCount = Enum.GetValues<MigrationManifestEntryStatus>().Max(s => (int)s) + 1;
+
+        /// <summary>
+        /// Gets the content type of the entries, or null if the statistics are for entries of all content types.
+        /// </summary>
+        public Type? ContentType { get; }
+
+        /// <summary>
+        /// Gets the total number of entries.
+        /// </summary>
+        public int TotalCount { get; }
+
+        /// <summary>
+        /// Gets the number of entries for each status, indexed by <see cref="MigrationManifestEntryStatus"/> value.
+        /// </summary>
+        public int[] StatusCounts { get; }
+
+        /// <summary>
+        /// Gets the number of entries that have at least one error.
+        /// </summary>
+        public int EntriesWithErrors { get; }
+
+        /// <summary>
+        /// Gets the total number of errors across all entries.
+        /// </summary>
+        public int ErrorCount { get; }
+
+        /// <summary>
+        /// Gets the distinct skipped reasons of skipped entries, in the same order as <see cref="SkippedReasonCounts"/>.
+        /// </summary>
+        public string[] SkippedReasons { get; }
+
+        /// <summary>
+        /// Gets the number of skipped entries for each reason in <see cref="SkippedReasons"/>.
+        /// </summary>
+        public int[] SkippedReasonCounts { get; }
+
+        /// <summary>
+        /// Creates a new <see cref="MigrationManifestStatistics"/> object.
+        /// </summary>
+        /// <param name="contentType">The content type of the entries, or null for entries of all content types.</param>
+        /// <param name="entries">The entries to aggregate.</param>
+        public MigrationManifestStatistics(Type? contentType, IEnumerable<IMigrationManifestEntry> entries)
+        {
+            ContentType = contentType;
+            StatusCounts = new int[_statusCount];
+
+            var skippedReasons = new Dictionary<string, int>(StringComparer.Ordinal);
+
+            foreach (var entry in entries)
+            {
+                TotalCount++;
+                StatusCounts[(int)entry.Status]++;
+
+                var errorCount = entry.Errors.Count;
+                if (errorCount > 0)
+                {
+                    EntriesWithErrors++;
+                    ErrorCount += errorCount;
+                }
+
+                if (entry.Status is MigrationManifestEntryStatus.Skipped && !string.IsNullOrEmpty(entry.SkippedReason))
+                {
+                    skippedReasons[entry.SkippedReason] = skippedReasons.GetValueOrDefault(entry.SkippedReason) + 1;
+                }
+            }
+
+            SkippedReasons = skippedReasons.Keys.ToArray();
+            SkippedReasonCounts = skippedReasons.Values.ToArray();
+        }
+
+        /// <summary>
+        /// Aggregates statistics for all entries of a manifest.
+        /// </summary>
+        /// <param name="manifest">The manifest to aggregate.</param>
+        /// <returns>The statistics.</returns>
+        public static MigrationManifestStatistics ForManifest(IMigrationManifest manifest)
+            => new(null, manifest.Entries);
+
+        /// <summary>
+        /// Aggregates statistics for the entries of a manifest, separately for each content type.
+        /// </summary>
+        /// <param name="manifest">The manifest to aggregate.</param>
+        /// <returns>The statistics for each content type in the manifest.</returns>
+        public static IReadOnlyList<MigrationManifestStatistics> ForContentTypes(IMigrationManifest manifest)
+            => manifest.Entries.GetPartitionTypes()
+                .Select(t => new MigrationManifestStatistics(t, manifest.Entries.ForContentType(t)))
+                .ToArray();
+    }
+}
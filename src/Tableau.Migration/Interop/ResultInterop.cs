@@ -0,0 +1,52 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System.Collections.Generic;
+
+namespace Tableau.Migration.Interop
+{
+    /// <summary>
+    /// Reads the status of a collection of results in a single call,
+    /// so results can be filtered through interop without a call for each result.
+    /// </summary>
+    public static class ResultInterop
+    {
+        /// <summary>
+        /// Gets the indexes of the results with a success status.
+        /// </summary>
+        /// <param name="results">The results.</param>
+        /// <param name="success">True to get the indexes of successful results, false to get the indexes of failed results.</param>
+        /// <returns>The indexes of the matching results, in ascending order.</returns>
+        public static int[] GetIndexesBySuccess(IEnumerable<IResult> results, bool success)
+        {
+            var indexes = new List<int>();
+
+            var index = 0;
+            foreach (var result in results)
+            {
+                if (result.Success == success)
+                {
+                    indexes.Add(index);
+                }
+
+                index++;
+            }
+
+            return indexes.ToArray();
+        }
+    }
+}
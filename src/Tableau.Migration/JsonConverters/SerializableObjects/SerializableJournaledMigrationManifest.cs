@@ -0,0 +1,50 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+
+namespace Tableau.Migration.JsonConverters.SerializableObjects
+{
+    /// <summary>
+    /// Represents a migration manifest snapshot saved by a manifest journal serializer,
+    /// which identifies the journal that applies to the snapshot.
+    /// </summary>
+    public class SerializableJournaledMigrationManifest : SerializableMigrationManifest
+    {
+        /// <summary>
+        /// Gets or sets the generation ID of the snapshot.
+        /// Only a journal with the same generation ID in its header applies to the snapshot.
+        /// </summary>
+        public Guid? JournalGeneration { get; set; }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="SerializableJournaledMigrationManifest"/> class.
+        /// </summary>
+        public SerializableJournaledMigrationManifest() { }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="SerializableJournaledMigrationManifest"/> class with details from an <see cref="IMigrationManifest"/>.
+        /// </summary>
+        /// <param name="manifest">The migration manifest to serialize.</param>
+        /// <param name="journalGeneration">The generation ID of the snapshot.</param>
+        internal SerializableJournaledMigrationManifest(IMigrationManifest manifest, Guid journalGeneration)
+            : base(manifest)
+        {
+            JournalGeneration = journalGeneration;
+        }
+    }
+}
@@ -0,0 +1,46 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+
+namespace Tableau.Migration.JsonConverters.SerializableObjects
+{
+    /// <summary>
+    /// Represents the first line of a migration manifest journal, identifying the snapshot the journal applies to.
+    /// </summary>
+    public class SerializableManifestJournalHeader
+    {
+        /// <summary>
+        /// Gets or sets the generation ID of the snapshot the journal applies to.
+        /// </summary>
+        public Guid? SnapshotGeneration { get; set; }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="SerializableManifestJournalHeader"/> class.
+        /// </summary>
+        public SerializableManifestJournalHeader() { }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="SerializableManifestJournalHeader"/> class.
+        /// </summary>
+        /// <param name="snapshotGeneration">The generation ID of the snapshot the journal applies to.</param>
+        internal SerializableManifestJournalHeader(Guid snapshotGeneration)
+        {
+            SnapshotGeneration = snapshotGeneration;
+        }
+    }
+}
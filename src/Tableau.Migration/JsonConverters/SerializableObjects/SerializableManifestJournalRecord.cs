@@ -0,0 +1,51 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+namespace Tableau.Migration.JsonConverters.SerializableObjects
+{
+    /// <summary>
+    /// Represents a single line of a migration manifest journal, recording the latest state of a manifest entry.
+    /// </summary>
+    public class SerializableManifestJournalRecord
+    {
+        /// <summary>
+        /// Gets or sets the full name of the content type of the entry's manifest partition.
+        /// </summary>
+        public string? ContentType { get; set; }
+
+        /// <summary>
+        /// Gets or sets the manifest entry.
+        /// </summary>
+        public SerializableManifestEntry? Entry { get; set; }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="SerializableManifestJournalRecord"/> class.
+        /// </summary>
+        public SerializableManifestJournalRecord() { }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="SerializableManifestJournalRecord"/> class.
+        /// </summary>
+        /// <param name="contentType">The full name of the content type of the entry's manifest partition.</param>
+        /// <param name="entry">The manifest entry.</param>
+        internal SerializableManifestJournalRecord(string contentType, SerializableManifestEntry entry)
+        {
+            ContentType = contentType;
+            Entry = entry;
+        }
+    }
+}
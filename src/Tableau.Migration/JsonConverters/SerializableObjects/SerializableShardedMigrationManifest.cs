@@ -0,0 +1,56 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System.Collections.Generic;
+using System.Linq;
+
+namespace Tableau.Migration.JsonConverters.SerializableObjects
+{
+    /// <summary>
+    /// Represents the index file of a sharded migration manifest, 
+    /// where the entries of each content type partition are stored in a separate file.
+    /// </summary>
+    public class SerializableShardedMigrationManifest : SerializableMigrationManifest
+    {
+        /// <summary>
+        /// Gets or sets the partition file names, relative to the manifest directory, by content type full name.
+        /// </summary>
+        public Dictionary<string, string>? Partitions { get; set; } = new();
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="SerializableShardedMigrationManifest"/> class.
+        /// </summary>
+        public SerializableShardedMigrationManifest() { }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="SerializableShardedMigrationManifest"/> class 
+        /// with details from an <see cref="IMigrationManifest"/>, without its entries.
+        /// </summary>
+        /// <param name="manifest">The migration manifest to serialize.</param>
+        /// <param name="partitions">The partition file names by content type full name.</param>
+        internal SerializableShardedMigrationManifest(IMigrationManifest manifest, Dictionary<string, string> partitions)
+        {
+            PlanId = manifest.PlanId;
+            MigrationId = manifest.MigrationId;
+            PipelineProfile = manifest.PipelineProfile;
+            ManifestVersion = manifest.ManifestVersion;
+
+            Errors = manifest.Errors.Select(e => new SerializableException(e)).ToList();
+            Partitions = partitions;
+        }
+    }
+}
@@ -0,0 +1,87 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Immutable;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Tableau.Migration.Paging
+{
+    /// <summary>
+    /// <see cref="IPager{TContent}"/> implementation that pulls each page from a source on demand,
+    /// so that only the current page of items is held in memory.
+    /// </summary>
+    /// <typeparam name="TItem">The item type.</typeparam>
+    public class StreamingPager<TItem> : IPager<TItem>
+    {
+        /// <summary>
+        /// Delegate that gets the next items from the source.
+        /// </summary>
+        /// <param name="count">The maximum number of items to get.</param>
+        /// <param name="cancel">The cancellation token to obey.</param>
+        /// <returns>The next items, with fewer than <paramref name="count"/> items when the source has no more items.</returns>
+        public delegate Task<IImmutableList<TItem>> NextItemsCallback(int count, CancellationToken cancel);
+
+        private readonly NextItemsCallback _nextItems;
+        private readonly int _pageSize;
+        private readonly int? _totalCount;
+
+        private int _pageNumber;
+        private int _itemCount;
+        private bool _fetchedAllPages;
+
+        /// <summary>
+        /// Creates a new <see cref="StreamingPager{TItem}"/> object.
+        /// </summary>
+        /// <param name="nextItems">Function to get the next items from the source.</param>
+        /// <param name="pageSize">The page size to page by.</param>
+        /// <param name="totalCount">
+        /// The total number of items in the source, or null if not known in advance.
+        /// When null, the total count of each page is the number of items read so far.
+        /// </param>
+        public StreamingPager(NextItemsCallback nextItems, int pageSize, int? totalCount = null)
+        {
+            if (pageSize < 1)
+            {
+                throw new ArgumentOutOfRangeException(nameof(pageSize), pageSize, "Page size must be at least 1.");
+            }
+
+            _nextItems = nextItems;
+            _pageSize = pageSize;
+            _totalCount = totalCount;
+
+            _pageNumber = 1;
+        }
+
+        /// <inheritdoc />
+        public async Task<IPagedResult<TItem>> NextPageAsync(CancellationToken cancel)
+        {
+            IImmutableList<TItem> pageItems = ImmutableArray<TItem>.Empty;
+
+            if (!_fetchedAllPages)
+            {
+                pageItems = await _nextItems(_pageSize, cancel).ConfigureAwait(false) ?? ImmutableArray<TItem>.Empty;
+
+                _itemCount += pageItems.Count;
+                _fetchedAllPages = pageItems.Count < _pageSize || (_totalCount is not null && _itemCount >= _totalCount);
+            }
+
+            return PagedResult<TItem>.Succeeded(pageItems, _pageNumber++, _pageSize, _totalCount ?? _itemCount, _fetchedAllPages);
+        }
+    }
+}
@@ -36,7 +36,7 @@ from tableau_migration import (
     Migrator, 
     MigrationPlanBuilder, 
     MigrationManifestEntryStatus,
-    MigrationManifestSerializer,
+    MigrationManifestJournalSerializer,
     cancellation_token_source
 )
 from tableau_migration.migration import (
@@ -124,7 +124,7 @@ class Program():
         
 
         # Setup base objects for migrations
-        self._manifest_serializer = MigrationManifestSerializer()
+        self._manifest_serializer = MigrationManifestJournalSerializer()
         plan_builder = MigrationPlanBuilder()
         migration = Migrator()
     
@@ -192,7 +192,7 @@ class Program():
         end_time = time.time()
 
         # Save the manifest.    
-        self._manifest_serializer.save(result.manifest, helper.manifest_path)
+        self._manifest_serializer.compact(result.manifest, helper.manifest_path)
 
         print_result.print_result(result, self.logger)    
 
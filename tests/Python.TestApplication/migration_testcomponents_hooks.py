@@ -26,7 +26,7 @@ from tableau_migration import (
     ContentBatchMigrationCompletedHookBase,
     IContentBatchMigrationResult,
     MigrationActionCompletedHookBase,
-    MigrationManifestSerializer,
+    MigrationManifestJournalSerializer,
     IMigrationActionResult,
     IDataSource,
     IGroup,
@@ -68,9 +68,9 @@ class SaveManifestHookBase(ContentBatchMigrationCompletedHookBase[TContent]):
         """Executes the hook."""
         self._logger.debug("Saving manifest.")
         
-        serializer = MigrationManifestSerializer()
+        serializer = MigrationManifestJournalSerializer()
         manifest = self.services.get_manifest()
-        serializer.save(manifest, helper.manifest_path)
+        serializer.append_batch(manifest, ctx, helper.manifest_path)
     
 class SaveUserManifestHook(SaveManifestHookBase[IUser]):
     """Updates the manifest file after a user batch is migrated."""
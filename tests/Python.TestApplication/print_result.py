@@ -1,5 +1,4 @@
 from tableau_migration import (
-    IMigrationManifestEntry, 
     MigrationManifestEntryStatus, 
     MigrationResult,
     ServerToCloudMigrationPipeline
@@ -11,30 +10,21 @@ def print_result(result: MigrationResult, logger: Logger):
         """Prints the result of a migration."""
         logger.info(f'Result: {result.status}')
     
+        content_type_stats = result.manifest.stats_by_content_type()
+
         for pipeline_content_type in ServerToCloudMigrationPipeline.get_content_types():
             content_type = pipeline_content_type.content_type
         
-            type_entries = [IMigrationManifestEntry(x) for x in result.manifest.entries.ForContentType(content_type)]
-        
-            count_total = len(type_entries)
+            type_stats = content_type_stats.get(content_type.Name)
+            statuses = type_stats["statuses"] if type_stats else {}
 
-            count_migrated = 0
-            count_skipped = 0
-            count_errored = 0
-            count_cancelled = 0
-            count_pending = 0
+            count_total = type_stats["total"] if type_stats else 0
 
-            for entry in type_entries:
-                if entry.status == MigrationManifestEntryStatus.MIGRATED:
-                    count_migrated += 1
-                elif entry.status == MigrationManifestEntryStatus.SKIPPED:
-                    count_skipped += 1
-                elif entry.status == MigrationManifestEntryStatus.ERROR:
-                    count_errored += 1
-                elif entry.status == MigrationManifestEntryStatus.CANCELED:
-                    count_cancelled += 1
-                elif entry.status == MigrationManifestEntryStatus.PENDING:
-                    count_pending += 1
+            count_migrated = statuses.get(MigrationManifestEntryStatus.MIGRATED, 0)
+            count_skipped = statuses.get(MigrationManifestEntryStatus.SKIPPED, 0)
+            count_errored = statuses.get(MigrationManifestEntryStatus.ERROR, 0)
+            count_cancelled = statuses.get(MigrationManifestEntryStatus.CANCELED, 0)
+            count_pending = statuses.get(MigrationManifestEntryStatus.PENDING, 0)
             
             output = f'''
             {content_type.Name}
@@ -0,0 +1,78 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Linq;
+using Tableau.Migration.Api.Simulation;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Api.Simulation
+{
+    public class SyntheticSiteSeederTests
+    {
+        public class Seed : AutoFixtureTestBase
+        {
+            private TableauApiSimulator CreateSimulator()
+                => Create<TableauApiSimulatorFactory>().GetOrCreate(new("http://localhost"), true);
+
+            [Fact]
+            public void SeedsContent()
+            {
+                var simulator = CreateSimulator();
+                var initialUsers = simulator.Data.Users.Count;
+                var initialProjects = simulator.Data.Projects.Count;
+
+                SyntheticSiteSeeder.Seed(simulator, users: 25, groups: 4, projects: 12, dataSources: 7, workbooks: 5, extractRefreshTasks: 6);
+
+                var data = simulator.Data;
+
+                Assert.Equal(initialUsers + 25, data.Users.Count);
+                var seededGroups = data.Groups.Where(g => g.Name!.StartsWith("group")).ToList();
+                Assert.Equal(4, seededGroups.Count);
+                Assert.Equal(initialProjects + 12, data.Projects.Count);
+                Assert.Equal(7, data.DataSources.Count);
+                Assert.Equal(5, data.Workbooks.Count);
+                Assert.Equal(5, data.Views.Count);
+                Assert.Equal(6, data.ServerExtractRefreshTasks.Count);
+
+                Assert.Equal(25, seededGroups.Sum(g => data.GroupUsers[g.Id].Count));
+                Assert.Equal(2, data.Projects.Count(p => p.Name!.StartsWith("project") && p.ParentProjectId is null));
+                Assert.All(data.ServerExtractRefreshTasks, t => Assert.True(t.ExtractRefresh!.DataSource is not null ^ t.ExtractRefresh.Workbook is not null));
+            }
+
+            [Fact]
+            public void SeedsWithoutUsersOrProjects()
+            {
+                var simulator = CreateSimulator();
+
+                SyntheticSiteSeeder.Seed(simulator, users: 0, groups: 0, projects: 0, dataSources: 2, workbooks: 0, extractRefreshTasks: 3);
+
+                var data = simulator.Data;
+
+                Assert.All(data.DataSources, d => Assert.Equal(data.DefaultProject.Id, d.Project!.Id));
+                Assert.All(data.DataSources, d => Assert.Equal(data.SignIn!.User!.Id, d.Owner!.Id));
+                Assert.All(data.ServerExtractRefreshTasks, t => Assert.NotNull(t.ExtractRefresh!.DataSource));
+            }
+
+            [Fact]
+            public void NullSimulator()
+            {
+                Assert.Throws<ArgumentNullException>(() => SyntheticSiteSeeder.Seed(null!, 1, 1, 1, 1, 1, 1));
+            }
+        }
+    }
+}
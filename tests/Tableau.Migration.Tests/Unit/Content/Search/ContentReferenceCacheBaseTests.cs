@@ -121,6 +121,37 @@ namespace Tableau.Migration.Tests.Unit.Content.Search
             { }
         }
 
+        public class SeedingContentReferenceCacheLoadStrategy<TContent> : IContentReferenceCacheLoadStrategy<TContent>
+            where TContent : IContentReference
+        {
+            public IEnumerable<IContentReference> Seed { get; set; } = Enumerable.Empty<IContentReference>();
+
+            public async Task LoadAsync(IContentReferenceCacheLoadAttempt<TContent> attempt, CancellationToken cancel)
+            {
+                // Seed once, like a snapshot that is read on the first cache miss.
+                attempt.AddReferences(Seed);
+                Seed = Enumerable.Empty<IContentReference>();
+
+                await attempt.LoadAllAsync(cancel);
+            }
+        }
+
+        public class SeededContentReferenceCache<TContent> : ContentReferenceCacheBase<TContent>
+            where TContent : IContentReference
+        {
+            public TestContentReferenceStore<TContent> TestStore => (TestContentReferenceStore<TContent>)base.Store;
+
+            public SeedingContentReferenceCacheLoadStrategy<TContent> TestStrategy { get; }
+
+            protected override string Name => "Seeded";
+
+            public SeededContentReferenceCache(SeedingContentReferenceCacheLoadStrategy<TContent> strategy, ILogger<SeededContentReferenceCache<TContent>> logger)
+                : base(strategy, new TestContentReferenceStore<TContent>(), logger)
+            {
+                TestStrategy = strategy;
+            }
+        }
+
         public class ContentReferenceCacheBaseTest : AutoFixtureTestBase
         {
             protected readonly TestContentReferenceCache<ContentReferenceStub> Cache;
@@ -632,6 +663,143 @@ namespace Tableau.Migration.Tests.Unit.Content.Search
 
         #endregion
 
+        #region - ForLocationsAsync -
+
+        public sealed class ForLocationsAsync : ContentReferenceCacheBaseTest
+        {
+            [Fact]
+            public async Task FindsManyWithSingleLoadAsync()
+            {
+                Cache.TestStore.Data = CreateMany<ContentReferenceStub>(3).ToImmutableArray();
+
+                var result = await Cache.ForLocationsAsync(Cache.TestStore.Data.Select(i => i.Location), Cancel);
+
+                Assert.Equal(3, result.Count);
+                foreach (var item in Cache.TestStore.Data)
+                {
+                    Assert.Equal(item, result[item.Location]);
+                }
+
+                Assert.Equal(1, Cache.TestStore.LoadCalls);
+            }
+
+            [Fact]
+            public async Task UsesCachedValuesAsync()
+            {
+                Cache.TestStore.Data = CreateMany<ContentReferenceStub>(2).ToImmutableArray();
+
+                var searchItem = Cache.TestStore.Data.First();
+                var cached = await Cache.ForLocationAsync(searchItem.Location, Cancel);
+
+                var result = await Cache.ForLocationsAsync(Cache.TestStore.Data.Select(i => i.Location), Cancel);
+
+                Assert.Same(cached, result[searchItem.Location]);
+                Assert.Equal(2, result.Count);
+                Assert.Equal(1, Cache.TestStore.LoadCalls);
+            }
+
+            [Fact]
+            public async Task NotFoundReturnsNullAsync()
+            {
+                Cache.TestStore.Data = new[]
+                {
+                    Create<ContentReferenceStub>()
+                };
+
+                var searchItem = Cache.TestStore.Data.First();
+                var notFoundLoc = Create<ContentLocation>();
+
+                var result = await Cache.ForLocationsAsync(new[] { searchItem.Location, notFoundLoc, notFoundLoc }, Cancel);
+
+                Assert.Equal(2, result.Count);
+                Assert.Equal(searchItem, result[searchItem.Location]);
+                Assert.Null(result[notFoundLoc]);
+
+                //Test not found value cached.
+                var result2 = await Cache.ForLocationAsync(notFoundLoc, Cancel);
+                Assert.Null(result2);
+
+                Assert.Equal(2, Cache.TestStore.LoadCalls);
+            }
+
+            [Fact]
+            public async Task EmptyAsync()
+            {
+                var result = await Cache.ForLocationsAsync(Enumerable.Empty<ContentLocation>(), Cancel);
+
+                Assert.Empty(result);
+                Assert.Equal(0, Cache.TestStore.LoadCalls);
+            }
+        }
+
+        #endregion
+
+        #region - ForIdsAsync -
+
+        public sealed class ForIdsAsync : ContentReferenceCacheBaseTest
+        {
+            [Fact]
+            public async Task FindsManyWithSingleLoadAsync()
+            {
+                Cache.TestStore.Data = CreateMany<ContentReferenceStub>(3).ToImmutableArray();
+
+                var result = await Cache.ForIdsAsync(Cache.TestStore.Data.Select(i => i.Id), Cancel);
+
+                Assert.Equal(3, result.Count);
+                foreach (var item in Cache.TestStore.Data)
+                {
+                    Assert.Equal(item, result[item.Id]);
+                }
+
+                //Test values cached by location.
+                var result2 = await Cache.ForLocationAsync(Cache.TestStore.Data.First().Location, Cancel);
+                Assert.Same(result[Cache.TestStore.Data.First().Id], result2);
+
+                Assert.Equal(1, Cache.TestStore.LoadCalls);
+            }
+
+            [Fact]
+            public async Task DoesNotSearchEmptyIdAsync()
+            {
+                var result = await Cache.ForIdsAsync(new[] { Guid.Empty }, Cancel);
+
+                var nullResult = Assert.Single(result);
+                Assert.Equal(Guid.Empty, nullResult.Key);
+                Assert.Null(nullResult.Value);
+
+                Assert.Equal(0, Cache.TestStore.LoadCalls);
+            }
+        }
+
+        #endregion
+
+        #region - AddReferences -
+
+        public sealed class AddReferences : AutoFixtureTestBase
+        {
+            [Fact]
+            public async Task BulkLoadReplacesAddedReferencesAsync()
+            {
+                var strategy = new SeedingContentReferenceCacheLoadStrategy<ContentReferenceStub>();
+                var cache = new SeededContentReferenceCache<ContentReferenceStub>(strategy, Create<ILogger<SeededContentReferenceCache<ContentReferenceStub>>>());
+
+                var current = CreateMany<ContentReferenceStub>(2).ToImmutableArray();
+                var deleted = Create<ContentReferenceStub>();
+                var moved = new ContentReferenceStub(current[1].Id, current[1].ContentUrl, Create<ContentLocation>(), current[1].Name);
+
+                strategy.Seed = new IContentReference[] { current[0], deleted, moved };
+                cache.TestStore.Data = current;
+
+                Assert.NotNull(await cache.ForLocationAsync(current[0].Location, Cancel));
+
+                Assert.Equal(current.OrderBy(r => r.Id).Cast<IContentReference>(), (await cache.GetAllAsync(Cancel)).OrderBy(r => r.Id));
+                Assert.Null(await cache.ForIdAsync(deleted.Id, Cancel));
+                Assert.Equal(current[1], await cache.ForIdAsync(current[1].Id, Cancel));
+            }
+        }
+
+        #endregion
+
         #region - GetAllAsync -
 
         public sealed class GetAllAsync : ContentReferenceCacheBaseTest
@@ -0,0 +1,70 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using Moq;
+using Tableau.Migration.Content.Search;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Content.Search
+{
+    public sealed class IContentReferenceCacheTests
+    {
+        public sealed class ForLocationsAsync : AutoFixtureTestBase
+        {
+            [Fact]
+            public async Task CallsForLocationAsyncForEachLocationAsync()
+            {
+                var mockCache = new Mock<IContentReferenceCache>() { CallBase = true };
+                var found = Create<IContentReference>();
+                var missing = Create<ContentLocation>();
+
+                mockCache.Setup(x => x.ForLocationAsync(found.Location, It.IsAny<CancellationToken>())).ReturnsAsync(found);
+
+                var result = await mockCache.Object.ForLocationsAsync(new[] { found.Location, missing, found.Location }.AsEnumerable(), default);
+
+                Assert.Equal(2, result.Count);
+                Assert.Same(found, result[found.Location]);
+                Assert.Null(result[missing]);
+                mockCache.Verify(x => x.ForLocationAsync(found.Location, It.IsAny<CancellationToken>()), Times.Once);
+            }
+        }
+
+        public sealed class ForIdsAsync : AutoFixtureTestBase
+        {
+            [Fact]
+            public async Task CallsForIdAsyncForEachIdAsync()
+            {
+                var mockCache = new Mock<IContentReferenceCache>() { CallBase = true };
+                var found = Create<IContentReference>();
+                var missing = Guid.NewGuid();
+
+                mockCache.Setup(x => x.ForIdAsync(found.Id, It.IsAny<CancellationToken>())).ReturnsAsync(found);
+
+                var result = await mockCache.Object.ForIdsAsync(new[] { found.Id, missing, found.Id }.AsEnumerable(), default);
+
+                Assert.Equal(2, result.Count);
+                Assert.Same(found, result[found.Id]);
+                Assert.Null(result[missing]);
+                mockCache.Verify(x => x.ForIdAsync(found.Id, It.IsAny<CancellationToken>()), Times.Once);
+            }
+        }
+    }
+}
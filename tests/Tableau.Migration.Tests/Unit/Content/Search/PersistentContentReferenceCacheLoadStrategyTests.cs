@@ -0,0 +1,185 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.Collections.Immutable;
+using System.IO.Abstractions.TestingHelpers;
+using System.Linq;
+using System.Threading.Tasks;
+using Moq;
+using Tableau.Migration.Content.Search;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Content.Search
+{
+    public sealed class PersistentContentReferenceCacheLoadStrategyTests
+    {
+        public sealed class LoadAsync : AutoFixtureTestBase
+        {
+            private readonly MockFileSystem _fileSystem = new();
+            private readonly string _snapshotPath;
+
+            public LoadAsync()
+            {
+                _snapshotPath = _fileSystem.Path.Combine(_fileSystem.Path.GetTempPath(), "snapshots", "destination", "IUser.refs");
+            }
+
+            private PersistentContentReferenceCacheLoadStrategy<TestContentType> CreateStrategy(TimeSpan? maxAge = null)
+                => new(_fileSystem, _snapshotPath, maxAge ?? PersistentContentReferenceCacheLoadStrategy<TestContentType>.DefaultMaxAge);
+
+            private Mock<IContentReferenceCacheLoadAttempt<TestContentType>> CreateAttempt(List<IContentReference> added)
+            {
+                var mockAttempt = Create<Mock<IContentReferenceCacheLoadAttempt<TestContentType>>>();
+                mockAttempt.Setup(x => x.AddReferences(It.IsAny<IEnumerable<IContentReference>>()))
+                    .Callback<IEnumerable<IContentReference>>(added.AddRange);
+                mockAttempt.Setup(x => x.LoadItemAsync(Cancel))
+                    .ReturnsAsync(ContentReferenceLoadResult<TestContentType>.Empty);
+
+                return mockAttempt;
+            }
+
+            private async Task<ImmutableArray<TestContentType>> WriteSnapshotAsync()
+            {
+                var items = CreateMany<TestContentType>(3).ToImmutableArray();
+
+                var mockAttempt = CreateAttempt(new());
+                mockAttempt.Setup(x => x.GetLoadedReferences()).Returns(items.CastArray<IContentReference>());
+
+                await CreateStrategy().LoadAsync(mockAttempt.Object, Cancel);
+
+                return items;
+            }
+
+            private static void AssertReferences(IEnumerable<IContentReference> expected, IEnumerable<IContentReference> actual)
+            {
+                Assert.Equal(
+                    expected.Select(r => (r.Id, r.ContentUrl, r.Name, r.Location)).OrderBy(r => r.Id),
+                    actual.Select(r => (r.Id, r.ContentUrl, r.Name, r.Location)).OrderBy(r => r.Id));
+            }
+
+            [Fact]
+            public async Task BulkLoadsAndWritesSnapshotWithoutSnapshotAsync()
+            {
+                var items = CreateMany<TestContentType>(3).ToImmutableArray();
+                var added = new List<IContentReference>();
+
+                var mockAttempt = CreateAttempt(added);
+                mockAttempt.Setup(x => x.GetLoadedReferences()).Returns(items.CastArray<IContentReference>());
+                mockAttempt.Setup(x => x.IsItemLoaded()).Returns(true);
+
+                await CreateStrategy().LoadAsync(mockAttempt.Object, Cancel);
+
+                Assert.Empty(added);
+                Assert.True(_fileSystem.FileExists(_snapshotPath));
+                mockAttempt.Verify(x => x.LoadAllAsync(Cancel), Times.Once);
+                mockAttempt.Verify(x => x.LoadItemAsync(Cancel), Times.Never);
+            }
+
+            [Fact]
+            public async Task WarmStartsFromSnapshotAsync()
+            {
+                var items = await WriteSnapshotAsync();
+                var added = new List<IContentReference>();
+
+                var mockAttempt = CreateAttempt(added);
+                mockAttempt.Setup(x => x.IsItemLoaded()).Returns(() => added.Any());
+
+                await CreateStrategy().LoadAsync(mockAttempt.Object, Cancel);
+
+                AssertReferences(items, added);
+                mockAttempt.Verify(x => x.LoadAllAsync(Cancel), Times.Never);
+                mockAttempt.Verify(x => x.LoadItemAsync(Cancel), Times.Never);
+            }
+
+            [Fact]
+            public async Task SearchesDeltaIndividuallyAndAppendsAsync()
+            {
+                var items = await WriteSnapshotAsync();
+                var newItem = Create<TestContentType>();
+
+                var mockAttempt = CreateAttempt(new());
+                mockAttempt.Setup(x => x.IsItemLoaded()).Returns(false);
+                mockAttempt.Setup(x => x.LoadItemAsync(Cancel))
+                    .ReturnsAsync(new ContentReferenceLoadResult<TestContentType>(ImmutableArray.Create(newItem)));
+
+                await CreateStrategy().LoadAsync(mockAttempt.Object, Cancel);
+
+                mockAttempt.Verify(x => x.LoadAllAsync(Cancel), Times.Never);
+                mockAttempt.Verify(x => x.LoadItemAsync(Cancel), Times.Once);
+
+                // The appended item is loaded by the next run.
+                var added = new List<IContentReference>();
+                var nextAttempt = CreateAttempt(added);
+                nextAttempt.Setup(x => x.IsItemLoaded()).Returns(true);
+
+                await CreateStrategy().LoadAsync(nextAttempt.Object, Cancel);
+
+                AssertReferences(items.Append(newItem), added);
+            }
+
+            [Fact]
+            public async Task BulkLoadsWhenIndividualSearchUnsupportedAsync()
+            {
+                await WriteSnapshotAsync();
+
+                var mockAttempt = CreateAttempt(new());
+                mockAttempt.Setup(x => x.IsItemLoaded()).Returns(false);
+                mockAttempt.Setup(x => x.LoadItemAsync(Cancel))
+                    .ReturnsAsync(ContentReferenceLoadResult<TestContentType>.Unsupported);
+                mockAttempt.Setup(x => x.GetLoadedReferences()).Returns(ImmutableArray<IContentReference>.Empty);
+
+                await CreateStrategy().LoadAsync(mockAttempt.Object, Cancel);
+
+                mockAttempt.Verify(x => x.LoadItemAsync(Cancel), Times.Once);
+                mockAttempt.Verify(x => x.LoadAllAsync(Cancel), Times.Once);
+            }
+
+            [Fact]
+            public async Task IgnoresExpiredSnapshotAsync()
+            {
+                await WriteSnapshotAsync();
+                var added = new List<IContentReference>();
+
+                var mockAttempt = CreateAttempt(added);
+                mockAttempt.Setup(x => x.IsItemLoaded()).Returns(true);
+                mockAttempt.Setup(x => x.GetLoadedReferences()).Returns(ImmutableArray<IContentReference>.Empty);
+
+                await CreateStrategy(TimeSpan.Zero).LoadAsync(mockAttempt.Object, Cancel);
+
+                Assert.Empty(added);
+                mockAttempt.Verify(x => x.LoadAllAsync(Cancel), Times.Once);
+            }
+
+            [Fact]
+            public async Task IgnoresUnreadableSnapshotAsync()
+            {
+                _fileSystem.AddFile(_snapshotPath, new MockFileData(new byte[] { 1, 2, 3 }));
+                var added = new List<IContentReference>();
+
+                var mockAttempt = CreateAttempt(added);
+                mockAttempt.Setup(x => x.IsItemLoaded()).Returns(true);
+                mockAttempt.Setup(x => x.GetLoadedReferences()).Returns(ImmutableArray<IContentReference>.Empty);
+
+                await CreateStrategy().LoadAsync(mockAttempt.Object, Cancel);
+
+                Assert.Empty(added);
+                mockAttempt.Verify(x => x.LoadAllAsync(Cancel), Times.Once);
+            }
+        }
+    }
+}
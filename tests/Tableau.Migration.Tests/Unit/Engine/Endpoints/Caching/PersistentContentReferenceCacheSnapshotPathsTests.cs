@@ -0,0 +1,85 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.IO;
+using Moq;
+using Tableau.Migration.Api;
+using Tableau.Migration.Engine.Endpoints;
+using Tableau.Migration.Engine.Endpoints.Caching;
+using Tableau.Migration.Engine.Services;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Engine.Endpoints.Caching
+{
+    public sealed class PersistentContentReferenceCacheSnapshotPathsTests
+    {
+        public sealed class GetSnapshotPath : AutoFixtureTestBase
+        {
+            private static TableauApiEndpointConfiguration CreateEndpoint(string serverUrl, string siteContentUrl)
+                => new(new TableauSiteConnectionConfiguration(new Uri(serverUrl), siteContentUrl, "tokenName", "token"), MigrationServiceBuilder.Empty);
+
+            [Fact]
+            public void IncludesServerAndSite()
+            {
+                var path = PersistentContentReferenceCacheSnapshotPaths.GetSnapshotPath<TestContentType>("snapshots", "destination",
+                    CreateEndpoint("https://Online.Tableau.com", "mySite"));
+
+                Assert.Equal(Path.Combine("snapshots", "destination", "online.tableau.com", "mySite", "TestContentType.refs"), path);
+            }
+
+            [Fact]
+            public void IncludesNonDefaultPort()
+            {
+                var path = PersistentContentReferenceCacheSnapshotPaths.GetSnapshotPath<TestContentType>("snapshots", "source",
+                    CreateEndpoint("http://localhost:8080", "mySite"));
+
+                Assert.Equal(Path.Combine("snapshots", "source", "localhost_8080", "mySite", "TestContentType.refs"), path);
+            }
+
+            [Fact]
+            public void DefaultSite()
+            {
+                var path = PersistentContentReferenceCacheSnapshotPaths.GetSnapshotPath<TestContentType>("snapshots", "source",
+                    CreateEndpoint("https://localhost", string.Empty));
+
+                Assert.Equal(Path.Combine("snapshots", "source", "localhost",
+                    PersistentContentReferenceCacheSnapshotPaths.DefaultSiteDirectoryName, "TestContentType.refs"), path);
+            }
+
+            [Fact]
+            public void SeparatesSites()
+            {
+                var path1 = PersistentContentReferenceCacheSnapshotPaths.GetSnapshotPath<TestContentType>("snapshots", "destination",
+                    CreateEndpoint("https://localhost", "site1"));
+                var path2 = PersistentContentReferenceCacheSnapshotPaths.GetSnapshotPath<TestContentType>("snapshots", "destination",
+                    CreateEndpoint("https://localhost", "site2"));
+
+                Assert.NotEqual(path1, path2);
+            }
+
+            [Fact]
+            public void NonApiEndpoint()
+            {
+                var path = PersistentContentReferenceCacheSnapshotPaths.GetSnapshotPath<TestContentType>("snapshots", "source",
+                    Mock.Of<IMigrationPlanEndpointConfiguration>());
+
+                Assert.Equal(Path.Combine("snapshots", "source", "TestContentType.refs"), path);
+            }
+        }
+    }
+}
@@ -16,6 +16,7 @@
 //
 
 using System;
+using System.Collections.Generic;
 using System.Collections.Immutable;
 using System.Linq;
 using System.Threading;
@@ -512,6 +513,134 @@ namespace Tableau.Migration.Tests.Unit.Engine.Endpoints.Search
 
         #endregion
 
+        #region - FindManyBySourceLocationsAsync -
+
+        public sealed class FindManyBySourceLocationsAsync : LocationDestinationContentFinderTest
+        {
+            [Fact]
+            public async Task FindsManifestDynamicAndCachedAsync()
+            {
+                var destinationItem = Create<TestContentType>();
+                var destinationInfo = Create<IContentReference>();
+                var mappedItem = Create<TestContentType>();
+                var mappedLoc = Create<ContentLocation>();
+                var dynamicItem = Create<TestContentType>();
+                var missingLoc = Create<ContentLocation>();
+
+                var entries = Manifest.Entries.GetOrCreatePartition<TestContentType>().GetEntryBuilder(2)
+                    .CreateEntries(new[] { destinationItem, mappedItem }, (i, e) => e, 0);
+
+                entries.First().DestinationFound(destinationInfo);
+                entries.Last().MapToDestination(mappedLoc);
+
+                var dynamicEntry = CreateManifestEntry(dynamicItem);
+                MockManifestUpdateCache.Setup(x => x.UpdateManifestByLocationAsync(dynamicItem.Location, Cancel))
+                    .ReturnsAsync(dynamicEntry);
+                MockManifestUpdateCache.Setup(x => x.UpdateManifestByLocationAsync(missingLoc, Cancel))
+                    .ReturnsAsync((IMigrationManifestEntryEditor?)null);
+
+                var mappedCacheItem = Create<IContentReference>();
+                var dynamicCacheItem = Create<IContentReference>();
+                IImmutableDictionary<ContentLocation, IContentReference?> cacheResult = new Dictionary<ContentLocation, IContentReference?>
+                {
+                    { mappedLoc, mappedCacheItem },
+                    { dynamicEntry.MappedLocation, dynamicCacheItem }
+                }.ToImmutableDictionary();
+
+                MockCache.Setup(x => x.ForLocationsAsync(It.IsAny<IEnumerable<ContentLocation>>(), Cancel))
+                    .ReturnsAsync(cacheResult);
+
+                var result = await Finder.FindManyBySourceLocationsAsync(new[] { destinationItem.Location, mappedItem.Location, dynamicItem.Location, missingLoc }, Cancel);
+
+                Assert.Equal(4, result.Count);
+                Assert.Same(destinationInfo, result[destinationItem.Location]);
+                Assert.Same(mappedCacheItem, result[mappedItem.Location]);
+                Assert.Same(dynamicCacheItem, result[dynamicItem.Location]);
+                Assert.Null(result[missingLoc]);
+
+                MockCache.Verify(x => x.ForLocationsAsync(It.Is<IEnumerable<ContentLocation>>(l => l.Count() == 2), Cancel), Times.Once);
+                MockCache.Verify(x => x.ForLocationAsync(It.IsAny<ContentLocation>(), It.IsAny<CancellationToken>()), Times.Never);
+            }
+        }
+
+        #endregion
+
+        #region - FindManyBySourceIdsAsync -
+
+        public sealed class FindManyBySourceIdsAsync : LocationDestinationContentFinderTest
+        {
+            [Fact]
+            public async Task FindsManifestAndCachedAsync()
+            {
+                var destinationItem = Create<TestContentType>();
+                var destinationInfo = Create<IContentReference>();
+                var mappedItem = Create<TestContentType>();
+                var mappedLoc = Create<ContentLocation>();
+
+                var entries = Manifest.Entries.GetOrCreatePartition<TestContentType>().GetEntryBuilder(2)
+                    .CreateEntries(new[] { destinationItem, mappedItem }, (i, e) => e, 0);
+
+                entries.First().DestinationFound(destinationInfo);
+                entries.Last().MapToDestination(mappedLoc);
+
+                var mappedCacheItem = Create<IContentReference>();
+                IImmutableDictionary<ContentLocation, IContentReference?> cacheResult = new Dictionary<ContentLocation, IContentReference?>
+                {
+                    { mappedLoc, mappedCacheItem }
+                }.ToImmutableDictionary();
+
+                MockCache.Setup(x => x.ForLocationsAsync(It.IsAny<IEnumerable<ContentLocation>>(), Cancel))
+                    .ReturnsAsync(cacheResult);
+
+                var result = await Finder.FindManyBySourceIdsAsync(new[] { destinationItem.Id, mappedItem.Id }, Cancel);
+
+                Assert.Equal(2, result.Count);
+                Assert.Same(destinationInfo, result[destinationItem.Id]);
+                Assert.Same(mappedCacheItem, result[mappedItem.Id]);
+
+                MockCache.Verify(x => x.ForLocationsAsync(It.IsAny<IEnumerable<ContentLocation>>(), Cancel), Times.Once);
+            }
+        }
+
+        #endregion
+
+        #region - FindManyByIdsAsync -
+
+        public sealed class FindManyByIdsAsync : LocationDestinationContentFinderTest
+        {
+            [Fact]
+            public async Task FindsManifestAndCachedAsync()
+            {
+                var sourceItem = Create<TestContentType>();
+                var destinationInfo = Create<IContentReference>();
+
+                var entry = Manifest.Entries.GetOrCreatePartition<TestContentType>().GetEntryBuilder(1)
+                    .CreateEntries(new[] { sourceItem }, (i, e) => e, 0);
+
+                entry.Single().DestinationFound(destinationInfo);
+
+                var cacheItem = Create<IContentReference>();
+                IImmutableDictionary<Guid, IContentReference?> cacheResult = new Dictionary<Guid, IContentReference?>
+                {
+                    { cacheItem.Id, cacheItem }
+                }.ToImmutableDictionary();
+
+                MockCache.Setup(x => x.ForIdsAsync(It.IsAny<IEnumerable<Guid>>(), Cancel))
+                    .ReturnsAsync(cacheResult);
+
+                var result = await Finder.FindManyByIdsAsync(new[] { destinationInfo.Id, cacheItem.Id }, Cancel);
+
+                Assert.Equal(2, result.Count);
+                Assert.Same(destinationInfo, result[destinationInfo.Id]);
+                Assert.Same(cacheItem, result[cacheItem.Id]);
+
+                MockCache.Verify(x => x.ForIdsAsync(It.Is<IEnumerable<Guid>>(ids => ids.Single() == cacheItem.Id), Cancel), Times.Once);
+                MockCache.Verify(x => x.ForIdAsync(It.IsAny<Guid>(), It.IsAny<CancellationToken>()), Times.Never);
+            }
+        }
+
+        #endregion
+
         #region - FindAllAsync -
 
         public sealed class FindAllAsync : LocationDestinationContentFinderTest
@@ -16,6 +16,7 @@
 //
 
 using System;
+using System.Collections.Generic;
 using System.Collections.Immutable;
 using System.Linq;
 using System.Threading;
@@ -152,6 +153,93 @@ namespace Tableau.Migration.Tests.Unit.Engine.Endpoints.Search
 
         #endregion
 
+        #region - FindManyByIdsAsync -
+
+        public sealed class FindManyByIdsAsync : ManifestSourceContentReferenceFinderTest
+        {
+            [Fact]
+            public async Task FindsManifestAndCacheReferencesAsync()
+            {
+                var manifestItem = Create<TestContentType>();
+                var cacheItem = Create<TestContentType>();
+                var missingId = Guid.NewGuid();
+
+                var entry = Manifest.Entries.GetOrCreatePartition<TestContentType>().GetEntryBuilder(1)
+                    .CreateEntries(new[] { manifestItem }, (i, e) => e, 0)
+                    .Single();
+
+                IImmutableDictionary<Guid, IContentReference?> cacheResult = new Dictionary<Guid, IContentReference?>
+                {
+                    { cacheItem.Id, cacheItem },
+                    { missingId, null }
+                }.ToImmutableDictionary();
+
+                ContentReferenceCache.Setup(x => x.ForIdsAsync(It.IsAny<IEnumerable<Guid>>(), Cancel))
+                    .ReturnsAsync(cacheResult);
+
+                var result = await Finder.FindManyByIdsAsync(new[] { manifestItem.Id, cacheItem.Id, missingId }, Cancel);
+
+                Assert.Equal(3, result.Count);
+                Assert.Same(entry.Source, result[manifestItem.Id]);
+                Assert.Same(cacheItem, result[cacheItem.Id]);
+                Assert.Null(result[missingId]);
+
+                ContentReferenceCache.Verify(x => x.ForIdsAsync(It.Is<IEnumerable<Guid>>(ids => ids.SequenceEqual(new[] { cacheItem.Id, missingId })), Cancel), Times.Once);
+                ContentReferenceCache.Verify(x => x.ForIdAsync(It.IsAny<Guid>(), It.IsAny<CancellationToken>()), Times.Never);
+            }
+
+            [Fact]
+            public async Task AllInManifestSkipsCacheAsync()
+            {
+                var sourceItems = CreateMany<TestContentType>().ToImmutableArray();
+
+                Manifest.Entries.GetOrCreatePartition<TestContentType>().GetEntryBuilder(sourceItems.Length)
+                    .CreateEntries(sourceItems, (i, e) => e, 0);
+
+                var result = await Finder.FindManyByIdsAsync(sourceItems.Select(i => i.Id), Cancel);
+
+                Assert.Equal(sourceItems.Length, result.Count);
+                ContentReferenceCache.Verify(x => x.ForIdsAsync(It.IsAny<IEnumerable<Guid>>(), It.IsAny<CancellationToken>()), Times.Never);
+            }
+        }
+
+        #endregion
+
+        #region - FindManyBySourceLocationsAsync -
+
+        public sealed class FindManyBySourceLocationsAsync : ManifestSourceContentReferenceFinderTest
+        {
+            [Fact]
+            public async Task FindsManifestAndCacheReferencesAsync()
+            {
+                var manifestItem = Create<TestContentType>();
+                var cacheItem = Create<TestContentType>();
+
+                var entry = Manifest.Entries.GetOrCreatePartition<TestContentType>().GetEntryBuilder(1)
+                    .CreateEntries(new[] { manifestItem }, (i, e) => e, 0)
+                    .Single();
+
+                IImmutableDictionary<ContentLocation, IContentReference?> cacheResult = new Dictionary<ContentLocation, IContentReference?>
+                {
+                    { cacheItem.Location, cacheItem }
+                }.ToImmutableDictionary();
+
+                ContentReferenceCache.Setup(x => x.ForLocationsAsync(It.IsAny<IEnumerable<ContentLocation>>(), Cancel))
+                    .ReturnsAsync(cacheResult);
+
+                var result = await Finder.FindManyBySourceLocationsAsync(new[] { manifestItem.Location, cacheItem.Location }, Cancel);
+
+                Assert.Equal(2, result.Count);
+                Assert.Same(entry.Source, result[manifestItem.Location]);
+                Assert.Same(cacheItem, result[cacheItem.Location]);
+
+                ContentReferenceCache.Verify(x => x.ForLocationsAsync(It.IsAny<IEnumerable<ContentLocation>>(), Cancel), Times.Once);
+                ContentReferenceCache.Verify(x => x.ForLocationAsync(It.IsAny<ContentLocation>(), It.IsAny<CancellationToken>()), Times.Never);
+            }
+        }
+
+        #endregion
+
         #region - FindAllAsync -
 
         public sealed class FindAllAsync : ManifestSourceContentReferenceFinderTest
@@ -18,6 +18,7 @@
 using System;
 using System.Collections.Generic;
 using System.Collections.Immutable;
+using System.Linq;
 using System.Threading;
 using System.Threading.Tasks;
 using AutoFixture;
@@ -54,6 +55,69 @@ namespace Tableau.Migration.Tests.Unit.Engine.Hooks.Mappings
             }
         }
 
+        private class TestBatchMapping : TestMapping, IContentBatchMapping<IUser>
+        {
+            private readonly List<IReadOnlyList<ContentMappingContext<IUser>>> _batches;
+            private readonly Func<IReadOnlyList<ContentMappingContext<IUser>>, IEnumerable<ContentMappingContext<IUser>>?> _map;
+
+            public TestBatchMapping(List<IReadOnlyList<ContentMappingContext<IUser>>> batches, Func<IReadOnlyList<ContentMappingContext<IUser>>, IEnumerable<ContentMappingContext<IUser>>?> map)
+                : base(new(), null)
+            {
+                _batches = batches;
+                _map = map;
+            }
+
+            public Task<IReadOnlyList<ContentMappingContext<IUser>>> ExecuteBatchAsync(IReadOnlyList<ContentMappingContext<IUser>> contexts, CancellationToken cancel)
+            {
+                _batches.Add(contexts);
+
+                var mapped = _map(contexts);
+                return Task.FromResult<IReadOnlyList<ContentMappingContext<IUser>>>(mapped is null ? null! : mapped.ToImmutableArray());
+            }
+        }
+
+        private class CallOrderMapping : IContentBatchMapping<IUser>
+        {
+            private readonly string _name;
+            private readonly List<(string Name, ContentMappingContext<IUser> Context)> _calls;
+
+            public CallOrderMapping(string name, List<(string Name, ContentMappingContext<IUser> Context)> calls)
+            {
+                _name = name;
+                _calls = calls;
+            }
+
+            public Task<ContentMappingContext<IUser>?> ExecuteAsync(ContentMappingContext<IUser> ctx, CancellationToken cancel)
+            {
+                _calls.Add((_name, ctx));
+
+                return Task.FromResult<ContentMappingContext<IUser>?>(null);
+            }
+
+            public Task<IReadOnlyList<ContentMappingContext<IUser>>> ExecuteBatchAsync(IReadOnlyList<ContentMappingContext<IUser>> contexts, CancellationToken cancel)
+            {
+                foreach (var ctx in contexts)
+                {
+                    _calls.Add((_name, ctx));
+                }
+
+                return Task.FromResult(contexts);
+            }
+        }
+
+        private class CallOrderItemMapping : IContentMapping<IUser>
+        {
+            private readonly CallOrderMapping _inner;
+
+            public CallOrderItemMapping(string name, List<(string Name, ContentMappingContext<IUser> Context)> calls)
+            {
+                _inner = new(name, calls);
+            }
+
+            public Task<ContentMappingContext<IUser>?> ExecuteAsync(ContentMappingContext<IUser> ctx, CancellationToken cancel)
+                => _inner.ExecuteAsync(ctx, cancel);
+        }
+
         #endregion
 
         #region - ExecuteAsync -
@@ -150,5 +214,179 @@ namespace Tableau.Migration.Tests.Unit.Engine.Hooks.Mappings
         }
 
         #endregion
+
+        #region - ExecuteBatchAsync -
+
+        public class ExecuteBatchAsync : AutoFixtureTestBase
+        {
+            private readonly List<ContentMappingContext<IUser>> _mappingExecutionContexts;
+            private readonly List<IReadOnlyList<ContentMappingContext<IUser>>> _batches;
+            private readonly List<IMigrationHookFactory> _mappingFactories;
+
+            private readonly ContentMappingRunner _runner;
+
+            public ExecuteBatchAsync()
+            {
+                _mappingExecutionContexts = new();
+                _batches = new();
+                _mappingFactories = new();
+
+                var mockMappings = AutoFixture.Create<Mock<IMigrationHookFactoryCollection>>();
+                mockMappings
+                    .Setup(x => x.GetHooks<IContentMapping<IUser>>())
+                    .Returns(() => _mappingFactories.ToImmutableArray());
+
+                var mockPlan = AutoFixture.Create<Mock<IMigrationPlan>>();
+                mockPlan
+                    .SetupGet(x => x.Mappings)
+                    .Returns(mockMappings.Object);
+
+                _runner = new(
+                    mockPlan.Object,
+                    new Mock<IServiceProvider>().Object,
+                    Create<ISharedResourcesLocalizer>(),
+                    Create<ILogger<ContentMappingRunner>>());
+            }
+
+            [Fact]
+            public async Task CallsBatchMappingOnceAsync()
+            {
+                // Arrange
+                var mappedLocation = Create<ContentLocation>();
+                var mapping = new TestBatchMapping(_batches, contexts => contexts.Select(ctx => ctx.MapTo(mappedLocation)));
+                _mappingFactories.Add(new MigrationHookFactory(s => mapping));
+
+                var input = CreateMany<ContentMappingContext<IUser>>(5).ToImmutableArray();
+
+                // Act
+                var result = await _runner.ExecuteBatchAsync<IUser>(input, default);
+
+                // Asserts
+                Assert.Equal(input, Assert.Single(_batches).ToImmutableArray());
+                Assert.All(result, ctx => Assert.Equal(mappedLocation, ctx.MappedLocation));
+                Assert.Equal(input.Select(x => x.ContentItem), result.Select(x => x.ContentItem));
+            }
+
+            [Fact]
+            public async Task CallsPerItemMappingForEachItemInOrderAsync()
+            {
+                // Arrange
+                var first = new TestBatchMapping(_batches, contexts => contexts.Select(ctx => ctx.MapTo(Create<ContentLocation>())));
+                var second = new TestMapping(_mappingExecutionContexts, null);
+
+                _mappingFactories.Add(new MigrationHookFactory(s => first));
+                _mappingFactories.Add(new MigrationHookFactory(s => second));
+
+                var input = CreateMany<ContentMappingContext<IUser>>(3).ToImmutableArray();
+
+                // Act
+                var result = await _runner.ExecuteBatchAsync<IUser>(input, default);
+
+                // Asserts
+                Assert.Equal(result.ToArray(), _mappingExecutionContexts);
+            }
+
+            [Fact]
+            public async Task RunsEachItemThroughPerItemMappingsWithoutBatchMappingsAsync()
+            {
+                // Arrange
+                var calls = new List<(string Name, ContentMappingContext<IUser> Context)>();
+                var created = 0;
+
+                _mappingFactories.Add(new MigrationHookFactory(s => { created++; return new CallOrderItemMapping("a", calls); }));
+                _mappingFactories.Add(new MigrationHookFactory(s => { created++; return new CallOrderItemMapping("b", calls); }));
+
+                var input = CreateMany<ContentMappingContext<IUser>>(2).ToImmutableArray();
+
+                Assert.False(_runner.HasBatchMappings<IUser>());
+                created = 0;
+
+                // Act
+                var result = await _runner.ExecuteBatchAsync<IUser>(input, default);
+
+                // Asserts
+                Assert.Equal(input, result.ToImmutableArray());
+                Assert.Equal(new[] { ("a", input[0]), ("b", input[0]), ("a", input[1]), ("b", input[1]) }, calls);
+                Assert.Equal(4, created);
+            }
+
+            [Fact]
+            public async Task KeepsPerItemOrderAroundBatchMappingsAsync()
+            {
+                // Arrange
+                var calls = new List<(string Name, ContentMappingContext<IUser> Context)>();
+
+                _mappingFactories.Add(new MigrationHookFactory(s => new CallOrderItemMapping("a", calls)));
+                _mappingFactories.Add(new MigrationHookFactory(s => new CallOrderItemMapping("b", calls)));
+                _mappingFactories.Add(new MigrationHookFactory(s => new CallOrderMapping("batch", calls)));
+                _mappingFactories.Add(new MigrationHookFactory(s => new CallOrderItemMapping("c", calls)));
+
+                var input = CreateMany<ContentMappingContext<IUser>>(2).ToImmutableArray();
+
+                Assert.True(_runner.HasBatchMappings<IUser>());
+
+                // Act
+                var result = await _runner.ExecuteBatchAsync<IUser>(input, default);
+
+                // Asserts
+                Assert.Equal(input, result.ToImmutableArray());
+                Assert.Equal(new[]
+                {
+                    ("a", input[0]), ("b", input[0]),
+                    ("a", input[1]), ("b", input[1]),
+                    ("batch", input[0]), ("batch", input[1]),
+                    ("c", input[0]), ("c", input[1])
+                }, calls);
+            }
+
+            [Fact]
+            public async Task BatchMappingCountMismatchThrowsAsync()
+            {
+                // Arrange
+                var mapping = new TestBatchMapping(_batches, contexts => contexts.Skip(1));
+                _mappingFactories.Add(new MigrationHookFactory(s => mapping));
+
+                var input = CreateMany<ContentMappingContext<IUser>>(2).ToImmutableArray();
+
+                // Act/Assert
+                await Assert.ThrowsAsync<InvalidOperationException>(() => _runner.ExecuteBatchAsync<IUser>(input, default));
+            }
+
+            [Fact]
+            public async Task NullBatchResultKeepsInputContextsAsync()
+            {
+                // Arrange
+                var mapping = new TestBatchMapping(_batches, contexts => null);
+                _mappingFactories.Add(new MigrationHookFactory(s => mapping));
+
+                var input = CreateMany<ContentMappingContext<IUser>>(2).ToImmutableArray();
+
+                // Act
+                var result = await _runner.ExecuteBatchAsync<IUser>(input, default);
+
+                // Asserts
+                Assert.Equal(input, result.ToImmutableArray());
+            }
+
+            [Fact]
+            public async Task NullBatchResultElementsKeepInputContextsAsync()
+            {
+                // Arrange
+                var mappedLocation = Create<ContentLocation>();
+                var mapping = new TestBatchMapping(_batches, contexts => new[] { contexts[0].MapTo(mappedLocation), null! });
+                _mappingFactories.Add(new MigrationHookFactory(s => mapping));
+
+                var input = CreateMany<ContentMappingContext<IUser>>(2).ToImmutableArray();
+
+                // Act
+                var result = await _runner.ExecuteBatchAsync<IUser>(input, default);
+
+                // Asserts
+                Assert.Equal(mappedLocation, result[0].MappedLocation);
+                Assert.Same(input[1], result[1]);
+            }
+        }
+
+        #endregion
     }
 }
@@ -17,6 +17,7 @@
 
 using System;
 using System.Collections;
+using System.Collections.Generic;
 using System.Collections.Immutable;
 using System.Linq;
 using System.Threading;
@@ -422,6 +423,57 @@ namespace Tableau.Migration.Tests.Unit.Engine.Manifest
                 Assert.All(entries, e => Assert.Same(e.ManifestEntry, Partition.ByMappedLocation[e.ManifestEntry.MappedLocation]));
                 Assert.All(items, i => _mockMappingRunner.Verify(x => x.ExecuteAsync<TestContentType>(It.Is<ContentMappingContext<TestContentType>>(ctx => ctx.ContentItem == i), _cancel), Times.Once));
             }
+
+            [Fact]
+            public async Task MapsEntriesInBatchAsync()
+            {
+                const int COUNT = 10;
+                var items = CreateMany<TestContentType>(COUNT).ToImmutableArray();
+
+                var mockBatchMappingRunner = Create<Mock<IContentBatchMappingRunner>>();
+                mockBatchMappingRunner.Setup(x => x.HasBatchMappings<TestContentType>()).Returns(true);
+                mockBatchMappingRunner.Setup(x => x.ExecuteBatchAsync(It.IsAny<IReadOnlyList<ContentMappingContext<TestContentType>>>(), _cancel))
+                    .ReturnsAsync((IReadOnlyList<ContentMappingContext<TestContentType>> contexts, CancellationToken cancel)
+                        => contexts.Select(ctx => ctx.MapTo(Create<ContentLocation>())).ToImmutableArray());
+
+                var entryBuilder = Partition.GetEntryBuilder(COUNT);
+
+                var entries = entryBuilder
+                    .CreateEntries(items, (i, e) => new ContentMigrationItem<TestContentType>(i, e), 0);
+
+                var result = await entryBuilder.MapEntriesAsync(items, mockBatchMappingRunner.Object, _cancel);
+
+                Assert.Same(entryBuilder, result);
+
+                Assert.All(entries, e => Assert.Same(e.ManifestEntry, Partition.ByMappedLocation[e.ManifestEntry.MappedLocation]));
+                mockBatchMappingRunner.Verify(x => x.ExecuteBatchAsync(It.Is<IReadOnlyList<ContentMappingContext<TestContentType>>>(c => c.Count == COUNT), _cancel), Times.Once);
+                mockBatchMappingRunner.Verify(x => x.ExecuteAsync(It.IsAny<ContentMappingContext<TestContentType>>(), _cancel), Times.Never);
+            }
+
+            [Fact]
+            public async Task MapsEntriesPerItemWithoutBatchMappingsAsync()
+            {
+                const int COUNT = 10;
+                var items = CreateMany<TestContentType>(COUNT).ToImmutableArray();
+
+                var mockBatchMappingRunner = Create<Mock<IContentBatchMappingRunner>>();
+                mockBatchMappingRunner.Setup(x => x.HasBatchMappings<TestContentType>()).Returns(false);
+                mockBatchMappingRunner.Setup(x => x.ExecuteAsync(It.IsAny<ContentMappingContext<TestContentType>>(), _cancel))
+                    .ReturnsAsync((ContentMappingContext<TestContentType> ctx, CancellationToken cancel) => ctx.MapTo(Create<ContentLocation>()));
+
+                var entryBuilder = Partition.GetEntryBuilder(COUNT);
+
+                var entries = entryBuilder
+                    .CreateEntries(items, (i, e) => new ContentMigrationItem<TestContentType>(i, e), 0);
+
+                var result = await entryBuilder.MapEntriesAsync(items, mockBatchMappingRunner.Object, _cancel);
+
+                Assert.Same(entryBuilder, result);
+
+                Assert.All(entries, e => Assert.Same(e.ManifestEntry, Partition.ByMappedLocation[e.ManifestEntry.MappedLocation]));
+                mockBatchMappingRunner.Verify(x => x.ExecuteAsync(It.IsAny<ContentMappingContext<TestContentType>>(), _cancel), Times.Exactly(COUNT));
+                mockBatchMappingRunner.Verify(x => x.ExecuteBatchAsync(It.IsAny<IReadOnlyList<ContentMappingContext<TestContentType>>>(), _cancel), Times.Never);
+            }
         }
 
         #endregion
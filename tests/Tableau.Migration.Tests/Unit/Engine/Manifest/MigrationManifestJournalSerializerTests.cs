@@ -0,0 +1,205 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System.IO.Abstractions.TestingHelpers;
+using System.Linq;
+using System.Threading.Tasks;
+using Tableau.Migration.Engine.Manifest;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Engine.Manifest
+{
+    public class MigrationManifestJournalSerializerTests
+    {
+        public abstract class MigrationManifestJournalSerializerTest : AutoFixtureTestBase
+        {
+            protected readonly MockFileSystem FileSystem = new();
+
+            protected readonly MigrationManifestSerializer SnapshotSerializer;
+
+            protected readonly MigrationManifestJournalSerializer Serializer;
+
+            protected readonly MigrationManifest Manifest;
+
+            protected readonly string Path;
+
+            protected string JournalPath => MigrationManifestJournalSerializer.GetJournalPath(Path);
+
+            public MigrationManifestJournalSerializerTest()
+            {
+                SnapshotSerializer = new(FileSystem);
+                Serializer = new(FileSystem, SnapshotSerializer);
+
+                Manifest = (MigrationManifest)Create<IMigrationManifest>();
+                Path = FileSystem.Path.Combine(FileSystem.Path.GetTempPath(), "manifests", "manifest.json");
+            }
+
+            protected async Task<bool> ChangeAndAppendEntryAsync(int compactionThreshold = MigrationManifestJournalSerializer.DefaultCompactionThreshold)
+            {
+                var contentType = Manifest.Entries.GetPartitionTypes().First();
+                var entry = (IMigrationManifestEntryEditor)Manifest.Entries.ForContentType(contentType).First();
+
+                entry.SetSkipped(false, "journal");
+
+                return await Serializer.AppendAsync(Manifest, contentType, [entry], Path, compactionThreshold, Cancel);
+            }
+        }
+
+        public class AppendAsync : MigrationManifestJournalSerializerTest
+        {
+            [Fact]
+            public async Task CompactsWithoutSnapshotAsync()
+            {
+                var compacted = await ChangeAndAppendEntryAsync();
+
+                Assert.True(compacted);
+                Assert.True(FileSystem.File.Exists(Path));
+                Assert.False(FileSystem.File.Exists(JournalPath));
+            }
+
+            [Fact]
+            public async Task AppendsChangedEntriesAsync()
+            {
+                await Serializer.CompactAsync(Manifest, Path, Cancel);
+                var snapshot = FileSystem.File.ReadAllText(Path);
+
+                var compacted = await ChangeAndAppendEntryAsync();
+
+                Assert.False(compacted);
+                Assert.Equal(snapshot, FileSystem.File.ReadAllText(Path));
+
+                // Header line and one record.
+                Assert.Equal(2, FileSystem.File.ReadAllLines(JournalPath).Length);
+            }
+
+            [Fact]
+            public async Task CompactsSnapshotWithUnknownGenerationAsync()
+            {
+                await SnapshotSerializer.SaveAsync(Manifest, Path);
+
+                var compacted = await ChangeAndAppendEntryAsync();
+
+                Assert.True(compacted);
+                Assert.False(FileSystem.File.Exists(JournalPath));
+            }
+
+            [Fact]
+            public async Task ContinuesLoadedJournalAsync()
+            {
+                await Serializer.CompactAsync(Manifest, Path, Cancel);
+                await ChangeAndAppendEntryAsync();
+
+                var serializer = new MigrationManifestJournalSerializer(FileSystem, SnapshotSerializer);
+                await serializer.LoadAsync(Path, Cancel);
+
+                var contentType = Manifest.Entries.GetPartitionTypes().First();
+                var entry = Manifest.Entries.ForContentType(contentType).First();
+                var compacted = await serializer.AppendAsync(Manifest, contentType, [entry], Path, Cancel);
+
+                Assert.False(compacted);
+                Assert.Equal(3, FileSystem.File.ReadAllLines(JournalPath).Length);
+            }
+
+            [Fact]
+            public async Task CompactsAtThresholdAsync()
+            {
+                await Serializer.CompactAsync(Manifest, Path, Cancel);
+
+                var compacted = await ChangeAndAppendEntryAsync(compactionThreshold: 0);
+
+                Assert.True(compacted);
+                Assert.False(FileSystem.File.Exists(JournalPath));
+                Assert.Equal(Manifest, await SnapshotSerializer.LoadAsync(Path, Cancel));
+            }
+        }
+
+        public class LoadAsync : MigrationManifestJournalSerializerTest
+        {
+            [Fact]
+            public async Task MissingFileAsync()
+            {
+                Assert.Null(await Serializer.LoadAsync(Path, Cancel));
+            }
+
+            [Fact]
+            public async Task LoadsSnapshotWithoutJournalAsync()
+            {
+                await SnapshotSerializer.SaveAsync(Manifest, Path);
+
+                Assert.Equal(Manifest, await Serializer.LoadAsync(Path, Cancel));
+            }
+
+            [Fact]
+            public async Task ReplaysJournalAsync()
+            {
+                await Serializer.CompactAsync(Manifest, Path, Cancel);
+                await ChangeAndAppendEntryAsync();
+
+                Assert.Equal(Manifest, await Serializer.LoadAsync(Path, Cancel));
+            }
+
+            [Fact]
+            public async Task StopsAtIncompleteRecordAsync()
+            {
+                await Serializer.CompactAsync(Manifest, Path, Cancel);
+                await ChangeAndAppendEntryAsync();
+
+                FileSystem.File.AppendAllText(JournalPath, "{\"ContentType\":\"Tableau.Migr");
+
+                Assert.Equal(Manifest, await Serializer.LoadAsync(Path, Cancel));
+            }
+
+            [Fact]
+            public async Task IgnoresJournalOfOtherGenerationAsync()
+            {
+                await Serializer.CompactAsync(Manifest, Path, Cancel);
+                await ChangeAndAppendEntryAsync();
+                var staleJournal = FileSystem.File.ReadAllText(JournalPath);
+
+                var contentType = Manifest.Entries.GetPartitionTypes().First();
+                var entry = (IMigrationManifestEntryEditor)Manifest.Entries.ForContentType(contentType).First();
+                entry.SetSkipped(false, "compacted");
+                await Serializer.CompactAsync(Manifest, Path, Cancel);
+
+                // An interrupted compaction leaves the journal of the previous snapshot behind, with any file time.
+                FileSystem.File.WriteAllText(JournalPath, staleJournal);
+
+                Assert.Equal(Manifest, await Serializer.LoadAsync(Path, Cancel));
+            }
+
+            [Fact]
+            public async Task ReplacesEntryWithDifferentPathCaseAsync()
+            {
+                await Serializer.CompactAsync(Manifest, Path, Cancel);
+                await ChangeAndAppendEntryAsync();
+
+                var contentType = Manifest.Entries.GetPartitionTypes().First();
+                var entry = Manifest.Entries.ForContentType(contentType).First();
+                var path = entry.Source.Location.Path;
+
+                var lines = FileSystem.File.ReadAllLines(JournalPath);
+                lines[1] = lines[1].Replace(path, path.ToUpperInvariant());
+                FileSystem.File.WriteAllLines(JournalPath, lines);
+
+                var loaded = await Serializer.LoadAsync(Path, Cancel);
+
+                Assert.NotNull(loaded);
+                Assert.Equal(Manifest.Entries.ForContentType(contentType).Count(), loaded.Entries.ForContentType(contentType).Count());
+            }
+        }
+    }
+}
@@ -282,6 +282,126 @@ namespace Tableau.Migration.Tests.Unit.Engine.Manifest
             Assert.NotNull(loadedManifest);
             Assert.Equal(PipelineProfile.ServerToCloud, loadedManifest.PipelineProfile);
         }
+
+        [Fact]
+        public async Task ManifestSaveLoadShardedAsync()
+        {
+            var manifest = Create<IMigrationManifest>();
+            var fileSystem = new MockFileSystem();
+            var serializer = new MigrationManifestSerializer(fileSystem);
+            var directory = fileSystem.Path.Combine(fileSystem.Path.GetTempPath(), "manifest");
+            var cancel = new CancellationToken();
+
+            await serializer.SaveShardedAsync(manifest, directory, cancel);
+
+            Assert.True(fileSystem.File.Exists(fileSystem.Path.Combine(directory, MigrationManifestSerializer.ShardedManifestIndexFileName)));
+            Assert.Equal(manifest.Entries.GetPartitionTypes().Count() + 1, fileSystem.Directory.GetFiles(directory).Length);
+
+            var loadedManifest = await serializer.LoadShardedAsync(directory, null, cancel);
+
+            Assert.NotNull(loadedManifest);
+            Assert.Equal(manifest as MigrationManifest, loadedManifest);
+        }
+
+        [Fact]
+        public async Task ManifestSaveShardedReplacesExistingAsync()
+        {
+            var manifest = Create<IMigrationManifest>();
+            var fileSystem = new MockFileSystem();
+            var serializer = new MigrationManifestSerializer(fileSystem);
+            var directory = fileSystem.Path.Combine(fileSystem.Path.GetTempPath(), "manifest");
+            var cancel = new CancellationToken();
+
+            await serializer.SaveShardedAsync(Create<IMigrationManifest>(), directory, cancel);
+            await serializer.SaveShardedAsync(manifest, directory, cancel);
+
+            Assert.Equal(manifest.Entries.GetPartitionTypes().Count() + 1, fileSystem.Directory.GetFiles(directory).Length);
+
+            var loadedManifest = await serializer.LoadShardedAsync(directory, null, cancel);
+
+            Assert.NotNull(loadedManifest);
+            Assert.Equal(manifest as MigrationManifest, loadedManifest);
+        }
+
+        [Fact]
+        public async Task ManifestSaveShardedKeepsUnloadedPartitionsAsync()
+        {
+            var manifest = Create<IMigrationManifest>();
+            var fileSystem = new MockFileSystem();
+            var serializer = new MigrationManifestSerializer(fileSystem);
+            var directory = fileSystem.Path.Combine(fileSystem.Path.GetTempPath(), "manifest");
+            var otherDirectory = fileSystem.Path.Combine(fileSystem.Path.GetTempPath(), "other");
+            var cancel = new CancellationToken();
+
+            var partitionType = manifest.Entries.GetPartitionTypes().First();
+
+            await serializer.SaveShardedAsync(manifest, directory, cancel);
+            var partialManifest = await serializer.LoadShardedAsync(directory, [partitionType], cancel);
+
+            Assert.NotNull(partialManifest);
+
+            await serializer.SaveShardedAsync(partialManifest, directory, cancel);
+            await serializer.SaveShardedAsync(partialManifest, otherDirectory, cancel);
+
+            Assert.Equal(manifest as MigrationManifest, await serializer.LoadShardedAsync(directory, null, cancel));
+            Assert.Equal(manifest as MigrationManifest, await serializer.LoadShardedAsync(otherDirectory, null, cancel));
+        }
+
+        [Fact]
+        public async Task ManifestSaveShardedRejectsEntriesOfUnloadedPartitionsAsync()
+        {
+            var manifest = Create<IMigrationManifest>();
+            var fileSystem = new MockFileSystem();
+            var serializer = new MigrationManifestSerializer(fileSystem);
+            var directory = fileSystem.Path.Combine(fileSystem.Path.GetTempPath(), "manifest");
+            var cancel = new CancellationToken();
+
+            var partitionTypes = manifest.Entries.GetPartitionTypes().ToList();
+
+            await serializer.SaveShardedAsync(manifest, directory, cancel);
+            var partialManifest = await serializer.LoadShardedAsync(directory, [partitionTypes[0]], cancel);
+
+            Assert.NotNull(partialManifest);
+
+            var otherPartition = manifest.Entries.ForContentType(partitionTypes[1]);
+            partialManifest.Entries.GetOrCreatePartition(partitionTypes[1]).CreateEntries(otherPartition.ToList());
+
+            await Assert.ThrowsAsync<InvalidOperationException>(() => serializer.SaveShardedAsync(partialManifest, directory, cancel));
+        }
+
+        [Fact]
+        public async Task ManifestLoadShardedContentTypesAsync()
+        {
+            var manifest = Create<IMigrationManifest>();
+            var fileSystem = new MockFileSystem();
+            var serializer = new MigrationManifestSerializer(fileSystem);
+            var directory = fileSystem.Path.Combine(fileSystem.Path.GetTempPath(), "manifest");
+            var cancel = new CancellationToken();
+
+            var partitionType = manifest.Entries.GetPartitionTypes().First();
+
+            await serializer.SaveShardedAsync(manifest, directory, cancel);
+            var loadedManifest = await serializer.LoadShardedAsync(directory, [partitionType], cancel);
+
+            Assert.NotNull(loadedManifest);
+            Assert.Equal(manifest.PlanId, loadedManifest.PlanId);
+            Assert.Equal(manifest.MigrationId, loadedManifest.MigrationId);
+            Assert.Equal(manifest.Errors.Count, loadedManifest.Errors.Count);
+
+            var loadedPartitionType = Assert.Single(loadedManifest.Entries.GetPartitionTypes());
+            Assert.Equal(partitionType, loadedPartitionType);
+            Assert.Equal(manifest.Entries.ForContentType(partitionType).Count(), loadedManifest.Entries.ForContentType(partitionType).Count());
+        }
+
+        [Fact]
+        public async Task ManifestLoadShardedMissingDirectoryAsync()
+        {
+            var serializer = Create<MigrationManifestSerializer>();
+
+            var loadedManifest = await serializer.LoadShardedAsync("missing", null, new CancellationToken());
+
+            Assert.Null(loadedManifest);
+        }
     }
 
     public class TempFile : IDisposable
@@ -0,0 +1,65 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Linq;
+using Tableau.Migration.Engine.Hooks.Mappings;
+using Tableau.Migration.Interop.Hooks;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Interop.Hooks
+{
+    public class ContentMappingInteropTests
+    {
+        public class MapBatch : AutoFixtureTestBase
+        {
+            [Fact]
+            public void MapsLocations()
+            {
+                var contexts = CreateMany<TestContentType>(2)
+                    .Select(item => new ContentMappingContext<TestContentType>(item, item.Location))
+                    .ToArray();
+                var mappedLocation = Create<ContentLocation>();
+
+                var results = ContentMappingInterop.MapBatch(contexts, [mappedLocation, null]);
+
+                Assert.Equal(2, results.Count);
+                Assert.Equal(mappedLocation, results[0].MappedLocation);
+                Assert.Same(contexts[0].ContentItem, results[0].ContentItem);
+                Assert.Same(contexts[1], results[1]);
+            }
+
+            [Fact]
+            public void ThrowsOnCountMismatch()
+            {
+                var item = Create<TestContentType>();
+                var contexts = new[] { new ContentMappingContext<TestContentType>(item, item.Location) };
+
+                Assert.Throws<ArgumentException>(() => ContentMappingInterop.MapBatch(contexts, []));
+            }
+
+            [Fact]
+            public void ThrowsOnInvalidLocation()
+            {
+                var item = Create<TestContentType>();
+                var contexts = new[] { new ContentMappingContext<TestContentType>(item, item.Location) };
+
+                Assert.Throws<ArgumentException>(() => ContentMappingInterop.MapBatch(contexts, ["location"]));
+            }
+        }
+    }
+}
@@ -0,0 +1,101 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using Microsoft.Extensions.Logging;
+using Tableau.Migration.Interop.Logging;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Interop.Logging
+{
+    public sealed class BufferedNonGenericLoggerBaseTests
+    {
+        private sealed class TestLogger : BufferedNonGenericLoggerBase
+        {
+            public List<string> Written { get; } = new();
+
+            public override void WriteLog(LogLevel logLevel, EventId eventId, string state, Exception? exception, string message)
+                => Written.Add(message);
+        }
+
+        public sealed class IsEnabled
+        {
+            [Fact]
+            public void DefaultsToAllLevels()
+            {
+                var logger = new TestLogger();
+
+                Assert.True(logger.IsEnabled(LogLevel.Trace));
+                Assert.False(logger.IsEnabled(LogLevel.None));
+            }
+
+            [Fact]
+            public void UsesMinimumLevel()
+            {
+                var logger = new TestLogger { MinimumLevel = LogLevel.Warning };
+
+                Assert.False(logger.IsEnabled(LogLevel.Information));
+                Assert.True(logger.IsEnabled(LogLevel.Warning));
+                Assert.True(logger.IsEnabled(LogLevel.Error));
+            }
+        }
+
+        public sealed class Log
+        {
+            [Fact]
+            public void WritesDirectlyWithoutBuffer()
+            {
+                var logger = new TestLogger();
+
+                logger.LogInformation("message");
+
+                Assert.Equal(new[] { "message" }, logger.Written);
+            }
+
+            [Fact]
+            public void WritesToBuffer()
+            {
+                using var buffer = new LogRecordBuffer();
+                var logger = new TestLogger { CategoryName = "category", Buffer = buffer };
+
+                logger.LogWarning(new EventId(7), "message");
+
+                Assert.Empty(logger.Written);
+
+                var record = Assert.Single(buffer.Drain(10, 0));
+                Assert.Equal("category", record.CategoryName);
+                Assert.Equal(LogLevel.Warning, record.LogLevel);
+                Assert.Equal(7, record.EventId);
+                Assert.Equal("message", record.Message);
+                Assert.Equal(Environment.CurrentManagedThreadId, record.ThreadId);
+            }
+
+            [Fact]
+            public void SkipsDisabledLevels()
+            {
+                using var buffer = new LogRecordBuffer();
+                var logger = new TestLogger { MinimumLevel = LogLevel.Error, Buffer = buffer };
+
+                logger.LogInformation("message");
+
+                Assert.Equal(0, buffer.Count);
+                Assert.Empty(logger.Written);
+            }
+        }
+    }
+}
@@ -0,0 +1,121 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Linq;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Tableau.Migration.Interop.Logging;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Interop.Logging
+{
+    public sealed class LogRecordBufferTests
+    {
+        private static BufferedLogRecord CreateRecord(string message)
+            => new("category", LogLevel.Information, 0, message, 0, 1);
+
+        public sealed class Ctor
+        {
+            [Fact]
+            public void InvalidCapacity()
+            {
+                Assert.Throws<ArgumentOutOfRangeException>(() => new LogRecordBuffer(0));
+            }
+        }
+
+        public sealed class TryAdd
+        {
+            [Fact]
+            public void AddsUntilFull()
+            {
+                using var buffer = new LogRecordBuffer(2);
+
+                Assert.True(buffer.TryAdd(CreateRecord("1")));
+                Assert.True(buffer.TryAdd(CreateRecord("2")));
+                Assert.False(buffer.TryAdd(CreateRecord("3")));
+
+                Assert.Equal(2, buffer.Count);
+                Assert.Equal(1, buffer.DroppedCount);
+            }
+
+            [Fact]
+            public void ConcurrentWriters()
+            {
+                using var buffer = new LogRecordBuffer(1000);
+
+                Parallel.For(0, 1500, i => buffer.TryAdd(CreateRecord(i.ToString())));
+
+                Assert.Equal(1000, buffer.Count);
+                Assert.Equal(500, buffer.DroppedCount);
+            }
+        }
+
+        public sealed class Drain
+        {
+            [Fact]
+            public void DrainsInOrderUpToMaxCount()
+            {
+                using var buffer = new LogRecordBuffer();
+
+                foreach (var i in Enumerable.Range(0, 5))
+                {
+                    buffer.TryAdd(CreateRecord(i.ToString()));
+                }
+
+                var first = buffer.Drain(3, 0);
+                var second = buffer.Drain(3, 0);
+
+                Assert.Equal(new[] { "0", "1", "2" }, first.Select(r => r.Message));
+                Assert.Equal(new[] { "3", "4" }, second.Select(r => r.Message));
+                Assert.Equal(0, buffer.Count);
+            }
+
+            [Fact]
+            public void EmptyAfterTimeout()
+            {
+                using var buffer = new LogRecordBuffer();
+
+                Assert.Empty(buffer.Drain(10, 10));
+            }
+
+            [Fact]
+            public async Task WakesWaitingReader()
+            {
+                using var buffer = new LogRecordBuffer();
+
+                var drain = Task.Run(() => buffer.Drain(10, 30000));
+                buffer.TryAdd(CreateRecord("1"));
+
+                var records = await drain.WaitAsync(TimeSpan.FromSeconds(10));
+
+                Assert.Single(records);
+            }
+
+            [Fact]
+            public void FreesCapacity()
+            {
+                using var buffer = new LogRecordBuffer(1);
+
+                buffer.TryAdd(CreateRecord("1"));
+                buffer.Drain(10, 0);
+
+                Assert.True(buffer.TryAdd(CreateRecord("2")));
+            }
+        }
+    }
+}
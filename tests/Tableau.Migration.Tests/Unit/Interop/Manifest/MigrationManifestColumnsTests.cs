@@ -0,0 +1,131 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text;
+using Moq;
+using Tableau.Migration.Content;
+using Tableau.Migration.Engine.Manifest;
+using Tableau.Migration.Interop.Manifest;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Interop.Manifest
+{
+    public class MigrationManifestColumnsTests
+    {
+        public abstract class MigrationManifestColumnsTest : AutoFixtureTestBase
+        {
+            protected IMigrationManifestEntry CreateEntry(MigrationManifestEntryStatus status, string path,
+                bool hasDestination = false, int errorCount = 0, string skippedReason = "")
+            {
+                var mockEntry = new Mock<IMigrationManifestEntry>();
+                mockEntry.SetupGet(e => e.Source).Returns(new ContentReferenceStub(Guid.NewGuid(), "", ContentLocation.FromPath(path)));
+                mockEntry.SetupGet(e => e.Destination).Returns(hasDestination ? new ContentReferenceStub(Guid.NewGuid(), "", ContentLocation.FromPath(path)) : null);
+                mockEntry.SetupGet(e => e.Status).Returns(status);
+                mockEntry.SetupGet(e => e.Errors).Returns(Enumerable.Range(0, errorCount).Select(_ => new Exception()).ToArray());
+                mockEntry.SetupGet(e => e.SkippedReason).Returns(skippedReason);
+                return mockEntry.Object;
+            }
+
+            protected IMigrationManifestContentTypePartition CreatePartition(Type contentType, params IMigrationManifestEntry[] entries)
+            {
+                var mockPartition = new Mock<IMigrationManifestContentTypePartition>();
+                mockPartition.SetupGet(p => p.ContentType).Returns(contentType);
+                mockPartition.SetupGet(p => p.Count).Returns(entries.Length);
+                mockPartition.Setup(p => p.GetEnumerator()).Returns(() => ((IEnumerable<IMigrationManifestEntry>)entries).GetEnumerator());
+                return mockPartition.Object;
+            }
+        }
+
+        public class Ctor : MigrationManifestColumnsTest
+        {
+            [Fact]
+            public void Empty()
+            {
+                var columns = new MigrationManifestColumns(Array.Empty<IMigrationManifestContentTypePartition>());
+
+                Assert.Equal(0, columns.RowCount);
+                Assert.Empty(columns.ContentTypeNames);
+                Assert.Empty(columns.SourceIds);
+                Assert.Equal(new[] { 0 }, columns.SourceLocationOffsets);
+                Assert.Empty(columns.SourceLocationData);
+                Assert.Empty(columns.SkippedReasonNames);
+            }
+
+            [Fact]
+            public void BuildsColumns()
+            {
+                var users = new[]
+                {
+                    CreateEntry(MigrationManifestEntryStatus.Migrated, "user1", hasDestination: true),
+                    CreateEntry(MigrationManifestEntryStatus.Skipped, "user2", skippedReason: "a")
+                };
+                var groups = new[]
+                {
+                    CreateEntry(MigrationManifestEntryStatus.Error, "gr\u00f6up", errorCount: 2),
+                    CreateEntry(MigrationManifestEntryStatus.Skipped, "group2", skippedReason: "a")
+                };
+
+                var columns = new MigrationManifestColumns([CreatePartition(typeof(IUser), users), CreatePartition(typeof(IGroup), groups)]);
+                var entries = users.Concat(groups).ToArray();
+
+                Assert.Equal(4, columns.RowCount);
+                Assert.Equal(new[] { nameof(IUser), nameof(IGroup) }, columns.ContentTypeNames);
+                Assert.Equal(new[] { 0, 0, 1, 1 }, columns.ContentTypeCodes);
+                Assert.Equal(entries.SelectMany(e => e.Source.Id.ToByteArray(bigEndian: true)), columns.SourceIds);
+
+                var paths = Enumerable.Range(0, columns.RowCount)
+                    .Select(i => Encoding.UTF8.GetString(columns.SourceLocationData, columns.SourceLocationOffsets[i], columns.SourceLocationOffsets[i + 1] - columns.SourceLocationOffsets[i]));
+                Assert.Equal(entries.Select(e => e.Source.Location.Path), paths);
+
+                Assert.Equal(new byte[] { 1, 0, 0, 0 }, columns.HasDestination);
+                Assert.Equal(users[0].Destination!.Id.ToByteArray(bigEndian: true), columns.DestinationIds.Take(MigrationManifestColumns.GuidSize));
+                Assert.All(columns.DestinationIds.Skip(MigrationManifestColumns.GuidSize), b => Assert.Equal(0, b));
+
+                Assert.Equal(entries.Select(e => (int)e.Status), columns.Statuses);
+                Assert.Equal(new[] { 0, 0, 2, 0 }, columns.ErrorCounts);
+                Assert.Equal(new[] { "a" }, columns.SkippedReasonNames);
+                Assert.Equal(new[] { -1, 0, -1, 0 }, columns.SkippedReasonCodes);
+            }
+        }
+
+        public class ForManifest : MigrationManifestColumnsTest
+        {
+            [Fact]
+            public void ReadsEachPartition()
+            {
+                var users = CreatePartition(typeof(IUser), CreateEntry(MigrationManifestEntryStatus.Migrated, "user"));
+                var groups = CreatePartition(typeof(IGroup));
+
+                var mockEntries = new Mock<IMigrationManifestEntryCollection>();
+                mockEntries.Setup(e => e.GetPartitionTypes()).Returns([typeof(IUser), typeof(IGroup)]);
+                mockEntries.Setup(e => e.ForContentType(typeof(IUser))).Returns(users);
+                mockEntries.Setup(e => e.ForContentType(typeof(IGroup))).Returns(groups);
+
+                var mockManifest = new Mock<IMigrationManifest>();
+                mockManifest.SetupGet(m => m.Entries).Returns(mockEntries.Object);
+
+                var columns = MigrationManifestColumns.ForManifest(mockManifest.Object);
+
+                Assert.Equal(1, columns.RowCount);
+                Assert.Equal(new[] { nameof(IUser), nameof(IGroup) }, columns.ContentTypeNames);
+            }
+        }
+    }
+}
@@ -0,0 +1,123 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Moq;
+using Tableau.Migration.Content;
+using Tableau.Migration.Engine.Manifest;
+using Tableau.Migration.Interop.Manifest;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Interop.Manifest
+{
+    public class MigrationManifestStatisticsTests
+    {
+        public abstract class MigrationManifestStatisticsTest : AutoFixtureTestBase
+        {
+            protected IMigrationManifestEntry CreateEntry(MigrationManifestEntryStatus status, int errorCount = 0, string skippedReason = "")
+            {
+                var mockEntry = new Mock<IMigrationManifestEntry>();
+                mockEntry.SetupGet(e => e.Status).Returns(status);
+                mockEntry.SetupGet(e => e.Errors).Returns(Enumerable.Range(0, errorCount).Select(_ => new Exception()).ToArray());
+                mockEntry.SetupGet(e => e.SkippedReason).Returns(skippedReason);
+                return mockEntry.Object;
+            }
+        }
+
+        public class Ctor : MigrationManifestStatisticsTest
+        {
+            [Fact]
+            public void Empty()
+            {
+                var stats = new MigrationManifestStatistics(typeof(IUser), Array.Empty<IMigrationManifestEntry>());
+
+                Assert.Same(typeof(IUser), stats.ContentType);
+                Assert.Equal(0, stats.TotalCount);
+                Assert.Equal(Enum.GetValues<MigrationManifestEntryStatus>().Length, stats.StatusCounts.Length);
+                Assert.All(stats.StatusCounts, c => Assert.Equal(0, c));
+                Assert.Empty(stats.SkippedReasons);
+                Assert.Empty(stats.SkippedReasonCounts);
+            }
+
+            [Fact]
+            public void AggregatesEntries()
+            {
+                var entries = new List<IMigrationManifestEntry>
+                {
+                    CreateEntry(MigrationManifestEntryStatus.Migrated),
+                    CreateEntry(MigrationManifestEntryStatus.Migrated),
+                    CreateEntry(MigrationManifestEntryStatus.Error, errorCount: 2),
+                    CreateEntry(MigrationManifestEntryStatus.Error, errorCount: 1),
+                    CreateEntry(MigrationManifestEntryStatus.Skipped, skippedReason: "a"),
+                    CreateEntry(MigrationManifestEntryStatus.Skipped, skippedReason: "a"),
+                    CreateEntry(MigrationManifestEntryStatus.Skipped, skippedReason: "b"),
+                    CreateEntry(MigrationManifestEntryStatus.Pending)
+                };
+
+                var stats = new MigrationManifestStatistics(null, entries);
+
+                Assert.Null(stats.ContentType);
+                Assert.Equal(8, stats.TotalCount);
+                Assert.Equal(1, stats.StatusCounts[(int)MigrationManifestEntryStatus.Pending]);
+                Assert.Equal(3, stats.StatusCounts[(int)MigrationManifestEntryStatus.Skipped]);
+                Assert.Equal(2, stats.StatusCounts[(int)MigrationManifestEntryStatus.Migrated]);
+                Assert.Equal(2, stats.StatusCounts[(int)MigrationManifestEntryStatus.Error]);
+                Assert.Equal(0, stats.StatusCounts[(int)MigrationManifestEntryStatus.Canceled]);
+                Assert.Equal(2, stats.EntriesWithErrors);
+                Assert.Equal(3, stats.ErrorCount);
+
+                var skippedReasons = stats.SkippedReasons.Zip(stats.SkippedReasonCounts).ToDictionary(p => p.First, p => p.Second);
+                Assert.Equal(new Dictionary<string, int> { ["a"] = 2, ["b"] = 1 }, skippedReasons);
+            }
+        }
+
+        public class ForContentTypes : MigrationManifestStatisticsTest
+        {
+            [Fact]
+            public void AggregatesEachPartition()
+            {
+                var mockEntries = new Mock<IMigrationManifestEntryCollection>();
+                mockEntries.Setup(e => e.GetPartitionTypes()).Returns([typeof(IUser), typeof(IGroup)]);
+
+                var mockUsers = new Mock<IMigrationManifestContentTypePartition>();
+                mockUsers.Setup(p => p.GetEnumerator()).Returns(() => new List<IMigrationManifestEntry>
+                {
+                    CreateEntry(MigrationManifestEntryStatus.Migrated)
+                }.GetEnumerator());
+
+                var mockGroups = new Mock<IMigrationManifestContentTypePartition>();
+                mockGroups.Setup(p => p.GetEnumerator()).Returns(() => new List<IMigrationManifestEntry>().GetEnumerator());
+
+                mockEntries.Setup(e => e.ForContentType(typeof(IUser))).Returns(mockUsers.Object);
+                mockEntries.Setup(e => e.ForContentType(typeof(IGroup))).Returns(mockGroups.Object);
+
+                var mockManifest = new Mock<IMigrationManifest>();
+                mockManifest.SetupGet(m => m.Entries).Returns(mockEntries.Object);
+
+                var stats = MigrationManifestStatistics.ForContentTypes(mockManifest.Object);
+
+                Assert.Equal(2, stats.Count);
+                Assert.Same(typeof(IUser), stats[0].ContentType);
+                Assert.Equal(1, stats[0].TotalCount);
+                Assert.Same(typeof(IGroup), stats[1].ContentType);
+                Assert.Equal(0, stats[1].TotalCount);
+            }
+        }
+    }
+}
@@ -0,0 +1,55 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using Tableau.Migration.Interop;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Interop
+{
+    public class ResultInteropTests
+    {
+        public class GetIndexesBySuccess
+        {
+            private readonly IResult[] _results =
+            [
+                Result.Succeeded(),
+                Result.Failed(new Exception()),
+                Result.Succeeded(),
+                Result.Failed(new Exception())
+            ];
+
+            [Fact]
+            public void GetsSucceededIndexes()
+            {
+                Assert.Equal(new[] { 0, 2 }, ResultInterop.GetIndexesBySuccess(_results, true));
+            }
+
+            [Fact]
+            public void GetsFailedIndexes()
+            {
+                Assert.Equal(new[] { 1, 3 }, ResultInterop.GetIndexesBySuccess(_results, false));
+            }
+
+            [Fact]
+            public void Empty()
+            {
+                Assert.Empty(ResultInterop.GetIndexesBySuccess([], false));
+            }
+        }
+    }
+}
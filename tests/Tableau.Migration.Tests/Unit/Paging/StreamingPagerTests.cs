@@ -0,0 +1,151 @@
+﻿//
+//  Copyright (c) 2026, Salesforce, Inc.
+//  SPDX-License-Identifier: Apache-2
+//  
+//  Licensed under the Apache License, Version 2.0 (the "License") 
+//  you may not use this file except in compliance with the License.
+//  You may obtain a copy of the License at
+//  
+//  http://www.apache.org/licenses/LICENSE-2.0
+//  
+//  Unless required by applicable law or agreed to in writing, software
+//  distributed under the License is distributed on an "AS IS" BASIS,
+//  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//  See the License for the specific language governing permissions and
+//  limitations under the License.
+//
+
+using System;
+using System.Collections.Generic;
+using System.Collections.Immutable;
+using System.Linq;
+using System.Threading.Tasks;
+using Tableau.Migration.Content;
+using Tableau.Migration.Paging;
+using Xunit;
+
+namespace Tableau.Migration.Tests.Unit.Paging
+{
+    public sealed class StreamingPagerTests
+    {
+        public sealed class Ctor
+        {
+            [Fact]
+            public void ThrowsOnInvalidPageSize()
+            {
+                Assert.Throws<ArgumentOutOfRangeException>(() => new StreamingPager<IUser>((c, cancel) => Task.FromResult<IImmutableList<IUser>>(ImmutableArray<IUser>.Empty), 0));
+            }
+        }
+
+        public sealed class NextPageAsync : AutoFixtureTestBase
+        {
+            private static StreamingPager<TItem>.NextItemsCallback CreateCallback<TItem>(IEnumerator<TItem> source, List<int> requestedCounts)
+            {
+                return (count, cancel) =>
+                {
+                    requestedCounts.Add(count);
+
+                    var items = ImmutableArray.CreateBuilder<TItem>(count);
+                    while (items.Count < count && source.MoveNext())
+                    {
+                        items.Add(source.Current);
+                    }
+
+                    return Task.FromResult<IImmutableList<TItem>>(items.ToImmutable());
+                };
+            }
+
+            [Fact]
+            public async Task PagesThroughSourceAsync()
+            {
+                int count = 105;
+                int pageSize = 10;
+
+                var collection = CreateMany<IUser>(count).ToImmutableArray();
+                var requestedCounts = new List<int>();
+
+                var pager = new StreamingPager<IUser>(CreateCallback(collection.AsEnumerable().GetEnumerator(), requestedCounts), pageSize);
+
+                for (int i = 0; i < count / pageSize + 1; i++)
+                {
+                    var pageResult = await pager.NextPageAsync(Cancel);
+
+                    pageResult.AssertSuccess();
+                    Assert.Equal(pageSize, pageResult.PageSize);
+                    Assert.Equal(i + 1, pageResult.PageNumber);
+                    Assert.Equal(Math.Min(count, (i + 1) * pageSize), pageResult.TotalCount);
+                    Assert.Equal(collection.Skip(i * pageSize).Take(pageSize), pageResult.Value);
+                    Assert.Equal(i == count / pageSize, pageResult.FetchedAllPages);
+                }
+
+                Assert.All(requestedCounts, c => Assert.Equal(pageSize, c));
+                Assert.Equal(count / pageSize + 1, requestedCounts.Count);
+            }
+
+            [Fact]
+            public async Task UsesKnownTotalCountAsync()
+            {
+                var collection = CreateMany<IUser>(20).ToImmutableArray();
+                var requestedCounts = new List<int>();
+
+                var pager = new StreamingPager<IUser>(CreateCallback(collection.AsEnumerable().GetEnumerator(), requestedCounts), 10, collection.Length);
+
+                var firstPage = await pager.NextPageAsync(Cancel);
+                Assert.Equal(20, firstPage.TotalCount);
+                Assert.False(firstPage.FetchedAllPages);
+
+                var secondPage = await pager.NextPageAsync(Cancel);
+                Assert.Equal(20, secondPage.TotalCount);
+                Assert.True(secondPage.FetchedAllPages);
+
+                Assert.Equal(2, requestedCounts.Count);
+            }
+
+            [Fact]
+            public async Task ExactPageMultipleEndsWithEmptyPageAsync()
+            {
+                var collection = CreateMany<IUser>(10).ToImmutableArray();
+                var requestedCounts = new List<int>();
+
+                var pager = new StreamingPager<IUser>(CreateCallback(collection.AsEnumerable().GetEnumerator(), requestedCounts), 10);
+
+                var firstPage = await pager.NextPageAsync(Cancel);
+                Assert.Equal(10, firstPage.Value!.Count);
+                Assert.False(firstPage.FetchedAllPages);
+
+                var lastPage = await pager.NextPageAsync(Cancel);
+                Assert.Empty(lastPage.Value!);
+                Assert.True(lastPage.FetchedAllPages);
+            }
+
+            [Fact]
+            public async Task DoesNotCallSourceAfterLastPageAsync()
+            {
+                var requestedCounts = new List<int>();
+
+                var pager = new StreamingPager<IUser>(CreateCallback(CreateMany<IUser>(3).GetEnumerator(), requestedCounts), 10);
+
+                await pager.NextPageAsync(Cancel);
+                var pageResult = await pager.NextPageAsync(Cancel);
+
+                pageResult.AssertSuccess();
+                Assert.Empty(pageResult.Value!);
+                Assert.True(pageResult.FetchedAllPages);
+                Assert.Single(requestedCounts);
+            }
+
+            [Fact]
+            public async Task GetAllPagesAsync()
+            {
+                var collection = CreateMany<IUser>(25).ToImmutableArray();
+
+                IPager<IUser> pager = new StreamingPager<IUser>(CreateCallback(collection.AsEnumerable().GetEnumerator(), new List<int>()), 10);
+
+                var result = await pager.GetAllPagesAsync(Cancel);
+
+                result.AssertSuccess();
+                Assert.Equal(collection, result.Value);
+            }
+        }
+    }
+}